@@ -17,6 +17,7 @@ from crewai.knowledge.source.text_file_knowledge_source import TextFileKnowledge
 
 from .tools import (
     validate_content_tool,
+    validate_file_tool,
     sync_localization_tool,
     run_build_tool,
     analyze_validation_report_tool,
@@ -231,6 +232,7 @@ class EnlistedCrew:
                 read_event_file_tool,
                 list_event_files_tool,
                 validate_content_tool,
+                validate_file_tool,
             ],
             knowledge_sources=[self.content_knowledge],
         )
@@ -264,6 +266,7 @@ class EnlistedCrew:
             tools=[
                 run_build_tool,
                 validate_content_tool,
+                validate_file_tool,
                 check_code_style_tool,
                 check_bannerlord_patterns_tool,
                 check_framework_compatibility_tool,
@@ -288,6 +291,7 @@ class EnlistedCrew:
                 suggest_style_improvements_tool,
                 read_event_file_tool,
                 validate_event_schema_tool,
+                validate_file_tool,
                 read_writing_style_guide_tool,
                 read_doc_tool,
             ],
@@ -302,6 +306,7 @@ class EnlistedCrew:
             llm=SONNET_QA,  # TIER 2.5: QA is last defense - NEVER skimp here
             tools=[
                 validate_content_tool,
+                validate_file_tool,
                 sync_localization_tool,
                 run_build_tool,
                 analyze_validation_report_tool,
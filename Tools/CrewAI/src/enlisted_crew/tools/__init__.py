@@ -6,6 +6,7 @@ Tools that extend CrewAI agent capabilities for Enlisted mod development.
 
 from .validation_tools import (
     validate_content_tool,
+    validate_file_tool,
     sync_localization_tool,
     run_build_tool,
     analyze_validation_report_tool,
@@ -47,6 +48,7 @@ from .docs_tools import (
 __all__ = [
     # Validation tools
     "validate_content_tool",
+    "validate_file_tool",
     "sync_localization_tool", 
     "run_build_tool",
     "analyze_validation_report_tool",
@@ -6,6 +6,7 @@ JSON schema validation and event creation based on event-system-schemas.md
 
 import json
 import os
+import sys
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from crewai.tools import tool
@@ -27,124 +28,59 @@ def get_project_root() -> Path:
 
 PROJECT_ROOT = get_project_root()
 
+# Shared with validate_content.py: Tools/Validation/content_schema.json
+_validation_dir = str(PROJECT_ROOT / "Tools" / "Validation")
+if _validation_dir not in sys.path:
+    sys.path.insert(0, _validation_dir)
+
+from content_schema import SchemaIssue, load_schema, validate_event  # noqa: E402
+
+CONTENT_SCHEMA = load_schema()
+
 # Valid values from event-system-schemas.md
-VALID_SKILLS = {
-    "OneHanded", "TwoHanded", "Polearm", "Bow", "Crossbow", "Throwing",
-    "Riding", "Athletics", "Crafting", "Scouting", "Tactics", "Roguery",
-    "Charm", "Leadership", "Trade", "Stewardship", "Medicine", "Engineering",
-    "Perception"
-}
+VALID_SKILLS = set(CONTENT_SCHEMA.enum("skills"))
+VALID_ROLES = set(CONTENT_SCHEMA.enum("roles"))
+VALID_CONTEXTS = set(CONTENT_SCHEMA.enum("contexts"))
+VALID_CATEGORIES = set(CONTENT_SCHEMA.enum("categories"))
+VALID_SEVERITIES = set(CONTENT_SCHEMA.enum("order_severities"))
+TOOLTIP_MAX_LENGTH = CONTENT_SCHEMA.limits["tooltip_max_length"]
 
-VALID_ROLES = {"Any", "Scout", "Medic", "Engineer", "Officer", "Operative", "NCO", "Soldier"}
 
-VALID_CONTEXTS = {"Any", "War", "Peace", "Siege", "Battle", "Town", "Village", "Camp", "March"}
+def _schema_issues(event: Dict[str, Any]) -> List[SchemaIssue]:
+    """Structure issues from the compiled content schema plus role/context/skill checks."""
+    issues = list(validate_event(event))
 
-VALID_CATEGORIES = {
-    "decision", "escalation", "role", "universal", "muster", "crisis", "general",
-    "onboarding", "pay", "promotion", "retinue", "training", "threshold",
-    "medical", "map_incident"
-}
+    reqs = event.get("requirements")
+    reqs = reqs if isinstance(reqs, dict) else {}
+    role = reqs.get("role")
+    if isinstance(role, str) and role not in VALID_ROLES:
+        issues.append(SchemaIssue("requirements.role", "warning", "logic",
+                                  f"Invalid role: {role}. Valid: {sorted(VALID_ROLES)}"))
+    context = reqs.get("context")
+    if isinstance(context, str) and context not in VALID_CONTEXTS:
+        issues.append(SchemaIssue("requirements.context", "warning", "logic",
+                                  f"Invalid context: {context}. Valid: {sorted(VALID_CONTEXTS)}"))
 
-VALID_SEVERITIES = {"normal", "attention", "critical", "urgent", "positive"}
+    for opt in event.get("options") or []:
+        if not isinstance(opt, dict):
+            continue
+        skill_xp = (opt.get("effects") or {}).get("skillXp") or {}
+        for skill in skill_xp:
+            if skill not in VALID_SKILLS:
+                issues.append(SchemaIssue("effects.skill", "warning", "logic",
+                                          f"Unknown skill in effects.skillXp: {skill}"))
+        # Same rule as validate_content.py: a skill name or {"skill": ...}
+        check = opt.get("skillCheck")
+        skill = check.get("skill") if isinstance(check, dict) else check
+        if skill and str(skill) not in VALID_SKILLS:
+            issues.append(SchemaIssue("effects.skill", "error", "reference",
+                                      f"Invalid skill in skillCheck: '{skill}'"))
+    return issues
 
 
 def validate_event_structure(event: Dict[str, Any]) -> List[str]:
-    """Validate an event's structure against the schema."""
-    issues = []
-    
-    # Required fields
-    if "id" not in event:
-        issues.append("Missing required field: id")
-    
-    if "category" not in event:
-        issues.append("Missing required field: category")
-    elif event["category"] not in VALID_CATEGORIES:
-        issues.append(f"Invalid category: {event['category']}. Valid: {VALID_CATEGORIES}")
-    
-    # Title/setup - need either ID or fallback (both preferred)
-    if "titleId" not in event and "title" not in event:
-        issues.append("Missing title: need titleId or title (both preferred)")
-    
-    if "setupId" not in event and "setup" not in event:
-        issues.append("Missing setup: need setupId or setup (both preferred)")
-    
-    # Field ordering: fallback must immediately follow ID
-    fields = list(event.keys())
-    if "titleId" in event and "title" in event:
-        title_id_idx = fields.index("titleId")
-        title_idx = fields.index("title")
-        if title_idx != title_id_idx + 1:
-            issues.append("JSON field order: 'title' must immediately follow 'titleId'")
-    
-    if "setupId" in event and "setup" in event:
-        setup_id_idx = fields.index("setupId")
-        setup_idx = fields.index("setup")
-        if setup_idx != setup_id_idx + 1:
-            issues.append("JSON field order: 'setup' must immediately follow 'setupId'")
-    
-    # Options validation
-    if "options" in event:
-        options = event["options"]
-        if len(options) == 1:
-            issues.append("CRITICAL: Cannot have exactly 1 option. Use 0 (dynamic) or 2-6.")
-        elif len(options) > 6:
-            issues.append(f"Too many options ({len(options)}). Max is 6 (rarely 5-6).")
-        
-        for i, opt in enumerate(options):
-            # Tooltip is required
-            if "tooltip" not in opt or not opt.get("tooltip"):
-                issues.append(f"Option {i+1} missing tooltip (required, <80 chars)")
-            elif len(opt.get("tooltip", "")) > 80:
-                issues.append(f"Option {i+1} tooltip too long ({len(opt['tooltip'])} chars, max 80)")
-            
-            # Order events must have skillXp
-            if event.get("category") == "order" or event.get("id", "").startswith("ord_"):
-                effects = opt.get("effects", {})
-                if "skillXp" not in effects:
-                    issues.append(f"Option {i+1}: Order events MUST include effects.skillXp")
-    
-    # Requirements validation
-    if "requirements" in event:
-        reqs = event["requirements"]
-        
-        # Tier validation
-        if "tier" in reqs:
-            tier = reqs["tier"]
-            if isinstance(tier, dict):
-                min_tier = tier.get("min", 1)
-                max_tier = tier.get("max", 9)
-                if min_tier < 1 or max_tier > 9:
-                    issues.append(f"Invalid tier range: {min_tier}-{max_tier}. Valid: 1-9")
-        
-        # Role validation
-        if "role" in reqs:
-            role = reqs["role"]
-            if isinstance(role, str) and role not in VALID_ROLES:
-                issues.append(f"Invalid role: {role}. Valid: {VALID_ROLES}")
-        
-        # Context validation
-        if "context" in reqs:
-            context = reqs["context"]
-            if isinstance(context, str) and context not in VALID_CONTEXTS:
-                issues.append(f"Invalid context: {context}. Valid: {VALID_CONTEXTS}")
-    
-    # Effects validation
-    for opt in event.get("options", []):
-        effects = opt.get("effects", {})
-        
-        # Skill XP validation
-        if "skillXp" in effects:
-            for skill, xp in effects["skillXp"].items():
-                if skill not in VALID_SKILLS:
-                    issues.append(f"Unknown skill in effects.skillXp: {skill}")
-        
-        # Skill check validation
-        if "skill_check" in opt:
-            check = opt["skill_check"]
-            if "skill" in check and check["skill"] not in VALID_SKILLS:
-                issues.append(f"Unknown skill in skill_check: {check['skill']}")
-    
-    return issues
+    """Validate an event's structure against the schema (validate_content.py's structure rules)."""
+    return [issue.message for issue in _schema_issues(event)]
 
 
 @tool("Validate Event Schema")
@@ -152,13 +88,16 @@ def validate_event_schema_tool(event_json: str) -> str:
     """
     Validate a JSON event against the Enlisted schema.
     
+    Runs the structure checks of content_schema.json that validate_content.py
+    uses. String IDs, flags and cross-file rules are not checked here; use
+    Validate File on the saved file for the full validator.
+    
     Checks:
-    - Required fields (id, category, title, setup)
-    - Field ordering (fallback after ID)
+    - Required fields (id, category or order_type, title, setup)
     - Option count (0 or 2-6, never 1)
-    - Tooltip presence and length (<80 chars)
-    - Order events have skillXp
-    - Valid skills, roles, contexts
+    - Option text and tooltip presence, tooltip length (<100 chars)
+    - Known categories and severities, unknown top-level fields
+    - Valid skills, roles and contexts
     
     Args:
         event_json: JSON string of the event to validate
@@ -170,16 +109,18 @@ def validate_event_schema_tool(event_json: str) -> str:
         event = json.loads(event_json)
     except json.JSONDecodeError as e:
         return f"INVALID JSON: {e}"
+    if not isinstance(event, dict):
+        return "INVALID JSON: expected a single event object"
     
-    issues = validate_event_structure(event)
+    issues = _schema_issues(event)
     
     if not issues:
         return "SCHEMA VALID: Event follows all schema rules."
     
     report = f"SCHEMA ISSUES ({len(issues)}):\n\n"
     for issue in issues:
-        severity = "❌" if "CRITICAL" in issue or "Missing required" in issue else "⚠️"
-        report += f"  {severity} {issue}\n"
+        severity = "❌" if issue.severity == "error" else "⚠️"
+        report += f"  {severity} {issue.message}\n"
     
     return report
 
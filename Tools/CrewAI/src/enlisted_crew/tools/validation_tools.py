@@ -4,8 +4,11 @@ Validation Tools for Enlisted CrewAI
 Wrappers around existing validation scripts in Tools/Validation/
 """
 
+import io
+import json
 import subprocess
 import os
+import sys
 from pathlib import Path
 from crewai.tools import tool
 
@@ -30,42 +33,72 @@ def get_project_root() -> Path:
 PROJECT_ROOT = get_project_root()
 
 
+VALIDATION_DIR = PROJECT_ROOT / "Tools" / "Validation"
+
+
+def _validation_api():
+    """Import the in-process validator (one warm session per process)."""
+    if str(VALIDATION_DIR) not in sys.path:
+        sys.path.insert(0, str(VALIDATION_DIR))
+    import validation_api
+    return validation_api
+
+
+def _report_json(report, limit: int = 25) -> str:
+    return json.dumps(report.to_dict(limit=limit), indent=1)
+
+
 @tool("Validate Content")
 def validate_content_tool() -> str:
     """
-    Run the Enlisted content validator (validate_content.py).
+    Run the Enlisted content validator (validate_content.py) in-process.
     
     Validates all JSON events, decisions, orders, and project structure.
-    Returns a report with errors, warnings, and info messages.
+    Returns a compact JSON summary: ok, error/warning/info counts,
+    counts by category, and the first 25 errors and warnings.
     
     Use this to check if content follows schema rules before committing.
+    Repeated calls reuse the loaded localization and unchanged results.
     """
-    validator_path = PROJECT_ROOT / "Tools" / "Validation" / "validate_content.py"
+    if not (VALIDATION_DIR / "validation_api.py").exists():
+        return f"ERROR: Validator not found at {VALIDATION_DIR}"
     
-    if not validator_path.exists():
-        return f"ERROR: Validator not found at {validator_path}"
+    try:
+        return _report_json(_validation_api().validate_paths())
+    except Exception as e:
+        return f"ERROR: Failed to run validator: {e}"
+
+
+@tool("Validate File")
+def validate_file_tool(file_path: str, phases: str = "") -> str:
+    """
+    Validate one or more files in-process and report only their issues.
+    
+    Runs the phases the files affect: Phases 1-4 plus cross-file checks for
+    event/decision JSON, Phase 5.5 for camp_opportunities.json, Phases 7-9
+    for C# files, Phases 6/9.5 for config files, Phase 10 for any content
+    file with IDs (orders, dialogue, conditions, ...).
+    
+    Args:
+        file_path: Path relative to the project root (comma-separate several)
+        phases: Optional comma-separated phase keys to run instead
+                (1-4, 4, 5, 5.5, 6, 7, 8, 9, 9.5, 10); their issues are all reported
+    
+    Returns:
+        Compact JSON summary (counts and the first 25 errors and warnings).
+    """
+    paths = [p.strip() for p in file_path.split(",") if p.strip()]
+    if not paths:
+        return "ERROR: No file path given"
+    missing = [p for p in paths if not (PROJECT_ROOT / p).exists()]
+    if missing:
+        return f"ERROR: File not found: {', '.join(missing)}"
     
+    keys = [k.strip() for k in phases.split(",") if k.strip()] or None
     try:
-        result = subprocess.run(
-            ["python", str(validator_path)],
-            capture_output=True,
-            text=True,
-            cwd=str(PROJECT_ROOT),
-            timeout=120  # 2 minute timeout
-        )
-        
-        output = result.stdout
-        if result.stderr:
-            output += f"\n\nSTDERR:\n{result.stderr}"
-        
-        # Add exit code info
-        if result.returncode != 0:
-            output += f"\n\nValidator exited with code {result.returncode}"
-        
-        return output
-        
-    except subprocess.TimeoutExpired:
-        return "ERROR: Validation timed out after 2 minutes"
+        return _report_json(_validation_api().validate_paths(paths, keys))
+    except ValueError as e:
+        return f"ERROR: {e}"
     except Exception as e:
         return f"ERROR: Failed to run validator: {e}"
 
@@ -159,41 +192,23 @@ def analyze_validation_report_tool() -> str:
     - MEDIUM: Fix when convenient
     - LOW: Fix as content completes
     """
-    analyzer_path = PROJECT_ROOT / "Tools" / "Validation" / "analyze_validation.py"
-    report_path = PROJECT_ROOT / "Tools" / "Debugging" / "validation_report.txt"
-    
-    # First run validation to generate report
-    validator_path = PROJECT_ROOT / "Tools" / "Validation" / "validate_content.py"
+    if not (VALIDATION_DIR / "validation_api.py").exists():
+        return f"ERROR: Validator not found at {VALIDATION_DIR}"
     
     try:
-        # Generate fresh report
-        with open(report_path, "w") as f:
-            result = subprocess.run(
-                ["python", str(validator_path)],
-                stdout=f,
-                stderr=subprocess.STDOUT,
-                cwd=str(PROJECT_ROOT),
-                timeout=120
-            )
+        # Same warm in-process session as Validate Content; every issue, exact counts
+        report = _validation_api().validate_paths()
+        data = report.to_dict(limit=len(report.issues), include_info=True)
         
-        # Run analyzer
-        if analyzer_path.exists():
-            result = subprocess.run(
-                ["python", str(analyzer_path)],
-                capture_output=True,
-                text=True,
-                cwd=str(PROJECT_ROOT),
-                timeout=30
-            )
-            return result.stdout + (result.stderr if result.stderr else "")
+        if (VALIDATION_DIR / "analyze_validation.py").exists():
+            from analyze_validation import analyze_issue_records, print_analysis
+            
+            output = io.StringIO()
+            print_analysis(analyze_issue_records(data["issues"], data), out=output)
+            return output.getvalue()
         else:
-            # If analyzer doesn't exist, return raw report summary
-            with open(report_path) as f:
-                content = f.read()
-            # Extract just summary lines
-            lines = content.split("\n")
-            summary_lines = [l for l in lines if "[ERROR]" in l or "[WARNING]" in l][:50]
-            return "\n".join(summary_lines)
+            # If analyzer doesn't exist, return raw issue summary
+            return report.summary(limit=50)
             
     except Exception as e:
         return f"ERROR: Failed to analyze: {e}"
@@ -1,6 +1,83 @@
+"""
+Create or update a translated copy of an English string table.
+
+Without --merge the output is the English file with the language tag replaced
+(and every text blanked with --blank). With --merge an existing translation at
+--output is updated in place of being overwritten: the English file's layout
+is kept, and each string gets, in order of preference,
+- its existing translation, if the English text is unchanged since it was translated
+- its existing translation marked <!-- fuzzy -->, if the English text changed
+- the English text (or "" with --blank), if it is new or was never translated
+IDs no longer in the English file are dropped. A translation merged for the
+first time (no sidecar yet) is taken to match the current English text.
+
+Both modes write <output>.sources.json, the hash of the English text each
+string was translated from (see localization_index.py). A fuzzy string stops
+being fuzzy on the next merge once its translation has been edited.
+"""
+
 import argparse
 from pathlib import Path
 import re
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "Validation"))
+
+from localization_index import load_index, parse_strings, read_sources, source_hash, write_sources
+from validation_cache import atomic_write
+
+STRING_RE = re.compile(r'(<string\s+id=")([^"]*)("\s+text=")([^"]*)(")')
+FUZZY_MARKER = "<!-- fuzzy --> "
+
+
+def xml_attr(text: str) -> str:
+    return (text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            .replace('"', "&quot;").replace("\n", "&#xA;"))
+
+
+def merge(xml: str, english: dict, translations: dict, old_sources: dict, old_fuzzy: dict, blank: bool):
+    """
+    Rewrite every <string> of the English xml in one pass.
+
+    Returns (xml, sources, fuzzy, counts) where sources/fuzzy are the new sidecar
+    sections and counts tallies kept/fuzzy/reviewed/updated/new strings.
+    """
+    sources = {}
+    fuzzy = {}
+    counts = dict.fromkeys(("kept", "fuzzy", "reviewed", "updated", "new"), 0)
+
+    def replace(match):
+        string_id = match.group(2)
+        english_text = english.get(string_id, "")
+        current = source_hash(english_text)
+        sources[string_id] = current
+        translation = translations.get(string_id)
+        old = old_sources.get(string_id)
+        prefix = ""
+        if translation is None:
+            counts["new"] += 1
+            text = "" if blank else match.group(4)
+        elif not translation or old is None or old == current:
+            counts["kept"] += 1
+            text = xml_attr(translation)
+        elif source_hash(translation) == old:
+            # Still the old English text, never translated: follow the English
+            counts["updated"] += 1
+            text = "" if blank else match.group(4)
+        elif string_id in old_fuzzy and old_fuzzy[string_id] != source_hash(translation):
+            # Edited since it was marked fuzzy: the translator has caught up
+            counts["reviewed"] += 1
+            text = xml_attr(translation)
+        else:
+            counts["fuzzy"] += 1
+            sources[string_id] = old
+            fuzzy[string_id] = old_fuzzy.get(string_id, source_hash(translation))
+            prefix = FUZZY_MARKER
+            text = xml_attr(translation)
+        return prefix + match.group(1) + string_id + match.group(3) + text + match.group(5)
+
+    xml = STRING_RE.sub(replace, xml)
+    return xml, sources, fuzzy, counts
 
 
 def main() -> None:
@@ -9,28 +86,42 @@ def main() -> None:
     parser.add_argument("--language", required=True, help="Target language name as Bannerlord expects, e.g. French, German, Russian")
     parser.add_argument("--output", required=True, help="Output path for the translated XML file")
     parser.add_argument("--blank", action="store_true", help="Blank out all text attributes (keeps IDs).")
+    parser.add_argument("--merge", action="store_true",
+                        help="Update an existing translation at --output: keep unchanged translations, "
+                             "mark changed ones fuzzy, add new IDs and drop removed ones.")
     args = parser.parse_args()
 
     src = Path(args.input)
     if not src.exists():
         raise FileNotFoundError(src)
+    out = Path(args.output)
 
     xml = src.read_text(encoding="utf-8")
+    english = load_index(src).texts()
 
     # Replace/insert language tag(s). Keep file format stable.
     xml = re.sub(r'(<tag\s+language=")[^"]+("\s*/>)', rf'\1{args.language}\2', xml, count=1, flags=re.IGNORECASE)
 
-    if args.blank:
-        # Replace text="..." with text=""
-        xml = re.sub(r'\btext="[^"]*"', 'text=""', xml)
+    translations = {}
+    old_sources = {}
+    old_fuzzy = {}
+    if args.merge and out.exists():
+        translations = parse_strings(out).texts()
+        old_sources = read_sources(out) or {}
+        old_fuzzy = read_sources(out, "fuzzy") or {}
+
+    xml, sources, fuzzy, counts = merge(xml, english, translations, old_sources, old_fuzzy, args.blank)
 
-    out = Path(args.output)
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(xml, encoding="utf-8")
+    with atomic_write(out) as f:
+        f.write(xml)
+    write_sources(out, sources, fuzzy)
     print(f"Wrote: {out}")
+    if args.merge:
+        removed = len(translations.keys() - english.keys())
+        print(f"  {counts['kept']} kept, {counts['fuzzy']} fuzzy, {counts['reviewed']} reviewed, "
+              f"{counts['updated']} updated, {counts['new']} new, {removed} removed")
 
 
 if __name__ == "__main__":
     main()
-
-
@@ -8,14 +8,118 @@ Provides fix recommendations and examples for each issue type.
 Usage:
     python Tools/Validation/analyze_validation.py [path/to/report.txt]
     (defaults to Tools/Debugging/validation_report.txt)
+
+    Structured reports are read losslessly (no truncation, exact counts):
+    python Tools/Validation/validate_content.py --format ndjson | python Tools/Validation/analyze_validation.py -
+    python Tools/Validation/analyze_validation.py report.json     (or report.ndjson)
 """
 
+import json
 import re
 import sys
 from collections import defaultdict
 from pathlib import Path
 
 
+def _new_issue_buckets():
+    return {
+        'structure': defaultdict(list),
+        'reference': defaultdict(list),
+        'logic': defaultdict(list),
+        'consistency': defaultdict(list),
+        'style': defaultdict(list),
+        'completeness': defaultdict(list),
+        'project': defaultdict(list),
+        'config': defaultdict(list),
+        'code_quality': defaultdict(list),
+    }
+
+
+def categorize_issue(issues, category, file, event_id, message):
+    """File one issue into the actionable buckets used by print_analysis."""
+    # Categorize by type
+    if category == 'structure':
+        if 'Invalid option count: 1' in message:
+            issues['structure']['single_option'].append((file, event_id, message))
+        elif 'option count' in message:
+            issues['structure']['invalid_option_count'].append((file, event_id, message))
+        elif 'tooltip' in message.lower():
+            issues['structure']['tooltip_issues'].append((file, event_id, message))
+        else:
+            issues['structure']['other'].append((file, event_id, message))
+    
+    elif category == 'reference':
+        if 'not found in enlisted_strings.xml' in message:
+            # For C# files, event_id is the string_id; for JSON, extract from message
+            if file.endswith('.cs'):
+                string_id = event_id
+            else:
+                string_match = re.search(r"'([^']+)' not found", message)
+                string_id = string_match.group(1) if string_match else 'unknown'
+            issues['reference']['missing_strings'].append((file, event_id, string_id))
+    
+    elif category == 'logic':
+        # SAFETY: Use flexible pattern matching instead of exact strings
+        message_lower = message.lower()
+        if 'skillxp' in message_lower or 'xp' in message_lower and 'grant' in message_lower:
+            issues['logic']['missing_order_xp'].append((file, event_id, message))
+        elif 'tier' in message_lower and 'role' in message_lower:
+            issues['logic']['tier_role_mismatch'].append((file, event_id, message))
+        elif 'cooldown' in message_lower:
+            issues['logic']['cooldown_issues'].append((file, event_id, message))
+        else:
+            # SAFETY: Capture unrecognized logic issues for review
+            issues['logic']['other'].append((file, event_id, message))
+    
+    elif category == 'consistency':
+        issues['consistency']['flags'].append((file, event_id, message))
+    
+    elif category == 'style':
+        message_lower = message.lower()
+        if 'hint' in message_lower and 'long' in message_lower:
+            issues['style']['long_hints'].append((file, event_id, message))
+        elif 'hint' in message_lower and 'placeholder' in message_lower:
+            issues['style']['hints_no_placeholders'].append((file, event_id, message))
+        elif 'hint' in message_lower and 'ui text' in message_lower:
+            issues['style']['hints_ui_style'].append((file, event_id, message))
+        else:
+            issues['style']['other'].append((file, event_id, message))
+    
+    elif category == 'completeness':
+        if 'missing hints' in message.lower():
+            issues['completeness']['missing_hints'].append((file, event_id, message))
+        else:
+            issues['completeness']['other'].append((file, event_id, message))
+    
+    elif category == 'project':
+        message_lower = message.lower()
+        if 'not in .csproj' in message_lower or 'not in csproj' in message_lower:
+            issues['project']['missing_from_csproj'].append((file, event_id, message))
+        elif 'does not exist' in message_lower:
+            issues['project']['orphaned_in_csproj'].append((file, event_id, message))
+        elif 'content directory' in message_lower and 'no itemgroup' in message_lower:
+            issues['project']['content_not_deployed'].append((file, event_id, message))
+        elif 'itemgroup' in message_lower and 'no copy command' in message_lower:
+            issues['project']['content_not_deployed'].append((file, event_id, message))
+        elif 'rogue file' in message_lower:
+            issues['project']['rogue_files'].append((file, event_id, message))
+        elif 'unexpected directory' in message_lower:
+            issues['project']['rogue_dirs'].append((file, event_id, message))
+        elif 'gui asset' in message_lower:
+            issues['project']['gui_missing'].append((file, event_id, message))
+        else:
+            issues['project']['other'].append((file, event_id, message))
+    
+    elif category == 'config':
+        issues['config']['errors'].append((file, event_id, message))
+    
+    elif category == 'code_quality':
+        if 'IsCurrentlyAtSea' in message:
+            issues['code_quality']['sea_context'].append((file, event_id, message))
+        else:
+            issues['code_quality']['other'].append((file, event_id, message))
+
+
 def parse_validation_report(report_path: str):
     """Parse validation report and categorize issues."""
     
@@ -45,18 +149,7 @@ def parse_validation_report(report_path: str):
     truncation_match = re.search(r'\.\.\. and (\d+) more warnings', content)
     is_truncated = truncation_match is not None
     
-    # Categorize issues
-    issues = {
-        'structure': defaultdict(list),
-        'reference': defaultdict(list),
-        'logic': defaultdict(list),
-        'consistency': defaultdict(list),
-        'style': defaultdict(list),
-        'completeness': defaultdict(list),
-        'project': defaultdict(list),
-        'config': defaultdict(list),
-        'code_quality': defaultdict(list),
-    }
+    issues = _new_issue_buckets()
     
     # Parse issue lines
     for line in content.split('\n'):
@@ -69,88 +162,7 @@ def parse_validation_report(report_path: str):
             continue
         
         severity, file, event_id, category, message = match.groups()
-        
-        # Categorize by type
-        if category == 'structure':
-            if 'Invalid option count: 1' in message:
-                issues['structure']['single_option'].append((file, event_id, message))
-            elif 'option count' in message:
-                issues['structure']['invalid_option_count'].append((file, event_id, message))
-            elif 'tooltip' in message.lower():
-                issues['structure']['tooltip_issues'].append((file, event_id, message))
-            else:
-                issues['structure']['other'].append((file, event_id, message))
-        
-        elif category == 'reference':
-            if 'not found in enlisted_strings.xml' in message:
-                # For C# files, event_id is the string_id; for JSON, extract from message
-                if file.endswith('.cs'):
-                    string_id = event_id
-                else:
-                    string_match = re.search(r"'([^']+)' not found", message)
-                    string_id = string_match.group(1) if string_match else 'unknown'
-                issues['reference']['missing_strings'].append((file, event_id, string_id))
-        
-        elif category == 'logic':
-            # SAFETY: Use flexible pattern matching instead of exact strings
-            message_lower = message.lower()
-            if 'skillxp' in message_lower or 'xp' in message_lower and 'grant' in message_lower:
-                issues['logic']['missing_order_xp'].append((file, event_id, message))
-            elif 'tier' in message_lower and 'role' in message_lower:
-                issues['logic']['tier_role_mismatch'].append((file, event_id, message))
-            elif 'cooldown' in message_lower:
-                issues['logic']['cooldown_issues'].append((file, event_id, message))
-            else:
-                # SAFETY: Capture unrecognized logic issues for review
-                issues['logic']['other'].append((file, event_id, message))
-        
-        elif category == 'consistency':
-            issues['consistency']['flags'].append((file, event_id, message))
-        
-        elif category == 'style':
-            message_lower = message.lower()
-            if 'hint' in message_lower and 'long' in message_lower:
-                issues['style']['long_hints'].append((file, event_id, message))
-            elif 'hint' in message_lower and 'placeholder' in message_lower:
-                issues['style']['hints_no_placeholders'].append((file, event_id, message))
-            elif 'hint' in message_lower and 'ui text' in message_lower:
-                issues['style']['hints_ui_style'].append((file, event_id, message))
-            else:
-                issues['style']['other'].append((file, event_id, message))
-        
-        elif category == 'completeness':
-            if 'missing hints' in message.lower():
-                issues['completeness']['missing_hints'].append((file, event_id, message))
-            else:
-                issues['completeness']['other'].append((file, event_id, message))
-        
-        elif category == 'project':
-            message_lower = message.lower()
-            if 'not in .csproj' in message_lower or 'not in csproj' in message_lower:
-                issues['project']['missing_from_csproj'].append((file, event_id, message))
-            elif 'does not exist' in message_lower:
-                issues['project']['orphaned_in_csproj'].append((file, event_id, message))
-            elif 'content directory' in message_lower and 'no itemgroup' in message_lower:
-                issues['project']['content_not_deployed'].append((file, event_id, message))
-            elif 'itemgroup' in message_lower and 'no copy command' in message_lower:
-                issues['project']['content_not_deployed'].append((file, event_id, message))
-            elif 'rogue file' in message_lower:
-                issues['project']['rogue_files'].append((file, event_id, message))
-            elif 'unexpected directory' in message_lower:
-                issues['project']['rogue_dirs'].append((file, event_id, message))
-            elif 'gui asset' in message_lower:
-                issues['project']['gui_missing'].append((file, event_id, message))
-            else:
-                issues['project']['other'].append((file, event_id, message))
-        
-        elif category == 'config':
-            issues['config']['errors'].append((file, event_id, message))
-        
-        elif category == 'code_quality':
-            if 'IsCurrentlyAtSea' in message:
-                issues['code_quality']['sea_context'].append((file, event_id, message))
-            else:
-                issues['code_quality']['other'].append((file, event_id, message))
+        categorize_issue(issues, category, file, event_id, message)
     
     return {
         'stats': {
@@ -167,58 +179,106 @@ def parse_validation_report(report_path: str):
     }
 
 
-def print_analysis(data):
-    """Print analysis report."""
+def parse_structured_report(text: str):
+    """
+    Parse validate_content.py --format json or ndjson output.
+    
+    Every issue is present (no truncation) and the summary counts are exact.
+    """
+    stripped = text.lstrip()
+    if stripped.startswith('{') and '"issues"' in stripped[:200]:
+        document = json.loads(text)
+        records = document.get('issues', [])
+        summary = document.get('summary', {})
+    else:
+        records, summary = [], {}
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get('type') == 'summary':
+                summary = record
+            elif record.get('type') == 'issue':
+                records.append(record)
+    return analyze_issue_records(records, summary)
+
+
+def analyze_issue_records(records, summary):
+    """Categorize structured issue records (dicts with severity/category/message/file/event_id)."""
+    issues = _new_issue_buckets()
+    for record in records:
+        # Same file/event keys the text report shows ("name.json:event_id")
+        file = Path(record.get('file') or '').name
+        categorize_issue(issues, record['category'], file, record.get('event_id') or '', record['message'])
+    
+    by_category = summary.get('by_category', {})
+    return {
+        'stats': {
+            'events': summary.get('total_events', 0),
+            'errors': summary.get('errors', 0),
+            'warnings': summary.get('warnings', 0),
+            'warning_reference': by_category.get('warning_reference', 0),
+            'warning_code_quality': by_category.get('warning_code_quality', 0),
+            'warning_structure': by_category.get('warning_structure', 0),
+            'warning_consistency': by_category.get('warning_consistency', 0),
+            'is_truncated': False,
+        },
+        'issues': issues
+    }
+
+
+def print_analysis(data, out=None):
+    """Print analysis report (to `out`, default sys.stdout)."""
     
-    print("=" * 80)
-    print("VALIDATION ANALYSIS - ACTIONABLE SUMMARY")
-    print("=" * 80)
-    print(f"\nTotal Events: {data['stats']['events']}")
-    print(f"Errors: {data['stats']['errors']}")
-    print(f"Warnings: {data['stats']['warnings']}")
-    print()
+    print("=" * 80, file=out)
+    print("VALIDATION ANALYSIS - ACTIONABLE SUMMARY", file=out)
+    print("=" * 80, file=out)
+    print(f"\nTotal Events: {data['stats']['events']}", file=out)
+    print(f"Errors: {data['stats']['errors']}", file=out)
+    print(f"Warnings: {data['stats']['warnings']}", file=out)
+    print(file=out)
     
     # Structure Issues
-    print("=" * 80)
-    print("STRUCTURE ISSUES")
-    print("=" * 80)
+    print("=" * 80, file=out)
+    print("STRUCTURE ISSUES", file=out)
+    print("=" * 80, file=out)
     
     single_opt = data['issues']['structure']['single_option']
     if single_opt:
-        print(f"\n[CRITICAL] Single Option Events ({len(single_opt)}):")
-        print("Events must have 0 options (dynamic) or 2-6 options (player choice)")
+        print(f"\n[CRITICAL] Single Option Events ({len(single_opt)}):", file=out)
+        print("Events must have 0 options (dynamic) or 2-6 options (player choice)", file=out)
         for file, event_id, msg in single_opt[:5]:
-            print(f"  - {file}:{event_id}")
-        print("\nFIX: Add a second option OR set options: [] if dynamically generated")
+            print(f"  - {file}:{event_id}", file=out)
+        print("\nFIX: Add a second option OR set options: [] if dynamically generated", file=out)
     
     tooltip = data['issues']['structure']['tooltip_issues']
     if tooltip:
-        print(f"\n[HIGH] Tooltip Issues ({len(tooltip)}):")
+        print(f"\n[HIGH] Tooltip Issues ({len(tooltip)}):", file=out)
         long_tooltips = [t for t in tooltip if 'long' in t[2].lower()]
         missing_tooltips = [t for t in tooltip if 'missing' in t[2].lower()]
         
         if long_tooltips:
-            print(f"  Long Tooltips ({len(long_tooltips)}) - Should be <80 chars:")
+            print(f"  Long Tooltips ({len(long_tooltips)}) - Should be <80 chars:", file=out)
             for file, event_id, msg in long_tooltips[:5]:
                 length = re.search(r'(\d+) chars', msg)
                 length_str = f" ({length.group(1)} chars)" if length else ""
-                print(f"    - {file}:{event_id}{length_str}")
+                print(f"    - {file}:{event_id}{length_str}", file=out)
         
         if missing_tooltips:
-            print(f"  Missing Tooltips ({len(missing_tooltips)}):")
+            print(f"  Missing Tooltips ({len(missing_tooltips)}):", file=out)
             for file, event_id, msg in missing_tooltips[:5]:
-                print(f"    - {file}:{event_id}")
+                print(f"    - {file}:{event_id}", file=out)
     
     # Logic Issues
-    print("\n" + "=" * 80)
-    print("LOGIC ISSUES")
-    print("=" * 80)
+    print("\n" + "=" * 80, file=out)
+    print("LOGIC ISSUES", file=out)
+    print("=" * 80, file=out)
     
     missing_xp = data['issues']['logic']['missing_order_xp']
     if missing_xp:
-        print(f"\n[HIGH] Missing Order XP ({len(missing_xp)}):")
-        print("Order events MUST grant skillXp - players expect XP for completing orders")
-        print("\nAffected files:")
+        print(f"\n[HIGH] Missing Order XP ({len(missing_xp)}):", file=out)
+        print("Order events MUST grant skillXp - players expect XP for completing orders", file=out)
+        print("\nAffected files:", file=out)
         files = defaultdict(list)
         for file, event_id, msg in missing_xp:
             opt_match = re.search(r"option '([^']+)'", msg)
@@ -226,39 +286,39 @@ def print_analysis(data):
             files[file].append(f"{event_id}:{opt_id}")
         
         for file, events in sorted(files.items())[:10]:
-            print(f"  {file}:")
+            print(f"  {file}:", file=out)
             for evt in events[:3]:
-                print(f"    - {evt}")
+                print(f"    - {evt}", file=out)
             if len(events) > 3:
-                print(f"    ... and {len(events) - 3} more")
+                print(f"    ... and {len(events) - 3} more", file=out)
         
-        print("\nFIX: Add skillXp to effects:")
-        print('  "effects": {')
-        print('    "skillXp": { "Tactics": 12 }  // Adjust skill and amount based on order type')
-        print('  }')
+        print("\nFIX: Add skillXp to effects:", file=out)
+        print('  "effects": {', file=out)
+        print('    "skillXp": { "Tactics": 12 }  // Adjust skill and amount based on order type', file=out)
+        print('  }', file=out)
     
     tier_role = data['issues']['logic']['tier_role_mismatch']
     if tier_role:
-        print(f"\n[MEDIUM] Tier×Role Mismatches ({len(tier_role)}):")
+        print(f"\n[MEDIUM] Tier×Role Mismatches ({len(tier_role)}):", file=out)
         for file, event_id, msg in tier_role[:5]:
-            print(f"  - {file}:{event_id}")
-            print(f"    {msg}")
+            print(f"  - {file}:{event_id}", file=out)
+            print(f"    {msg}", file=out)
     
     # SAFETY: Report unrecognized logic issues
     other_logic = data['issues']['logic']['other']
     if other_logic:
-        print(f"\n[INFO] Other Logic Issues ({len(other_logic)}):")
-        print("These issues don't match known patterns - review manually:")
+        print(f"\n[INFO] Other Logic Issues ({len(other_logic)}):", file=out)
+        print("These issues don't match known patterns - review manually:", file=out)
         for file, event_id, msg in other_logic[:5]:
-            print(f"  - {file}:{event_id}")
-            print(f"    {msg}")
+            print(f"  - {file}:{event_id}", file=out)
+            print(f"    {msg}", file=out)
         if len(other_logic) > 5:
-            print(f"  ... and {len(other_logic) - 5} more")
+            print(f"  ... and {len(other_logic) - 5} more", file=out)
     
     # Reference Issues
-    print("\n" + "=" * 80)
-    print("REFERENCE ISSUES (Missing Localization)")
-    print("=" * 80)
+    print("\n" + "=" * 80, file=out)
+    print("REFERENCE ISSUES (Missing Localization)", file=out)
+    print("=" * 80, file=out)
     
     missing_strings = data['issues']['reference']['missing_strings']
     total_reference_warnings = data['stats'].get('warning_reference', len(missing_strings))
@@ -266,10 +326,10 @@ def print_analysis(data):
     
     if missing_strings or total_reference_warnings > 0:
         if is_truncated:
-            print(f"\n[HIGH PRIORITY] Missing XML Strings (showing {len(missing_strings)} of {total_reference_warnings} total):")
-            print("  WARNING: Report truncated - run with --fix-refs to see all missing strings")
+            print(f"\n[HIGH PRIORITY] Missing XML Strings (showing {len(missing_strings)} of {total_reference_warnings} total):", file=out)
+            print("  WARNING: Report truncated - run with --fix-refs to see all missing strings", file=out)
         else:
-            print(f"\n[HIGH PRIORITY] Missing XML Strings ({len(missing_strings)}):")
+            print(f"\n[HIGH PRIORITY] Missing XML Strings ({len(missing_strings)}):", file=out)
         
         # Separate C# vs JSON files
         csharp_missing = [(f, e, s) for f, e, s in missing_strings if f.endswith('.cs')]
@@ -277,11 +337,11 @@ def print_analysis(data):
         
         # Estimate split if truncated (C# warnings appear first in validator output)
         if is_truncated and len(csharp_missing) == len(missing_strings):
-            print(f"\n  C# TextObject References: ~{total_reference_warnings} (exact count requires --fix-refs)")
-            print(f"  JSON Event References: (unknown - report truncated)")
+            print(f"\n  C# TextObject References: ~{total_reference_warnings} (exact count requires --fix-refs)", file=out)
+            print(f"  JSON Event References: (unknown - report truncated)", file=out)
         else:
-            print(f"\n  C# TextObject References: {len(csharp_missing)}")
-            print(f"  JSON Event References: {len(json_missing)}")
+            print(f"\n  C# TextObject References: {len(csharp_missing)}", file=out)
+            print(f"  JSON Event References: {len(json_missing)}", file=out)
         
         # Group by file
         by_file = defaultdict(lambda: defaultdict(list))
@@ -294,13 +354,13 @@ def print_analysis(data):
         csharp_files.sort(key=lambda x: -x[1])
         
         if csharp_files:
-            print("\n[USER-FACING] C# Files with Missing Localization:")
-            print("  These show fallback text in game - high priority to fix")
+            print("\n[USER-FACING] C# Files with Missing Localization:", file=out)
+            print("  These show fallback text in game - high priority to fix", file=out)
             for file, count in csharp_files[:10]:
-                print(f"    {file.ljust(40)} {count:3d} strings")
+                print(f"    {file.ljust(40)} {count:3d} strings", file=out)
             if len(csharp_files) > 10:
                 remaining = sum(c for _, c in csharp_files[10:])
-                print(f"    ... and {len(csharp_files) - 10} more files ({remaining} strings)")
+                print(f"    ... and {len(csharp_files) - 10} more files ({remaining} strings)", file=out)
         
         # Show JSON files
         json_files = [(f, sum(len(strings) for strings in events.values())) 
@@ -308,9 +368,9 @@ def print_analysis(data):
         json_files.sort(key=lambda x: -x[1])
         
         if json_files:
-            print("\n[CONTENT] JSON Events with Missing Strings:")
+            print("\n[CONTENT] JSON Events with Missing Strings:", file=out)
             for file, count in json_files[:5]:
-                print(f"    {file}: {count} missing strings")
+                print(f"    {file}: {count} missing strings", file=out)
         
         # Check for schema v1 files
         escalation = by_file.get('events_escalation_thresholds.json')
@@ -319,226 +379,226 @@ def print_analysis(data):
             for event_id, strings in list(escalation.items())[:2]:
                 sample_ids.extend(strings[:2])
             
-            print("\n[ACTION REQUIRED] events_escalation_thresholds.json:")
-            print("  This file uses SCHEMA V1 (deprecated) with 'll_evt_*' string IDs")
-            print(f"  Missing strings: {sum(len(s) for s in escalation.values())}")
-            print(f"  Sample IDs: {sample_ids[:3]}")
-            print("\n  RECOMMENDATION: Migrate to schema v2")
-            print("    1. Remove 'content' wrapper object")
-            print("    2. Move titleId/setupId to top level")
-            print("    3. Rename 'outcome' -> 'resultText'")
-            print("    4. Change string prefix: ll_evt_* -> evt_*")
-            print("    5. Run: python Tools/Validation/sync_event_strings.py")
-        
-        print("\nFIX OPTIONS:")
-        print("  1. Generate stub file: python Tools/Validation/validate_content.py --fix-refs")
-        print("     Creates _missing_strings.txt with all missing string entries")
-        print("  2. Review stubs and add proper localized text")
-        print("  3. Add to ModuleData/Languages/enlisted_strings.xml")
-        print("\nSee: Tools/Validation/VALIDATION_BASELINE.md for more details")
+            print("\n[ACTION REQUIRED] events_escalation_thresholds.json:", file=out)
+            print("  This file uses SCHEMA V1 (deprecated) with 'll_evt_*' string IDs", file=out)
+            print(f"  Missing strings: {sum(len(s) for s in escalation.values())}", file=out)
+            print(f"  Sample IDs: {sample_ids[:3]}", file=out)
+            print("\n  RECOMMENDATION: Migrate to schema v2", file=out)
+            print("    1. Remove 'content' wrapper object", file=out)
+            print("    2. Move titleId/setupId to top level", file=out)
+            print("    3. Rename 'outcome' -> 'resultText'", file=out)
+            print("    4. Change string prefix: ll_evt_* -> evt_*", file=out)
+            print("    5. Run: python Tools/Validation/sync_event_strings.py", file=out)
+        
+        print("\nFIX OPTIONS:", file=out)
+        print("  1. Generate stub file: python Tools/Validation/validate_content.py --fix-refs", file=out)
+        print("     Creates _missing_strings.txt with all missing string entries", file=out)
+        print("  2. Review stubs and add proper localized text", file=out)
+        print("  3. Add to ModuleData/Languages/enlisted_strings.xml", file=out)
+        print("\nSee: Tools/Validation/VALIDATION_BASELINE.md for more details", file=out)
     
     # Code Quality Issues
     code_quality = data['issues']['code_quality']
     if any(code_quality.values()):
-        print("\n" + "=" * 80)
-        print("CODE QUALITY ISSUES")
-        print("=" * 80)
+        print("\n" + "=" * 80, file=out)
+        print("CODE QUALITY ISSUES", file=out)
+        print("=" * 80, file=out)
         
         sea_context = code_quality.get('sea_context', [])
         if sea_context:
-            print(f"\n[ACCEPTABLE] IsCurrentlyAtSea Pattern ({len(sea_context)}):")
-            print("  These are low-priority usages per VALIDATION_BASELINE.md")
-            print("  Critical paths (ContentOrchestrator, WorldStateAnalyzer) already fixed")
+            print(f"\n[ACCEPTABLE] IsCurrentlyAtSea Pattern ({len(sea_context)}):", file=out)
+            print("  These are low-priority usages per VALIDATION_BASELINE.md", file=out)
+            print("  Critical paths (ContentOrchestrator, WorldStateAnalyzer) already fixed", file=out)
             
             # Group by file
             by_file = defaultdict(list)
             for file, line_num, msg in sea_context:
                 by_file[file].append(line_num)
             
-            print("\n  Files affected:")
+            print("\n  Files affected:", file=out)
             for file, lines in sorted(by_file.items(), key=lambda x: -len(x[1]))[:5]:
-                print(f"    {file}: {len(lines)} instances")
+                print(f"    {file}: {len(lines)} instances", file=out)
             
             if len(by_file) > 5:
                 total_remaining = sum(len(lines) for f, lines in list(by_file.items())[5:])
-                print(f"    ... and {len(by_file) - 5} more files ({total_remaining} instances)")
+                print(f"    ... and {len(by_file) - 5} more files ({total_remaining} instances)", file=out)
             
-            print("\n  Status: Acceptable technical debt (non-critical paths)")
+            print("\n  Status: Acceptable technical debt (non-critical paths)", file=out)
     
     # Consistency Issues
     consistency = data['issues']['consistency']['flags']
     if consistency:
-        print("\n" + "=" * 80)
-        print("CONSISTENCY ISSUES")
-        print("=" * 80)
-        print(f"\n[INFO] Flag Usage ({len(consistency)}):")
-        print("Terminal flags (set but never checked) are expected for end-of-chain events")
-        print(f"Review if needed: {len(consistency)} flag-related messages")
+        print("\n" + "=" * 80, file=out)
+        print("CONSISTENCY ISSUES", file=out)
+        print("=" * 80, file=out)
+        print(f"\n[INFO] Flag Usage ({len(consistency)}):", file=out)
+        print("Terminal flags (set but never checked) are expected for end-of-chain events", file=out)
+        print(f"Review if needed: {len(consistency)} flag-related messages", file=out)
     
     # Style Issues (Hints)
     style_issues = data['issues']['style']
     if any(style_issues.values()):
-        print("\n" + "=" * 80)
-        print("STYLE ISSUES (Opportunity Hints)")
-        print("=" * 80)
+        print("\n" + "=" * 80, file=out)
+        print("STYLE ISSUES (Opportunity Hints)", file=out)
+        print("=" * 80, file=out)
         
         long_hints = style_issues.get('long_hints', [])
         if long_hints:
-            print(f"\n[MEDIUM] Long Hints ({len(long_hints)}):")
-            print("Hints should be under 10 words for readability in Daily Brief")
+            print(f"\n[MEDIUM] Long Hints ({len(long_hints)}):", file=out)
+            print("Hints should be under 10 words for readability in Daily Brief", file=out)
             for file, event_id, msg in long_hints[:5]:
-                print(f"  - {file}:{event_id}")
-            print("\nFIX: Shorten to camp gossip style:")
-            print('  "hint": "{SOLDIER_NAME} mentioned drill tonight."')
+                print(f"  - {file}:{event_id}", file=out)
+            print("\nFIX: Shorten to camp gossip style:", file=out)
+            print('  "hint": "{SOLDIER_NAME} mentioned drill tonight."', file=out)
         
         no_placeholders = style_issues.get('hints_no_placeholders', [])
         if no_placeholders:
-            print(f"\n[LOW] Hints Without Placeholders ({len(no_placeholders)}):")
-            print("Camp rumors should use placeholders for personalization")
+            print(f"\n[LOW] Hints Without Placeholders ({len(no_placeholders)}):", file=out)
+            print("Camp rumors should use placeholders for personalization", file=out)
             for file, event_id, msg in no_placeholders[:5]:
-                print(f"  - {file}:{event_id}")
-            print("\nFIX: Add dynamic tokens:")
-            print('  "hint": "{VETERAN_1_NAME} mentioned a card game tonight."')
-            print("  Available: {SOLDIER_NAME}, {COMRADE_NAME}, {SERGEANT}, {SETTLEMENT_NAME}")
+                print(f"  - {file}:{event_id}", file=out)
+            print("\nFIX: Add dynamic tokens:", file=out)
+            print('  "hint": "{VETERAN_1_NAME} mentioned a card game tonight."', file=out)
+            print("  Available: {SOLDIER_NAME}, {COMRADE_NAME}, {SERGEANT}, {SETTLEMENT_NAME}", file=out)
         
         ui_style = style_issues.get('hints_ui_style', [])
         if ui_style:
-            print(f"\n[HIGH] UI-Style Hints ({len(ui_style)}):")
-            print("Hints should be narrative, not UI descriptions")
+            print(f"\n[HIGH] UI-Style Hints ({len(ui_style)}):", file=out)
+            print("Hints should be narrative, not UI descriptions", file=out)
             for file, event_id, msg in ui_style[:5]:
-                print(f"  - {file}:{event_id}")
-            print("\nFIX: Write as camp gossip, not system text:")
-            print('  BAD:  "Card game opportunity available at dusk"')
-            print('  GOOD: "{SOLDIER_NAME} is running cards tonight."')
+                print(f"  - {file}:{event_id}", file=out)
+            print("\nFIX: Write as camp gossip, not system text:", file=out)
+            print('  BAD:  "Card game opportunity available at dusk"', file=out)
+            print('  GOOD: "{SOLDIER_NAME} is running cards tonight."', file=out)
     
     # Completeness Issues
     completeness = data['issues']['completeness']
     if completeness.get('missing_hints'):
-        print("\n" + "=" * 80)
-        print("COMPLETENESS ISSUES")
-        print("=" * 80)
+        print("\n" + "=" * 80, file=out)
+        print("COMPLETENESS ISSUES", file=out)
+        print("=" * 80, file=out)
         missing = completeness['missing_hints']
-        print(f"\n[INFO] Opportunities Missing Hints ({len(missing)}):")
-        print("Opportunities without hints won't show foreshadowing in Daily Brief")
+        print(f"\n[INFO] Opportunities Missing Hints ({len(missing)}):", file=out)
+        print("Opportunities without hints won't show foreshadowing in Daily Brief", file=out)
         for file, event_id, msg in missing[:3]:
-            print(f"  - {msg}")
+            print(f"  - {msg}", file=out)
     
     # Project Structure Issues
     project_issues = data['issues']['project']
     if any(project_issues.values()):
-        print("\n" + "=" * 80)
-        print("PROJECT STRUCTURE ISSUES")
-        print("=" * 80)
+        print("\n" + "=" * 80, file=out)
+        print("PROJECT STRUCTURE ISSUES", file=out)
+        print("=" * 80, file=out)
         
         missing_csproj = project_issues.get('missing_from_csproj', [])
         if missing_csproj:
-            print(f"\n[CRITICAL] C# Files Missing from .csproj ({len(missing_csproj)}):")
-            print("These files exist in src/ but won't compile until added to .csproj")
+            print(f"\n[CRITICAL] C# Files Missing from .csproj ({len(missing_csproj)}):", file=out)
+            print("These files exist in src/ but won't compile until added to .csproj", file=out)
             for file, event_id, msg in missing_csproj[:10]:
                 # Extract file path from message
                 match = re.search(r'C# file not in .csproj: ([^\s]+)', msg)
                 if match:
                     cs_file = match.group(1)
                     csproj_path = cs_file.replace('/', '\\\\')
-                    print(f"  - {cs_file}")
+                    print(f"  - {cs_file}", file=out)
                 else:
-                    print(f"  - {msg}")
+                    print(f"  - {msg}", file=out)
             if len(missing_csproj) > 10:
-                print(f"  ... and {len(missing_csproj) - 10} more")
-            print("\nFIX: Add to Enlisted.csproj:")
-            print('  <Compile Include="src\\\\Features\\\\YourFile.cs"/>')
+                print(f"  ... and {len(missing_csproj) - 10} more", file=out)
+            print("\nFIX: Add to Enlisted.csproj:", file=out)
+            print('  <Compile Include="src\\\\Features\\\\YourFile.cs"/>', file=out)
         
         orphaned = project_issues.get('orphaned_in_csproj', [])
         if orphaned:
-            print(f"\n[CRITICAL] Files in .csproj That Don't Exist ({len(orphaned)}):")
-            print("These entries reference deleted/moved files - remove from .csproj")
+            print(f"\n[CRITICAL] Files in .csproj That Don't Exist ({len(orphaned)}):", file=out)
+            print("These entries reference deleted/moved files - remove from .csproj", file=out)
             for file, event_id, msg in orphaned[:10]:
-                print(f"  - {msg}")
-            print("\nFIX: Remove the <Compile Include=\"...\"/> entry from .csproj")
+                print(f"  - {msg}", file=out)
+            print("\nFIX: Remove the <Compile Include=\"...\"/> entry from .csproj", file=out)
         
         rogue_files = project_issues.get('rogue_files', [])
         if rogue_files:
-            print(f"\n[MEDIUM] Rogue Files in Root Directory ({len(rogue_files)}):")
-            print("These files clutter the root and should be organized per BLUEPRINT.md")
+            print(f"\n[MEDIUM] Rogue Files in Root Directory ({len(rogue_files)}):", file=out)
+            print("These files clutter the root and should be organized per BLUEPRINT.md", file=out)
             for file, event_id, msg in rogue_files[:10]:
-                print(f"  - {msg}")
+                print(f"  - {msg}", file=out)
             if len(rogue_files) > 10:
-                print(f"  ... and {len(rogue_files) - 10} more")
-            print("\nFIX: Move files to appropriate folders:")
-            print("  *.py → Tools/Research/ or Tools/Validation/")
-            print("  *.ps1 → Tools/Debugging/ or Tools/Steam/")
-            print("  *.md → docs/ or Tools/Debugging/")
-            print("  *.txt → Tools/Debugging/ or delete (if temporary)")
+                print(f"  ... and {len(rogue_files) - 10} more", file=out)
+            print("\nFIX: Move files to appropriate folders:", file=out)
+            print("  *.py → Tools/Research/ or Tools/Validation/", file=out)
+            print("  *.ps1 → Tools/Debugging/ or Tools/Steam/", file=out)
+            print("  *.md → docs/ or Tools/Debugging/", file=out)
+            print("  *.txt → Tools/Debugging/ or delete (if temporary)", file=out)
         
         rogue_dirs = project_issues.get('rogue_dirs', [])
         if rogue_dirs:
-            print(f"\n[MEDIUM] Unexpected Directories in Root ({len(rogue_dirs)}):")
+            print(f"\n[MEDIUM] Unexpected Directories in Root ({len(rogue_dirs)}):", file=out)
             for file, event_id, msg in rogue_dirs[:5]:
-                print(f"  - {msg}")
-            print("\nFIX: Review and relocate or delete these directories")
+                print(f"  - {msg}", file=out)
+            print("\nFIX: Review and relocate or delete these directories", file=out)
         
         content_not_deployed = project_issues.get('content_not_deployed', [])
         if content_not_deployed:
-            print(f"\n[CRITICAL] Content Directories Not Deployed ({len(content_not_deployed)}):")
-            print("These content folders exist in source but WON'T be copied to the game folder!")
-            print("Players will experience missing content (events won't fire, etc.)")
+            print(f"\n[CRITICAL] Content Directories Not Deployed ({len(content_not_deployed)}):", file=out)
+            print("These content folders exist in source but WON'T be copied to the game folder!", file=out)
+            print("Players will experience missing content (events won't fire, etc.)", file=out)
             for file, event_id, msg in content_not_deployed[:10]:
-                print(f"  - {msg}")
-            print("\nFIX: Add three things to Enlisted.csproj:")
-            print("  1. ItemGroup: <YourDataName Include=\"path\\\\to\\\\*.json\"/>")
-            print("  2. MakeDir:   <MakeDir Directories=\"$(OutputPath)..\\\\..\\\\path\\\\to\\\\\"/>")
-            print("  3. Copy:      <Copy SourceFiles=\"@(YourDataName)\" DestinationFolder=\"...\"/>")
-            print("\nExample for order_events:")
-            print("  <OrderEventsData Include=\"ModuleData\\\\Enlisted\\\\Orders\\\\order_events\\\\*.json\"/>")
+                print(f"  - {msg}", file=out)
+            print("\nFIX: Add three things to Enlisted.csproj:", file=out)
+            print("  1. ItemGroup: <YourDataName Include=\"path\\\\to\\\\*.json\"/>", file=out)
+            print("  2. MakeDir:   <MakeDir Directories=\"$(OutputPath)..\\\\..\\\\path\\\\to\\\\\"/>", file=out)
+            print("  3. Copy:      <Copy SourceFiles=\"@(YourDataName)\" DestinationFolder=\"...\"/>", file=out)
+            print("\nExample for order_events:", file=out)
+            print("  <OrderEventsData Include=\"ModuleData\\\\Enlisted\\\\Orders\\\\order_events\\\\*.json\"/>", file=out)
         
         gui_missing = project_issues.get('gui_missing', [])
         if gui_missing:
-            print(f"\n[LOW] GUI Assets Not in .csproj ({len(gui_missing)}):")
-            print("These GUI files won't be copied during build")
+            print(f"\n[LOW] GUI Assets Not in .csproj ({len(gui_missing)}):", file=out)
+            print("These GUI files won't be copied during build", file=out)
             for file, event_id, msg in gui_missing[:5]:
-                print(f"  - {msg}")
-            print("\nFIX: Add to .csproj <ItemGroup> for GUI assets:")
-            print('  <Content Include="GUI\\\\Prefabs\\\\YourFile.xml"/>')
+                print(f"  - {msg}", file=out)
+            print("\nFIX: Add to .csproj <ItemGroup> for GUI assets:", file=out)
+            print('  <Content Include="GUI\\\\Prefabs\\\\YourFile.xml"/>', file=out)
     
     # Summary
-    print("\n" + "=" * 80)
-    print("PRIORITY FIX ORDER")
-    print("=" * 80)
-    print("\n1. [CRITICAL] Fix content directories not deployed (players get missing content!)")
-    print("2. [CRITICAL] Fix C# files missing from .csproj (won't compile)")
-    print("3. [CRITICAL] Remove orphaned .csproj entries (build errors)")
-    print("4. [CRITICAL] Fix single-option events (blocks validation)")
-    print("5. [HIGH] Add C# TextObject localization strings (user-facing fallback text)")
-    print("6. [HIGH] Add missing order XP (player-facing issue)")
-    print("7. [HIGH] Fix long tooltips (UX issue)")
-    print("8. [HIGH] Fix UI-style hints (immersion issue)")
-    print("9. [MEDIUM] Clean up rogue root files (organization)")
-    print("10. [MEDIUM] Migrate schema v1 files to v2 (maintenance)")
-    print("11. [MEDIUM] Shorten long hints (readability)")
-    print("12. [LOW] Add JSON event localization strings (as content is completed)")
-    print("13. [LOW] Add placeholders to hints (personalization)")
-    print("\n" + "=" * 80)
-    print("DISCOVERED ISSUES")
-    print("=" * 80)
-    print("\nPhase 9 (C# TextObject validation) revealed:")
+    print("\n" + "=" * 80, file=out)
+    print("PRIORITY FIX ORDER", file=out)
+    print("=" * 80, file=out)
+    print("\n1. [CRITICAL] Fix content directories not deployed (players get missing content!)", file=out)
+    print("2. [CRITICAL] Fix C# files missing from .csproj (won't compile)", file=out)
+    print("3. [CRITICAL] Remove orphaned .csproj entries (build errors)", file=out)
+    print("4. [CRITICAL] Fix single-option events (blocks validation)", file=out)
+    print("5. [HIGH] Add C# TextObject localization strings (user-facing fallback text)", file=out)
+    print("6. [HIGH] Add missing order XP (player-facing issue)", file=out)
+    print("7. [HIGH] Fix long tooltips (UX issue)", file=out)
+    print("8. [HIGH] Fix UI-style hints (immersion issue)", file=out)
+    print("9. [MEDIUM] Clean up rogue root files (organization)", file=out)
+    print("10. [MEDIUM] Migrate schema v1 files to v2 (maintenance)", file=out)
+    print("11. [MEDIUM] Shorten long hints (readability)", file=out)
+    print("12. [LOW] Add JSON event localization strings (as content is completed)", file=out)
+    print("13. [LOW] Add placeholders to hints (personalization)", file=out)
+    print("\n" + "=" * 80, file=out)
+    print("DISCOVERED ISSUES", file=out)
+    print("=" * 80, file=out)
+    print("\nPhase 9 (C# TextObject validation) revealed:", file=out)
     
     total_ref = data['stats'].get('warning_reference', 0)
     visible_ref = len([m for m in data['issues']['reference']['missing_strings'] if m[0].endswith('.cs')])
     
     if data['stats'].get('is_truncated'):
-        print(f"  * ~{total_ref} missing C# localization strings (report truncated)")
+        print(f"  * ~{total_ref} missing C# localization strings (report truncated)", file=out)
     else:
-        print(f"  * {visible_ref} missing C# localization strings")
-    
-    print("  * These cause fallback text to display instead of proper localized strings")
-    print("  * Previously invisible until Phase 9 was added to validator")
-    print("  * See: Tools/Validation/VALIDATION_BASELINE.md section 5")
-    print("\nRecommendation:")
-    print("  Run: python Tools/Validation/validate_content.py --fix-refs")
-    print("  This generates _missing_strings.txt with all 293 unique missing strings")
-    print("  Review: _missing_strings.txt (contains stub XML entries)")
-    print("  Update: ModuleData/Languages/enlisted_strings.xml (add proper text)")
-    print()
+        print(f"  * {visible_ref} missing C# localization strings", file=out)
+    
+    print("  * These cause fallback text to display instead of proper localized strings", file=out)
+    print("  * Previously invisible until Phase 9 was added to validator", file=out)
+    print("  * See: Tools/Validation/VALIDATION_BASELINE.md section 5", file=out)
+    print("\nRecommendation:", file=out)
+    print("  Run: python Tools/Validation/validate_content.py --fix-refs", file=out)
+    print("  This generates _missing_strings.txt with all 293 unique missing strings", file=out)
+    print("  Review: _missing_strings.txt (contains stub XML entries)", file=out)
+    print("  Update: ModuleData/Languages/enlisted_strings.xml (add proper text)", file=out)
+    print(file=out)
 
 
 def main():
@@ -547,13 +607,21 @@ def main():
     else:
         report_path = 'Tools/Debugging/validation_report.txt'
 
+    if report_path == '-':
+        data = parse_structured_report(sys.stdin.read())
+        print_analysis(data)
+        return 0
+    
     if not Path(report_path).exists():
         print(f"Error: {report_path} not found")
         print("\nRun validation first:")
         print("  python Tools/Validation/validate_content.py > Tools/Debugging/validation_report.txt")
         return 1
     
-    data = parse_validation_report(report_path)
+    if Path(report_path).suffix in ('.json', '.ndjson'):
+        data = parse_structured_report(Path(report_path).read_text(encoding='utf-8-sig'))
+    else:
+        data = parse_validation_report(report_path)
     print_analysis(data)
     
     return 0
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Synthetic corpus generator and benchmark suite for the validation toolchain.
+
+Generates schema-valid content at multiples of the project's current volume
+(events, decisions, order events, opportunities, enlisted_strings.xml and C#
+files with TextObject references) in a scratch project tree, then times every
+validate_content.py phase (via --profile) and the sync/inject tools against it.
+Results are compared with a baseline recorded earlier on the same machine;
+any metric slower than the baseline by more than the threshold fails the run.
+
+Usage:
+    python Tools/Validation/benchmark_validation.py                    # 1x and 10x vs baseline
+    python Tools/Validation/benchmark_validation.py --scales 1,10,100  # include 100x
+    python Tools/Validation/benchmark_validation.py --save-baseline    # record a new baseline
+    python Tools/Validation/benchmark_validation.py --generate DIR --scales 10   # corpus only
+
+Options:
+    --scales LIST      Comma-separated volume multipliers (default: 1,10)
+    --repeat N         Runs per scale; the fastest run is kept (default: 3)
+    --threshold F      Allowed slowdown vs baseline, 0.25 = 25% (default: 0.25)
+    --baseline PATH    Baseline file (default: Tools/Validation/.cache/benchmark_baseline.json)
+    --save-baseline    Write this run's results as the new baseline
+    --keep             Keep the generated corpora (printed paths) for inspection
+    --generate DIR     Only write a corpus for the first scale into DIR
+
+The scratch tree is a copy of the project layout: Tools/Validation/*.py is copied
+into it, so the tools resolve paths, caches and snapshots inside the corpus and
+never touch the real ModuleData/. Timings are machine-specific, so the baseline
+lives in the gitignored .cache/ directory, and a baseline recorded on another
+machine (Python version, platform or CPU count) is reported but not compared.
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from xml.sax.saxutils import quoteattr
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+VALIDATION_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = VALIDATION_DIR / ".cache" / "benchmark_baseline.json"
+BASELINE_VERSION = 1
+
+# Differences below this many seconds are treated as noise, whatever the ratio
+NOISE_FLOOR_S = 0.05
+
+SKILLS = ["OneHanded", "Polearm", "Bow", "Riding", "Athletics", "Scouting", "Tactics",
+          "Roguery", "Charm", "Leadership", "Stewardship", "Medicine", "Engineering"]
+CATEGORIES = ["escalation", "role", "universal", "general", "training", "pay", "crisis"]
+ROLES = ["Any", "Scout", "Medic", "Engineer", "Soldier"]
+WORLD_STATES = ["peacetime_garrison", "war_marching", "war_active_campaign", "siege_attacking"]
+OPPORTUNITY_TYPES = ["training", "social", "economic", "recovery"]
+DAY_PHASES = ["Dawn", "Midday", "Dusk", "Night"]
+WORDS = ("the sergeant watches the line as rain soaks the camp and the men mutter "
+         "about pay rations horses and the long road north").split()
+
+
+# ============================================================================
+# Corpus generation
+# ============================================================================
+
+def _count_events(pattern: str, key: str = "events") -> int:
+    total = 0
+    for path in glob.glob(str(PROJECT_ROOT / pattern), recursive=True):
+        try:
+            with open(path, encoding="utf-8-sig") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+        items = data if isinstance(data, list) else (data.get(key) or []) if isinstance(data, dict) else []
+        total += len(items)
+    return total
+
+
+def measure_volume() -> Dict[str, int]:
+    """Current project content volume - the 1x reference for synthetic corpora."""
+    from localization_index import load_index
+
+    cs_files = list((PROJECT_ROOT / "src").rglob("*.cs"))
+    textobjects = 0
+    for path in cs_files:
+        textobjects += path.read_text(encoding="utf-8-sig", errors="replace").count("TextObject(\"{=")
+    xml_path = PROJECT_ROOT / "ModuleData" / "Languages" / "enlisted_strings.xml"
+    return {
+        "events": _count_events("ModuleData/Enlisted/Events/**/*.json"),
+        "decisions": (_count_events("ModuleData/Enlisted/Decisions/**/*.json")
+                      - _count_events("ModuleData/Enlisted/Decisions/camp_opportunities*.json", "opportunities")),
+        "order_events": _count_events("ModuleData/Enlisted/Orders/order_events/**/*.json"),
+        "opportunities": _count_events("ModuleData/Enlisted/Decisions/camp_opportunities*.json", "opportunities"),
+        "strings": len(load_index(xml_path)) if xml_path.exists() else 0,
+        "cs_files": len(cs_files),
+        "textobjects": textobjects,
+    }
+
+
+class CorpusBuilder:
+    """Writes one synthetic project tree."""
+
+    # Roughly the real files' density
+    EVENTS_PER_FILE = 15
+
+    def __init__(self, root: Path, seed: int):
+        self.root = root
+        self.rng = random.Random(seed)
+        self.strings: Dict[str, str] = {}
+        self.flags: List[str] = []
+
+    def _text(self, words: int) -> str:
+        return " ".join(self.rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+    def _string(self, string_id: str, text: str, missing_rate: float = 0.03) -> str:
+        """Register a localized string; a few are left out of the XML on purpose."""
+        if self.rng.random() >= missing_rate:
+            self.strings[string_id] = text
+        return string_id
+
+    def _option(self, event_id: str, index: int, order: bool) -> Dict[str, Any]:
+        opt_id = f"opt{index}"
+        text = self._text(5)
+        option: Dict[str, Any] = {"id": opt_id, "textId": self._string(f"{event_id}_{opt_id}", text)}
+        # ~10% of options lack fallback text so inject_fallback_text has work to do
+        if self.rng.random() >= 0.1:
+            option["text"] = text
+        if not order:
+            option["tooltip"] = self._text(8)[:90]
+        effects: Dict[str, Any] = {"skillXp": {self.rng.choice(SKILLS): self.rng.randint(5, 30)}}
+        if self.rng.random() < 0.15:
+            flag = f"bench_flag_{len(self.flags)}"
+            self.flags.append(flag)
+            effects["setFlags"] = [flag]
+        option["effects"] = effects
+        if self.rng.random() < 0.3:
+            option["skillCheck"] = {"skill": self.rng.choice(SKILLS), "difficulty": self.rng.randint(20, 60)}
+        result = self._text(12)
+        option["resultTextId"] = self._string(f"{event_id}_{opt_id}_result", result)
+        option["resultText"] = result
+        return option
+
+    def _event(self, event_id: str, order_type: Optional[str] = None) -> Dict[str, Any]:
+        title, setup = self._text(3), self._text(25)
+        event: Dict[str, Any] = {"id": event_id}
+        if order_type:
+            event.update({"order_type": order_type, "category": "order_event",
+                          "severity": self.rng.choice(["normal", "attention", "urgent"])})
+        else:
+            event["category"] = "decision" if event_id.startswith("dec_") else self.rng.choice(CATEGORIES)
+        event.update({
+            "titleId": self._string(f"{event_id}_title", title), "title": title,
+            "setupId": self._string(f"{event_id}_setup", setup), "setup": setup,
+        })
+        if order_type:
+            event["requirements"] = {"world_state": self.rng.sample(WORLD_STATES, 2)}
+        else:
+            role = self.rng.choice(ROLES)
+            event["requirements"] = {"tier": {"min": 1 if role != "Officer" else 5, "max": 9}, "role": role}
+            if self.flags and self.rng.random() < 0.2:
+                event["triggers"] = {"all": ["is_enlisted", f"has_flag:{self.rng.choice(self.flags)}"]}
+            event["timing"] = {"cooldown_days": self.rng.randint(1, 7), "priority": "normal"}
+        event["options"] = [self._option(event_id, i, bool(order_type))
+                            for i in range(self.rng.randint(2, 4))]
+        return event
+
+    def _write_json(self, relative: str, data: Any):
+        path = self.root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+    def _write_event_files(self, directory: str, prefix: str, count: int, order: bool = False):
+        for file_index in range(0, count, self.EVENTS_PER_FILE):
+            events = []
+            order_type = f"order_bench_{file_index // self.EVENTS_PER_FILE}" if order else None
+            for i in range(file_index, min(count, file_index + self.EVENTS_PER_FILE)):
+                events.append(self._event(f"{prefix}{i}", order_type))
+            data: Dict[str, Any] = {"schemaVersion": 2, "events": events}
+            if order:
+                data["order_type"] = order_type
+            self._write_json(f"{directory}/{prefix}{file_index // self.EVENTS_PER_FILE:04d}.json", data)
+
+    def _write_opportunities(self, count: int):
+        opportunities = []
+        for i in range(count):
+            opp_id = f"opp_bench_{i}"
+            hint = f"{{SOLDIER_NAME}} mentioned {self.rng.choice(WORDS)} tonight."
+            opportunities.append({
+                "id": opp_id,
+                "type": self.rng.choice(OPPORTUNITY_TYPES),
+                "titleId": self._string(f"{opp_id}_title", self._text(3)), "title": self._text(3),
+                "hintId": self._string(f"{opp_id}_hint", hint), "hint": hint,
+                "targetDecision": f"dec_bench_{i}",
+                "validPhases": self.rng.sample(DAY_PHASES, 2),
+                "baseFitness": self.rng.randint(20, 80),
+            })
+        self._write_json("ModuleData/Enlisted/Decisions/camp_opportunities.json", {"opportunities": opportunities})
+
+    def _write_csharp(self, file_count: int, textobject_count: int):
+        string_ids = list(self.strings)
+        per_file = max(1, textobject_count // max(1, file_count))
+        compile_includes = []
+        for i in range(file_count):
+            lines = ["using TaleWorlds.Localization;", "", "namespace Enlisted.Bench", "{",
+                     f"    public static class BenchBehavior{i}", "    {",
+                     "        public static void Show(MobileParty party)", "        {"]
+            for j in range(per_file):
+                # Mostly existing IDs, a few unknown ones (Phase 9 warnings)
+                string_id = (self.rng.choice(string_ids) if string_ids and self.rng.random() > 0.05
+                             else f"bench_missing_{i}_{j}")
+                lines.append(f'            var t{j} = new TextObject("{{={string_id}}}{self._text(4)}");')
+            if i % 10 == 0:
+                lines += ["            if (party.CurrentSettlement == null && party.BesiegedSettlement == null && party.IsCurrentlyAtSea)",
+                          "            {", "                return;", "            }"]
+            lines += ["        }", "    }", "}", ""]
+            relative = f"src/Features/Bench/Bench{i // 100:02d}/BenchBehavior{i}.cs"
+            path = self.root / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("\n".join(lines), encoding="utf-8")
+            compile_includes.append(relative.replace("/", "\\"))
+
+        project = ['<?xml version="1.0" encoding="utf-8"?>',
+                   '<Project ToolsVersion="15.0" xmlns="http://schemas.microsoft.com/developer/msbuild/2003">',
+                   "  <ItemGroup>"]
+        project += [f'    <Compile Include="{include}"/>' for include in compile_includes]
+        project += ["  </ItemGroup>", "  <ItemGroup>",
+                    '    <OrderEventsData Include="ModuleData\\Enlisted\\Orders\\order_events\\*.json"/>',
+                    "  </ItemGroup>",
+                    '  <Target Name="AfterBuild">',
+                    '    <MakeDir Directories="$(OutputPath)..\\..\\ModuleData\\Enlisted\\Orders\\order_events\\"/>',
+                    '    <Copy SourceFiles="@(OrderEventsData)" DestinationFolder="$(OutputPath)..\\..\\ModuleData\\Enlisted\\Orders\\order_events\\"/>',
+                    "  </Target>", "</Project>", ""]
+        (self.root / "Enlisted.csproj").write_text("\n".join(project), encoding="utf-8")
+
+    def _write_strings(self, target_count: int):
+        # Pad with unrelated system strings up to the scaled table size
+        filler = 0
+        while len(self.strings) < target_count:
+            self.strings[f"menu_bench_{filler}"] = self._text(6)
+            filler += 1
+        lines = ['<?xml version="1.0" encoding="utf-8"?>',
+                 '<base xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" type="string">',
+                 "  <strings>"]
+        lines += [f"    <string id={quoteattr(string_id)} text={quoteattr(text)} />"
+                  for string_id, text in self.strings.items()]
+        lines += ["  </strings>", "</base>", ""]
+        path = self.root / "ModuleData" / "Languages" / "enlisted_strings.xml"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("\n".join(lines), encoding="utf-8")
+
+    def build(self, volume: Dict[str, int], scale: int):
+        self._write_event_files("ModuleData/Enlisted/Events", "evt_bench_", volume["events"] * scale)
+        self._write_event_files("ModuleData/Enlisted/Decisions", "dec_bench_", volume["decisions"] * scale)
+        self._write_event_files("ModuleData/Enlisted/Orders/order_events", "ord_bench_",
+                                volume["order_events"] * scale, order=True)
+        self._write_opportunities(volume["opportunities"] * scale)
+        self._write_csharp(volume["cs_files"] * scale, volume["textobjects"] * scale)
+        self._write_strings(volume["strings"] * scale)
+
+        # Configs are not content-scaled; Phases 6 and 9.5 run against the real ones
+        shutil.copytree(PROJECT_ROOT / "ModuleData" / "Enlisted" / "Config",
+                        self.root / "ModuleData" / "Enlisted" / "Config")
+        tools_dir = self.root / "Tools" / "Validation"
+        tools_dir.mkdir(parents=True, exist_ok=True)
+        # Scripts plus their data files (content_schema.json)
+        for script in [*VALIDATION_DIR.glob("*.py"), *VALIDATION_DIR.glob("*.json")]:
+            shutil.copy2(script, tools_dir / script.name)
+        (self.root / "Tools" / "README.md").write_text("# Tools\n", encoding="utf-8")
+
+
+def generate_corpus(root: Path, volume: Dict[str, int], scale: int, seed: int = 1):
+    CorpusBuilder(root, seed).build(volume, scale)
+
+
+# ============================================================================
+# Benchmark
+# ============================================================================
+
+def _run(corpus: Path, script: str, args: List[str]) -> float:
+    """Run a copied tool inside the corpus; returns wall seconds."""
+    started = time.perf_counter()
+    subprocess.run([sys.executable, str(corpus / "Tools" / "Validation" / script)] + args,
+                   cwd=str(corpus), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    return time.perf_counter() - started
+
+
+def benchmark_corpus(corpus: Path) -> Dict[str, float]:
+    """Time every validator phase and the sync/inject tools once."""
+    metrics: Dict[str, float] = {}
+    profile_path = corpus / "profile.json"
+    metrics["validate_content.process"] = _run(
+        corpus, "validate_content.py",
+        ["--no-cache", "--check-orphans", "--format", "ndjson", "--profile", str(profile_path)])
+    with open(profile_path, encoding="utf-8") as f:
+        profile = json.load(f)
+    for record in profile["phases"]:
+        metrics[f"phase_{record['phase']}"] = record["wall_s"]
+    metrics["validate_content.total"] = profile["total"]["wall_s"]
+    metrics["validate_content.peak_rss_mib"] = round((profile["total"]["peak_rss_bytes"] or 0) / 2 ** 20, 1)
+    metrics["sync_event_strings"] = _run(corpus, "sync_event_strings.py", ["--check"])
+    metrics["inject_fallback_text"] = _run(corpus, "inject_fallback_text.py", ["--dry-run", "--no-backup"])
+    return metrics
+
+
+def machine_info() -> Dict[str, Any]:
+    """What a baseline's timings depend on; baselines only compare on a matching machine."""
+    return {"python": platform.python_version(), "platform": platform.platform(), "cpu_count": os.cpu_count()}
+
+
+def run_benchmarks(scales: List[int], repeat: int, keep: bool) -> Dict[str, Any]:
+    volume = measure_volume()
+    results: Dict[str, Any] = {
+        "version": BASELINE_VERSION,
+        "machine": machine_info(),
+        "volume_1x": volume,
+        "scales": {},
+    }
+    for scale in scales:
+        corpus = Path(tempfile.mkdtemp(prefix=f"enlisted_bench_{scale}x_"))
+        print(f"[BENCH] Generating {scale}x corpus in {corpus}...")
+        generate_corpus(corpus, volume, scale)
+        best: Dict[str, float] = {}
+        for _ in range(repeat):
+            for name, value in benchmark_corpus(corpus).items():
+                best[name] = min(value, best.get(name, value))
+        results["scales"][str(scale)] = {k: round(v, 4) for k, v in best.items()}
+        if keep:
+            print(f"[BENCH] Kept corpus: {corpus}")
+        else:
+            shutil.rmtree(corpus, ignore_errors=True)
+    return results
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Metrics that got slower than baseline * (1 + threshold), beyond the noise floor."""
+    regressions = []
+    for scale, metrics in results["scales"].items():
+        base_metrics = baseline.get("scales", {}).get(scale)
+        if not base_metrics:
+            continue
+        for name, value in metrics.items():
+            base = base_metrics.get(name)
+            if base is None or name.endswith("peak_rss_mib"):
+                continue
+            if value > base * (1 + threshold) and value - base > NOISE_FLOOR_S:
+                regressions.append(f"{scale}x {name}: {base:.3f}s -> {value:.3f}s (+{(value / base - 1) * 100:.0f}%)"
+                                   if base else f"{scale}x {name}: {base:.3f}s -> {value:.3f}s")
+    return regressions
+
+
+def print_results(results: Dict[str, Any], baseline: Optional[Dict[str, Any]]):
+    scales = list(results["scales"])
+    names = list(dict.fromkeys(name for metrics in results["scales"].values() for name in metrics))
+    print()
+    print("=" * 80)
+    print("VALIDATION BENCHMARK" + (" (baseline in brackets)" if baseline else ""))
+    print("=" * 80)
+    print("  " + "metric".ljust(32) + "".join(f"{scale + 'x':>22}" for scale in scales))
+    for name in names:
+        row = "  " + name.ljust(32)
+        for scale in scales:
+            value = results["scales"][scale].get(name)
+            base = (baseline or {}).get("scales", {}).get(scale, {}).get(name)
+            cell = "-" if value is None else f"{value:.3f}"
+            if base is not None:
+                cell += f" [{base:.3f}]"
+            row += f"{cell:>22}"
+        print(row)
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the validation toolchain on synthetic corpora")
+    parser.add_argument("--scales", default="1,10", help="Comma-separated volume multipliers (default: 1,10)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scale; fastest is kept")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown vs baseline (0.25 = 25%%)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--keep", action="store_true", help="Keep generated corpora")
+    parser.add_argument("--generate", type=Path, metavar="DIR", help="Only generate a corpus into DIR")
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(",") if s.strip()]
+
+    if args.generate:
+        if args.generate.exists() and any(args.generate.iterdir()):
+            print(f"Error: {args.generate} is not empty")
+            return 1
+        generate_corpus(args.generate, measure_volume(), scales[0])
+        print(f"[BENCH] Wrote {scales[0]}x corpus to {args.generate}")
+        return 0
+
+    results = run_benchmarks(scales, max(1, args.repeat), args.keep)
+
+    baseline = None
+    if args.baseline.exists():
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("version") != BASELINE_VERSION:
+            print(f"[WARNING] Ignoring baseline with unknown version: {args.baseline}")
+            baseline = None
+        elif baseline.get("machine") != results["machine"]:
+            print(f"[WARNING] Ignoring baseline recorded on another machine: {args.baseline}")
+            print(f"  baseline: {baseline.get('machine')}")
+            print(f"  this run: {results['machine']}")
+            baseline = None
+
+    print_results(results, baseline)
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"[BENCH] Baseline saved to {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print("[BENCH] No baseline to compare against (run with --save-baseline)")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"[X] {len(regressions)} metric(s) regressed by more than {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print(f"[OK] No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
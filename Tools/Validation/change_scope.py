@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Change scope for validate_content.py --changed-since REV.
+
+Works out, from `git diff --name-only REV` (plus untracked files), which part of
+the project a set of changes can affect:
+
+- changed content files, and content files that depend on them:
+    - files referencing a string ID that was added to or removed from
+      enlisted_strings.xml since REV
+    - files setting, clearing or reading a flag whose setters, clearers or
+      readers changed
+- standalone phases to re-run (the same path -> phase map as --watch), with
+  Phase 9 only when C# files changed or C# TextObjects use a changed string ID
+- whether the cross-file checks (duplicate event IDs, flag consistency) are
+  needed: only when flag usage or the set of event IDs changed
+
+Dependents come from the persisted reference graph (reference_graph.py), so
+finding them does not require a full validation run. Issues are then reported
+only for files, flags, event IDs and string IDs inside the scope.
+"""
+
+import json
+import re
+import subprocess
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+from localization_index import LocalizationParseError, parse_strings
+from reference_graph import FLAG_CLEAR, FLAG_READ, FLAG_SET, STRING, extract_json_references, load_graph
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+LOCALIZATION_XML = "ModuleData/Languages/enlisted_strings.xml"
+FLAG_KINDS = (FLAG_SET, FLAG_CLEAR, FLAG_READ)
+
+_QUOTED_ID = re.compile(r"'([^']+)'")
+
+
+class ChangeScopeError(RuntimeError):
+    """git could not resolve the revision or list the changes."""
+
+
+def _git(*args: str) -> bytes:
+    try:
+        result = subprocess.run(["git", *args], capture_output=True, timeout=60, cwd=PROJECT_ROOT)
+    except (OSError, subprocess.SubprocessError) as e:
+        raise ChangeScopeError(f"git {args[0]} failed: {e}")
+    if result.returncode != 0:
+        raise ChangeScopeError(result.stderr.decode("utf-8", "replace").strip() or f"git {args[0]} failed")
+    return result.stdout
+
+
+def git_changed_paths(revision: str) -> Set[str]:
+    """Paths (posix, relative to the project root) changed since revision, including untracked files."""
+    try:
+        _git("rev-parse", "--verify", "--quiet", f"{revision}^{{commit}}")
+    except ChangeScopeError:
+        raise ChangeScopeError(f"unknown revision '{revision}'")
+    changed = _git("diff", "--name-only", "--relative", revision, "--").decode("utf-8").splitlines()
+    untracked = _git("ls-files", "--others", "--exclude-standard").decode("utf-8").splitlines()
+    return {path for path in changed + untracked if path}
+
+
+def git_show(revision: str, path: str) -> Optional[bytes]:
+    """Contents of path at revision, or None if it did not exist there."""
+    try:
+        return _git("show", f"{revision}:./{path}")
+    except ChangeScopeError:
+        return None
+
+
+def _top_level_ids(text: Optional[str]) -> Set[str]:
+    """Event/decision IDs defined by a content file's text."""
+    if not text:
+        return set()
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        return set()
+    items = data if isinstance(data, list) else (data.get("events") or []) if isinstance(data, dict) else []
+    return {item["id"] for item in items if isinstance(item, dict) and isinstance(item.get("id"), str)}
+
+
+class ChangeScope:
+    """What a --changed-since run validates and reports."""
+
+    def __init__(self, revision: str, changed_paths: Set[str]):
+        self.revision = revision
+        self.changed_paths = changed_paths
+        # Content files (posix) to run Phases 1-4 on
+        self.content_files: Set[str] = set()
+        # Files whose issues are reported
+        self.report_files: Set[str] = set(changed_paths)
+        self.phases: Set[str] = set()
+        # String IDs added to or removed from the XML since revision
+        self.string_ids: Set[str] = set()
+        # Flags whose setters/clearers/readers changed
+        self.flags: Set[str] = set()
+        # Event IDs added or removed by changed content
+        self.changed_event_ids: Set[str] = set()
+        # Event IDs defined by in-scope content (filled in after Phases 1-4)
+        self.event_ids: Set[str] = set()
+        self.cross_file = False
+        self.orphans = False
+        self.dependents = 0
+
+    @classmethod
+    def compute(cls, revision: str, session) -> "ChangeScope":
+        """Resolve the scope against a session whose localization and file lists are loaded."""
+        scope = cls(revision, git_changed_paths(revision))
+        _, phases, xml_changed = session.affected_phases(scope.changed_paths)
+        content_posix = {Path(f).as_posix() for f in session.content_files}
+        opportunity_posix = {Path(f).as_posix() for f in session.opportunity_files}
+        changed_content = {p for p in scope.changed_paths
+                           if p.startswith("ModuleData/Enlisted/") and p.endswith(".json")
+                           and (p in content_posix or p not in opportunity_posix and not (PROJECT_ROOT / p).exists())}
+
+        # affected_phases() is built for --watch: narrow its XML and content rules
+        phases.discard("5.5")
+        phases.discard("9")
+        if any(p in opportunity_posix for p in scope.changed_paths):
+            phases.add("5.5")
+        if any(p.startswith("src/") and p.endswith(".cs") for p in scope.changed_paths):
+            phases.add("9")
+        scope.content_files = {p for p in changed_content if p in content_posix}
+
+        graph = load_graph()
+        if xml_changed:
+            scope.orphans = True
+            old_xml = git_show(revision, LOCALIZATION_XML)
+            try:
+                old_ids = set(parse_strings(Path(LOCALIZATION_XML), old_xml).ids()) if old_xml else set()
+            except LocalizationParseError:
+                old_ids = set()
+            scope.string_ids = old_ids ^ session.localization_ids
+            for ref in scope._references(graph, scope.string_ids, (STRING,)):
+                if ref.file in content_posix:
+                    scope._add_dependent(ref.file)
+                elif ref.file in opportunity_posix:
+                    phases.add("5.5")
+                elif ref.file.endswith(".cs"):
+                    phases.add("9")
+
+        for path in changed_content:
+            old = git_show(revision, path)
+            old_text = old.decode("utf-8-sig", "replace") if old is not None else None
+            new_flags = {(r.kind, r.target, r.source) for r in graph.references_from(path) if r.kind in FLAG_KINDS}
+            old_flags = set()
+            if old_text is not None:
+                old_flags = {(r.kind, r.target, r.source) for r in extract_json_references(Path(path), path, old_text)
+                             if r.kind in FLAG_KINDS}
+            # Only flags whose setters/clearers/readers actually changed
+            scope.flags.update(target for _, target, _ in old_flags ^ new_flags)
+            current_path = PROJECT_ROOT / path
+            current = current_path.read_text(encoding="utf-8-sig") if current_path.exists() else None
+            changed_ids = _top_level_ids(old_text) ^ _top_level_ids(current)
+            if changed_ids:
+                # New/removed IDs can create or resolve duplicates
+                scope.changed_event_ids |= changed_ids
+                scope.cross_file = True
+
+        if scope.flags:
+            scope.cross_file = True
+            for ref in scope._references(graph, scope.flags, FLAG_KINDS):
+                if ref.file in content_posix:
+                    scope._add_dependent(ref.file)
+
+        scope.phases = phases
+        scope.report_files |= scope.content_files
+        return scope
+
+    @staticmethod
+    def _references(graph, targets: Iterable[str], kinds):
+        for target in sorted(targets):
+            yield from graph.references_to(target, kinds)
+
+    def _add_dependent(self, path: str):
+        if path not in self.content_files:
+            self.content_files.add(path)
+            self.dependents += 1
+
+    @property
+    def empty(self) -> bool:
+        return not self.content_files and not self.phases and not self.orphans
+
+    def includes(self, issue) -> bool:
+        """Whether an issue from the scoped run belongs in the report."""
+        path = Path(issue.file_path).as_posix() if issue.file_path else ""
+        if path in self.report_files or (issue.event_id and issue.event_id in self.event_ids):
+            return True
+        if path == "flag_analysis":
+            # "Flag 'x' ..." or "Flag cycle ['x', 'y']: ..."
+            return any(flag in self.flags for flag in _QUOTED_ID.findall(issue.message.split(":", 1)[0]))
+        if path.endswith(".cs"):
+            # Phase 9 reports missing TextObject IDs with the ID as event_id
+            return bool(issue.event_id and issue.event_id in self.string_ids)
+        if path.startswith("ModuleData/"):
+            # e.g. an unchanged opportunity whose hintId was added or removed
+            match = _QUOTED_ID.search(issue.message)
+            return bool(match and (match.group(1) in self.string_ids or match.group(1) in self.changed_event_ids))
+        # Project-level and summary issues (Enlisted.csproj, orphan_analysis, ...) come only
+        # from phases that ran because of the change
+        return True
+
+    def summary_lines(self) -> List[str]:
+        lines = [f"[SCOPE] {len(self.changed_paths)} file(s) changed since {self.revision}"]
+        if self.content_files:
+            lines.append(f"[SCOPE] Phases 1-4 on {len(self.content_files)} content file(s) "
+                         f"({self.dependents} dependent(s))")
+        if self.string_ids:
+            lines.append(f"[SCOPE] {len(self.string_ids)} string ID(s) added/removed in enlisted_strings.xml")
+        if self.flags:
+            lines.append(f"[SCOPE] {len(self.flags)} flag(s) touched")
+        lines.append(f"[SCOPE] Cross-file checks: {'yes' if self.cross_file else 'skipped'}; "
+                     f"standalone phases: {', '.join(sorted(self.phases, key=float)) or 'none'}")
+        return lines
@@ -0,0 +1,1135 @@
+#!/usr/bin/env python3
+"""
+Typed, cached models for the ModuleData/Enlisted/Config files.
+
+Every config file has a frozen, slotted dataclass mirroring its JSON. Fields
+carry their checks (type, range, allowed values) as dataclass metadata, so one
+generic reader builds the model and collects every problem with a dotted path:
+
+    from config_models import load_config
+
+    loaded = load_config("progression_config.json")
+    loaded.model.tier_progression.requirements[2].xp_required    # 3000
+    loaded.issues        # [ConfigIssue(severity, path, message), ...]
+    load_all()           # {file name: LoadedConfig} for the whole folder
+
+Missing fields are reported and left as None; a value of the wrong type is
+reported and left as None; unknown keys (other than "_comment"-style keys) are
+reported as info since the game ignores them.
+
+Loaded models are memoized per process by the SHA-256 of the file; the hash is
+only recomputed when the file's (mtime, size) changes. Treat models as
+read-only: the same instance is handed to every caller. validate_content.py
+Phases 6 and 9.5 report the issues.
+
+    python Tools/Validation/config_models.py [FILE ...] [--json]
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union, get_args,
+                    get_origin, get_type_hints)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from content_schema import load_schema
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+CONFIG_DIR = PROJECT_ROOT / "ModuleData" / "Enlisted" / "Config"
+
+DAY_PHASES = tuple(load_schema().enum("day_phases"))
+OUTCOMES = ("excellent", "good", "normal", "poor", "mishap")
+LOG_LEVELS = ("Off", "Error", "Warn", "Info", "Debug", "Trace")
+WAR_STANCES = ("desperate", "defensive", "balanced", "offensive")
+FORMATION_CLASSES = ("Infantry", "Ranged", "Cavalry", "HorseArcher")
+# CampRoutineProcessor.GetSkillFromName (case-insensitive); anything else falls back to Athletics
+ROUTINE_SKILLS = ("onehanded", "twohanded", "polearm", "bow", "crossbow", "throwing", "riding",
+                  "athletics", "crafting", "smithing", "scouting", "tactics", "roguery", "charm",
+                  "leadership", "trade", "steward", "medicine", "engineering", "perception")
+
+PERCENT = {"min": 0, "max": 100}
+CHANCE = {"min": 0.0, "max": 1.0}
+TIER = {"min": 1, "max": 9}
+NON_NEGATIVE = {"min": 0}
+
+
+def spec(default: Any = dataclasses.MISSING, **checks) -> Any:
+    """
+    A model field with its checks:
+
+        key      JSON key when it differs from the field name
+        min/max  numeric range (applied to every number in a list/dict)
+        choices  allowed strings (every string in a list/dict); lower=True compares lowercased
+        keys     allowed keys of a dict field
+    """
+    if isinstance(default, (list, dict)):
+        return field(default_factory=lambda: type(default)(default), metadata=checks)
+    return field(default=default, metadata=checks)
+
+
+class ConfigIssue(NamedTuple):
+    severity: str
+    # Dotted path of the value ("timing.caught_up_chance_percent"); "" for the file
+    path: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}" if self.path else self.message
+
+    @property
+    def pointer(self) -> str:
+        """The path as a JSON pointer ("timing.min_cooldown_hours" -> "/timing/min_cooldown_hours")."""
+        if not self.path:
+            return ""
+        return "/" + re.sub(r"\[(\d+)\]", r".\1", self.path).replace(".", "/")
+
+
+class _Reader:
+    """Builds a model from JSON, collecting issues instead of raising."""
+
+    def __init__(self):
+        self.issues: List[ConfigIssue] = []
+
+    def report(self, severity: str, path: str, message: str):
+        self.issues.append(ConfigIssue(severity, path, message))
+
+    def build(self, cls, data: Any, path: str = "") -> Any:
+        if not isinstance(data, dict):
+            self.report("error", path, f"Expected an object, got {_json_type(data)}")
+            return None
+        hints = _hints(cls)
+        values = {}
+        known = set()
+        for f in dataclasses.fields(cls):
+            key = f.metadata.get("key", f.name)
+            known.add(key)
+            child = f"{path}.{key}" if path else key
+            if key in data:
+                values[f.name] = self.value(hints[f.name], data[key], child, f.metadata)
+            elif f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING:
+                self.report("warning", child, "Missing required field")
+                values[f.name] = None
+        for key in data:
+            if key not in known and not key.startswith(("_", "$")):
+                self.report("info", f"{path}.{key}" if path else key, "Unknown field (ignored by the game)")
+        model = cls(**values)
+        check = getattr(model, "check", None)
+        if check is not None:
+            for severity, message in check():
+                self.report(severity, path, message)
+        return model
+
+    def value(self, tp: Any, value: Any, path: str, checks: Dict[str, Any]) -> Any:
+        origin = get_origin(tp)
+        if tp is Any:
+            return value
+        if origin is Union:
+            if value is None:
+                return None
+            inner = [arg for arg in get_args(tp) if arg is not type(None)][0]
+            return self.value(inner, value, path, checks)
+        if dataclasses.is_dataclass(tp):
+            return self.build(tp, value, path)
+        if origin is list:
+            if not isinstance(value, list):
+                return self._wrong_type("a list", value, path)
+            (item,) = get_args(tp)
+            return [self.value(item, v, f"{path}[{i}]", checks) for i, v in enumerate(value)]
+        if origin is dict:
+            if not isinstance(value, dict):
+                return self._wrong_type("an object", value, path)
+            _, item = get_args(tp)
+            allowed = checks.get("keys")
+            if allowed is not None:
+                for key in value:
+                    if key not in allowed:
+                        self.report("warning", f"{path}.{key}", f"Unexpected key (expected: {', '.join(allowed)})")
+            return {k: self.value(item, v, f"{path}.{k}", checks) for k, v in value.items()}
+        return self.scalar(tp, value, path, checks)
+
+    def scalar(self, tp: type, value: Any, path: str, checks: Dict[str, Any]) -> Any:
+        if tp is bool:
+            if not isinstance(value, bool):
+                return self._wrong_type("true/false", value, path)
+            return value
+        if tp in (int, float):
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or \
+                    tp is int and not isinstance(value, int):
+                return self._wrong_type("an integer" if tp is int else "a number", value, path)
+            low, high = checks.get("min"), checks.get("max")
+            if low is not None and value < low or high is not None and value > high:
+                bounds = f"{low}-{high}" if low is not None and high is not None else \
+                    f">= {low}" if low is not None else f"<= {high}"
+                self.report("error", path, f"Out of range ({bounds}): {value}")
+            return tp(value)
+        if tp is str:
+            if not isinstance(value, str):
+                return self._wrong_type("a string", value, path)
+            choices = checks.get("choices")
+            if choices is not None:
+                compared = value.lower() if checks.get("lower") else value
+                if compared not in choices:
+                    self.report("warning", path, f"Unknown value '{value}' (expected: {', '.join(choices)})")
+            return value
+        raise TypeError(f"Unsupported field type in config model: {tp!r}")
+
+    def _wrong_type(self, expected: str, value: Any, path: str) -> None:
+        self.report("error", path, f"Expected {expected}, got {_json_type(value)}")
+        return None
+
+
+_HINTS: Dict[type, Dict[str, Any]] = {}
+
+
+def _hints(cls) -> Dict[str, Any]:
+    hints = _HINTS.get(cls)
+    if hints is None:
+        hints = _HINTS[cls] = get_type_hints(cls)
+    return hints
+
+
+def _json_type(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true/false"
+    return {dict: "an object", list: "a list", str: "a string"}.get(type(value), "a number")
+
+
+def _ordered(low: Optional[float], high: Optional[float], low_name: str, high_name: str) -> Iterator[Tuple[str, str]]:
+    if low is not None and high is not None and low > high:
+        yield "error", f"{low_name} ({low}) is greater than {high_name} ({high})"
+
+
+def model(cls):
+    return dataclass(frozen=True, slots=True)(cls)
+
+
+# ============================================================================
+# baggage_config.json
+# ============================================================================
+
+@model
+class BaggageAccessWindows:
+    temporary_access_hours: int = spec(**NON_NEGATIVE)
+    night_halt_grants_access: bool = spec()
+    muster_grants_access: bool = spec()
+    settlement_always_access: bool = spec()
+
+
+@model
+class BaggageTiming:
+    caught_up_check_hours: int = spec(**NON_NEGATIVE)
+    caught_up_chance_percent: int = spec(**PERCENT)
+    min_cooldown_hours: int = spec(**NON_NEGATIVE)
+    max_cooldown_hours: int = spec(**NON_NEGATIVE)
+
+    def check(self):
+        yield from _ordered(self.min_cooldown_hours, self.max_cooldown_hours, "min_cooldown_hours", "max_cooldown_hours")
+
+
+@model
+class BaggageEmergencyAccess:
+    base_qm_rep_cost: int = spec(**NON_NEGATIVE)
+    nco_qm_rep_cost: int = spec(**NON_NEGATIVE)
+    officer_qm_rep_cost: int = spec(**NON_NEGATIVE)
+    cooldown_hours: int = spec(**NON_NEGATIVE)
+    high_rep_threshold: int = spec(min=-100, max=100)
+    spam_penalty_soldier_rep: int = spec(**NON_NEGATIVE)
+
+
+@model
+class BaggageRankGates:
+    emergency_request_min_tier: int = spec(**TIER)
+    column_halt_min_tier: int = spec(**TIER)
+    daily_access_window_min_tier: int = spec(**TIER)
+
+
+@model
+class BaggageLockdown:
+    supply_threshold_percent: int = spec(**PERCENT)
+
+
+@model
+class BaggageEvents:
+    delay_event_chance_bad_weather: int = spec(**PERCENT)
+    delay_event_chance_mountains: int = spec(**PERCENT)
+    raid_event_chance_enemy_territory: int = spec(**PERCENT)
+    theft_event_chance_low_rep: int = spec(**PERCENT)
+
+
+@model
+class BaggageConfig:
+    access_windows: BaggageAccessWindows = spec()
+    timing: BaggageTiming = spec()
+    emergency_access: BaggageEmergencyAccess = spec()
+    rank_gates: BaggageRankGates = spec()
+    lockdown: BaggageLockdown = spec()
+    events: BaggageEvents = spec()
+
+
+# ============================================================================
+# camp_schedule.json
+# ============================================================================
+
+@model
+class ScheduleSlot:
+    category: str = spec()
+    weight: float = spec(**CHANCE)
+    # Phase 9.5 reports empty or placeholder descriptions
+    description: str = spec("")
+    skippedWhen: List[str] = spec([])
+    boostedWhen: List[str] = spec([])
+
+
+@model
+class SchedulePhase:
+    slot1: ScheduleSlot = spec()
+    slot2: ScheduleSlot = spec()
+    flavor: str = spec("")
+
+
+@model
+class ActivityOverride:
+    description: str = spec()
+    modifiers: Dict[str, float] = spec(**NON_NEGATIVE)
+
+
+@model
+class PressureOverride:
+    effect: str = spec()
+    description: str = spec()
+    threshold: Optional[int] = spec(None, **PERCENT)
+    recoveryThreshold: Optional[int] = spec(None, **PERCENT)
+    hoursBeforeBattle: Optional[int] = spec(None, **NON_NEGATIVE)
+
+
+@model
+class LordSituationModifier:
+    description: str = spec()
+    skipPhases: List[str] = spec(choices=DAY_PHASES)
+    boostCategories: List[str] = spec()
+
+
+@model
+class CampSchedule:
+    schemaVersion: int = spec()
+    description: str = spec()
+    phases: Dict[str, SchedulePhase] = spec(keys=DAY_PHASES)
+    categoryMappings: Dict[str, List[str]] = spec()
+    activityOverrides: Dict[str, ActivityOverride] = spec()
+    pressureOverrides: Dict[str, PressureOverride] = spec()
+    lordSituationModifiers: Dict[str, LordSituationModifier] = spec()
+    scheduleBoostMultiplier: float = spec(**NON_NEGATIVE)
+    deviationDisplayEnabled: bool = spec()
+
+
+# ============================================================================
+# enlisted_config.json
+# ============================================================================
+
+@model
+class SystemInfo:
+    config_version: str = spec()
+    compatible_game_versions: List[str] = spec()
+    mod_version: str = spec()
+
+
+@model
+class GameplaySettings:
+    reserve_troop_threshold: int = spec(**NON_NEGATIVE)
+    desertion_grace_period_days: int = spec(**NON_NEGATIVE)
+    leave_max_days: int = spec(**NON_NEGATIVE)
+
+
+@model
+class QuartermasterSettings:
+    soldier_tax: float = spec(**NON_NEGATIVE)
+    buyback_rate: float = spec(**NON_NEGATIVE)
+    officer_stock_tax: float = spec(**NON_NEGATIVE)
+
+
+@model
+class RetirementSettings:
+    first_term_days: int = spec(**NON_NEGATIVE)
+    renewal_term_days: int = spec(**NON_NEGATIVE)
+    cooldown_days: int = spec(**NON_NEGATIVE)
+    first_term_gold: int = spec(**NON_NEGATIVE)
+    first_term_reenlist_bonus: int = spec(**NON_NEGATIVE)
+    renewal_discharge_gold: int = spec(**NON_NEGATIVE)
+    renewal_continue_bonus: int = spec(**NON_NEGATIVE)
+    lord_relation_bonus: int = spec(min=-100, max=100)
+    faction_reputation_bonus: int = spec(min=-100, max=100)
+    other_lords_relation_bonus: int = spec(min=-100, max=100)
+    other_lords_min_relation: int = spec(min=-100, max=100)
+    pension_honorable_daily: int = spec(**NON_NEGATIVE)
+    pension_veteran_daily: int = spec(**NON_NEGATIVE)
+    pension_relation_stop_threshold: int = spec(min=-100, max=100)
+    severance_honorable: int = spec(**NON_NEGATIVE)
+    severance_veteran: int = spec(**NON_NEGATIVE)
+    debug_skip_gear_stripping: bool = spec()
+    probation_days: int = spec(**NON_NEGATIVE)
+    probation_wage_multiplier: float = spec(**NON_NEGATIVE)
+    probation_fatigue_cap: int = spec(**NON_NEGATIVE)
+    commander_reentry_fine_gold: int = spec(**NON_NEGATIVE)
+
+
+@model
+class WageFormula:
+    base_wage: int = spec(**NON_NEGATIVE)
+    level_multiplier: float = spec(**NON_NEGATIVE)
+    tier_multiplier: float = spec(**NON_NEGATIVE)
+    xp_divisor: int = spec(min=1)
+    army_bonus_multiplier: float = spec(**NON_NEGATIVE)
+
+
+@model
+class FinanceSettings:
+    show_in_clan_tooltip: bool = spec()
+    tooltip_label: str = spec()
+    payday_interval_days: int = spec(min=1)
+    payday_jitter_days: int = spec(**NON_NEGATIVE)
+    wage_formula: WageFormula = spec()
+
+
+@model
+class CampLifeSettings:
+    enabled: bool = spec()
+    logistics_high_threshold: int = spec(**PERCENT)
+    morale_low_threshold: int = spec(**PERCENT)
+    pay_tension_high_threshold: int = spec(**PERCENT)
+    scrutiny_high_threshold: int = spec(**PERCENT)
+    qm_purchase_fine: float = spec(**NON_NEGATIVE)
+    qm_purchase_tense: float = spec(**NON_NEGATIVE)
+    qm_purchase_sour: float = spec(**NON_NEGATIVE)
+    qm_purchase_predatory: float = spec(**NON_NEGATIVE)
+    qm_buyback_fine: float = spec(**NON_NEGATIVE)
+    qm_buyback_tense: float = spec(**NON_NEGATIVE)
+    qm_buyback_sour: float = spec(**NON_NEGATIVE)
+    qm_buyback_predatory: float = spec(**NON_NEGATIVE)
+
+
+@model
+class EscalationSettings:
+    enabled: bool = spec()
+    scrutiny_decay_interval_days: int = spec(**NON_NEGATIVE)
+    discipline_decay_interval_days: int = spec(**NON_NEGATIVE)
+    soldier_rep_decay_interval_days: int = spec(**NON_NEGATIVE)
+    medical_risk_decay_interval_days: int = spec(**NON_NEGATIVE)
+    threshold_event_cooldown_days: int = spec(**NON_NEGATIVE)
+
+
+@model
+class LancePersonaSettings:
+    enabled: bool = spec()
+    seed_salt: str = spec()
+    female_leader_chance: float = spec(**CHANCE)
+    female_second_chance: float = spec(**CHANCE)
+    female_veteran_chance: float = spec(**CHANCE)
+    female_soldier_chance: float = spec(**CHANCE)
+    female_recruit_chance: float = spec(**CHANCE)
+
+
+@model
+class PlayerConditionSettings:
+    enabled: bool = spec()
+    definitions_file: str = spec()
+    basic_treatment_multiplier: float = spec(**NON_NEGATIVE)
+    thorough_treatment_multiplier: float = spec(**NON_NEGATIVE)
+    herbal_treatment_multiplier: float = spec(**NON_NEGATIVE)
+    exhaustion_enabled: bool = spec()
+
+
+@model
+class CampActivitySettings:
+    enabled: bool = spec()
+    definitions_file: str = spec()
+
+
+@model
+class DecisionPacing:
+    max_per_day: int = spec(**NON_NEGATIVE)
+    max_per_week: int = spec(**NON_NEGATIVE)
+    min_hours_between: int = spec(**NON_NEGATIVE)
+    per_event_cooldown_days: int = spec(**NON_NEGATIVE)
+    per_category_cooldown_days: int = spec(**NON_NEGATIVE)
+
+    def check(self):
+        yield from _ordered(self.max_per_day, self.max_per_week, "max_per_day", "max_per_week")
+
+
+@model
+class DecisionActivity:
+    enabled: bool = spec()
+    activity_match_boost: float = spec(**NON_NEGATIVE)
+    duty_match_boost: float = spec(**NON_NEGATIVE)
+
+
+@model
+class DecisionMenu:
+    enabled: bool = spec()
+    max_visible_decisions: int = spec(min=1)
+    show_unavailable: bool = spec()
+
+
+@model
+class DecisionTierGates:
+    enabled: bool = spec()
+    lord_invitation: int = spec(**TIER)
+    lord_direct: int = spec(**TIER)
+    lance_leader_orders: int = spec(**TIER)
+    noble_events: int = spec(**TIER)
+    command_decisions: int = spec(**TIER)
+    lance_mate: int = spec(**TIER)
+    situation: int = spec(**TIER)
+
+
+@model
+class DecisionEventSettings:
+    enabled: bool = spec()
+    events_folder: str = spec()
+    pacing: DecisionPacing = spec()
+    activity: DecisionActivity = spec()
+    menu: DecisionMenu = spec()
+    tier_gates: DecisionTierGates = spec()
+
+
+@model
+class OrderScheduling:
+    normal_advance_hours: int = spec(**NON_NEGATIVE)
+    urgent_advance_hours: int = spec(**NON_NEGATIVE)
+    critical_advance_hours: int = spec(**NON_NEGATIVE)
+
+
+@model
+class OrchestratorSettings:
+    enabled: bool = spec()
+    log_decisions: bool = spec()
+    activity_modifiers: Dict[str, float] = spec(**NON_NEGATIVE)
+    order_scheduling: OrderScheduling = spec()
+
+
+@model
+class OrderForecasting:
+    enabled: bool = spec()
+    imminent_warning_min_hours: int = spec(**NON_NEGATIVE)
+    imminent_warning_max_hours: int = spec(**NON_NEGATIVE)
+    comment: str = spec("")
+
+    def check(self):
+        yield from _ordered(self.imminent_warning_min_hours, self.imminent_warning_max_hours,
+                            "imminent_warning_min_hours", "imminent_warning_max_hours")
+
+
+@model
+class NativeTraitMapping:
+    enabled: bool = spec()
+    scale_divisor: int = spec(min=1)
+    minimum_change: int = spec(**NON_NEGATIVE)
+
+
+@model
+class EnlistedConfig:
+    schemaVersion: int = spec()
+    enabled: bool = spec()
+    system_info: SystemInfo = spec()
+    gameplay: GameplaySettings = spec()
+    quartermaster: QuartermasterSettings = spec()
+    retirement: RetirementSettings = spec()
+    finance: FinanceSettings = spec()
+    camp_life: CampLifeSettings = spec()
+    escalation: EscalationSettings = spec()
+    lance_personas: LancePersonaSettings = spec()
+    player_conditions: PlayerConditionSettings = spec()
+    camp_activities: CampActivitySettings = spec()
+    decision_events: DecisionEventSettings = spec()
+    orchestrator: OrchestratorSettings = spec()
+    order_forecasting: OrderForecasting = spec()
+    native_trait_mapping: NativeTraitMapping = spec()
+
+
+# ============================================================================
+# equipment_pricing.json
+# ============================================================================
+
+@model
+class PricingRules:
+    base_cost_per_tier: int = spec(**NON_NEGATIVE)
+    formation_multipliers: Dict[str, float] = spec(**NON_NEGATIVE)
+    elite_multiplier: float = spec(**NON_NEGATIVE)
+    culture_modifiers: Dict[str, float] = spec(**NON_NEGATIVE)
+
+
+@model
+class RetirementRequirements:
+    minimum_service_days: int = spec(**NON_NEGATIVE)
+    honorable_discharge_bonus_multiplier: float = spec(**NON_NEGATIVE)
+    equipment_retention_tier_requirement: int = spec(**TIER)
+
+
+@model
+class MedicalTreatment:
+    standard_cooldown_days: int = spec(**NON_NEGATIVE)
+    field_medic_cooldown_days: int = spec(**NON_NEGATIVE)
+    base_healing_percentage: float = spec(**CHANCE)
+    field_medic_healing_percentage: float = spec(**CHANCE)
+    minimum_heal_amount: int = spec(**NON_NEGATIVE)
+
+
+@model
+class FormationDetection:
+    auto_detect_on_equipment_change: bool = spec()
+    allow_formation_switching: bool = spec()
+    switching_cooldown_hours: int = spec(**NON_NEGATIVE)
+
+
+@model
+class EquipmentPricing:
+    schemaVersion: int = spec()
+    enabled: bool = spec()
+    pricing_rules: PricingRules = spec()
+    troop_overrides: Dict[str, int] = spec(**NON_NEGATIVE)
+    retirement_requirements: RetirementRequirements = spec()
+    medical_treatment: MedicalTreatment = spec()
+    formation_detection: FormationDetection = spec()
+
+
+# ============================================================================
+# orchestrator_overrides.json
+# ============================================================================
+
+@model
+class NeedTrigger:
+    need: str = spec()
+    threshold: int = spec(**PERCENT)
+    comparison: str = spec("lessThan", choices=("lessThan", "greaterThan"))
+
+
+@model
+class OverrideActivity:
+    category: str = spec()
+    name: str = spec()
+    description: str = spec()
+    reason: str = spec()
+    priority: int = spec(**NON_NEGATIVE)
+    addressesNeed: str = spec()
+    replaceBothSlots: bool = spec()
+    affectedPhases: List[str] = spec(choices=DAY_PHASES)
+    skill: str = spec(choices=ROUTINE_SKILLS, lower=True)
+    baseXpMin: int = spec(**NON_NEGATIVE)
+    baseXpMax: int = spec(**NON_NEGATIVE)
+
+    def check(self):
+        yield from _ordered(self.baseXpMin, self.baseXpMax, "baseXpMin", "baseXpMax")
+
+
+@model
+class NeedBasedOverride:
+    trigger: NeedTrigger = spec()
+    override: OverrideActivity = spec()
+    activationText: str = spec()
+    recoveryThreshold: int = spec(**PERCENT)
+    cooldownDays: int = spec(**NON_NEGATIVE)
+
+
+@model
+class VarietyInjection:
+    category: str = spec()
+    name: str = spec()
+    description: str = spec()
+    preferredPhases: List[str] = spec(choices=DAY_PHASES)
+    weight: int = spec(**NON_NEGATIVE)
+    skill: str = spec(choices=ROUTINE_SKILLS, lower=True)
+    baseXpMin: int = spec(**NON_NEGATIVE)
+    baseXpMax: int = spec(**NON_NEGATIVE)
+    activationText: str = spec()
+
+    def check(self):
+        yield from _ordered(self.baseXpMin, self.baseXpMax, "baseXpMin", "baseXpMax")
+
+
+@model
+class VarietySettings:
+    minDaysBetweenInjections: int = spec(**NON_NEGATIVE)
+    maxDaysBetweenInjections: int = spec(**NON_NEGATIVE)
+    injectionChancePerDay: float = spec(**CHANCE)
+    maxInjectionsPerWeek: int = spec(**NON_NEGATIVE)
+    skipDuringIntense: bool = spec()
+    skipDuringSiege: bool = spec()
+
+    def check(self):
+        yield from _ordered(self.minDaysBetweenInjections, self.maxDaysBetweenInjections,
+                            "minDaysBetweenInjections", "maxDaysBetweenInjections")
+
+
+@model
+class PriorityRules:
+    needBasedAlwaysWins: bool = spec()
+    conflictResolution: str = spec()
+    maxSimultaneousOverrides: int = spec(min=1)
+
+
+@model
+class OrchestratorOverrides:
+    schemaVersion: int = spec()
+    description: str = spec()
+    needBasedOverrides: Dict[str, NeedBasedOverride] = spec()
+    varietyInjections: Dict[str, VarietyInjection] = spec()
+    varietySettings: VarietySettings = spec()
+    priorityRules: PriorityRules = spec()
+
+
+# ============================================================================
+# progression_config.json
+# ============================================================================
+
+@model
+class TierRequirement:
+    tier: int = spec(**TIER)
+    xp_required: int = spec(**NON_NEGATIVE)
+    name: str = spec()
+    duration: str = spec()
+
+
+@model
+class FormationSelection:
+    trigger_tier: int = spec(**TIER)
+    allow_multiple_changes: bool = spec()
+    change_cooldown_days: int = spec(**NON_NEGATIVE)
+    free_changes: int = spec(**NON_NEGATIVE)
+
+
+@model
+class TierProgression:
+    requirements: List[TierRequirement] = spec()
+    formation_selection: FormationSelection = spec()
+
+    def check(self):
+        previous = None
+        for requirement in self.requirements or ():
+            if requirement is None or requirement.xp_required is None or requirement.tier is None:
+                continue
+            if previous is not None and (requirement.tier <= previous.tier or
+                                         requirement.xp_required < previous.xp_required):
+                yield "error", (f"Tier {requirement.tier} ({requirement.xp_required} XP) does not follow "
+                                f"tier {previous.tier} ({previous.xp_required} XP)")
+            previous = requirement
+
+
+@model
+class CultureRanks:
+    style: str = spec()
+    ranks: List[str] = spec()
+
+    def check(self):
+        if self.ranks is not None and len(self.ranks) != 9:
+            yield "warning", f"Expected 9 rank names (T1-T9), found {len(self.ranks)}"
+
+
+@model
+class BaseWageFormula:
+    daily_base: int = spec(**NON_NEGATIVE)
+    tier_bonus_per_level: int = spec(**NON_NEGATIVE)
+    hero_level_multiplier: float = spec(**NON_NEGATIVE)
+    xp_bonus_divisor: int = spec(min=1)
+    maximum_base_wage: int = spec(**NON_NEGATIVE)
+
+
+@model
+class WageSystem:
+    base_formula: BaseWageFormula = spec()
+    assignment_multipliers: Dict[str, float] = spec(**NON_NEGATIVE)
+    army_bonuses: Dict[str, float] = spec(**NON_NEGATIVE)
+
+
+@model
+class XpSources:
+    daily_base: int = spec(**NON_NEGATIVE)
+    battle_participation: int = spec(**NON_NEGATIVE)
+    xp_per_kill: int = spec(**NON_NEGATIVE)
+
+
+@model
+class PromotionBenefit:
+    equipment_access: List[str] = spec([])
+    formation_selection: bool = spec(False)
+    officer_track: bool = spec(False)
+    commander_track: bool = spec(False)
+
+
+@model
+class TrackDefinition:
+    tiers: List[int] = spec(**TIER)
+    description: str = spec()
+
+
+@model
+class ProgressionConfig:
+    schemaVersion: int = spec()
+    enabled: bool = spec()
+    tier_progression: TierProgression = spec()
+    culture_ranks: Dict[str, CultureRanks] = spec()
+    wage_system: WageSystem = spec()
+    xp_sources: XpSources = spec()
+    promotion_benefits: Dict[str, PromotionBenefit] = spec()
+    track_definitions: Dict[str, TrackDefinition] = spec()
+
+
+# ============================================================================
+# retinue_config.json
+# ============================================================================
+
+@model
+class SoldierType:
+    id: str = spec()
+    display_key: str = spec()
+    description_key: str = spec()
+    formation_class: str = spec(choices=FORMATION_CLASSES)
+    available_all_factions: bool = spec()
+    faction_whitelist: List[str] = spec([])
+
+
+@model
+class FactionOverride:
+    archers_display_key: Optional[str] = spec(None)
+    archers_description_key: Optional[str] = spec(None)
+    horse_archers_display_key: Optional[str] = spec(None)
+    unavailable_types: List[str] = spec([])
+
+
+@model
+class TrickleReplenishment:
+    enabled: bool = spec()
+    min_days: int = spec(**NON_NEGATIVE)
+    max_days: int = spec(**NON_NEGATIVE)
+    soldiers_per_tick: int = spec(**NON_NEGATIVE)
+
+    def check(self):
+        yield from _ordered(self.min_days, self.max_days, "min_days", "max_days")
+
+
+@model
+class RequisitionSettings:
+    enabled: bool = spec()
+    cooldown_days: int = spec(**NON_NEGATIVE)
+    cost_multiplier: float = spec(**NON_NEGATIVE)
+
+
+@model
+class Replenishment:
+    trickle: TrickleReplenishment = spec()
+    requisition: RequisitionSettings = spec()
+
+
+@model
+class RetinueEconomics:
+    daily_upkeep_per_soldier: int = spec(**NON_NEGATIVE)
+    desertion_enabled: bool = spec()
+
+
+@model
+class RetinueConfig:
+    schemaVersion: int = spec()
+    enabled: bool = spec()
+    soldier_types: Dict[str, SoldierType] = spec()
+    faction_overrides: Dict[str, FactionOverride] = spec()
+    replenishment: Replenishment = spec()
+    economics: RetinueEconomics = spec()
+    description: str = spec("")
+    capacity_note: str = spec("")
+
+
+# ============================================================================
+# routine_outcomes.json
+# ============================================================================
+
+@model
+class IntRange:
+    min: int = spec()
+    max: int = spec()
+
+    def check(self):
+        yield from _ordered(self.min, self.max, "min", "max")
+
+
+@model
+class RoutineActivity:
+    name: str = spec()
+    skill: str = spec(choices=ROUTINE_SKILLS, lower=True)
+    xpRanges: Dict[str, IntRange] = spec(keys=OUTCOMES)
+    fatigueChange: int = spec()
+    flavorText: Dict[str, List[str]] = spec(keys=OUTCOMES)
+    seaVariants: Dict[str, List[str]] = spec({}, keys=OUTCOMES)
+    mishapChance: Optional[float] = spec(None, **CHANCE)
+    mishapCondition: Optional[str] = spec(None)
+    goldChance: Dict[str, float] = spec({}, keys=OUTCOMES, **CHANCE)
+    goldRange: Optional[IntRange] = spec(None)
+    goldLossChance: Dict[str, float] = spec({}, keys=OUTCOMES, **CHANCE)
+    goldLossRange: Optional[IntRange] = spec(None)
+    moraleChange: Dict[str, int] = spec({}, keys=OUTCOMES)
+    readinessChange: Dict[str, int] = spec({}, keys=OUTCOMES)
+    supplyChange: Dict[str, IntRange] = spec({}, keys=OUTCOMES)
+    recoveryBonus: Dict[str, float] = spec({}, keys=OUTCOMES, **NON_NEGATIVE)
+
+
+@model
+class RoutineOutcomes:
+    schemaVersion: int = spec()
+    description: str = spec()
+    outcomeWeights: Dict[str, Dict[str, int]] = spec(**NON_NEGATIVE)
+    activities: Dict[str, RoutineActivity] = spec()
+
+    def check(self):
+        for name, weights in (self.outcomeWeights or {}).items():
+            missing = [outcome for outcome in OUTCOMES if outcome not in (weights or {})]
+            if missing:
+                yield "warning", f"outcomeWeights.{name} has no weight for: {', '.join(missing)}"
+
+
+# ============================================================================
+# settings.json
+# ============================================================================
+
+@model
+class EncounterSettings:
+    AttachWhenClose: bool = spec()
+    AttachRange: float = spec(**NON_NEGATIVE)
+    TrailDistance: float = spec(**NON_NEGATIVE)
+    SuppressPlayerEncounter: bool = spec()
+
+
+@model
+class Settings:
+    schemaVersion: int = spec()
+    enabled: bool = spec()
+    use_new_muster_menu: bool = spec()
+    PauseGameDuringMuster: bool = spec()
+    EnableDebugTools: bool = spec()
+    LogMenus: bool = spec()
+    LogCampaignEvents: bool = spec()
+    RunTroopDiscoveryValidation: bool = spec()
+    LogModConflicts: bool = spec()
+    LogThrottleSeconds: int = spec(**NON_NEGATIVE)
+    LogLevels: Dict[str, str] = spec(choices=LOG_LEVELS)
+    dutiesConfig: str = spec()
+    Encounter: EncounterSettings = spec()
+
+
+# ============================================================================
+# simulation_config.json
+# ============================================================================
+
+@model
+class RosterRates:
+    baseRecoveryChance: float = spec(**CHANCE)
+    baseDeathChance: float = spec(**CHANCE)
+    # Per 100 soldiers per day
+    baseSicknessRate: float = spec(**NON_NEGATIVE)
+    baseInjuryRate: float = spec(**NON_NEGATIVE)
+    baseDesertionRate: float = spec(**NON_NEGATIVE)
+
+
+@model
+class IncidentSettings:
+    minPerDay: int = spec(**NON_NEGATIVE)
+    maxPerDay: int = spec(**NON_NEGATIVE)
+    cooldownDays: int = spec(**NON_NEGATIVE)
+
+    def check(self):
+        yield from _ordered(self.minPerDay, self.maxPerDay, "minPerDay", "maxPerDay")
+
+
+@model
+class PressureThresholds:
+    lowSuppliesDays: int = spec(**NON_NEGATIVE)
+    lowMoraleDays: int = spec(**NON_NEGATIVE)
+    lowRestDays: int = spec(**NON_NEGATIVE)
+    highSicknessDays: int = spec(**NON_NEGATIVE)
+    desertionCount: int = spec(**NON_NEGATIVE)
+
+
+@model
+class IncidentDefinition:
+    id: str = spec()
+    category: str = spec()
+    textId: str = spec()
+    weight: int = spec(**NON_NEGATIVE)
+    # CompanySimulationBehavior defaults a missing severity to "minor"
+    severity: str = spec("minor")
+    cooldown: int = spec(0, **NON_NEGATIVE)
+    effects: Dict[str, Any] = spec({})
+    setsFlag: Optional[str] = spec(None)
+
+
+@model
+class SimulationConfig:
+    roster: RosterRates = spec()
+    incidents: IncidentSettings = spec()
+    pressure_thresholds: PressureThresholds = spec()
+    incident_definitions: List[IncidentDefinition] = spec()
+
+
+# ============================================================================
+# strategic_context_config.json
+# ============================================================================
+
+@model
+class StrategicContext:
+    display_name: str = spec()
+    description: str = spec()
+    order_tags: List[str] = spec()
+    inappropriate_tags: List[str] = spec()
+    needs_prediction: Dict[str, int] = spec(**PERCENT)
+
+
+@model
+class CoordinationDetection:
+    min_allied_lords: int = spec(**NON_NEGATIVE)
+    max_distance_km: float = spec(**NON_NEGATIVE)
+    same_target_bonus: float = spec(**NON_NEGATIVE)
+
+
+@model
+class ContextDetectionRule:
+    min_allied_armies: Optional[int] = spec(None, **NON_NEGATIVE)
+    war_stance_min: Optional[str] = spec(None, choices=WAR_STANCES)
+    war_stance_max: Optional[str] = spec(None, choices=WAR_STANCES)
+    in_enemy_territory: Optional[bool] = spec(None)
+    in_own_territory: Optional[bool] = spec(None)
+    defending_own_territory: Optional[bool] = spec(None)
+    in_settlement: Optional[bool] = spec(None)
+    active_siege: Optional[bool] = spec(None)
+    no_siege: Optional[bool] = spec(None)
+    small_force: Optional[bool] = spec(None)
+    at_peace: Optional[bool] = spec(None)
+    stationary: Optional[bool] = spec(None)
+    winter_season: Optional[bool] = spec(None)
+    army_below_strength: Optional[bool] = spec(None)
+
+
+@model
+class StrategicContextConfig:
+    war_stance_thresholds: Dict[str, float] = spec(keys=WAR_STANCES, **CHANCE)
+    weights: Dict[str, float] = spec(**CHANCE)
+    strategic_contexts: Dict[str, StrategicContext] = spec()
+    settlement_strategic_value: Dict[str, float] = spec(**NON_NEGATIVE)
+    coordination_detection: CoordinationDetection = spec()
+    context_detection_rules: Dict[str, ContextDetectionRule] = spec()
+
+    def check(self):
+        if self.weights and all(w is not None for w in self.weights.values()):
+            total = sum(self.weights.values())
+            if abs(total - 1.0) > 0.001:
+                yield "warning", f"weights add up to {total:g}, expected 1"
+        for name in self.context_detection_rules or {}:
+            if self.strategic_contexts is not None and name not in self.strategic_contexts:
+                yield "warning", f"context_detection_rules.{name} has no strategic_contexts entry"
+
+
+# ============================================================================
+# Loading
+# ============================================================================
+
+CONFIG_MODELS: Dict[str, type] = {
+    "baggage_config.json": BaggageConfig,
+    "camp_schedule.json": CampSchedule,
+    "enlisted_config.json": EnlistedConfig,
+    "equipment_pricing.json": EquipmentPricing,
+    "orchestrator_overrides.json": OrchestratorOverrides,
+    "progression_config.json": ProgressionConfig,
+    "retinue_config.json": RetinueConfig,
+    "routine_outcomes.json": RoutineOutcomes,
+    "settings.json": Settings,
+    "simulation_config.json": SimulationConfig,
+    "strategic_context_config.json": StrategicContextConfig,
+}
+
+
+class LoadedConfig(NamedTuple):
+    name: str
+    path: Path
+    sha256: str
+    # None when the file is not valid JSON or has no model
+    model: Any
+    issues: Tuple[ConfigIssue, ...]
+    data: Any = None
+
+    @property
+    def ok(self) -> bool:
+        return not any(issue.severity == "error" for issue in self.issues)
+
+
+# path -> ((mtime_ns, size), LoadedConfig); (file name, sha256) -> LoadedConfig
+_BY_PATH: Dict[Path, Tuple[Tuple[int, int], LoadedConfig]] = {}
+_BY_HASH: Dict[Tuple[str, str], LoadedConfig] = {}
+
+
+def parse_config(name: str, raw: bytes, path: Optional[Path] = None) -> LoadedConfig:
+    """Parse and check one config file's bytes (no memoization)."""
+    sha256 = hashlib.sha256(raw).hexdigest()
+    path = path or CONFIG_DIR / name
+    try:
+        data = json.loads(raw.decode("utf-8-sig"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        return LoadedConfig(name, path, sha256, None, (ConfigIssue("error", "", f"Invalid JSON: {e}"),))
+    cls = CONFIG_MODELS.get(name)
+    if cls is None:
+        return LoadedConfig(name, path, sha256, None, (), data)
+    reader = _Reader()
+    model = reader.build(cls, data)
+    return LoadedConfig(name, path, sha256, model, tuple(reader.issues), data)
+
+
+def load_config(name_or_path: Union[str, Path]) -> LoadedConfig:
+    """
+    Load a config by file name ("settings.json") or path, memoized by content hash.
+
+    Raises OSError if the file cannot be read.
+    """
+    path = Path(name_or_path)
+    if len(path.parts) == 1:
+        path = CONFIG_DIR / path
+    path = path.resolve()
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _BY_PATH.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    raw = path.read_bytes()
+    key = (path.name, hashlib.sha256(raw).hexdigest())
+    loaded = _BY_HASH.get(key)
+    if loaded is None or loaded.path != path:
+        loaded = _BY_HASH[key] = parse_config(path.name, raw, path)
+    _BY_PATH[path] = (stamp, loaded)
+    return loaded
+
+
+def load_all(config_dir: Path = CONFIG_DIR) -> Dict[str, LoadedConfig]:
+    """Every *.json in the config folder, by file name (sorted)."""
+    return {path.name: load_config(path) for path in sorted(config_dir.glob("*.json"))}
+
+
+def main():
+    args = [a for a in sys.argv[1:] if a != "--json"]
+    as_json = "--json" in sys.argv[1:]
+    loaded = [load_config(a) for a in args] if args else list(load_all().values())
+    if as_json:
+        print(json.dumps({c.name: [issue._asdict() for issue in c.issues] for c in loaded}, indent=2))
+    else:
+        for config in loaded:
+            status = "no model" if config.model is None and config.ok else \
+                "OK" if config.ok else "FAILED"
+            print(f"{config.name}: {status} ({len(config.issues)} issue(s))")
+            for issue in config.issues:
+                print(f"  [{issue.severity.upper()}] {issue}")
+    return 0 if all(c.ok for c in loaded) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+"""
+Language server (LSP over stdio) for ModuleData event JSON.
+
+Serves, for event, decision and order event files:
+
+- diagnostics from the validate_content.py Phase 1-4 rules, re-checked on
+  every edit against the unsaved buffer
+- completion of textId/titleId/setupId/... values from enlisted_strings.xml
+- go-to-definition from a string ID to its <string> in enlisted_strings.xml
+- hover: the localized text of a string ID, or who sets, clears and reads a flag
+  (on the flag itself or on a has_flag:/flag: trigger)
+
+The localization index, the validator rules and the reference graph stay loaded
+for the life of the server; an edit re-validates only the edited document
+(a few milliseconds for the largest content file). The localization index is
+reloaded when enlisted_strings.xml changes, and the reference graph on save.
+
+Usage (editor config):
+    python Tools/Validation/content_lsp.py
+
+    python Tools/Validation/content_lsp.py --check ModuleData/Enlisted/Events/events_baggage_stowage.json
+        Print the diagnostics the server would publish for one file, with timings.
+
+VS Code example (settings for a generic LSP client extension):
+    "command": ["python", "Tools/Validation/content_lsp.py"], "languages": ["json"]
+"""
+
+import bisect
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+from urllib.request import url2pathname
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+SERVER_NAME = "enlisted-content-lsp"
+
+# Content the validator treats as events (camp_opportunities*.json has its own schema)
+CONTENT_DIRS = ("ModuleData/Enlisted/Events/", "ModuleData/Enlisted/Decisions/",
+                "ModuleData/Enlisted/Orders/order_events/")
+
+# LSP constants
+SEVERITY = {"error": 1, "warning": 2, "info": 3}
+SYNC_FULL = 1
+COMPLETION_VALUE = 12
+MARKUP_MARKDOWN = "markdown"
+METHOD_NOT_FOUND = -32601
+SERVER_NOT_INITIALIZED = -32002
+REQUEST_FAILED = -32803
+
+COMPLETION_LIMIT = 200
+HOVER_REFS_LIMIT = 10
+
+# "someId": "partial  (cursor at the end)
+_ID_VALUE_BEFORE_CURSOR = re.compile(r'"(\w+Id)"\s*:\s*"([^"\\]*)$')
+_STRING_LITERAL = re.compile(r'"((?:[^"\\\n]|\\.)*)"')
+_QUOTED_IN_MESSAGE = re.compile(r"'([^'\s]+)'")
+
+
+# ============================================================================
+# Positions
+# ============================================================================
+
+def _utf16_length(text: str) -> int:
+    return len(text.encode("utf-16-le")) // 2
+
+
+def _to_utf16_column(line: str, column: int) -> int:
+    """Code point column -> LSP (UTF-16) column."""
+    return column if line.isascii() else _utf16_length(line[:column])
+
+
+def _from_utf16_column(line: str, character: int) -> int:
+    """LSP (UTF-16) column -> code point column."""
+    if line.isascii():
+        return min(character, len(line))
+    units = 0
+    for column, char in enumerate(line):
+        if units >= character:
+            return column
+        units += 2 if ord(char) > 0xFFFF else 1
+    return len(line)
+
+
+class TextDocument:
+    """One open editor buffer with a lazily built line-start table."""
+
+    __slots__ = ("uri", "path", "rel", "version", "text", "_line_starts")
+
+    def __init__(self, uri: str, text: str, version: int = 0):
+        self.uri = uri
+        self.path = uri_to_path(uri)
+        self.rel = project_relative(self.path)
+        self.version = version
+        self.set_text(text, version)
+
+    def set_text(self, text: str, version: int):
+        self.text = text[1:] if text.startswith("\ufeff") else text
+        self.version = version
+        self._line_starts: Optional[List[int]] = None
+
+    @property
+    def line_starts(self) -> List[int]:
+        if self._line_starts is None:
+            starts = [0]
+            find = self.text.find
+            position = find("\n")
+            while position != -1:
+                starts.append(position + 1)
+                position = find("\n", position + 1)
+            self._line_starts = starts
+        return self._line_starts
+
+    def line(self, number: int) -> str:
+        starts = self.line_starts
+        if number >= len(starts):
+            return ""
+        end = starts[number + 1] - 1 if number + 1 < len(starts) else len(self.text)
+        return self.text[starts[number]:end].rstrip("\r")
+
+    def position(self, offset: int) -> Dict[str, int]:
+        """Character offset -> LSP position."""
+        number = bisect.bisect_right(self.line_starts, offset) - 1
+        column = offset - self.line_starts[number]
+        return {"line": number, "character": _to_utf16_column(self.line(number), column)}
+
+    def range(self, start: int, end: int) -> Dict[str, Dict[str, int]]:
+        return {"start": self.position(start), "end": self.position(end)}
+
+    def string_at(self, position: Dict[str, int]) -> Optional[Tuple[str, int, int]]:
+        """The JSON string literal under an LSP position: (value, start column, end column)."""
+        line = self.line(position["line"])
+        column = _from_utf16_column(line, position["character"])
+        for match in _STRING_LITERAL.finditer(line):
+            if match.start() <= column <= match.end():
+                return match.group(1), match.start(1), match.end(1)
+        return None
+
+
+def uri_to_path(uri: str) -> Path:
+    parsed = urlparse(uri)
+    if parsed.scheme != "file":
+        return Path(unquote(parsed.path))
+    return Path(url2pathname(unquote(parsed.path)))
+
+
+def path_to_uri(path: Path) -> str:
+    return path.resolve().as_uri()
+
+
+def project_relative(path: Path) -> Optional[str]:
+    """Posix path relative to the project root, or None for files outside it."""
+    try:
+        return path.resolve().relative_to(PROJECT_ROOT).as_posix()
+    except ValueError:
+        return None
+
+
+def is_content_file(rel: Optional[str]) -> bool:
+    return bool(rel and rel.endswith(".json") and rel.startswith(CONTENT_DIRS)
+                and not Path(rel).name.startswith("camp_opportunities"))
+
+
+# ============================================================================
+# Language features
+# ============================================================================
+
+class ContentLanguageServer:
+    """Validator state kept warm between edits, plus the open documents."""
+
+    def __init__(self):
+        import validate_content
+        from localization_index import DEFAULT_XML_PATH
+        from reference_graph import FLAG_CLEAR, FLAG_READ, FLAG_SET, flag_of_trigger, load_graph
+        self._vc = validate_content
+        self._xml_path = DEFAULT_XML_PATH
+        self._flag_kinds = ((FLAG_SET, "Set by"), (FLAG_CLEAR, "Cleared by"), (FLAG_READ, "Read by"))
+        self._flag_of_trigger = flag_of_trigger
+        self._load_graph = load_graph
+        self.documents: Dict[str, TextDocument] = {}
+        self._xml_stamp = None
+        self._graph = None
+        self.localization = None
+        self.localization_ids = set()
+        self._sorted_ids: List[str] = []
+        self._refresh_localization()
+
+    # ---- Warm state --------------------------------------------------------
+
+    def _refresh_localization(self):
+        """Reload the string table if enlisted_strings.xml changed (one stat per call)."""
+        from localization_index import LocalizationParseError, load_index
+        try:
+            st = os.stat(self._xml_path)
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+        if stamp == self._xml_stamp:
+            return
+        self._xml_stamp = stamp
+        try:
+            self.localization = load_index(self._xml_path) if stamp else None
+        except LocalizationParseError:
+            self.localization = None
+        self.localization_ids = set(self.localization.ids()) if self.localization else set()
+        self._sorted_ids = sorted(self.localization_ids)
+
+    @property
+    def graph(self):
+        if self._graph is None:
+            self._graph = self._load_graph()
+        return self._graph
+
+    def refresh_graph(self):
+        if self._graph is not None:
+            self._graph.refresh()
+
+    # ---- Diagnostics -------------------------------------------------------
+
+    def diagnostics(self, doc: TextDocument) -> List[Dict[str, Any]]:
+        """Phase 1-4 issues for one buffer, positioned on the event they belong to."""
+        if not is_content_file(doc.rel):
+            return []
+        self._refresh_localization()
+        ctx = self._vc.ValidationContext()
+        self._vc.validate_event_text(doc.text, doc.rel, ctx, self.localization_ids)
+        spans = _event_spans(doc.text)
+        return [_diagnostic(doc, issue, spans) for issue in ctx.issues]
+
+    # ---- Requests ----------------------------------------------------------
+
+    def completion(self, doc: TextDocument, position: Dict[str, int]) -> Dict[str, Any]:
+        """String IDs for the value of any "...Id" key, by prefix."""
+        line = doc.line(position["line"])
+        column = _from_utf16_column(line, position["character"])
+        match = _ID_VALUE_BEFORE_CURSOR.search(line[:column])
+        if not match:
+            return {"isIncomplete": False, "items": []}
+        self._refresh_localization()
+        prefix = match.group(2)
+        ids = self._sorted_ids
+        start = bisect.bisect_left(ids, prefix)
+        end = bisect.bisect_left(ids, prefix + "\uffff", lo=start)
+        edit_range = {"start": {"line": position["line"], "character": _to_utf16_column(line, match.start(2))},
+                      "end": position}
+        items = []
+        for string_id in ids[start:min(end, start + COMPLETION_LIMIT)]:
+            text = self.localization.text(string_id, "")
+            items.append({"label": string_id, "kind": COMPLETION_VALUE,
+                          "detail": text[:80] + ("..." if len(text) > 80 else ""),
+                          "textEdit": {"range": edit_range, "newText": string_id}})
+        return {"isIncomplete": end - start > COMPLETION_LIMIT, "items": items}
+
+    def definition(self, doc: TextDocument, position: Dict[str, int]) -> Optional[Dict[str, Any]]:
+        """A string ID -> its <string> element in enlisted_strings.xml."""
+        self._refresh_localization()
+        found = doc.string_at(position)
+        if not found or not self.localization:
+            return None
+        line = self.localization.line(found[0])
+        if line is None:
+            return None
+        target = {"line": max(line - 1, 0), "character": 0}
+        return {"uri": path_to_uri(self._xml_path), "range": {"start": target, "end": target}}
+
+    def hover(self, doc: TextDocument, position: Dict[str, int]) -> Optional[Dict[str, Any]]:
+        """Localized text for a string ID; setters/clearers/readers for a flag or a has_flag:/flag: trigger."""
+        found = doc.string_at(position)
+        if not found:
+            return None
+        value, start, end = found
+        sections = []
+        if self.localization and value in self.localization:
+            sections.append(f"**`{value}`** (enlisted_strings.xml:{self.localization.line(value)})\n\n"
+                            f"{self.localization.text(value, '')}")
+        flag = self._flag_of_trigger(value) or value
+        for kind, title in self._flag_kinds:
+            refs = self.graph.references_to(flag, (kind,))
+            if refs:
+                lines = [f"- `{ref.source}` ({ref.location()})" for ref in refs[:HOVER_REFS_LIMIT]]
+                if len(refs) > HOVER_REFS_LIMIT:
+                    lines.append(f"- ... {len(refs) - HOVER_REFS_LIMIT} more")
+                sections.append(f"**Flag `{flag}` - {title.lower()}**\n" + "\n".join(lines))
+        if not sections:
+            return None
+        line = doc.line(position["line"])
+        return {
+            "contents": {"kind": MARKUP_MARKDOWN, "value": "\n\n---\n\n".join(sections)},
+            "range": {"start": {"line": position["line"], "character": _to_utf16_column(line, start)},
+                      "end": {"line": position["line"], "character": _to_utf16_column(line, end)}},
+        }
+
+
+def _event_spans(text: str) -> List[Tuple[str, int, int, int]]:
+    """(event ID, span start, span end, ID value start) for each top-level event, in file order."""
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        return []
+    events = data if isinstance(data, list) else data.get("events") if isinstance(data, dict) else None
+    found = []
+    position = 0
+    for event in events if isinstance(events, list) else ():
+        event_id = event.get("id") if isinstance(event, dict) else None
+        if not isinstance(event_id, str) or not event_id:
+            continue
+        match = re.compile(r'"id"\s*:\s*"' + re.escape(event_id) + '"').search(text, position)
+        if match:
+            found.append((event_id, match.start(), match.end(), match.end() - len(event_id) - 1))
+            position = match.end()
+    spans = []
+    for index, (event_id, start, id_end, value_start) in enumerate(found):
+        end = found[index + 1][1] if index + 1 < len(found) else len(text)
+        spans.append((event_id, start, end, value_start))
+    return spans
+
+
+def _diagnostic(doc: TextDocument, issue, spans) -> Dict[str, Any]:
+    """Place an issue on the quoted value its message names, else on its event's ID."""
+    start = end = 0
+    if issue.message.startswith("Invalid JSON:"):
+        match = re.search(r"line (\d+) column (\d+)", issue.message)
+        if match:
+            line = int(match.group(1)) - 1
+            offset = doc.line_starts[min(line, len(doc.line_starts) - 1)] + int(match.group(2)) - 1
+            start, end = offset, offset + 1
+    elif issue.event_id:
+        for event_id, span_start, span_end, value_start in spans:
+            if event_id == issue.event_id:
+                start, end = value_start, value_start + len(event_id)
+                for token in _QUOTED_IN_MESSAGE.findall(issue.message):
+                    at = doc.text.find(f'"{token}"', span_start, span_end)
+                    if at != -1 and token != event_id:
+                        start, end = at + 1, at + 1 + len(token)
+                        break
+                break
+    return {
+        "range": doc.range(start, end),
+        "severity": SEVERITY.get(issue.severity, 3),
+        "code": issue.category,
+        "source": "validate_content",
+        "message": issue.message,
+    }
+
+
+# ============================================================================
+# JSON-RPC over stdio
+# ============================================================================
+
+def read_message(stream: BinaryIO) -> Optional[Dict[str, Any]]:
+    """One Content-Length framed message, or None at end of input."""
+    length = None
+    while True:
+        header = stream.readline()
+        if not header:
+            return None
+        header = header.strip()
+        if not header:
+            break
+        name, _, value = header.decode("ascii", "replace").partition(":")
+        if name.lower() == "content-length":
+            length = int(value.strip())
+    if length is None:
+        return None
+    return json.loads(stream.read(length).decode("utf-8"))
+
+
+def write_message(stream: BinaryIO, message: Dict[str, Any]):
+    body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+    stream.flush()
+
+
+class StdioServer:
+    """Dispatches LSP requests and notifications to a ContentLanguageServer."""
+
+    def __init__(self, reader: BinaryIO, writer: BinaryIO):
+        self.reader = reader
+        self.writer = writer
+        self.server: Optional[ContentLanguageServer] = None
+        self.shutdown_requested = False
+
+    def send(self, message: Dict[str, Any]):
+        message["jsonrpc"] = "2.0"
+        write_message(self.writer, message)
+
+    def notify(self, method: str, params: Dict[str, Any]):
+        self.send({"method": method, "params": params})
+
+    def publish(self, doc: TextDocument, diagnostics: List[Dict[str, Any]]):
+        self.notify("textDocument/publishDiagnostics",
+                    {"uri": doc.uri, "version": doc.version, "diagnostics": diagnostics})
+
+    def log(self, message: str):
+        self.notify("window/logMessage", {"type": 4, "message": message})
+
+    def serve(self) -> int:
+        while True:
+            message = read_message(self.reader)
+            if message is None:
+                return 0 if self.shutdown_requested else 1
+            method = message.get("method")
+            if method == "exit":
+                return 0 if self.shutdown_requested else 1
+            if "id" in message and method is not None:
+                self._request(message)
+            elif method is not None:
+                self._notification(method, message.get("params") or {})
+
+    def _request(self, message: Dict[str, Any]):
+        request_id, method, params = message["id"], message["method"], message.get("params") or {}
+        if method == "initialize":
+            self.server = ContentLanguageServer()
+            self.send({"id": request_id, "result": {
+                "capabilities": {
+                    "textDocumentSync": {"openClose": True, "change": SYNC_FULL, "save": True},
+                    "completionProvider": {"triggerCharacters": ['"', "_"]},
+                    "definitionProvider": True,
+                    "hoverProvider": True,
+                },
+                "serverInfo": {"name": SERVER_NAME},
+            }})
+            return
+        if method == "shutdown":
+            self.shutdown_requested = True
+            self.send({"id": request_id, "result": None})
+            return
+        if self.server is None:
+            self.send({"id": request_id, "error": {"code": SERVER_NOT_INITIALIZED,
+                                                   "message": "initialize has not been called"}})
+            return
+        handlers = {
+            "textDocument/completion": self.server.completion,
+            "textDocument/definition": self.server.definition,
+            "textDocument/hover": self.server.hover,
+        }
+        handler = handlers.get(method)
+        if handler is None:
+            self.send({"id": request_id, "error": {"code": METHOD_NOT_FOUND, "message": f"Unknown method: {method}"}})
+            return
+        doc = self.server.documents.get(params.get("textDocument", {}).get("uri"))
+        try:
+            result = handler(doc, params["position"]) if doc else None
+        except Exception as e:
+            self.send({"id": request_id, "error": {"code": REQUEST_FAILED, "message": f"{method} failed: {e}"}})
+            return
+        self.send({"id": request_id, "result": result})
+
+    def _notification(self, method: str, params: Dict[str, Any]):
+        if self.server is None:
+            return
+        documents = self.server.documents
+        if method == "textDocument/didOpen":
+            item = params["textDocument"]
+            doc = documents[item["uri"]] = TextDocument(item["uri"], item["text"], item.get("version", 0))
+            self._check(doc)
+        elif method == "textDocument/didChange":
+            doc = documents.get(params["textDocument"]["uri"])
+            changes = params.get("contentChanges") or []
+            if doc is not None and changes:
+                # Full sync: the last change holds the whole document
+                doc.set_text(changes[-1]["text"], params["textDocument"].get("version", doc.version))
+                self._check(doc)
+        elif method == "textDocument/didSave":
+            doc = documents.get(params["textDocument"]["uri"])
+            self.server.refresh_graph()
+            if doc is not None:
+                self._check(doc)
+        elif method == "textDocument/didClose":
+            doc = documents.pop(params["textDocument"]["uri"], None)
+            if doc is not None:
+                self.publish(doc, [])
+
+    def _check(self, doc: TextDocument):
+        started = time.perf_counter()
+        try:
+            diagnostics = self.server.diagnostics(doc)
+        except Exception as e:
+            self.log(f"Validation failed for {doc.rel or doc.uri}: {e}")
+            return
+        self.publish(doc, diagnostics)
+        self.log(f"{doc.rel}: {len(diagnostics)} diagnostic(s) in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+
+def _check_file(file_name: str) -> int:
+    """--check: print the diagnostics the server would publish for one file."""
+    path = Path(file_name).resolve()
+    started = time.perf_counter()
+    server = ContentLanguageServer()
+    startup_ms = (time.perf_counter() - started) * 1000
+    doc = TextDocument(path_to_uri(path), path.read_text(encoding="utf-8-sig"))
+    timings = []
+    for _ in range(5):
+        started = time.perf_counter()
+        diagnostics = server.diagnostics(doc)
+        timings.append((time.perf_counter() - started) * 1000)
+    for diagnostic in diagnostics:
+        start = diagnostic["range"]["start"]
+        severity = {1: "ERROR", 2: "WARNING", 3: "INFO"}[diagnostic["severity"]]
+        print(f"{doc.rel}:{start['line'] + 1}:{start['character'] + 1}: [{severity}] "
+              f"[{diagnostic['code']}] {diagnostic['message']}")
+    print(f"{len(diagnostics)} diagnostic(s); startup {startup_ms:.0f} ms, "
+          f"re-check {min(timings):.1f} ms (best of {len(timings)})")
+    return 0
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] in ("-h", "--help"):
+        print(__doc__)
+        return 0
+    # stdout carries the protocol; the validator's progress prints go to stderr
+    protocol_out = sys.stdout.buffer
+    sys.stdout = sys.stderr
+    if args and args[0] == "--check":
+        if len(args) < 2:
+            print("--check needs a file", file=sys.stderr)
+            return 2
+        sys.stdout = sys.__stdout__
+        return _check_file(args[1])
+    return StdioServer(sys.stdin.buffer, protocol_out).serve()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
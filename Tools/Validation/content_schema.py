@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Compiled content schema shared by validate_content.py and the CrewAI tools.
+
+content_schema.json describes events, decisions, order events and
+opportunities: the valid enum values (skills, categories, severities, ...),
+limits (tooltip length, option counts) and, per content kind, the structure
+checks with their exact severities and messages. This module compiles every
+check once into a closure with its enums and limits pre-bound, so checking a
+single event is a handful of dict lookups:
+
+    from content_schema import load_schema
+
+    schema = load_schema()
+    schema.enum("skills")                         # frozenset of skill names
+    schema.kind("event").validate(event)          # [SchemaIssue, ...]
+    schema.kind("order_event").check("structure.event_type", event)
+    validate_event(event)                         # picks the kind from the event
+
+validate_content.py runs the same compiled checks as its Phase 1 rules, so a
+single event validated here gets the same issues as in a full run.
+
+    python Tools/Validation/content_schema.py FILE.json [--kind opportunity]
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+SCHEMA_PATH = Path(__file__).resolve().with_name("content_schema.json")
+
+KIND_EVENT = "event"
+KIND_DECISION = "decision"
+KIND_ORDER_EVENT = "order_event"
+KIND_OPPORTUNITY = "opportunity"
+
+
+class SchemaError(ValueError):
+    """content_schema.json is malformed."""
+
+
+class SchemaIssue(NamedTuple):
+    rule: str
+    severity: str
+    category: str
+    message: str
+    # False for issues reported against the file rather than the object (e.g. a missing id)
+    scoped: bool = True
+    # JSON pointer of the offending value within the object, when there is one
+    pointer: Optional[str] = None
+
+
+# A compiled check: (object, wrapped content) -> issues
+Check = Callable[[Dict[str, Any], Dict[str, Any]], List[SchemaIssue]]
+
+
+def _expected(values: Iterable[str]) -> str:
+    return "{" + ", ".join(repr(value) for value in sorted(values)) + "}"
+
+
+class _Compiler:
+    """Turns the JSON check specs of one schema into closures."""
+
+    def __init__(self, enums: Dict[str, FrozenSet[str]], limits: Dict[str, int], wrapped: FrozenSet[str]):
+        self.enums = enums
+        self.limits = limits
+        self.wrapped = wrapped
+
+    def getter(self, field: str) -> Callable[[Dict[str, Any], Dict[str, Any]], Any]:
+        """Field accessor; schema v1 keeps text and options inside 'content'."""
+        if field in self.wrapped:
+            return lambda obj, content: obj.get(field) or content.get(field)
+        return lambda obj, content: obj.get(field)
+
+    def compile(self, spec: Dict[str, Any], rule: str) -> Check:
+        kind = spec.get("check")
+        builder = getattr(self, f"_compile_{kind}", None)
+        if builder is None:
+            raise SchemaError(f"{rule}: unknown check type '{kind}'")
+        try:
+            return builder(spec, rule, spec.get("severity"), spec.get("category", "structure"),
+                           spec.get("scoped", True))
+        except KeyError as e:
+            raise SchemaError(f"{rule}: '{kind}' check is missing {e}")
+
+    def _compile_required(self, spec, rule, severity, category, scoped) -> Check:
+        getters = [self.getter(field) for field in spec.get("any_of") or [spec["field"]]]
+        # Placeholder values that count as missing (e.g. an id of "UNKNOWN")
+        missing = frozenset(spec.get("missing_values", ()))
+        issue = SchemaIssue(rule, severity, category, spec["message"], scoped)
+
+        def check(obj, content):
+            for get in getters:
+                value = get(obj, content)
+                if value and not (isinstance(value, str) and value in missing):
+                    return []
+            return [issue]
+        return check
+
+    def _compile_enum(self, spec, rule, severity, category, scoped) -> Check:
+        get = self.getter(spec["field"])
+        pointer = "/" + spec["field"]
+        allowed = self.enums[spec["enum"]]
+        lower = spec.get("lower", False)
+        each = spec.get("each", False)
+        message = spec["message"]
+        expected = _expected(allowed)
+
+        def bad(value) -> bool:
+            key = str(value).lower() if lower else value
+            try:
+                return key not in allowed
+            except TypeError:  # Unhashable (list/dict where a string belongs)
+                return True
+
+        def check(obj, content):
+            value = get(obj, content)
+            if not value:
+                return []
+            if each:
+                values = enumerate(value) if isinstance(value, list) else ()
+                return [SchemaIssue(rule, severity, category, message.format(value=v, expected=expected), scoped,
+                                    f"{pointer}/{i}") for i, v in values if bad(v)]
+            if bad(value):
+                return [SchemaIssue(rule, severity, category, message.format(value=value, expected=expected), scoped,
+                                    pointer)]
+            return []
+        return check
+
+    def _compile_known_fields(self, spec, rule, severity, category, scoped) -> Check:
+        known = frozenset(spec["fields"])
+        message = spec["message"]
+
+        def check(obj, content):
+            unknown = obj.keys() - known
+            if not unknown:
+                return []
+            return [SchemaIssue(rule, severity, category, message.format(fields=sorted(unknown)), scoped)]
+        return check
+
+    def _compile_forbidden(self, spec, rule, severity, category, scoped) -> Check:
+        field = spec["field"]
+        issue = SchemaIssue(rule, severity, category, spec["message"], scoped, "/" + field)
+        return lambda obj, content: [issue] if field in obj else []
+
+    def _compile_field_order(self, spec, rule, severity, category, scoped) -> Check:
+        first, then = spec["first"], spec["then"]
+        issue = SchemaIssue(rule, severity, category, spec["message"], scoped)
+
+        def check(obj, content):
+            if first in obj and then in obj:
+                keys = list(obj)
+                if keys.index(then) != keys.index(first) + 1:
+                    return [issue]
+            return []
+        return check
+
+    def _compile_max_length(self, spec, rule, severity, category, scoped) -> Check:
+        get = self.getter(spec["field"])
+        pointer = "/" + spec["field"]
+        limit = self.limits[spec["limit"]]
+        message = spec["message"]
+
+        def check(obj, content):
+            value = get(obj, content)
+            if value and len(value) > limit:
+                return [SchemaIssue(rule, severity, category, message.format(length=len(value)), scoped, pointer)]
+            return []
+        return check
+
+    def _compile_option_count(self, spec, rule, severity, category, scoped) -> Check:
+        get = self.getter("options")
+        minimum = self.limits["options_min"]
+        maximum = self.limits["options_max"]
+        recommended = self.limits["options_recommended_max"]
+        allow_empty = frozenset(spec.get("allow_empty_ids", ()))
+        relaxed_categories = frozenset(spec.get("relaxed_categories", ()))
+        empty = SchemaIssue(rule, severity, category, spec["empty_message"], scoped, "/options")
+        many = SchemaIssue(rule, spec.get("many_severity", "warning"), category, spec["many_message"], scoped,
+                           "/options")
+        single_message, too_many_message = spec["single_message"], spec["too_many_message"]
+
+        def check(obj, content):
+            options = get(obj, content) or []
+            count = len(options)
+            if not count:
+                return [] if obj.get("id") in allow_empty else [empty]
+            if count < minimum:
+                return [SchemaIssue(rule, severity, category, single_message.format(count=count), scoped, "/options")]
+            if count > maximum:
+                return [SchemaIssue(rule, severity, category, too_many_message.format(count=count), scoped,
+                                    "/options")]
+            if count > recommended:
+                # Onboarding, one-time and abort events may offer more choices
+                relaxed = (obj.get("category", "") in relaxed_categories
+                           or (obj.get("timing") or {}).get("oneTime")
+                           or any(isinstance(option, dict) and option.get("abortsEnlistment")
+                                  for option in options))
+                if not relaxed:
+                    return [many]
+            return []
+        return check
+
+    def _compile_options(self, spec, rule, severity, category, scoped) -> Check:
+        get = self.getter("options")
+        # Per-option checks see the option as the object; "stop" skips the rest for that option
+        checks = [(self._compile_option_check(sub, rule), sub.get("stop", False)) for sub in spec["checks"]]
+
+        def check(obj, content):
+            issues = []
+            for i, option in enumerate(get(obj, content) or []):
+                if not isinstance(option, dict):
+                    continue
+                label = option.get("id", f"option_{i}")
+                for option_check, stop in checks:
+                    found = [issue._replace(pointer=f"/options/{i}{issue.pointer or ''}")
+                             for issue in option_check(option, label)]
+                    issues.extend(found)
+                    if found and stop:
+                        break
+            return issues
+        return check
+
+    def _compile_option_check(self, spec, rule) -> Callable[[Dict[str, Any], str], List[SchemaIssue]]:
+        severity, category, scoped = spec["severity"], spec.get("category", "structure"), spec.get("scoped", True)
+        message = spec["message"]
+        if spec["check"] == "required":
+            fields = spec.get("any_of") or [spec["field"]]
+
+            def check(option, label):
+                if any(option.get(field) for field in fields):
+                    return []
+                return [SchemaIssue(rule, severity, category, message.format(option=label), scoped)]
+            return check
+        if spec["check"] == "max_length":
+            field, limit = spec["field"], self.limits[spec["limit"]]
+
+            def check(option, label):
+                value = option.get(field)
+                if value and len(value) > limit:
+                    return [SchemaIssue(rule, severity, category,
+                                        message.format(option=label, length=len(value)), scoped, "/" + field)]
+                return []
+            return check
+        raise SchemaError(f"{rule}: unsupported option check '{spec['check']}'")
+
+
+class CompiledKind:
+    """The compiled checks of one content kind, grouped by rule in report order."""
+
+    __slots__ = ("name", "description", "rules", "_checks")
+
+    def __init__(self, name: str, description: str, checks: List[Tuple[str, Check, bool]]):
+        self.name = name
+        self.description = description
+        self._checks: Dict[str, List[Tuple[Check, bool]]] = {}
+        for rule, check, stop in checks:
+            self._checks.setdefault(rule, []).append((check, stop))
+        self.rules: Tuple[str, ...] = tuple(self._checks)
+
+    def check(self, rule: str, obj: Dict[str, Any]) -> List[SchemaIssue]:
+        """Issues for one rule. Within a rule, a failed "stop" check ends that rule."""
+        content = obj.get("content") or {}
+        if not isinstance(content, dict):
+            content = {}  # Malformed wrapper: validate the top-level fields only
+        issues: List[SchemaIssue] = []
+        for check, stop in self._checks.get(rule, ()):
+            found = check(obj, content)
+            if found:
+                issues.extend(found)
+                if stop:
+                    break
+        return issues
+
+    def validate(self, obj: Dict[str, Any]) -> List[SchemaIssue]:
+        """All issues for one object; a failed "stop" check (the id gate) ends validation."""
+        issues: List[SchemaIssue] = []
+        for rule in self.rules:
+            found = self.check(rule, obj)
+            issues.extend(found)
+            if found and any(stop for _, stop in self._checks[rule]):
+                break
+        return issues
+
+
+class ContentSchema:
+    """content_schema.json with every kind compiled."""
+
+    def __init__(self, data: Dict[str, Any]):
+        try:
+            self.version = data["version"]
+            self.enums: Dict[str, FrozenSet[str]] = {name: frozenset(values) for name, values in data["enums"].items()}
+            self.limits: Dict[str, int] = dict(data["limits"])
+            self.role_min_tiers: Dict[str, int] = dict(data.get("role_min_tiers", {}))
+            self.escalation_tracks: Dict[str, Tuple[int, int]] = {
+                track: tuple(bounds) for track, bounds in data.get("escalation_tracks", {}).items()}
+            specs = data["kinds"]
+        except (KeyError, TypeError) as e:
+            raise SchemaError(f"content_schema.json is missing {e}")
+        compiler = _Compiler(self.enums, self.limits, frozenset(data.get("wrapped_fields", ())))
+        self.kinds: Dict[str, CompiledKind] = {}
+        for name in specs:
+            self.kinds[name] = CompiledKind(name, specs[name].get("description", ""),
+                                            self._kind_checks(name, specs, compiler))
+
+    def _kind_checks(self, name: str, specs: Dict[str, Any], compiler: _Compiler,
+                     seen: Tuple[str, ...] = ()) -> List[Tuple[str, Check, bool]]:
+        if name in seen:
+            raise SchemaError(f"kind '{name}' extends itself")
+        spec = specs[name]
+        checks = spec.get("checks", [])
+        base = spec.get("extends")
+        if not base:
+            return [(c["rule"], compiler.compile(c, c["rule"]), c.get("stop", False)) for c in checks]
+        if base not in specs:
+            raise SchemaError(f"kind '{name}' extends unknown kind '{base}'")
+        inherited = self._kind_checks(base, specs, compiler, seen + (name,))
+        # Replaced rules keep their position in the base kind's report order
+        replaced = set(spec.get("replace_rules", ()))
+        own = [(c["rule"], compiler.compile(c, c["rule"]), c.get("stop", False)) for c in checks]
+        merged: List[Tuple[str, Check, bool]] = []
+        for rule, check, stop in inherited:
+            if rule in replaced:
+                if not any(r == rule for r, _, _ in merged):
+                    merged.extend(item for item in own if item[0] == rule)
+                continue
+            merged.append((rule, check, stop))
+        merged.extend(item for item in own if item[0] not in replaced)
+        return merged
+
+    def enum(self, name: str) -> FrozenSet[str]:
+        return self.enums[name]
+
+    def kind(self, name: str) -> CompiledKind:
+        try:
+            return self.kinds[name]
+        except KeyError:
+            raise SchemaError(f"unknown content kind '{name}' (known: {', '.join(self.kinds)})")
+
+
+def kind_of(obj: Dict[str, Any]) -> str:
+    """Content kind of an event-like object (opportunities are only known from their file)."""
+    if obj.get("order_type"):
+        return KIND_ORDER_EVENT
+    if str(obj.get("id", "")).startswith("dec_"):
+        return KIND_DECISION
+    return KIND_EVENT
+
+
+_LOADED: Dict[Path, Tuple[int, ContentSchema]] = {}
+
+
+def load_schema(path: Optional[Path] = None) -> ContentSchema:
+    """Compile the schema once per process (recompiled if the file changes)."""
+    path = path or SCHEMA_PATH
+    mtime = path.stat().st_mtime_ns
+    cached = _LOADED.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        raise SchemaError(f"{path.name}: invalid JSON: {e}")
+    schema = ContentSchema(data)
+    _LOADED[path] = (mtime, schema)
+    return schema
+
+
+def validate_event(event: Dict[str, Any], kind: Optional[str] = None) -> List[SchemaIssue]:
+    """Schema issues for one event/decision/order event (or opportunity with kind='opportunity')."""
+    return load_schema().kind(kind or kind_of(event)).validate(event)
+
+
+def main():
+    args = sys.argv[1:]
+    if not args or args[0] in ("-h", "--help"):
+        print(__doc__)
+        return 1
+    kind = None
+    if "--kind" in args:
+        at = args.index("--kind")
+        kind = args[at + 1] if at + 1 < len(args) else None
+        del args[at:at + 2]
+    found = 0
+    for file_name in args:
+        with open(file_name, encoding="utf-8-sig") as f:
+            data = json.load(f)
+        items = data if isinstance(data, list) else (
+            data.get("events") or data.get("opportunities") or [data]) if isinstance(data, dict) else []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            for issue in validate_event(item, kind):
+                found += 1
+                print(f"[{issue.severity.upper()}] {file_name}:{item.get('id', '?')} [{issue.rule}] {issue.message}")
+    print(f"{found} issue(s)")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
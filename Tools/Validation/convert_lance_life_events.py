@@ -6,6 +6,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import html
 
+from localization_index import load_index
+
 
 ROOT = Path(__file__).resolve().parents[2]
 DOCS = ROOT / "docs" / "research"
@@ -64,9 +66,8 @@ def _upsert_enlisted_strings(string_table: Dict[str, str]) -> None:
     if not LANG_XML.exists():
         raise FileNotFoundError(f"Missing language file: {LANG_XML}")
 
-    xml_text = LANG_XML.read_text(encoding="utf-8")
-    # Collect existing ids quickly.
-    existing = set(re.findall(r'id="([^"]+)"', xml_text, flags=re.IGNORECASE))
+    # Collect existing ids from the shared (snapshot-backed) localization index.
+    existing = set(load_index(LANG_XML).ids())
 
     additions: List[str] = []
     for sid in sorted(string_table.keys(), key=lambda s: s.lower()):
@@ -78,6 +79,7 @@ def _upsert_enlisted_strings(string_table: Dict[str, str]) -> None:
     if not additions:
         return
 
+    xml_text = LANG_XML.read_text(encoding="utf-8")
     marker = "</strings>"
     idx = xml_text.rfind(marker)
     if idx < 0:
@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+Single-pass C# source index for validate_content.py.
+
+Phases 7, 8 and 9 all need the C# sources under src/. Instead of each phase
+walking src/ with rglob and re-reading every file (with different encodings),
+the index reads each file once (memory-mapped where possible) and keeps:
+
+- the decoded text (UTF-8, BOM stripped, newlines normalized to '\\n')
+- the SHA-256 of the raw bytes
+- line start offsets (for offset -> line lookups)
+- comment / string / char literal spans (computed lazily on first query)
+- the block and statement structure (computed lazily, see scan_structure)
+
+Every C# rule queries the same SourceFile objects, so they share one
+consistent view of the code.
+"""
+
+import bisect
+import hashlib
+import mmap
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+SPAN_COMMENT = "comment"
+SPAN_STRING = "string"
+SPAN_CHAR = "char"
+
+BLOCK_FILE = "file"
+BLOCK_TYPE = "type"              # namespace, class, struct, interface, record, enum
+BLOCK_MEMBER = "member"          # method, constructor, property, accessor, local function
+BLOCK_CONTROL = "control"        # if/else/for/while/switch/try/... and bare blocks
+BLOCK_LAMBDA = "lambda"
+BLOCK_INITIALIZER = "initializer"  # object/collection initializers, switch expressions
+
+
+def _read_bytes_and_hash(path: Path) -> Tuple[str, str]:
+    """Read and decode a file through mmap; returns (text, sha256)."""
+    with open(path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                sha = hashlib.sha256(mm).hexdigest()
+                text = str(memoryview(mm), "utf-8-sig")
+        except ValueError:
+            # Empty files cannot be mapped
+            data = f.read()
+            sha = hashlib.sha256(data).hexdigest()
+            text = data.decode("utf-8-sig")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text, sha
+
+
+# Characters that can open a comment or literal; everything else is skipped in bulk
+_LITERAL_START = re.compile(r"""[/"'@$]""")
+
+
+def scan_literal_spans(text: str) -> List[Tuple[int, int, str]]:
+    """
+    Find comment, string and char literal spans in C# source.
+
+    Handles // and /* */ comments, regular, verbatim (@"") and interpolated ($"", $@"")
+    strings including nested strings inside interpolation holes. Spans are
+    (start, end, kind) with end exclusive, in source order.
+    """
+    spans: List[Tuple[int, int, str]] = []
+    n = len(text)
+    i = 0
+    search = _LITERAL_START.search
+    while i < n:
+        match = search(text, i)
+        if match is None:
+            break
+        i = match.start()
+        c = text[i]
+        if c == "/" and i + 1 < n:
+            nxt = text[i + 1]
+            if nxt == "/":
+                end = text.find("\n", i)
+                end = n if end == -1 else end
+                spans.append((i, end, SPAN_COMMENT))
+                i = end
+                continue
+            if nxt == "*":
+                end = text.find("*/", i + 2)
+                end = n if end == -1 else end + 2
+                spans.append((i, end, SPAN_COMMENT))
+                i = end
+                continue
+        if c == '"' or (c in "@$" and i + 1 < n and text[i + 1] in '"@$'):
+            end = _scan_string(text, i)
+            if end > i:
+                spans.append((i, end, SPAN_STRING))
+                i = end
+                continue
+        if c == "'":
+            j = i + 1
+            while j < n and text[j] != "'" and text[j] != "\n":
+                j += 2 if text[j] == "\\" else 1
+            end = min(j + 1, n)
+            spans.append((i, end, SPAN_CHAR))
+            i = end
+            continue
+        i += 1
+    return spans
+
+
+def _scan_string(text: str, start: int) -> int:
+    """Return the end offset (exclusive) of the string literal beginning at start."""
+    n = len(text)
+    i = start
+    verbatim = interpolated = False
+    while i < n and text[i] in "@$":
+        verbatim |= text[i] == "@"
+        interpolated |= text[i] == "$"
+        i += 1
+    if i >= n or text[i] != '"':
+        return start
+    i += 1
+    while i < n:
+        c = text[i]
+        if c == "\\" and not verbatim:
+            i += 2
+            continue
+        if c == '"':
+            if verbatim and i + 1 < n and text[i + 1] == '"':
+                i += 2
+                continue
+            return i + 1
+        if c == "\n" and not verbatim:
+            return i  # Unterminated - stop at end of line
+        if interpolated and c == "{":
+            if i + 1 < n and text[i + 1] == "{":
+                i += 2
+                continue
+            i = _skip_interpolation_hole(text, i + 1)
+            continue
+        i += 1
+    return n
+
+
+def _skip_interpolation_hole(text: str, i: int) -> int:
+    """Skip an interpolation hole body (after '{'), honouring nested strings and braces."""
+    n = len(text)
+    depth = 1
+    while i < n and depth:
+        c = text[i]
+        if c == '"' or (c in "@$" and i + 1 < n and text[i + 1] in '"@$'):
+            end = _scan_string(text, i)
+            if end > i:
+                i = end
+                continue
+        if c == "'":
+            i += 1
+            while i < n and text[i] != "'" and text[i] != "\n":
+                i += 2 if text[i] == "\\" else 1
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+        i += 1
+    return i
+
+def blank_literals(text: str, spans: List[Tuple[int, int, str]]) -> str:
+    """Text with every comment and literal replaced by spaces (offsets and newlines kept)."""
+    parts = []
+    pos = 0
+    for start, end, _ in spans:
+        parts.append(text[pos:start])
+        chunk = text[start:end]
+        parts.append(" " * len(chunk) if "\n" not in chunk else re.sub(r"[^\n]", " ", chunk))
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+_TYPE_HEADER = re.compile(r"(?:^|[\s\]])(?:class|struct|interface|record|enum|namespace)\s+[\w@]")
+_CONTROL_HEADER = re.compile(
+    r"(?:else\b|if\b|for\b|foreach\b|while\b|do\b|switch\b|try\b|catch\b|finally\b|using\b|lock\b"
+    r"|unsafe\b|fixed\b|checked\b|unchecked\b|case\b|default\s*:|$)")
+_CONSTRAINED_MEMBER = re.compile(r"\)\s*where\b")
+_GROUP = re.compile(r"\([^()]*\)|\[[^\[\]]*\]")
+_ASSIGNMENT = re.compile(r"(?<![=!<>])=(?![=>])")
+_INITIALIZER_TAIL = re.compile(r"(?:^return\b|\bnew\s*(?:[\w<>.?]|,\s*)*$|\bswitch$)")
+
+
+def _outside_groups(header: str) -> str:
+    """Header with (...) and [...] groups removed, e.g. arguments and attributes."""
+    previous = None
+    while previous != header:
+        previous, header = header, _GROUP.sub("", header)
+    return header.strip()
+
+
+def _block_kind(header: str, in_expression: bool) -> str:
+    """Classify a block from the code before its '{' (literals already blanked)."""
+    if header.endswith("=>"):
+        return BLOCK_LAMBDA
+    if in_expression:
+        return BLOCK_INITIALIZER
+    if _CONTROL_HEADER.match(header):
+        return BLOCK_CONTROL
+    if _CONSTRAINED_MEMBER.search(header):
+        return BLOCK_MEMBER
+    outer = _outside_groups(header)
+    if _ASSIGNMENT.search(outer) or _INITIALIZER_TAIL.search(outer):
+        return BLOCK_INITIALIZER
+    if _TYPE_HEADER.search(header):
+        return BLOCK_TYPE
+    return BLOCK_MEMBER
+
+
+class CodeBlock:
+    """A brace-delimited block: its header, braces and direct child statements."""
+
+    __slots__ = ("kind", "header_start", "start", "end", "parent", "statements")
+
+    def __init__(self, kind: str, header_start: int, start: int, parent: int):
+        self.kind = kind
+        self.header_start = header_start  # first code character of the header
+        self.start = start                # offset of '{'
+        self.end = -1                     # offset after the matching '}'
+        self.parent = parent
+        # Direct children in source order: (start, end, block) where block is the
+        # index of a child block the statement owns (if/for/method bodies), else -1
+        self.statements: List[Tuple[int, int, int]] = []
+
+
+class CodeStructure:
+    """
+    Blocks and statements of one C# file, from a single linear scan.
+
+    Statements end at ';' outside parentheses or at the '}' of a block they own;
+    lambda and initializer blocks stay part of the statement that contains them.
+    """
+
+    __slots__ = ("code", "blocks", "_starts")
+
+    def __init__(self, code: str, blocks: List[CodeBlock]):
+        self.code = code
+        self.blocks = blocks
+        self._starts = [block.start for block in blocks]
+
+    def block_at(self, offset: int) -> int:
+        """Index of the innermost block containing offset (0 is the whole file)."""
+        idx = bisect.bisect_right(self._starts, offset) - 1
+        blocks = self.blocks
+        while idx > 0 and not (blocks[idx].start < offset < blocks[idx].end):
+            idx = blocks[idx].parent
+        return max(idx, 0)
+
+    def ancestors(self, block: int) -> Iterator[int]:
+        """block and its enclosing blocks, innermost first."""
+        while block >= 0:
+            yield block
+            block = self.blocks[block].parent
+
+    def member_of(self, offset: int) -> Optional[int]:
+        """Index of the innermost method/property/accessor body containing offset."""
+        for idx in self.ancestors(self.block_at(offset)):
+            if self.blocks[idx].kind == BLOCK_MEMBER:
+                return idx
+        return None
+
+    def statement_at(self, block: int, offset: int) -> Optional[Tuple[int, int, int]]:
+        """The direct child statement of block that contains offset."""
+        statements = self.blocks[block].statements
+        idx = bisect.bisect_right(statements, (offset, float("inf"), 0)) - 1
+        if idx >= 0 and statements[idx][0] <= offset < statements[idx][1]:
+            return statements[idx]
+        return None
+
+    def statement_span(self, statement: Tuple[int, int, int]) -> Tuple[int, int]:
+        """(start, end) of a statement; for statements owning a block, only the header."""
+        start, end, child = statement
+        return (start, self.blocks[child].start) if child >= 0 else (start, end)
+
+    def statement_text(self, statement: Tuple[int, int, int]) -> str:
+        start, end = self.statement_span(statement)
+        return self.code[start:end]
+
+    def header(self, block: int) -> str:
+        node = self.blocks[block]
+        return self.code[node.header_start:node.start].strip() if block else ""
+
+
+# Parenthesized groups without braces or ';' inside are skipped as one token
+_STRUCTURE_TOKEN = re.compile(r"\([^(){};]*\)|[{};()]")
+_NON_SPACE = re.compile(r"\S")
+
+
+def scan_structure(code: str) -> CodeStructure:
+    """
+    Build the block/statement structure of C# code whose comments and literals
+    are blanked (see blank_literals). Runs in one pass over the text.
+    """
+    blocks = [CodeBlock(BLOCK_FILE, 0, -1, -1)]
+    blocks[0].end = len(code) + 1
+    top = 0
+    paren = 0
+    statement_start = 0
+    # (parent block, parent paren depth, parent statement start) per open block
+    stack: List[Tuple[int, int, int]] = []
+    non_space = _NON_SPACE.search
+
+    def first_code(start: int, end: int) -> int:
+        match = non_space(code, start, end)
+        return match.start() if match else end
+
+    for match in _STRUCTURE_TOKEN.finditer(code):
+        c = match.group()
+        pos = match.start()
+        if len(c) > 1:
+            continue
+        if c == "(":
+            paren += 1
+        elif c == ")":
+            paren = max(0, paren - 1)
+        elif c == ";":
+            if paren == 0:
+                start = first_code(statement_start, pos)
+                blocks[top].statements.append((start, pos + 1, -1))
+                statement_start = pos + 1
+        elif c == "{":
+            header_start = first_code(statement_start, pos)
+            kind = _block_kind(code[header_start:pos].strip(),
+                               paren > 0 or blocks[top].kind == BLOCK_INITIALIZER)
+            blocks.append(CodeBlock(kind, header_start, pos, top))
+            stack.append((top, paren, statement_start))
+            top = len(blocks) - 1
+            paren = 0
+            statement_start = pos + 1
+        elif stack:
+            block = blocks[top]
+            start = first_code(statement_start, pos)
+            if start < pos:
+                # Last statement without ';' (enum members, initializer elements, ...)
+                block.statements.append((start, pos, -1))
+            block.end = pos + 1
+            child = top
+            top, paren, statement_start = stack.pop()
+            if paren == 0 and block.kind not in (BLOCK_LAMBDA, BLOCK_INITIALIZER):
+                blocks[top].statements.append((block.header_start, pos + 1, child))
+                statement_start = pos + 1
+    # Unbalanced braces: close whatever is still open at end of file
+    for block in blocks:
+        if block.end < 0:
+            block.end = len(code) + 1
+    return CodeStructure(code, blocks)
+
+
+class SourceFile:
+    """One indexed C# file."""
+
+    __slots__ = ("path", "name", "text", "sha256", "error",
+                 "_lines", "_line_offsets", "_spans", "_span_starts", "_structure")
+
+    def __init__(self, path: Path, base: Optional[Path] = None):
+        self.path = path
+        self.name = path.name
+        self.text = ""
+        self.sha256 = ""
+        self.error: Optional[Exception] = None
+        self._lines: Optional[List[str]] = None
+        self._line_offsets: Optional[List[int]] = None
+        self._spans: Optional[List[Tuple[int, int, str]]] = None
+        self._span_starts: Optional[List[int]] = None
+        self._structure: Optional[CodeStructure] = None
+        try:
+            self.text, self.sha256 = _read_bytes_and_hash(base / path if base else path)
+        except (OSError, UnicodeDecodeError) as e:
+            self.error = e
+
+    @property
+    def readable(self) -> bool:
+        return self.error is None
+
+    @property
+    def lines(self) -> List[str]:
+        if self._lines is None:
+            self._lines = self.text.split("\n")
+        return self._lines
+
+    @property
+    def line_offsets(self) -> List[int]:
+        """Offset of the first character of every line."""
+        if self._line_offsets is None:
+            offsets = [0]
+            find = self.text.find
+            pos = find("\n")
+            while pos != -1:
+                offsets.append(pos + 1)
+                pos = find("\n", pos + 1)
+            self._line_offsets = offsets
+        return self._line_offsets
+
+    def line_of(self, offset: int) -> int:
+        """1-based line number containing offset."""
+        return bisect.bisect_right(self.line_offsets, offset)
+
+    @property
+    def spans(self) -> List[Tuple[int, int, str]]:
+        """Comment / string / char literal spans (computed on first use)."""
+        if self._spans is None:
+            self._spans = scan_literal_spans(self.text)
+            self._span_starts = [s[0] for s in self._spans]
+        return self._spans
+
+    def span_at(self, offset: int) -> Optional[Tuple[int, int, str]]:
+        """The comment/string span containing offset, if any."""
+        spans = self.spans
+        idx = bisect.bisect_right(self._span_starts, offset) - 1
+        if idx >= 0 and spans[idx][0] <= offset < spans[idx][1]:
+            return spans[idx]
+        return None
+
+    def is_code(self, offset: int) -> bool:
+        """True if offset is outside comments and literals."""
+        return self.span_at(offset) is None
+
+    @property
+    def structure(self) -> CodeStructure:
+        """Blocks and statements (computed on first use)."""
+        if self._structure is None:
+            self._structure = scan_structure(blank_literals(self.text, self.spans))
+        return self._structure
+
+
+class CSharpSourceIndex:
+    """
+    All C# files under a source root, read once.
+
+    root is relative to base (default: the working directory); file paths stay
+    relative to base, the way the validator reports them.
+    """
+
+    def __init__(self, root: Path = Path("src"), base: Optional[Path] = None):
+        self.root = root
+        self.base = base
+        self.root_exists = self._root_dir().exists()
+        self.files: List[SourceFile] = []
+        self._by_path: Dict[str, SourceFile] = {}
+
+    @classmethod
+    def build(cls, root: Path = Path("src"), base: Optional[Path] = None) -> "CSharpSourceIndex":
+        index = cls(root, base)
+        if index.root_exists:
+            for path in index._scan():
+                index._add(SourceFile(path, base))
+        return index
+
+    def _root_dir(self) -> Path:
+        return self.base / self.root if self.base else self.root
+
+    def _scan(self) -> Iterator[Path]:
+        for path in self._root_dir().rglob("*.cs"):
+            yield path.relative_to(self.base) if self.base else path
+
+    def update(self, changed_paths) -> None:
+        """
+        Re-read changed files and pick up added/removed ones.
+
+        Unchanged files keep their SourceFile (and any lazily computed spans);
+        file order stays identical to a fresh build.
+        """
+        changed = {Path(p).as_posix() for p in changed_paths}
+        previous = self._by_path
+        self.root_exists = self._root_dir().exists()
+        self.files = []
+        self._by_path = {}
+        if not self.root_exists:
+            return
+        for path in self._scan():
+            key = path.as_posix()
+            source = previous.get(key)
+            if source is None or key in changed:
+                source = SourceFile(path, self.base)
+            self._add(source)
+
+    def _add(self, source: SourceFile):
+        self.files.append(source)
+        self._by_path[source.path.as_posix()] = source
+
+    def __iter__(self) -> Iterator[SourceFile]:
+        return iter(self.files)
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def get(self, path) -> Optional[SourceFile]:
+        return self._by_path.get(Path(path).as_posix())
+
+    def posix_paths(self) -> List[str]:
+        return [f.path.as_posix() for f in self.files]
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Event -> flag -> event dependency graph for validate_content.py Phase 4.
+
+Every event is a node gated by the flags in its triggers (all / any / none) and
+linked to the flags its options set (effects.setFlags, effects.set_flags,
+flags_set). Flags only accumulate in this model (a clear never makes content
+reachable), so reachability is a monotone fixpoint computed in one pass over
+the edges:
+
+- an event can fire once every `all` flag, and one `any` flag (when `any` is
+  flags only), is set by an event that can fire
+- a flag is reachable once an event that can fire sets it
+
+On top of that, in O(events + flags + edges):
+
+- flags whose setters can never fire (dead flags)
+- strongly connected groups of events that each wait for another's flag
+  (Tarjan SCC), none of which can fire first
+- `none` gates that permanently block an event: the flag is also required, or
+  every option that sets a required flag also sets the forbidden one and no
+  content clears it
+
+Usage:
+    python Tools/Validation/flag_graph.py                    # findings + summary
+    python Tools/Validation/flag_graph.py --dot flags.dot    # Graphviz export
+    python Tools/Validation/flag_graph.py --json flags.json  # machine-readable export
+"""
+
+import argparse
+import json
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from reference_graph import flags_cleared_by, flags_set_by
+
+GATE_ALL = "all"
+GATE_ANY = "any"
+GATE_NONE = "none"
+FLAG_TRIGGER_PREFIXES = ("has_flag:", "flag:")
+
+
+def _trigger_flag(trigger: Any) -> Optional[str]:
+    if isinstance(trigger, str):
+        for prefix in FLAG_TRIGGER_PREFIXES:
+            if trigger.startswith(prefix):
+                return trigger[len(prefix):]
+    return None
+
+
+class FlagNode(NamedTuple):
+    """One event's flag gates and per-option flag effects (cached with the Phase 1-4 facts)."""
+    event_id: str
+    file: str
+    all: List[str]
+    any: List[str]
+    # `any` also lists non-flag conditions, so it can hold without a flag
+    any_open: bool
+    none: List[str]
+    option_sets: List[List[str]]
+    clears: List[str]
+
+    @classmethod
+    def from_event(cls, event_id: str, file_path: str, triggers: Dict[str, Any],
+                   options: Iterable[Any]) -> Optional["FlagNode"]:
+        """The node for one event, or None if it neither reads nor writes flags."""
+        gates = {}
+        any_open = False
+        for gate in (GATE_ALL, GATE_ANY, GATE_NONE):
+            entries = (triggers.get(gate) or []) if isinstance(triggers, dict) else []
+            flags = []
+            for trigger in entries if isinstance(entries, list) else ():
+                flag = _trigger_flag(trigger)
+                if flag is not None:
+                    flags.append(flag)
+                elif gate == GATE_ANY:
+                    any_open = True
+            gates[gate] = flags
+        option_sets = []
+        clears = []
+        for option in options:
+            if isinstance(option, dict):
+                option_sets.append([f for f in flags_set_by(option) if isinstance(f, str)])
+                clears.extend(f for f in flags_cleared_by(option) if isinstance(f, str))
+        if not any(gates.values()) and not any(option_sets) and not clears:
+            return None
+        return cls(event_id, file_path, gates[GATE_ALL], gates[GATE_ANY], any_open, gates[GATE_NONE],
+                   [sets for sets in option_sets if sets], clears)
+
+    @property
+    def sets(self) -> Set[str]:
+        return {flag for sets in self.option_sets for flag in sets}
+
+    def to_fields(self) -> List[Any]:
+        """Positional form stored in the content facts cache (FlagNode(*fields))."""
+        return list(self)
+
+
+class FlagAnalysis(NamedTuple):
+    reachable_events: Set[str]
+    reachable_flags: Set[str]
+    # event -> gate flags that are never set by reachable content
+    unreachable_events: Dict[str, List[str]]
+    # flag -> its setters (all unreachable)
+    dead_flags: Dict[str, List[str]]
+    # each: (event IDs in the group, flags linking them)
+    cycles: List[Tuple[List[str], List[str]]]
+    # (event ID, forbidden flag, required flag or None for a direct contradiction)
+    blocking_none_gates: List[Tuple[str, str, Optional[str]]]
+
+
+class FlagGraph:
+    """Events, the flags they read and write, and both directions of every edge."""
+
+    def __init__(self, nodes: Iterable[FlagNode] = ()):
+        self.nodes: Dict[str, FlagNode] = {}
+        self.setters: Dict[str, List[str]] = {}
+        self.clearers: Dict[str, List[str]] = {}
+        # flag -> [(event, gate)]
+        self.readers: Dict[str, List[Tuple[str, str]]] = {}
+        # event -> sorted flags any of its options sets
+        self.sets: Dict[str, List[str]] = {}
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node: FlagNode):
+        if node.event_id in self.nodes:
+            return  # Duplicate IDs are reported by Phase 1; the first definition wins, as in-game
+        self.nodes[node.event_id] = node
+        sets = self.sets[node.event_id] = sorted(node.sets)
+        for flag in sets:
+            self.setters.setdefault(flag, []).append(node.event_id)
+        for flag in dict.fromkeys(node.clears):
+            self.clearers.setdefault(flag, []).append(node.event_id)
+        for gate, flags in ((GATE_ALL, node.all), (GATE_ANY, node.any), (GATE_NONE, node.none)):
+            for flag in dict.fromkeys(flags):
+                self.readers.setdefault(flag, []).append((node.event_id, gate))
+
+    @property
+    def flags(self) -> List[str]:
+        return list(dict.fromkeys([*self.setters, *self.clearers, *self.readers]))
+
+    # ---- Analysis ----------------------------------------------------------
+
+    def _contradictions(self) -> List[Tuple[str, str, Optional[str]]]:
+        """`none` gates that can never pass while the event can otherwise fire."""
+        found = []
+        for node in self.nodes.values():
+            required = set(node.all)
+            for flag in dict.fromkeys(node.none):
+                if flag in required:
+                    found.append((node.event_id, flag, None))
+                    continue
+                if flag in self.clearers:
+                    continue
+                # Every option setting a required flag also sets the forbidden one
+                for needed in node.all:
+                    option_sets = [sets for setter in self.setters.get(needed, ())
+                                   for sets in self.nodes[setter].option_sets if needed in sets]
+                    if option_sets and all(flag in sets for sets in option_sets):
+                        found.append((node.event_id, flag, needed))
+                        break
+        return found
+
+    def analyze(self) -> FlagAnalysis:
+        blocking = self._contradictions()
+        blocked = {event_id for event_id, _, _ in blocking}
+
+        # Outstanding requirements per event: each distinct `all` flag, plus one for a flag-only `any`
+        pending: Dict[str, int] = {}
+        any_waiting: Set[str] = set()
+        queue = deque()
+        for event_id, node in self.nodes.items():
+            count = len(set(node.all))
+            if node.any and not node.any_open:
+                count += 1
+                any_waiting.add(event_id)
+            pending[event_id] = count
+            if count == 0 and event_id not in blocked:
+                queue.append(event_id)
+
+        reachable_events: Set[str] = set(queue)
+        reachable_flags: Set[str] = set()
+        while queue:
+            for flag in self.sets[queue.popleft()]:
+                if flag in reachable_flags:
+                    continue
+                reachable_flags.add(flag)
+                for reader, gate in self.readers.get(flag, ()):
+                    if gate == GATE_ALL:
+                        pending[reader] -= 1
+                    elif gate == GATE_ANY and reader in any_waiting:
+                        any_waiting.discard(reader)
+                        pending[reader] -= 1
+                    else:
+                        continue
+                    if pending[reader] == 0 and reader not in blocked and reader not in reachable_events:
+                        reachable_events.add(reader)
+                        queue.append(reader)
+
+        unreachable = {}
+        for event_id, node in self.nodes.items():
+            if event_id in reachable_events:
+                continue
+            missing = [f for f in dict.fromkeys(node.all) if f not in reachable_flags]
+            if event_id in any_waiting:
+                missing.extend(f for f in dict.fromkeys(node.any) if f not in reachable_flags)
+            unreachable[event_id] = missing
+
+        dead_flags = {flag: setters for flag, setters in self.setters.items()
+                      if flag not in reachable_flags}
+
+        cycles = []
+        for component in self.strongly_connected_events():
+            if any(event_id in reachable_events for event_id in component):
+                continue
+            members = set(component)
+            if len(component) == 1 and not self._gates(component[0]).intersection(self.sets[component[0]]):
+                continue
+            links = sorted({flag for event_id in component for flag in self._gates(event_id)
+                            if any(setter in members for setter in self.setters.get(flag, ()))})
+            cycles.append((component, links))
+
+        return FlagAnalysis(reachable_events, reachable_flags, unreachable, dead_flags, cycles, blocking)
+
+    def _gates(self, event_id: str) -> Set[str]:
+        node = self.nodes[event_id]
+        return set(node.all) | set(node.any)
+
+    def strongly_connected_events(self) -> List[List[str]]:
+        """
+        Tarjan's SCCs over setter -> gated-event edges (iterative, O(V + E)).
+        Components come out in reverse topological order, members in file order.
+        """
+        successors: Dict[str, List[str]] = {}
+        for event_id in self.nodes:
+            targets = []
+            for flag in self.sets[event_id]:
+                targets.extend(reader for reader, gate in self.readers.get(flag, ()) if gate != GATE_NONE)
+            successors[event_id] = list(dict.fromkeys(targets))
+
+        order = {event_id: position for position, event_id in enumerate(self.nodes)}
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components: List[List[str]] = []
+        counter = 0
+        for root in self.nodes:
+            if root in index:
+                continue
+            work = [(root, iter(successors[root]))]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                event_id, children = work[-1]
+                advanced = False
+                for child in children:
+                    if child not in index:
+                        index[child] = lowlink[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(successors[child])))
+                        advanced = True
+                        break
+                    if child in on_stack:
+                        lowlink[event_id] = min(lowlink[event_id], index[child])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[event_id])
+                if lowlink[event_id] == index[event_id]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == event_id:
+                            break
+                    components.append(sorted(component, key=order.__getitem__))
+        return components
+
+    # ---- Export ------------------------------------------------------------
+
+    def to_dict(self, analysis: Optional[FlagAnalysis] = None) -> Dict[str, Any]:
+        analysis = analysis or self.analyze()
+        return {
+            "events": [{
+                "id": node.event_id, "file": node.file,
+                "reachable": node.event_id in analysis.reachable_events,
+                "all": node.all, "any": node.any, "any_open": node.any_open, "none": node.none,
+                "sets": self.sets[node.event_id], "clears": sorted(set(node.clears)),
+            } for node in self.nodes.values()],
+            "flags": [{
+                "flag": flag,
+                "reachable": flag in analysis.reachable_flags,
+                "setters": self.setters.get(flag, []),
+                "clearers": self.clearers.get(flag, []),
+                "readers": [{"event": event_id, "gate": gate} for event_id, gate in self.readers.get(flag, ())],
+            } for flag in self.flags],
+            "cycles": [{"events": events, "flags": flags} for events, flags in analysis.cycles],
+            "blocking_none_gates": [{"event": event_id, "flag": flag, "required": required}
+                                    for event_id, flag, required in analysis.blocking_none_gates],
+        }
+
+    def to_dot(self, analysis: Optional[FlagAnalysis] = None) -> str:
+        """Graphviz: events are boxes, flags ellipses; unreachable nodes are grey."""
+        analysis = analysis or self.analyze()
+
+        def quote(name: str) -> str:
+            return '"' + name.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+        lines = ["digraph flags {", "  rankdir=LR;", '  node [fontname="Helvetica", fontsize=10];']
+        for event_id in self.nodes:
+            style = "" if event_id in analysis.reachable_events else ', style=filled, fillcolor="#dddddd"'
+            lines.append(f"  {quote('event:' + event_id)} [label={quote(event_id)}, shape=box{style}];")
+        for flag in self.flags:
+            style = "" if flag in analysis.reachable_flags else ', style=filled, fillcolor="#dddddd"'
+            lines.append(f"  {quote('flag:' + flag)} [label={quote(flag)}, shape=ellipse{style}];")
+        for event_id, node in self.nodes.items():
+            for flag in self.sets[event_id]:
+                lines.append(f"  {quote('event:' + event_id)} -> {quote('flag:' + flag)};")
+            for flag in sorted(set(node.clears)):
+                lines.append(f"  {quote('event:' + event_id)} -> {quote('flag:' + flag)} [style=dotted, label=clear];")
+        for flag, readers in self.readers.items():
+            for event_id, gate in readers:
+                attributes = ' [style=dashed, color=red, label=none]' if gate == GATE_NONE else f" [label={gate}]"
+                lines.append(f"  {quote('flag:' + flag)} -> {quote('event:' + event_id)}{attributes};")
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+
+def build_from_content(use_cache: bool = True) -> FlagGraph:
+    """Graph of the project's content, from the (cached) Phase 1-4 facts."""
+    import io
+    import validate_content
+    # Progress lines of the validator are not part of this tool's output
+    session = validate_content.ValidationSession(use_cache=use_cache, out=io.StringIO())
+    session.load_localization()
+    session.discover_files()
+    session.validate_content()
+    nodes = []
+    for file_path in session.content_files:
+        nodes.extend(session.content_facts[file_path].flag_nodes)
+    return FlagGraph(nodes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze and export the event/flag dependency graph")
+    parser.add_argument("--dot", metavar="PATH", help="Write a Graphviz DOT file")
+    parser.add_argument("--json", metavar="PATH", help="Write the graph and findings as JSON")
+    parser.add_argument("--no-cache", action="store_true", help="Re-validate every content file")
+    args = parser.parse_args()
+
+    graph = build_from_content(use_cache=not args.no_cache)
+    analysis = graph.analyze()
+    if args.dot:
+        Path(args.dot).write_text(graph.to_dot(analysis), encoding="utf-8")
+        print(f"Wrote {args.dot}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(graph.to_dict(analysis), indent=2), encoding="utf-8")
+        print(f"Wrote {args.json}")
+
+    for event_id, missing in analysis.unreachable_events.items():
+        print(f"  [UNREACHABLE] {event_id} ({graph.nodes[event_id].file}) waits for {missing}")
+    for flag, setters in analysis.dead_flags.items():
+        print(f"  [DEAD FLAG] {flag} set only by {setters}")
+    for events, flags in analysis.cycles:
+        print(f"  [CYCLE] {events} via {flags}")
+    for event_id, flag, required in analysis.blocking_none_gates:
+        print(f"  [BLOCKED] {event_id}: none-gate '{flag}'" + (f" always set with '{required}'" if required else " is also required"))
+    print(f"{len(graph.nodes)} event(s) with flags, {len(graph.flags)} flag(s): "
+          f"{len(analysis.reachable_events)} event(s) and {len(analysis.reachable_flags)} flag(s) reachable")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Global ID registry for every content and dialogue type.
+
+One pass over ModuleData/Enlisted records every ID the game looks up by key,
+grouped into namespaces (one per runtime catalog):
+
+    event        events, decisions and order events
+    opportunity  camp opportunities (Decisions/camp_opportunities*.json)
+    order        orders (Orders/orders_*.json)
+    incident     company simulation incidents (simulation_config.json incident_definitions)
+    override     orchestrator overrides (needBasedOverrides/varietyInjections keys)
+    condition    injuries and illnesses (Conditions/condition_defs.json)
+    injury       injuries (Content/injuries.json)
+    dialogue     dialogue nodes (Dialogue/*.json)
+
+IDs are unique within a namespace. Dialogue nodes are the exception: a node ID
+may repeat with different `context` gates (the catalog picks the most specific
+match), so only a repeated (ID, context) pair collides. An ID used by more than
+one namespace is legal but ambiguous in logs and lookups, and is reported as
+shared. Duplicate keys inside a JSON object (which json.load silently drops)
+are recorded too.
+
+    registry = load_registry()
+    registry.lookup("order_guard_duty")     # [IdEntry(namespace='order', ...)]
+    registry.ids("opportunity")             # sorted IDs of one namespace
+    registry.collisions()                   # duplicates and shared IDs
+
+The registry is persisted in Tools/Validation/.cache/id_registry.pickle with the
+(mtime, size) of every input file, like reference_graph.py; a later load only
+re-reads files that changed. Phase 10 of validate_content.py reports its
+collisions.
+
+Usage:
+    python Tools/Validation/id_registry.py lookup order_guard_duty
+    python Tools/Validation/id_registry.py list opportunity
+    python Tools/Validation/id_registry.py collisions
+    python Tools/Validation/id_registry.py stats
+
+Options:
+    --json       Print the answer as JSON
+    --rebuild    Ignore the persisted registry and rescan every file
+"""
+
+import argparse
+import bisect
+import fnmatch
+import json
+import os
+import pickle
+import re
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from validation_cache import atomic_write
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+CONTENT_ROOT = PROJECT_ROOT / "ModuleData" / "Enlisted"
+SNAPSHOT_PATH = Path(__file__).resolve().parent / ".cache" / "id_registry.pickle"
+SNAPSHOT_VERSION = 1
+
+# (id, is an object key rather than an "id" value, variant)
+RawId = Tuple[str, bool, str]
+
+
+class _Object(dict):
+    """A JSON object that remembers its key/value pairs when a key repeats."""
+
+    pairs: Optional[List[Tuple[str, Any]]] = None
+
+
+def _object_hook(pairs: List[Tuple[str, Any]]) -> dict:
+    obj = _Object(pairs)
+    if len(obj) != len(pairs):
+        obj.pairs = pairs
+    return obj
+
+
+def _items(obj: Any) -> List[Tuple[str, Any]]:
+    if not isinstance(obj, dict):
+        return []
+    return getattr(obj, "pairs", None) or list(obj.items())
+
+
+def _list_ids(items: Any) -> Iterator[RawId]:
+    for item in items if isinstance(items, list) else ():
+        if isinstance(item, dict) and isinstance(item.get("id"), str) and item["id"]:
+            yield item["id"], False, ""
+
+
+def _section(data: Any, key: str) -> Any:
+    return data.get(key) if isinstance(data, dict) else None
+
+
+def _event_ids(data: Any) -> Iterator[RawId]:
+    # Same root handling as validate_content.py: an array or {"events": [...]}
+    return _list_ids(data if isinstance(data, list) else _section(data, "events"))
+
+
+def _key_ids(*sections: str) -> Callable[[Any], Iterator[RawId]]:
+    def extract(data: Any) -> Iterator[RawId]:
+        for section in sections:
+            for key, _ in _items(_section(data, section)):
+                yield key, True, ""
+    return extract
+
+
+def _dialogue_ids(data: Any) -> Iterator[RawId]:
+    for node in _section(data, "nodes") or ():
+        if isinstance(node, dict) and isinstance(node.get("id"), str) and node["id"]:
+            context = node.get("context")
+            yield node["id"], False, json.dumps(context, sort_keys=True) if context else ""
+
+
+class Namespace(NamedTuple):
+    name: str
+    description: str
+    # fnmatch patterns relative to ModuleData/Enlisted; the first matching namespace owns a file
+    patterns: Tuple[str, ...]
+    extract: Callable[[Any], Iterable[RawId]]
+    # Phase of validate_content.py that already reports invalid JSON / duplicate IDs here
+    parsed_by: Optional[str] = None
+    duplicates_by: Optional[str] = None
+
+
+NAMESPACES: Tuple[Namespace, ...] = (
+    Namespace("opportunity", "Camp opportunities", ("Decisions/camp_opportunities*.json",),
+              lambda data: _list_ids(_section(data, "opportunities")), parsed_by="5.5"),
+    Namespace("event", "Events, decisions and order events",
+              ("Events/*.json", "Decisions/*.json", "Orders/order_events/*.json"),
+              _event_ids, parsed_by="1-4", duplicates_by="1-4"),
+    Namespace("order", "Orders", ("Orders/orders_*.json",), _list_ids),
+    Namespace("incident", "Company simulation incidents", ("Config/simulation_config.json",),
+              lambda data: _list_ids(_section(data, "incident_definitions")), parsed_by="6"),
+    Namespace("override", "Orchestrator overrides", ("Config/orchestrator_overrides.json",),
+              _key_ids("needBasedOverrides", "varietyInjections"), parsed_by="6"),
+    Namespace("condition", "Injury and illness conditions", ("Conditions/condition_defs.json",),
+              _key_ids("injuries", "illnesses")),
+    Namespace("injury", "Injuries", ("Content/injuries.json",),
+              lambda data: _list_ids(_section(data, "injuries"))),
+    Namespace("dialogue", "Dialogue nodes (repeat per context variant)", ("Dialogue/*.json",), _dialogue_ids),
+)
+NAMESPACES_BY_NAME = {ns.name: ns for ns in NAMESPACES}
+
+
+def namespace_for(rel: str) -> Optional[Namespace]:
+    """The namespace that owns a project-relative (posix) path, if any."""
+    prefix = "ModuleData/Enlisted/"
+    if not rel.startswith(prefix):
+        return None
+    local = rel[len(prefix):]
+    for ns in NAMESPACES:
+        if any(fnmatch.fnmatchcase(local, pattern) for pattern in ns.patterns):
+            return ns
+    return None
+
+
+class IdEntry(NamedTuple):
+    namespace: str
+    id: str
+    file: str
+    line: int
+    # Canonical JSON of a dialogue node's context ("" when unconditional)
+    variant: str = ""
+
+    def location(self) -> str:
+        return f"{self.file}:{self.line}" if self.line else self.file
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {"namespace": self.namespace, "id": self.id, "file": self.file, "line": self.line}
+        if self.variant:
+            data["context"] = json.loads(self.variant)
+        return data
+
+
+class Collision(NamedTuple):
+    """A later definition of an ID that clashes with an earlier one."""
+
+    id: str
+    first: IdEntry
+    other: IdEntry
+
+    @property
+    def shared(self) -> bool:
+        """The two definitions live in different namespaces."""
+        return self.first.namespace != self.other.namespace
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.id, "kind": "shared" if self.shared else "duplicate",
+                "first": self.first.to_dict(), "other": self.other.to_dict()}
+
+
+class _Locator:
+    """Line numbers of IDs, searched in document order."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.position = 0
+        self.newlines = [m.start() for m in re.finditer("\n", text)]
+
+    def line(self, value: str, is_key: bool) -> int:
+        escaped = re.escape(json.dumps(value)[1:-1])
+        pattern = re.compile(rf'"{escaped}"\s*:' if is_key else rf'"id"\s*:\s*"{escaped}"')
+        match = pattern.search(self.text, self.position) or pattern.search(self.text)
+        if not match:
+            return 0
+        self.position = match.end()
+        return bisect.bisect_right(self.newlines, match.start()) + 1
+
+
+def extract_ids(path: Path, rel: str, ns: Namespace) -> Tuple[List[IdEntry], Optional[str]]:
+    """IDs one file defines, in document order, plus its JSON error (if any)."""
+    try:
+        text = path.read_text(encoding="utf-8-sig")
+        data = json.loads(text, object_pairs_hook=_object_hook)
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        return [], str(e)
+    locator = _Locator(text)
+    return [IdEntry(ns.name, value, rel, locator.line(value, is_key), variant)
+            for value, is_key, variant in ns.extract(data)], None
+
+
+class IdRegistry:
+    """Every content ID grouped per input file, with a hashed index by ID."""
+
+    def __init__(self):
+        # rel path -> (mtime_ns, size)
+        self.stamps: Dict[str, Tuple[int, int]] = {}
+        self.entries_by_file: Dict[str, List[IdEntry]] = {}
+        # rel path -> JSON error message
+        self.file_errors: Dict[str, str] = {}
+        self._by_id: Dict[str, List[IdEntry]] = {}
+        self._by_namespace: Dict[str, List[str]] = {}
+
+    # ---------------------------------------------------------------- building
+
+    @staticmethod
+    def input_files() -> Dict[str, Path]:
+        files = {}
+        if CONTENT_ROOT.exists():
+            for path in CONTENT_ROOT.rglob("*.json"):
+                rel = path.relative_to(PROJECT_ROOT).as_posix()
+                if namespace_for(rel):
+                    files[rel] = path
+        return files
+
+    def refresh(self) -> int:
+        """Re-extract added/changed files and drop removed ones. Returns files re-read."""
+        files = self.input_files()
+        reread = 0
+        for rel in list(self.entries_by_file):
+            if rel not in files:
+                del self.entries_by_file[rel]
+                self.stamps.pop(rel, None)
+                self.file_errors.pop(rel, None)
+        for rel, path in files.items():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stamp = (st.st_mtime_ns, st.st_size)
+            if self.stamps.get(rel) == stamp and rel in self.entries_by_file:
+                continue
+            entries, error = extract_ids(path, rel, namespace_for(rel))
+            self.entries_by_file[rel] = entries
+            if error:
+                self.file_errors[rel] = error
+            else:
+                self.file_errors.pop(rel, None)
+            self.stamps[rel] = stamp
+            reread += 1
+        self._reindex()
+        return reread
+
+    def _reindex(self):
+        by_id: Dict[str, List[IdEntry]] = defaultdict(list)
+        by_namespace: Dict[str, set] = defaultdict(set)
+        for rel in sorted(self.entries_by_file):
+            for entry in self.entries_by_file[rel]:
+                by_id[entry.id].append(entry)
+                by_namespace[entry.namespace].add(entry.id)
+        self._by_id = dict(by_id)
+        self._by_namespace = {name: sorted(ids) for name, ids in by_namespace.items()}
+
+    # ---------------------------------------------------------------- queries
+
+    def __contains__(self, value: str) -> bool:
+        return value in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def lookup(self, value: str, namespace: Optional[str] = None) -> List[IdEntry]:
+        """Every definition of an ID (optionally in one namespace), in file order."""
+        entries = self._by_id.get(value, [])
+        return entries if namespace is None else [e for e in entries if e.namespace == namespace]
+
+    def ids(self, namespace: str) -> List[str]:
+        """Sorted IDs defined in one namespace."""
+        return self._by_namespace.get(namespace, [])
+
+    def collisions(self) -> List[Collision]:
+        """
+        Duplicates within a namespace (dialogue: same ID and context) and IDs
+        shared across namespaces, sorted by ID.
+        """
+        order = {ns.name: index for index, ns in enumerate(NAMESPACES)}
+        found = []
+        for value in sorted(self._by_id):
+            entries = self._by_id[value]
+            if len(entries) < 2:
+                continue
+            first_by_key: Dict[Tuple[str, str], IdEntry] = {}
+            first_by_namespace: Dict[str, IdEntry] = {}
+            for entry in entries:
+                key = (entry.namespace, entry.variant)
+                if key in first_by_key:
+                    found.append(Collision(value, first_by_key[key], entry))
+                else:
+                    first_by_key[key] = entry
+                first_by_namespace.setdefault(entry.namespace, entry)
+            namespaces = sorted(first_by_namespace, key=order.get)
+            for name in namespaces[1:]:
+                found.append(Collision(value, first_by_namespace[namespaces[0]], first_by_namespace[name]))
+        return found
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "namespaces": {ns.name: {"description": ns.description, "ids": len(self.ids(ns.name))}
+                           for ns in NAMESPACES},
+            "files": {rel: [e.to_dict() for e in entries] for rel, entries in sorted(self.entries_by_file.items())},
+            "file_errors": dict(sorted(self.file_errors.items())),
+            "collisions": [c.to_dict() for c in self.collisions()],
+        }
+
+    # ---------------------------------------------------------------- persistence
+
+    def __getstate__(self):
+        return {"stamps": self.stamps, "entries_by_file": self.entries_by_file, "file_errors": self.file_errors}
+
+    def __setstate__(self, state):
+        self.__init__()
+        self.stamps = state["stamps"]
+        self.entries_by_file = state["entries_by_file"]
+        self.file_errors = state["file_errors"]
+        self._reindex()
+
+    def save(self, path: Path = SNAPSHOT_PATH):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_write(path, "wb") as f:
+                pickle.dump({"version": SNAPSHOT_VERSION, "registry": self}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # Snapshot is an optimization only
+
+
+def load_registry(path: Path = SNAPSHOT_PATH, rebuild: bool = False) -> IdRegistry:
+    """Load the persisted registry, bring it up to date with the files on disk, and save it back."""
+    registry = None
+    if not rebuild and path.exists():
+        try:
+            with open(path, "rb") as f:
+                snapshot = pickle.load(f)
+            if snapshot.get("version") == SNAPSHOT_VERSION:
+                registry = snapshot["registry"]
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError, AttributeError):
+            registry = None  # Corrupt snapshot - rebuild
+    if registry is None:
+        registry = IdRegistry()
+    if registry.refresh() or rebuild:
+        registry.save(path)
+    return registry
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def _describe(collision: Collision) -> str:
+    if collision.shared:
+        return (f"'{collision.id}' is used by both {collision.first.namespace} ({collision.first.location()}) "
+                f"and {collision.other.namespace} ({collision.other.location()})")
+    return f"duplicate {collision.other.namespace} ID '{collision.id}' at {collision.other.location()} " \
+           f"(first defined at {collision.first.location()})"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the global content ID registry")
+    parser.add_argument("command", choices=["lookup", "list", "collisions", "stats"])
+    parser.add_argument("target", nargs="?", help="ID (lookup) or namespace (list)")
+    parser.add_argument("--json", action="store_true", help="Print the answer as JSON")
+    parser.add_argument("--rebuild", action="store_true", help="Rescan every file")
+    args = parser.parse_args()
+    if args.command in ("lookup", "list") and not args.target:
+        parser.error(f"{args.command} needs a target")
+    if args.command == "list" and args.target not in NAMESPACES_BY_NAME:
+        parser.error(f"unknown namespace '{args.target}' (expected one of {', '.join(NAMESPACES_BY_NAME)})")
+
+    started = time.perf_counter()
+    registry = load_registry(rebuild=args.rebuild)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    if args.command == "lookup":
+        entries = registry.lookup(args.target)
+        if args.json:
+            print(json.dumps([e.to_dict() for e in entries], indent=2))
+        elif not entries:
+            print(f"'{args.target}' is not defined in any namespace")
+        else:
+            for entry in entries:
+                context = f" context={entry.variant}" if entry.variant else ""
+                print(f"  {entry.namespace:<12} {entry.location()}{context}")
+        return 0 if entries else 1
+    if args.command == "list":
+        ids = registry.ids(args.target)
+        print(json.dumps(ids, indent=2) if args.json else "\n".join(ids))
+        return 0
+    if args.command == "collisions":
+        collisions = registry.collisions()
+        if args.json:
+            print(json.dumps({"collisions": [c.to_dict() for c in collisions],
+                              "file_errors": registry.file_errors}, indent=2))
+        else:
+            for rel, error in sorted(registry.file_errors.items()):
+                print(f"  invalid JSON in {rel}: {error}")
+            for collision in collisions:
+                print(f"  {_describe(collision)}")
+            print(f"{len(collisions)} collision(s)")
+        return 1 if any(not c.shared for c in collisions) or registry.file_errors else 0
+
+    stats = {"files": len(registry.entries_by_file), "ids": len(registry),
+             **{ns.name: len(registry.ids(ns.name)) for ns in NAMESPACES},
+             "collisions": len(registry.collisions()), "load_ms": round(load_ms, 1)}
+    print(json.dumps(stats, indent=2) if args.json else
+          "\n".join(f"  {key}: {value}" for key, value in stats.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,13 +22,13 @@ Options:
 
 import json
 import os
-import re
 import shutil
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Tuple
-from xml.etree import ElementTree as ET
+
+from localization_index import LocalizationParseError, load_index
 
 # Paths relative to project root
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -51,7 +51,7 @@ FIELD_MAPPINGS = {
 
 
 def load_xml_strings(xml_path: Path) -> Dict[str, str]:
-    """Load all string definitions from the XML localization file using regex for robustness."""
+    """Load all string definitions from the XML localization file (shared localization index)."""
     strings = {}
     
     if not xml_path.exists():
@@ -59,28 +59,11 @@ def load_xml_strings(xml_path: Path) -> Dict[str, str]:
         return strings
     
     try:
-        with open(xml_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Use regex to extract string id and text attributes
-        # Pattern matches: <string id="..." text="..." />
-        pattern = r'<string\s+id="([^"]+)"\s+text="([^"]*)"'
-        matches = re.findall(pattern, content)
-        
-        for string_id, text in matches:
-            if string_id and text:
-                # Decode XML entities to plain text for JSON
-                text = text.replace("&#xA;", "\n")
-                text = text.replace("&apos;", "'")
-                text = text.replace("&quot;", '"')
-                text = text.replace("&amp;", "&")
-                text = text.replace("&lt;", "<")
-                text = text.replace("&gt;", ">")
-                strings[string_id] = text
-        
+        # The XML parser already decodes entities (&#xA;, &apos;, ...) to plain text for JSON
+        strings = {string_id: text for string_id, text in load_index(xml_path).texts().items() if text}
         print(f"[OK] Loaded {len(strings)} strings from XML")
         
-    except Exception as e:
+    except (LocalizationParseError, OSError) as e:
         print(f"[ERROR] Failed to read XML: {e}")
     
     return strings
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Compact, indexed issue storage for validate_content.py.
+
+ValidationIssue records use __slots__ and interned severity, category, file and
+event ID strings, so a report with many issues against the same few files
+shares one copy of each path. IssueStore keeps the issues in report order
+plus per-severity and per-category buckets and the "severity_category"
+counter, all maintained as issues are appended:
+
+    store.count("error")          # O(1)
+    store.by_severity("warning")  # issues of one severity, in report order
+    store.stats                   # Counter of "severity_category" -> count
+
+Nothing is filtered or sorted until a report asks for it.
+"""
+
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+SEVERITIES = ("error", "warning", "info")
+
+_intern = sys.intern
+
+
+def _intern_optional(value: Optional[str]) -> Optional[str]:
+    return _intern(value) if type(value) is str else value
+
+
+class ValidationIssue:
+    """Represents a validation issue with severity and context."""
+
+    __slots__ = ("severity", "category", "message", "file_path", "event_id", "pointer")
+
+    def __init__(self, severity: str, category: str, message: str, file_path: str, event_id: str = None,
+                 pointer: str = None):
+        self.severity = _intern(severity)  # "error", "warning", "info"
+        self.category = _intern(category)  # e.g., "structure", "reference", "logic", "consistency"
+        self.message = message
+        self.file_path = _intern_optional(file_path)
+        self.event_id = _intern_optional(event_id)
+        # JSON pointer of the offending value, relative to the event if event_id is set
+        # (json_locator.py resolves it to a line/column when a report is written)
+        self.pointer = pointer
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Structured form used by --format json/sarif/ndjson."""
+        return {
+            "severity": self.severity,
+            "category": self.category,
+            "message": self.message,
+            "file": self.file_path.replace("\\", "/") if self.file_path else self.file_path,
+            "event_id": self.event_id,
+        }
+
+    def to_fields(self) -> List[Any]:
+        """Positional form stored in the content facts cache (ValidationIssue(*fields))."""
+        return [self.severity, self.category, self.message, self.file_path, self.event_id, self.pointer]
+
+    def __str__(self):
+        prefix = f"[{self.severity.upper()}]"
+        location = f"{Path(self.file_path).name}"
+        if self.event_id:
+            location += f":{self.event_id}"
+        return f"{prefix} {location} [{self.category}] {self.message}"
+
+
+class IssueStore:
+    """Append-only issue list with incrementally maintained buckets and counts."""
+
+    __slots__ = ("_issues", "_by_severity", "_by_category", "stats")
+
+    def __init__(self, issues: Iterable[ValidationIssue] = ()):
+        self._issues: List[ValidationIssue] = []
+        self._by_severity: Dict[str, List[ValidationIssue]] = {severity: [] for severity in SEVERITIES}
+        self._by_category: Dict[str, List[ValidationIssue]] = {}
+        # "severity_category" -> count, as reported in the summary
+        self.stats: Counter = Counter()
+        self.extend(issues)
+
+    def append(self, issue: ValidationIssue):
+        self._issues.append(issue)
+        bucket = self._by_severity.get(issue.severity)
+        if bucket is None:
+            bucket = self._by_severity[issue.severity] = []
+        bucket.append(issue)
+        bucket = self._by_category.get(issue.category)
+        if bucket is None:
+            bucket = self._by_category[issue.category] = []
+        bucket.append(issue)
+        self.stats[f"{issue.severity}_{issue.category}"] += 1
+
+    def extend(self, issues: Iterable[ValidationIssue]):
+        for issue in issues:
+            self.append(issue)
+
+    def __len__(self) -> int:
+        return len(self._issues)
+
+    def __iter__(self) -> Iterator[ValidationIssue]:
+        return iter(self._issues)
+
+    def __getitem__(self, index: Union[int, slice]):
+        return self._issues[index]
+
+    def count(self, severity: str) -> int:
+        bucket = self._by_severity.get(severity)
+        return len(bucket) if bucket else 0
+
+    def by_severity(self, severity: str) -> List[ValidationIssue]:
+        """Issues of one severity in report order (a live view; do not modify)."""
+        return self._by_severity.get(severity, [])
+
+    def by_category(self, category: str) -> List[ValidationIssue]:
+        """Issues of one category in report order (a live view; do not modify)."""
+        return self._by_category.get(category, [])
+
+    def categories(self) -> List[str]:
+        return sorted(self._by_category)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Lazy line/column mapping for validation issues in JSON files.
+
+Issues only name a file and an event ID. SourceLocator turns them into an
+exact position when a report is written. It parses a file with position
+tracking the first time an issue for that file is located, so files without
+issues are never re-read:
+
+    locator = SourceLocator()
+    locator.locate(issue)   # Location(line=412, column=19, pointer="/events/7/options/1/textId")
+
+An issue is placed on, in order of preference:
+- the line/column named by an "Invalid JSON: ..." message
+- its pointer (ValidationIssue.pointer, relative to its event when it has one),
+  or the nearest part of it that exists (a missing field maps to its parent)
+- the first key or string value inside its event that the message quotes
+  ('textId_x', 'Medicine', ...)
+- the event's "id" value
+
+Lines and columns are 1-based; columns count characters (Unicode code points).
+"""
+
+import bisect
+import re
+from json.decoder import scanstring
+from json.scanner import NUMBER_RE
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_INVALID_JSON_POSITION = re.compile(r"^Invalid JSON: .*: line (\d+) column (\d+)")
+_QUOTED_IN_MESSAGE = re.compile(r"'([^'\s]+)'")
+_LITERALS = {"t": "true", "f": "false", "n": "null"}
+
+# Keys and array indices from the document root
+JsonPath = Tuple[Union[str, int], ...]
+
+
+class Location(NamedTuple):
+    line: int
+    column: int
+    # JSON pointer of the located value from the document root; None if only the line is known
+    pointer: Optional[str] = None
+
+
+def to_pointer(path: JsonPath) -> str:
+    """("events", 3, "titleId") -> "/events/3/titleId" (RFC 6901)."""
+    return "".join("/" + str(part).replace("~", "~0").replace("/", "~1") for part in path)
+
+
+def from_pointer(pointer: str) -> List[str]:
+    """"/options/1/textId" -> ["options", "1", "textId"]."""
+    if not pointer:
+        return []
+    return [part.replace("~1", "/").replace("~0", "~") for part in pointer.lstrip("/").split("/")]
+
+
+class JsonPositions:
+    """Start/end offsets of every value, and the offset of every member key, in one document."""
+
+    def __init__(self, text: str):
+        self.text = text
+        # path -> (start, end) of the value
+        self.spans: Dict[JsonPath, Tuple[int, int]] = {}
+        # path -> offset of the member's key
+        self.keys: Dict[JsonPath, int] = {}
+        # (offset, path, string, is_key) for every key and string value, in document order
+        self.strings: List[Tuple[int, JsonPath, str, bool]] = []
+        # "id" string value -> path of the first object carrying it
+        self.ids: Dict[str, JsonPath] = {}
+        self._line_starts: Optional[List[int]] = None
+        self._parse_value(_WHITESPACE.match(text, 0).end(), ())
+
+    def _parse_value(self, pos: int, path: JsonPath) -> int:
+        text = self.text
+        char = text[pos:pos + 1]
+        start = pos
+        if char == "{":
+            pos = _WHITESPACE.match(text, pos + 1).end()
+            if text[pos:pos + 1] == "}":
+                pos += 1
+            else:
+                while True:
+                    key, key_end = scanstring(text, pos + 1)
+                    child = path + (key,)
+                    self.keys[child] = pos
+                    self.strings.append((pos, child, key, True))
+                    pos = _WHITESPACE.match(text, key_end).end() + 1
+                    pos = _WHITESPACE.match(text, pos).end()
+                    value_start = pos
+                    pos = self._parse_value(pos, child)
+                    if key == "id" and text[value_start] == '"':
+                        self.ids.setdefault(self.strings[-1][2], path)
+                    pos = _WHITESPACE.match(text, pos).end()
+                    if text[pos] == "}":
+                        pos += 1
+                        break
+                    pos = _WHITESPACE.match(text, pos + 1).end()
+        elif char == "[":
+            pos = _WHITESPACE.match(text, pos + 1).end()
+            if text[pos:pos + 1] == "]":
+                pos += 1
+            else:
+                index = 0
+                while True:
+                    pos = self._parse_value(pos, path + (index,))
+                    index += 1
+                    pos = _WHITESPACE.match(text, pos).end()
+                    if text[pos] == "]":
+                        pos += 1
+                        break
+                    pos = _WHITESPACE.match(text, pos + 1).end()
+        elif char == '"':
+            value, pos = scanstring(text, pos + 1)
+            self.strings.append((start, path, value, False))
+        elif char in _LITERALS:
+            pos += len(_LITERALS[char])
+        else:
+            match = NUMBER_RE.match(text, pos)
+            if match is None:
+                raise ValueError(f"Unexpected character at {pos}")
+            pos = match.end()
+        self.spans[path] = (start, pos)
+        return pos
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        """1-based (line, column) of a character offset."""
+        if self._line_starts is None:
+            self._line_starts = [0] + [match.end() for match in re.finditer("\n", self.text)]
+        line = bisect.bisect_right(self._line_starts, offset)
+        return line, offset - self._line_starts[line - 1] + 1
+
+    def resolve(self, base: JsonPath, parts: List[str]) -> JsonPath:
+        """The longest existing path along base + parts (list indices given as strings)."""
+        path = base
+        for part in parts:
+            child = path + (part,)
+            if child not in self.spans and part.isdigit():
+                child = path + (int(part),)
+            if child not in self.spans:
+                break
+            path = child
+        return path
+
+    def find_string(self, value: str, within: JsonPath) -> Optional[Tuple[int, JsonPath]]:
+        """First key or string value equal to `value` inside the value at `within`."""
+        start, end = self.spans[within]
+        lo = bisect.bisect_left(self.strings, (start,))
+        for offset, path, string, _ in self.strings[lo:]:
+            if offset >= end:
+                break
+            if string == value:
+                return offset, path
+        return None
+
+
+class SourceLocator:
+    """Maps issues to locations, parsing each JSON file on its first issue."""
+
+    def __init__(self, root: Union[str, Path] = "."):
+        self.root = Path(root)
+        self._documents: Dict[str, Optional[JsonPositions]] = {}
+
+    def document(self, file_path: str) -> Optional[JsonPositions]:
+        """Positions for a file, or None if it cannot be read or parsed."""
+        if file_path not in self._documents:
+            try:
+                text = (self.root / file_path).read_text(encoding="utf-8-sig")
+                self._documents[file_path] = JsonPositions(text)
+            except (OSError, UnicodeDecodeError, ValueError, IndexError):
+                self._documents[file_path] = None
+        return self._documents[file_path]
+
+    def locate(self, issue: Any) -> Optional[Location]:
+        """Location of a ValidationIssue, or None for non-JSON files and file-level issues."""
+        file_path = issue.file_path
+        if not file_path or not file_path.lower().endswith(".json"):
+            return None
+        match = _INVALID_JSON_POSITION.match(issue.message)
+        if match:
+            return Location(int(match.group(1)), int(match.group(2)))
+        doc = self.document(file_path)
+        if doc is None:
+            return None
+
+        base: JsonPath = ()
+        if issue.event_id:
+            base = doc.ids.get(issue.event_id)
+            if base is None:
+                return None
+        pointer = getattr(issue, "pointer", None)
+        if pointer is not None:
+            return self._at(doc, doc.resolve(base, from_pointer(pointer)))
+        if not issue.event_id:
+            return None
+        for token in _QUOTED_IN_MESSAGE.findall(issue.message):
+            if token == issue.event_id:
+                continue
+            found = doc.find_string(token, base)
+            if found is not None:
+                line, column = doc.position(found[0])
+                return Location(line, column, to_pointer(found[1]))
+        return self._at(doc, base + ("id",))
+
+    def issue_record(self, issue: Any) -> Dict[str, Any]:
+        """issue.to_dict() plus "line", "column" and "pointer" when the issue can be placed."""
+        record = issue.to_dict()
+        location = self.locate(issue)
+        if location:
+            record["line"], record["column"] = location.line, location.column
+            if location.pointer is not None:
+                record["pointer"] = location.pointer
+        return record
+
+    @staticmethod
+    def _at(doc: JsonPositions, path: JsonPath) -> Location:
+        """A member is placed on its key, an array element or the root on its value."""
+        offset = doc.keys.get(path)
+        if offset is None:
+            offset = doc.spans[path][0]
+        line, column = doc.position(offset)
+        return Location(line, column, to_pointer(path))
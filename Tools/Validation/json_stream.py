@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Incremental reader for event files too large to json.load in one go.
+
+Walks a content file (a root array of events, or an object with an "events"
+array) one element at a time. Only the element being decoded and one read
+chunk are held in memory, so memory is bounded by the largest single event,
+not the file:
+
+    from json_stream import iter_events
+
+    with open(path, encoding="utf-8-sig") as f:
+        for event in iter_events(f, on_field=lambda key, value: ...):
+            ...
+
+Each element is located with a bracket/string scanner and decoded with
+json.loads. Syntax errors raise StreamDecodeError (a json.JSONDecodeError)
+carrying the line, column and character offset in the whole file. They are
+raised when the reader reaches the bad spot, so nothing after it is read.
+Events before the error have already been yielded.
+"""
+
+import json
+import re
+from typing import Any, Callable, Iterator, Optional, TextIO, Tuple
+
+CHUNK_SIZE = 64 * 1024
+
+# Characters that matter outside / inside strings while finding the end of a value
+_STRUCTURAL = re.compile(r'[\[\]{}"]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r'[\s,\]}]')
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DECODER = json.JSONDecoder()
+
+
+class StreamDecodeError(json.JSONDecodeError):
+    """A syntax error at an absolute position in the streamed file."""
+
+    def __init__(self, msg: str, pos: int, lineno: int, colno: int):
+        ValueError.__init__(self, f"{msg}: line {lineno} column {colno} (char {pos})")
+        self.msg = msg
+        self.doc = ""
+        self.pos = pos
+        self.lineno = lineno
+        self.colno = colno
+
+    def __reduce__(self):
+        return self.__class__, (self.msg, self.pos, self.lineno, self.colno)
+
+
+class RootFormatError(ValueError):
+    """The document is valid so far but is neither an array nor an object."""
+
+
+class _Reader:
+    """A sliding text window over the file with absolute line/column bookkeeping."""
+
+    def __init__(self, f: TextIO, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.eof = False
+        # Absolute position of buf[0]
+        self.offset = 0
+        self.line = 1
+        self.col = 1
+
+    def fill(self) -> bool:
+        """Append the next chunk; False at end of file."""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf += chunk
+        return True
+
+    def discard(self, pos: int):
+        """Drop buf[:pos], keeping the absolute position of the new buf[0]."""
+        dropped = self.buf[:pos]
+        newlines = dropped.count("\n")
+        if newlines:
+            self.line += newlines
+            self.col = pos - dropped.rfind("\n")
+        else:
+            self.col += pos
+        self.offset += pos
+        self.buf = self.buf[pos:]
+
+    def error(self, msg: str, pos: int) -> StreamDecodeError:
+        """An error at buf[pos]."""
+        before = self.buf[:pos]
+        newlines = before.count("\n")
+        if newlines:
+            return StreamDecodeError(msg, self.offset + pos, self.line + newlines, pos - before.rfind("\n"))
+        return StreamDecodeError(msg, self.offset + pos, self.line, self.col + pos)
+
+    def skip_whitespace(self, pos: int) -> int:
+        """Position of the next non-whitespace character (len(buf) at end of file)."""
+        while True:
+            pos = _WHITESPACE.match(self.buf, pos).end()
+            if pos < len(self.buf) or not self.fill():
+                return pos
+
+    def peek(self, pos: int) -> str:
+        """buf[pos], or "" at end of file."""
+        while pos >= len(self.buf):
+            if not self.fill():
+                return ""
+        return self.buf[pos]
+
+    def value_end(self, pos: int) -> int:
+        """End of the JSON value starting at buf[pos] (not validated; json.loads does that)."""
+        first = self.buf[pos]
+        if first not in "[{\"":
+            while True:
+                match = _SCALAR_END.search(self.buf, pos)
+                if match:
+                    return match.start()
+                pos = len(self.buf)
+                if not self.fill():
+                    return pos
+        depth = 0
+        in_string = False
+        while True:
+            match = (_STRING_SPECIAL if in_string else _STRUCTURAL).search(self.buf, pos)
+            if match is None:
+                pos = len(self.buf)
+                if not self.fill():
+                    return pos
+                continue
+            char = match.group()
+            pos = match.end()
+            if in_string:
+                if char == '"':
+                    in_string = False
+                    if depth == 0:
+                        return pos
+                elif self.peek(pos) == "":
+                    return pos
+                else:
+                    # Skip the escaped character (\" and \\ included)
+                    pos += 1
+            elif char == '"':
+                in_string = True
+            elif char in "[{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return pos
+
+    def decode(self, pos: int) -> Tuple[Any, int]:
+        """Decode the value at buf[pos]; returns (value, end)."""
+        if self.peek(pos) == "":
+            raise self.error("Expecting value", pos)
+        # Fast path: a value that ends before the buffer does is complete. Values
+        # cut off by the chunk boundary (or invalid ones) fall through to the scanner.
+        try:
+            value, end = _DECODER.raw_decode(self.buf, pos)
+            if end < len(self.buf) or self.eof:
+                return value, end
+        except json.JSONDecodeError:
+            pass
+        end = self.value_end(pos)
+        try:
+            return json.loads(self.buf[pos:end]), end
+        except json.JSONDecodeError as e:
+            raise self.error(e.msg, pos + e.pos) from None
+
+
+def iter_events(f: TextIO, on_field: Optional[Callable[[str, Any], None]] = None,
+                chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yield each event of a content file as it is decoded.
+
+    A root array yields its elements. A root object yields the elements of
+    "events"; every other member is decoded whole and passed to on_field(key,
+    value) as soon as it is read. As with `data.get("events") or []`, an events
+    value that is not an array is decoded whole and iterated.
+
+    Raises StreamDecodeError on a syntax error and RootFormatError when the root
+    is neither an array nor an object.
+    """
+    reader = _Reader(f, chunk_size)
+    pos = reader.skip_whitespace(0)
+    root = reader.peek(pos)
+    if root == "[":
+        yield from _iter_array(reader, pos)
+    elif root == "{":
+        yield from _iter_object(reader, pos, on_field)
+    else:
+        reader.decode(pos)
+        raise RootFormatError("root is neither an array nor an object")
+    pos = reader.skip_whitespace(0)
+    if pos < len(reader.buf):
+        raise reader.error("Extra data", pos)
+
+
+def _iter_array(reader: _Reader, pos: int) -> Iterator[Any]:
+    """Yield the elements of the array at buf[pos]; leaves the reader after its ']'."""
+    pos = reader.skip_whitespace(pos + 1)
+    if reader.peek(pos) == "]":
+        reader.discard(pos + 1)
+        return
+    while True:
+        reader.discard(pos)
+        value, pos = reader.decode(0)
+        yield value
+        pos = reader.skip_whitespace(pos)
+        char = reader.peek(pos)
+        if char == "]":
+            reader.discard(pos + 1)
+            return
+        if char != ",":
+            raise reader.error("Expecting ',' delimiter", pos)
+        pos = reader.skip_whitespace(pos + 1)
+
+
+def _iter_object(reader: _Reader, pos: int, on_field: Optional[Callable[[str, Any], None]]) -> Iterator[Any]:
+    """Yield the events of the object at buf[pos], reporting other members to on_field."""
+    pos = reader.skip_whitespace(pos + 1)
+    if reader.peek(pos) == "}":
+        reader.discard(pos + 1)
+        return
+    while True:
+        if reader.peek(pos) != '"':
+            raise reader.error("Expecting property name enclosed in double quotes", pos)
+        reader.discard(pos)
+        key, pos = reader.decode(0)
+        pos = reader.skip_whitespace(pos)
+        if reader.peek(pos) != ":":
+            raise reader.error("Expecting ':' delimiter", pos)
+        pos = reader.skip_whitespace(pos + 1)
+        if key == "events" and reader.peek(pos) == "[":
+            yield from _iter_array(reader, pos)
+            pos = 0
+        else:
+            reader.discard(pos)
+            value, pos = reader.decode(0)
+            if key == "events":
+                yield from value or []
+            elif on_field is not None:
+                on_field(key, value)
+        pos = reader.skip_whitespace(pos)
+        char = reader.peek(pos)
+        if char == "}":
+            reader.discard(pos + 1)
+            return
+        if char != ",":
+            raise reader.error("Expecting ',' delimiter", pos)
+        pos = reader.skip_whitespace(pos + 1)
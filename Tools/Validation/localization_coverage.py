@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Translation coverage matrix for every language under ModuleData/Languages/.
+
+English is the union of the string tables in ModuleData/Languages/
+(enlisted_strings.xml, enlisted_qm_dialogue.xml). A language is a folder with a
+language_data.xml whose <LanguageFile xml_path="..."/> entries name its string
+tables (see _TEMPLATE/README_TRANSLATOR.txt). Every English ID is classified as:
+
+    translated    present, differs from English and not stale
+    missing       no <string> with that ID
+    untranslated  text is empty or identical to English (placeholder-only text excluded)
+    stale         English changed since it was translated (needs the language's
+                  <file>.sources.json translation memory; see localization_index.py)
+
+IDs only the translation has are "extra". Each language is parsed with expat in
+its own worker process, so adding languages does not lengthen the run.
+
+Usage:
+    python Tools/Validation/localization_coverage.py                  # every language folder
+    python Tools/Validation/localization_coverage.py FR DE            # by folder
+    python Tools/Validation/localization_coverage.py path/to/file.xml # any string table
+    python Tools/Validation/localization_coverage.py --prefixes       # per-feature (ID prefix) matrix
+    python Tools/Validation/localization_coverage.py --list stale FR  # the IDs behind a count
+    python Tools/Validation/localization_coverage.py --json --min-coverage 90   # CI gate
+"""
+
+import argparse
+import concurrent.futures
+import json
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple
+
+from localization_index import LocalizationParseError, load_index, parse_strings, read_sources, source_hash
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+LANGUAGES_DIR = PROJECT_ROOT / "ModuleData" / "Languages"
+STATUSES = ("translated", "missing", "untranslated", "stale")
+
+# Text with nothing to translate once {PLACEHOLDERS} and punctuation are removed
+_PLACEHOLDER = re.compile(r"\{[^}]*\}")
+_LETTER = re.compile(r"[^\W\d_]")
+
+
+def english_tables(languages_dir: Path = LANGUAGES_DIR) -> List[Path]:
+    """The English string tables: every *.xml in the Languages root except language_data.xml."""
+    return sorted(path for path in languages_dir.glob("*.xml") if path.name != "language_data.xml")
+
+
+def load_english(languages_dir: Path = LANGUAGES_DIR) -> Dict[str, str]:
+    """id -> English text across all English tables (first definition wins)."""
+    english: Dict[str, str] = {}
+    for path in english_tables(languages_dir):
+        for string_id, text in load_index(path).texts().items():
+            english.setdefault(string_id, text)
+    return english
+
+
+def feature_prefix(string_id: str) -> str:
+    """Feature bucket of an ID, as in the Phase 5 orphan report ('mi_loot_take' -> 'mi_')."""
+    return string_id.split("_")[0] + "_" if "_" in string_id else "other"
+
+
+def needs_translation(text: str) -> bool:
+    """False for English text that reads the same in every language ('{RANK}', '...', '')."""
+    return bool(_LETTER.search(_PLACEHOLDER.sub("", text)))
+
+
+class Language(NamedTuple):
+    # Folder name (FR), or the file name suffix for a table given on the command line
+    code: str
+    name: str
+    files: List[Path]
+
+
+def discover_languages(languages_dir: Path = LANGUAGES_DIR) -> List[Language]:
+    """Every language folder with a language_data.xml (the _TEMPLATE folder excluded)."""
+    languages = []
+    for data_path in sorted(languages_dir.glob("*/language_data.xml")):
+        code = data_path.parent.name
+        if code.startswith("_"):
+            continue
+        root = ET.parse(data_path).getroot()
+        files = [languages_dir / node.get("xml_path", "") for node in root.iter("LanguageFile")
+                 if node.get("xml_path")]
+        languages.append(Language(code, root.get("name") or root.get("id") or code, files))
+    return languages
+
+
+class LanguageCoverage:
+    """Per-ID status of one language against English."""
+
+    def __init__(self, language: Language, status: Dict[str, str], extra: List[str],
+                 has_sources: bool, errors: List[str], seconds: float):
+        self.language = language
+        # English ID -> one of STATUSES
+        self.status = status
+        self.extra = extra
+        # False when no table has a .sources.json, so stale strings cannot be told apart
+        self.has_sources = has_sources
+        self.errors = errors
+        self.seconds = seconds
+
+    @property
+    def counts(self) -> Counter:
+        counts = Counter({status: 0 for status in STATUSES})
+        counts.update(self.status.values())
+        return counts
+
+    @property
+    def percent(self) -> float:
+        return 100.0 * self.counts["translated"] / len(self.status) if self.status else 100.0
+
+    def ids(self, status: str) -> List[str]:
+        if status == "extra":
+            return self.extra
+        return sorted(string_id for string_id, value in self.status.items() if value == status)
+
+    def by_prefix(self) -> Dict[str, Counter]:
+        """Feature prefix -> status counts."""
+        result: Dict[str, Counter] = {}
+        for string_id, value in self.status.items():
+            result.setdefault(feature_prefix(string_id), Counter())[value] += 1
+        return result
+
+    def to_dict(self, include_ids: bool = False) -> Dict[str, Any]:
+        counts = self.counts
+        result = {
+            "code": self.language.code,
+            "name": self.language.name,
+            "files": [_display(path) for path in self.language.files],
+            "total": len(self.status),
+            **{status: counts[status] for status in STATUSES},
+            "extra": len(self.extra),
+            "coverage": round(self.percent, 2),
+            "stale_tracked": self.has_sources,
+            "errors": self.errors,
+            "seconds": round(self.seconds, 3),
+            "prefixes": {prefix: {status: c[status] for status in STATUSES}
+                         for prefix, c in sorted(self.by_prefix().items())},
+        }
+        if include_ids:
+            result["ids"] = {status: self.ids(status) for status in STATUSES[1:] + ("extra",)}
+        return result
+
+
+def _display(path: Path) -> str:
+    try:
+        return Path(path).resolve().relative_to(PROJECT_ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def measure(language: Language, english: Dict[str, str]) -> LanguageCoverage:
+    """Classify every English ID for one language (streams each of its tables once)."""
+    started = time.perf_counter()
+    texts: Dict[str, str] = {}
+    sources: Dict[str, str] = {}
+    has_sources = False
+    errors = []
+    for path in language.files:
+        try:
+            for string_id, text in parse_strings(path).texts().items():
+                texts.setdefault(string_id, text)
+            file_sources = read_sources(path)
+        except (LocalizationParseError, OSError, ValueError) as e:
+            errors.append(f"{_display(path)}: {e}")
+            continue
+        if file_sources is not None:
+            has_sources = True
+            sources.update(file_sources)
+
+    status: Dict[str, str] = {}
+    for string_id, english_text in english.items():
+        text = texts.get(string_id)
+        if text is None:
+            status[string_id] = "missing"
+        elif (not text and english_text) or (text == english_text and needs_translation(english_text)):
+            status[string_id] = "untranslated"
+        elif has_sources and sources.get(string_id) != source_hash(english_text):
+            status[string_id] = "stale"
+        else:
+            status[string_id] = "translated"
+    extra = sorted(string_id for string_id in texts if string_id not in english)
+    return LanguageCoverage(language, status, extra, has_sources, errors, time.perf_counter() - started)
+
+
+# English texts shared by every task of a worker process
+_WORKER_ENGLISH: Dict[str, str] = {}
+
+
+def _init_worker(english: Dict[str, str]):
+    global _WORKER_ENGLISH
+    _WORKER_ENGLISH = english
+
+
+def _measure_in_worker(language: Language) -> LanguageCoverage:
+    return measure(language, _WORKER_ENGLISH)
+
+
+def measure_all(languages: List[Language], english: Dict[str, str], jobs: int = 0) -> List[LanguageCoverage]:
+    """Coverage for each language, one worker process per language (jobs caps the pool; 1 = serial)."""
+    workers = min(jobs or len(languages), len(languages))
+    if workers <= 1:
+        return [measure(language, english) for language in languages]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                                initargs=(english,)) as pool:
+        return list(pool.map(_measure_in_worker, languages))
+
+
+# ============================================================================
+# Reports
+# ============================================================================
+
+def print_matrix(results: List[LanguageCoverage], english_total: int):
+    print(f"English: {english_total} strings")
+    print()
+    header = f"{'Language':<22} {'Coverage':>8} {'Translated':>10} {'Missing':>8} {'Untransl.':>9} {'Stale':>7} {'Extra':>7} {'Time':>7}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        counts = result.counts
+        stale = str(counts["stale"]) if result.has_sources else "n/a"
+        label = f"{result.language.code} ({result.language.name})" if result.language.name != result.language.code \
+            else result.language.code
+        print(f"{label[:22]:<22} {result.percent:>7.1f}% {counts['translated']:>10} {counts['missing']:>8} "
+              f"{counts['untranslated']:>9} {stale:>7} {len(result.extra):>7} {result.seconds * 1000:>5.0f}ms")
+        for error in result.errors:
+            print(f"  [ERROR] {error}")
+    if any(not result.has_sources for result in results):
+        print()
+        print("Stale n/a: no <file>.sources.json next to the language's tables, so changed English cannot be detected.")
+
+
+def print_prefix_matrix(results: List[LanguageCoverage]):
+    """Coverage % per feature prefix (rows) and language (columns); fully translated prefixes omitted."""
+    per_language = [result.by_prefix() for result in results]
+    prefixes = sorted({prefix for breakdown in per_language for prefix in breakdown})
+    codes = [result.language.code[:8] for result in results]
+    print()
+    print(f"{'Prefix':<16} {'Strings':>7} " + " ".join(f"{code:>8}" for code in codes))
+    shown = 0
+    for prefix in prefixes:
+        cells = []
+        total = 0
+        complete = True
+        for breakdown in per_language:
+            counts = breakdown.get(prefix, Counter())
+            total = sum(counts.values())
+            complete &= counts["translated"] == total
+            cells.append(f"{100.0 * counts['translated'] / total:>7.1f}%" if total else f"{'-':>8}")
+        if complete:
+            continue
+        shown += 1
+        print(f"{prefix[:16]:<16} {total:>7} " + " ".join(cells))
+    if not shown:
+        print("(every prefix fully translated)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Translation coverage matrix for ModuleData/Languages")
+    parser.add_argument("languages", nargs="*",
+                        help="Language folders (FR) or string table paths; default: every language folder")
+    parser.add_argument("--prefixes", action="store_true", help="Add the per-feature (ID prefix) coverage matrix")
+    parser.add_argument("--list", choices=STATUSES[1:] + ("extra",), metavar="STATUS",
+                        help="List the IDs with this status (missing, untranslated, stale, extra)")
+    parser.add_argument("--json", action="store_true", help="Print the matrix as JSON")
+    parser.add_argument("--min-coverage", type=float, metavar="PCT",
+                        help="Exit with 1 if any language is below PCT%% translated")
+    parser.add_argument("--jobs", "-j", type=int, default=0, metavar="N",
+                        help="Worker processes (default: one per language; 1 = no workers)")
+    args = parser.parse_args()
+
+    available = {language.code.lower(): language for language in discover_languages()}
+    languages = []
+    for arg in args.languages:
+        if arg.lower() in available:
+            languages.append(available[arg.lower()])
+        elif Path(arg).is_file():
+            # enlisted_strings_fr.xml -> fr
+            code = Path(arg).stem.rsplit("_", 1)[-1]
+            languages.append(Language(code, code, [Path(arg)]))
+        else:
+            parser.error(f"'{arg}' is neither a language folder ({', '.join(sorted(available)) or 'none found'}) "
+                         "nor a string table")
+    if not args.languages:
+        languages = list(available.values())
+
+    english = load_english()
+    results = measure_all(languages, english, args.jobs)
+
+    if args.json:
+        print(json.dumps({
+            "english": {"files": [_display(path) for path in english_tables()], "total": len(english)},
+            "languages": [result.to_dict(include_ids=bool(args.list)) for result in results],
+        }, indent=2))
+    elif not languages:
+        print(f"No translations found (expected <code>/language_data.xml folders in {_display(LANGUAGES_DIR)})")
+    else:
+        print_matrix(results, len(english))
+        if args.prefixes:
+            print_prefix_matrix(results)
+        if args.list:
+            for result in results:
+                ids = result.ids(args.list)
+                print(f"\n{result.language.code}: {len(ids)} {args.list}")
+                for string_id in ids:
+                    print(f"  {string_id}")
+
+    if any(result.errors for result in results):
+        return 2
+    if args.min_coverage is not None and any(result.percent < args.min_coverage for result in results):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Shared localization index for the Tools scripts.
+
+One loader for enlisted_strings.xml (and any other Bannerlord string table):
+the file is streamed once with expat into an id -> (text, line) map, and a
+binary snapshot is kept in Tools/Validation/.cache/ keyed by the file's mtime,
+size and SHA-256. Later invocations load the snapshot in milliseconds instead
+of re-parsing the XML; within one process the index is also memoized.
+
+Usage:
+    from localization_index import load_index
+
+    index = load_index()                  # ModuleData/Languages/enlisted_strings.xml
+    "mi_loot_take" in index               # membership
+    index.text("mi_loot_take")            # decoded text (entities resolved)
+    index.line("mi_loot_take")            # 1-based line of the <string> element
+
+    python Tools/Validation/localization_index.py [path/to/strings.xml]   # stats
+
+Translated string tables can carry a translation-memory sidecar
+(<file>.sources.json) holding source_hash() of the English text each string
+was translated from; a string whose English text hashes differently since
+is stale (localization_coverage.py). generate_language_template.py --merge
+maintains it.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, KeysView, List, Optional, Tuple
+from xml.parsers import expat
+
+from validation_cache import atomic_write
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_XML_PATH = PROJECT_ROOT / "ModuleData" / "Languages" / "enlisted_strings.xml"
+SNAPSHOT_DIR = Path(__file__).resolve().parent / ".cache"
+SNAPSHOT_VERSION = 1
+
+# Re-raised so callers can catch parse problems without importing expat
+LocalizationParseError = expat.ExpatError
+
+
+class LocalizationIndex:
+    """Parsed string table: id -> (text, line)."""
+
+    __slots__ = ("path", "strings", "duplicates")
+
+    def __init__(self, path: Path, strings: Dict[str, Tuple[str, int]],
+                 duplicates: Optional[List[Tuple[str, int]]] = None):
+        self.path = path
+        self.strings = strings
+        # (id, line) of every repeated <string> after the first definition
+        self.duplicates = duplicates or []
+
+    def __contains__(self, string_id: str) -> bool:
+        return string_id in self.strings
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.strings)
+
+    def ids(self) -> KeysView:
+        return self.strings.keys()
+
+    def text(self, string_id: str, default: Optional[str] = None) -> Optional[str]:
+        entry = self.strings.get(string_id)
+        return entry[0] if entry else default
+
+    def line(self, string_id: str) -> Optional[int]:
+        entry = self.strings.get(string_id)
+        return entry[1] if entry else None
+
+    def texts(self) -> Dict[str, str]:
+        """Plain id -> text mapping."""
+        return {string_id: entry[0] for string_id, entry in self.strings.items()}
+
+
+def parse_strings(path: Path, data: Optional[bytes] = None) -> LocalizationIndex:
+    """
+    Stream a string table with expat. Raises LocalizationParseError on malformed XML.
+    
+    `data` parses those bytes (e.g. an older revision from git) instead of reading path.
+    """
+    strings: Dict[str, Tuple[str, int]] = {}
+    duplicates: List[Tuple[str, int]] = []
+    parser = expat.ParserCreate()
+
+    def start_element(name, attrs):
+        if name != "string":
+            return
+        string_id = attrs.get("id")
+        if not string_id:
+            return
+        line = parser.CurrentLineNumber
+        if string_id in strings:
+            duplicates.append((string_id, line))
+        else:
+            strings[string_id] = (attrs.get("text", ""), line)
+
+    parser.StartElementHandler = start_element
+    if data is not None:
+        parser.Parse(data, True)
+    else:
+        with open(path, "rb") as f:
+            parser.ParseFile(f)
+    return LocalizationIndex(Path(path), strings, duplicates)
+
+
+def source_hash(text: str) -> str:
+    """Short, stable hash of an English source text (translation-memory key)."""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+def sources_path(path: Path) -> Path:
+    """Translation-memory sidecar of a translated string table."""
+    path = Path(path)
+    return path.with_name(path.name + ".sources.json")
+
+
+def read_sources(path: Path, section: str = "sources") -> Optional[Dict[str, str]]:
+    """
+    id -> source_hash of the English text it was translated from; None without a sidecar.
+
+    section="fuzzy" reads the strings whose English text changed after they were
+    translated (id -> source_hash of the translation when that was detected).
+    """
+    try:
+        with open(sources_path(path), encoding="utf-8") as f:
+            return json.load(f).get(section, {})
+    except FileNotFoundError:
+        return None
+
+
+def write_sources(path: Path, sources: Dict[str, str], fuzzy: Optional[Dict[str, str]] = None):
+    """Write the sidecar of a translated string table atomically, IDs sorted so diffs stay small."""
+    target = sources_path(path)
+    document = {"version": 1, "sources": dict(sorted(sources.items()))}
+    if fuzzy:
+        document["fuzzy"] = dict(sorted(fuzzy.items()))
+    with atomic_write(target, newline="\n") as f:
+        json.dump(document, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+def _snapshot_path(path: Path) -> Path:
+    key = hashlib.sha1(str(Path(path).resolve()).encode("utf-8")).hexdigest()[:16]
+    return SNAPSHOT_DIR / f"strings_{Path(path).stem}_{key}.pickle"
+
+
+def _file_sha256(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+# In-process memo: resolved path -> (mtime_ns, size, index)
+_MEMO: Dict[str, Tuple[int, int, LocalizationIndex]] = {}
+
+
+def load_index(path: Optional[Path] = None, use_snapshot: bool = True) -> LocalizationIndex:
+    """
+    Load a string table, preferring the in-process memo, then the on-disk snapshot.
+
+    The snapshot is reused when mtime and size match, or when the content hash
+    matches (e.g. after a checkout touched the file without changing it).
+    """
+    path = Path(path) if path else DEFAULT_XML_PATH
+    stat = os.stat(path)
+    memo_key = str(path.resolve())
+    memo = _MEMO.get(memo_key)
+    if memo and memo[0] == stat.st_mtime_ns and memo[1] == stat.st_size:
+        return memo[2]
+
+    index = None
+    snapshot_path = _snapshot_path(path)
+    if use_snapshot and snapshot_path.exists():
+        try:
+            with open(snapshot_path, "rb") as f:
+                snapshot = pickle.load(f)
+            if snapshot.get("version") == SNAPSHOT_VERSION:
+                if snapshot["mtime_ns"] == stat.st_mtime_ns and snapshot["size"] == stat.st_size:
+                    index = LocalizationIndex(path, snapshot["strings"], snapshot["duplicates"])
+                elif snapshot["sha256"] == _file_sha256(path):
+                    index = LocalizationIndex(path, snapshot["strings"], snapshot["duplicates"])
+                    _write_snapshot(snapshot_path, index, stat, snapshot["sha256"])
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError):
+            index = None  # Corrupt snapshot - rebuild
+
+    if index is None:
+        index = parse_strings(path)
+        if use_snapshot:
+            _write_snapshot(snapshot_path, index, stat, _file_sha256(path))
+
+    _MEMO[memo_key] = (stat.st_mtime_ns, stat.st_size, index)
+    return index
+
+
+def _write_snapshot(snapshot_path: Path, index: LocalizationIndex, stat: os.stat_result, sha256: str):
+    try:
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_write(snapshot_path, "wb") as f:
+            pickle.dump({
+                "version": SNAPSHOT_VERSION,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": sha256,
+                "strings": index.strings,
+                "duplicates": index.duplicates,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Snapshot is an optimization only
+
+
+def main():
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_XML_PATH
+    if not path.exists():
+        print(f"Error: {path} not found")
+        return 1
+    index = load_index(path)
+    print(f"{path}: {len(index)} strings, {len(index.duplicates)} duplicate definitions")
+    for string_id, line in index.duplicates[:20]:
+        print(f"  duplicate '{string_id}' at line {line} (first at line {index.line(string_id)})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,44 +12,24 @@ Usage:
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
+from localization_index import LocalizationParseError, load_index, parse_strings
+
 
 def load_existing_strings(xml_path):
-    """Load existing string IDs from enlisted_strings.xml"""
+    """Load existing string IDs from enlisted_strings.xml (shared localization index)"""
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-        
-        existing_ids = set()
-        strings_element = root.find('strings')
-        if strings_element is not None:
-            for string_elem in strings_element.findall('string'):
-                string_id = string_elem.get('id')
-                if string_id:
-                    existing_ids.add(string_id)
-        
-        return existing_ids, tree, root
-    except Exception as e:
+        return set(load_index(xml_path).ids())
+    except (LocalizationParseError, OSError) as e:
         print(f"ERROR loading {xml_path}: {e}")
-        return set(), None, None
+        return None
 
 
 def load_new_strings(xml_path):
     """Load new strings from _extracted_strings.xml"""
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-        
-        new_strings = {}
-        strings_element = root.find('strings')
-        if strings_element is not None:
-            for string_elem in strings_element.findall('string'):
-                string_id = string_elem.get('id')
-                text = string_elem.get('text')
-                if string_id and text:
-                    new_strings[string_id] = text
-        
-        return new_strings
-    except Exception as e:
+        # One-off scratch file - parse directly, no snapshot
+        return {sid: text for sid, text in parse_strings(xml_path).texts().items() if text}
+    except (LocalizationParseError, OSError) as e:
         print(f"ERROR loading {xml_path}: {e}")
         return {}
 
@@ -73,8 +53,8 @@ def main():
     
     # Load existing strings
     print(f"\nLoading {enlisted_xml}...")
-    existing_ids, tree, root = load_existing_strings(enlisted_xml)
-    if tree is None:
+    existing_ids = load_existing_strings(enlisted_xml)
+    if existing_ids is None:
         return 1
     print(f"  Found {len(existing_ids)} existing strings")
     
@@ -95,6 +75,10 @@ def main():
         print("\n[OK] All strings already present in enlisted_strings.xml")
         return 0
     
+    # Only now parse the full tree - it is needed to write the merged file
+    tree = ET.parse(enlisted_xml)
+    root = tree.getroot()
+    
     # Add new strings to the XML
     strings_element = root.find('strings')
     if strings_element is None:
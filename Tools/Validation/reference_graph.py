@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+Bidirectional content reference graph.
+
+Links every localization string ID to the JSON events/options and C# lines
+that use it (and to its definition in enlisted_strings.xml), and every flag
+to the options that set or clear it and the events whose triggers read it.
+Lookups are plain dict hits in both directions:
+
+    graph.references_to("mi_loot_take")     # who uses this string / flag
+    graph.references_from("evt_x/opt_a")    # what does this event/option/file use
+    graph.ids_with_prefix("mi_loot_")       # ID search
+
+The graph is persisted in Tools/Validation/.cache/reference_graph.pickle with
+the (mtime, size) of every input file; a later load only re-reads files that
+changed, so queries never need a validation run.
+
+Usage:
+    python Tools/Validation/reference_graph.py who-uses mi_loot_take
+    python Tools/Validation/reference_graph.py impact mi_loot_take    # what breaks if it is deleted
+    python Tools/Validation/reference_graph.py flag escalation_started
+    python Tools/Validation/reference_graph.py uses evt_pay_tension_1
+    python Tools/Validation/reference_graph.py prefix mi_loot_
+    python Tools/Validation/reference_graph.py stats
+
+Options:
+    --json       Print the answer as JSON
+    --rebuild    Ignore the persisted graph and rescan every file
+"""
+
+import argparse
+import bisect
+import json
+import os
+import pickle
+import re
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from csharp_index import SourceFile
+from json_locator import JsonPath, JsonPositions
+from localization_index import DEFAULT_XML_PATH, load_index
+from validation_cache import atomic_write
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+CONTENT_ROOT = PROJECT_ROOT / "ModuleData" / "Enlisted"
+CSHARP_ROOT = PROJECT_ROOT / "src"
+SNAPSHOT_PATH = Path(__file__).resolve().parent / ".cache" / "reference_graph.pickle"
+SNAPSHOT_VERSION = 2
+
+# Same pattern Phase 9 of validate_content.py uses; group 2 is the inline fallback text
+TEXTOBJECT_PATTERN = re.compile(r'TextObject\s*\(\s*["\']?\{=([a-zA-Z0-9_]+)\}([^"\']*)', re.MULTILINE)
+
+# JSON keys ending in "Id" are localization references, except these
+NON_STRING_ID_FIELDS = {"packId"}
+
+# Reference kinds
+STRING = "string"
+FLAG_SET = "flag_set"
+FLAG_CLEAR = "flag_clear"
+FLAG_READ = "flag_read"
+
+# ============================================================================
+# Shared extraction helpers (also used by validate_content.py)
+# ============================================================================
+
+def flags_set_by(option: Dict[str, Any]) -> List[str]:
+    """Flags an option sets (effects.setFlags, effects.set_flags or flags_set)."""
+    effects = option.get("effects") or {}
+    return (effects.get("setFlags") or []) or (effects.get("set_flags") or []) or (option.get("flags_set") or [])
+
+
+def flags_cleared_by(option: Dict[str, Any]) -> List[str]:
+    effects = option.get("effects") or {}
+    return (effects.get("clearFlags") or []) or (effects.get("clear_flags") or []) or (option.get("flags_clear") or [])
+
+
+def flag_of_trigger(trigger: Any) -> Optional[str]:
+    """The flag a has_flag:/flag: condition names, or None for any other trigger."""
+    if isinstance(trigger, str) and (trigger.startswith("has_flag:") or trigger.startswith("flag:")):
+        return trigger.replace("has_flag:", "").replace("flag:", "")
+    return None
+
+
+def flags_read_by(triggers: Dict[str, Any], with_triggers: bool = False) -> List[Any]:
+    """
+    Flags named by has_flag:/flag: conditions in an event's triggers
+    ((trigger, flag) pairs with with_triggers=True).
+    """
+    flags = []
+    for trigger_list in [triggers.get("all") or [], triggers.get("any") or [], triggers.get("none") or []]:
+        for trigger in trigger_list:
+            flag = flag_of_trigger(trigger)
+            if flag is not None:
+                flags.append((trigger, flag) if with_triggers else flag)
+    return flags
+
+
+class PrefixTrie:
+    """Character trie over a small set of prefixes (e.g. SYSTEM_STRING_PREFIXES)."""
+
+    __slots__ = ("_root",)
+    _END = ""
+
+    def __init__(self, prefixes: Iterable[str] = ()):
+        self._root: Dict[str, Any] = {}
+        for prefix in prefixes:
+            self.add(prefix)
+
+    def add(self, prefix: str):
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[self._END] = prefix
+
+    def match(self, text: str) -> Optional[str]:
+        """Shortest registered prefix of text, or None."""
+        node = self._root
+        if self._END in node:
+            return node[self._END]
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                return None
+            if self._END in node:
+                return node[self._END]
+        return None
+
+    def __contains__(self, text: str) -> bool:
+        return self.match(text) is not None
+
+
+# ============================================================================
+# Graph
+# ============================================================================
+
+class Reference:
+    """One edge: `source` (event/option path or C# file) uses `target` at file:line."""
+
+    __slots__ = ("kind", "target", "source", "file", "line", "field", "has_fallback")
+
+    def __init__(self, kind: str, target: str, source: str, file: str, line: int,
+                 field: str, has_fallback: bool = False):
+        self.kind = kind
+        self.target = target
+        self.source = source
+        self.file = file
+        self.line = line
+        self.field = field
+        self.has_fallback = has_fallback
+
+    def __getstate__(self):
+        return (self.kind, self.target, self.source, self.file, self.line, self.field, self.has_fallback)
+
+    def __setstate__(self, state):
+        (self.kind, self.target, self.source, self.file, self.line, self.field, self.has_fallback) = state
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"kind": self.kind, "target": self.target, "source": self.source, "file": self.file,
+                "line": self.line, "field": self.field, "has_fallback": self.has_fallback}
+
+    def location(self) -> str:
+        return f"{self.file}:{self.line}"
+
+
+def _value_line(doc: Optional[JsonPositions], path: JsonPath) -> int:
+    """1-based line of the value at `path`, or 0 if the file could not be position-parsed."""
+    if doc is None or path not in doc.spans:
+        return 0
+    return doc.position(doc.spans[path][0])[0]
+
+
+def _string_line(doc: Optional[JsonPositions], value: str, within: Iterable[JsonPath]) -> int:
+    """Line of `value` in the first of the `within` containers holding it (0 if none does)."""
+    if doc is None:
+        return 0
+    for path in within:
+        if path in doc.spans:
+            found = doc.find_string(value, path)
+            if found is not None:
+                return doc.position(found[0])[0]
+    return 0
+
+
+def extract_json_references(path: Path, rel: str, text: Optional[str] = None) -> List[Reference]:
+    """String and flag references in one content JSON file (or in `text`, an older version of it)."""
+    try:
+        if text is None:
+            text = path.read_text(encoding="utf-8-sig")
+        data = json.loads(text)
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return []
+    try:
+        doc: Optional[JsonPositions] = JsonPositions(text)
+    except (ValueError, IndexError):
+        doc = None
+    refs: List[Reference] = []
+
+    def walk(node: Any, scope: Tuple[str, ...], at: JsonPath):
+        if isinstance(node, list):
+            for index, item in enumerate(node):
+                walk(item, scope, at + (index,))
+            return
+        if not isinstance(node, dict):
+            return
+        node_id = node.get("id")
+        if isinstance(node_id, str) and node_id:
+            scope = scope + (node_id,)
+        source = "/".join(scope) or rel
+        for key, value in node.items():
+            if (key.endswith("Id") and key not in NON_STRING_ID_FIELDS
+                    and isinstance(value, str) and value):
+                fallback = node.get(key[:-2])
+                refs.append(Reference(STRING, value, source, rel, _value_line(doc, at + (key,)), key,
+                                      bool(isinstance(fallback, str) and fallback.strip())))
+        if isinstance(node.get("effects"), dict) or "flags_set" in node or "flags_clear" in node:
+            # Same preference order as flags_set_by / flags_cleared_by
+            set_lists = (at + ("effects", "setFlags"), at + ("effects", "set_flags"), at + ("flags_set",))
+            clear_lists = (at + ("effects", "clearFlags"), at + ("effects", "clear_flags"), at + ("flags_clear",))
+            for flag in flags_set_by(node):
+                if isinstance(flag, str):
+                    refs.append(Reference(FLAG_SET, flag, source, rel, _string_line(doc, flag, set_lists),
+                                          "setFlags"))
+            for flag in flags_cleared_by(node):
+                if isinstance(flag, str):
+                    refs.append(Reference(FLAG_CLEAR, flag, source, rel, _string_line(doc, flag, clear_lists),
+                                          "clearFlags"))
+        triggers = node.get("triggers")
+        if isinstance(triggers, dict):
+            for trigger, flag in flags_read_by(triggers, with_triggers=True):
+                refs.append(Reference(FLAG_READ, flag, source, rel,
+                                      _string_line(doc, trigger, (at + ("triggers",),)), "triggers"))
+        for key, value in node.items():
+            if isinstance(value, (dict, list)):
+                walk(value, scope, at + (key,))
+
+    walk(data, (), ())
+    return refs
+
+
+def extract_csharp_references(path: Path, rel: str) -> List[Reference]:
+    """TextObject("{=id}fallback") references in one C# file."""
+    source = SourceFile(path)
+    if not source.readable:
+        return []
+    refs = []
+    for match in TEXTOBJECT_PATTERN.finditer(source.text):
+        refs.append(Reference(STRING, match.group(1), rel, rel, source.line_of(match.start()),
+                              "TextObject", bool(match.group(2).strip())))
+    return refs
+
+
+class ReferenceGraph:
+    """References grouped per input file, with forward and reverse indexes."""
+
+    def __init__(self):
+        # rel path -> (mtime_ns, size)
+        self.stamps: Dict[str, Tuple[int, int]] = {}
+        self.refs_by_file: Dict[str, List[Reference]] = {}
+        # string ID -> line in enlisted_strings.xml
+        self.definitions: Dict[str, int] = {}
+        self._by_target: Dict[str, List[Reference]] = {}
+        self._by_source: Dict[str, List[Reference]] = {}
+        self._sorted_ids: List[str] = []
+
+    # ---------------------------------------------------------------- building
+
+    @staticmethod
+    def input_files() -> Dict[str, Path]:
+        files = {}
+        for root, pattern in ((CONTENT_ROOT, "*.json"), (CSHARP_ROOT, "*.cs")):
+            if root.exists():
+                for path in root.rglob(pattern):
+                    files[path.relative_to(PROJECT_ROOT).as_posix()] = path
+        return files
+
+    def refresh(self) -> int:
+        """Re-extract added/changed files, drop removed ones, reload definitions. Returns files re-read."""
+        files = self.input_files()
+        reread = 0
+        for rel in list(self.refs_by_file):
+            if rel not in files:
+                del self.refs_by_file[rel]
+                self.stamps.pop(rel, None)
+        for rel, path in files.items():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stamp = (st.st_mtime_ns, st.st_size)
+            if self.stamps.get(rel) == stamp and rel in self.refs_by_file:
+                continue
+            if rel.endswith(".cs"):
+                self.refs_by_file[rel] = extract_csharp_references(path, rel)
+            else:
+                self.refs_by_file[rel] = extract_json_references(path, rel)
+            self.stamps[rel] = stamp
+            reread += 1
+        self.definitions = {}
+        if DEFAULT_XML_PATH.exists():
+            index = load_index(DEFAULT_XML_PATH)
+            self.definitions = {string_id: index.line(string_id) for string_id in index}
+        self._reindex()
+        return reread
+
+    def _reindex(self):
+        by_target: Dict[str, List[Reference]] = defaultdict(list)
+        by_source: Dict[str, List[Reference]] = defaultdict(list)
+        for rel in sorted(self.refs_by_file):
+            for ref in self.refs_by_file[rel]:
+                by_target[ref.target].append(ref)
+                # An option's references also belong to its event (and to the file)
+                scope = ref.source.split("/") if ref.source != ref.file else []
+                for depth in range(1, len(scope) + 1):
+                    by_source["/".join(scope[:depth])].append(ref)
+                by_source[ref.file].append(ref)
+        self._by_target = dict(by_target)
+        self._by_source = dict(by_source)
+        self._sorted_ids = sorted(set(self.definitions) | {
+            target for target, refs in by_target.items() if any(r.kind == STRING for r in refs)})
+
+    # ---------------------------------------------------------------- queries
+
+    def references_to(self, target: str, kinds: Optional[Iterable[str]] = None) -> List[Reference]:
+        refs = self._by_target.get(target, [])
+        if kinds is None:
+            return refs
+        kinds = set(kinds)
+        return [ref for ref in refs if ref.kind in kinds]
+
+    def references_from(self, source: str) -> List[Reference]:
+        """Everything an event, option ("event/option") or file references."""
+        return self._by_source.get(source, [])
+
+    def ids_with_prefix(self, prefix: str) -> List[str]:
+        """Defined or referenced string IDs starting with prefix (sorted)."""
+        ids = self._sorted_ids
+        start = bisect.bisect_left(ids, prefix)
+        end = start
+        while end < len(ids) and ids[end].startswith(prefix):
+            end += 1
+        return ids[start:end]
+
+    def impact(self, string_id: str) -> Dict[str, Any]:
+        """What deleting a string (or flag) would break."""
+        refs = self.references_to(string_id)
+        strings = [r for r in refs if r.kind == STRING]
+        readers = [r for r in refs if r.kind == FLAG_READ]
+        setters = [r for r in refs if r.kind == FLAG_SET]
+        return {
+            "id": string_id,
+            "defined_at": self.definitions.get(string_id),
+            # Shown as the inline/JSON fallback (untranslated) once the string is gone
+            "falls_back": [r for r in strings if r.has_fallback],
+            # Shown as the raw ID / empty text
+            "breaks": [r for r in strings if not r.has_fallback],
+            # Flag triggers that can never pass without a setter
+            "unreachable_triggers": readers if setters else [],
+        }
+
+    # ---------------------------------------------------------------- persistence
+
+    def __getstate__(self):
+        return {"stamps": self.stamps, "refs_by_file": self.refs_by_file}
+
+    def __setstate__(self, state):
+        self.__init__()
+        self.stamps = state["stamps"]
+        self.refs_by_file = state["refs_by_file"]
+
+    def save(self, path: Path = SNAPSHOT_PATH):
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_write(path, "wb") as f:
+                pickle.dump({"version": SNAPSHOT_VERSION, "graph": self}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # Snapshot is an optimization only
+
+
+def load_graph(path: Path = SNAPSHOT_PATH, rebuild: bool = False) -> ReferenceGraph:
+    """Load the persisted graph, bring it up to date with the files on disk, and save it back."""
+    graph = None
+    if not rebuild and path.exists():
+        try:
+            with open(path, "rb") as f:
+                snapshot = pickle.load(f)
+            if snapshot.get("version") == SNAPSHOT_VERSION:
+                graph = snapshot["graph"]
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError, AttributeError):
+            graph = None  # Corrupt snapshot - rebuild
+    if graph is None:
+        graph = ReferenceGraph()
+    if graph.refresh():
+        graph.save(path)
+    return graph
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def _print_refs(title: str, refs: List[Reference]):
+    print(f"{title} ({len(refs)}):")
+    for ref in refs:
+        fallback = " [fallback]" if ref.kind == STRING and ref.has_fallback else ""
+        print(f"  {ref.location():<70} {ref.source} ({ref.field}){fallback}")
+
+
+def _who_uses(graph: ReferenceGraph, target: str, as_json: bool) -> int:
+    refs = graph.references_to(target)
+    defined_at = graph.definitions.get(target)
+    if as_json:
+        print(json.dumps({"id": target, "defined_at": defined_at,
+                          "references": [r.to_dict() for r in refs]}, indent=2))
+        return 0
+    strings = [r for r in refs if r.kind == STRING]
+    if defined_at:
+        print(f"'{target}' defined at {DEFAULT_XML_PATH.relative_to(PROJECT_ROOT).as_posix()}:{defined_at}")
+    elif strings:
+        print(f"'{target}' is not defined in enlisted_strings.xml")
+    elif not refs:
+        print(f"'{target}' is not defined or referenced anywhere")
+        return 1
+    if strings:
+        _print_refs("Referenced by", strings)
+    for kind, title in ((FLAG_SET, "Set by"), (FLAG_CLEAR, "Cleared by"), (FLAG_READ, "Read by")):
+        flag_refs = [r for r in refs if r.kind == kind]
+        if flag_refs:
+            _print_refs(title, flag_refs)
+    return 0
+
+
+def _impact(graph: ReferenceGraph, target: str, as_json: bool) -> int:
+    impact = graph.impact(target)
+    if as_json:
+        print(json.dumps({key: [r.to_dict() for r in value] if isinstance(value, list) else value
+                          for key, value in impact.items()}, indent=2))
+        return 0
+    if not impact["breaks"] and not impact["falls_back"] and not impact["unreachable_triggers"]:
+        print(f"Deleting '{target}' breaks nothing (no references)")
+        return 0
+    if impact["breaks"]:
+        _print_refs(f"Deleting '{target}' leaves raw IDs / empty text at", impact["breaks"])
+    if impact["falls_back"]:
+        _print_refs(f"Deleting '{target}' shows untranslated fallback text at", impact["falls_back"])
+    if impact["unreachable_triggers"]:
+        _print_refs(f"Removing flag '{target}' makes these triggers unsatisfiable", impact["unreachable_triggers"])
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the content reference graph")
+    parser.add_argument("command", choices=["who-uses", "impact", "flag", "uses", "prefix", "stats"])
+    parser.add_argument("target", nargs="?", help="String ID, flag, event/option path, file or prefix")
+    parser.add_argument("--json", action="store_true", help="Print the answer as JSON")
+    parser.add_argument("--rebuild", action="store_true", help="Rescan every file")
+    args = parser.parse_args()
+    if args.command != "stats" and not args.target:
+        parser.error(f"{args.command} needs a target")
+
+    started = time.perf_counter()
+    graph = load_graph(rebuild=args.rebuild)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    if args.command in ("who-uses", "flag"):
+        return _who_uses(graph, args.target, args.json)
+    if args.command == "impact":
+        return _impact(graph, args.target, args.json)
+    if args.command == "uses":
+        refs = graph.references_from(args.target)
+        if args.json:
+            print(json.dumps([r.to_dict() for r in refs], indent=2))
+        else:
+            _print_refs(f"'{args.target}' references", refs)
+        return 0 if refs else 1
+    if args.command == "prefix":
+        ids = graph.ids_with_prefix(args.target)
+        if args.json:
+            print(json.dumps({i: len(graph.references_to(i, (STRING,))) for i in ids}, indent=2))
+        else:
+            for string_id in ids:
+                print(f"  {string_id:<60} {len(graph.references_to(string_id, (STRING,)))} reference(s)")
+            print(f"{len(ids)} ID(s) starting with '{args.target}'")
+        return 0
+
+    total = sum(len(refs) for refs in graph.refs_by_file.values())
+    stats = {"files": len(graph.refs_by_file), "references": total,
+             "defined_strings": len(graph.definitions), "targets": len(graph._by_target),
+             "load_ms": round(load_ms, 1)}
+    print(json.dumps(stats, indent=2) if args.json else
+          "\n".join(f"  {key}: {value}" for key, value in stats.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Declarative rule registry for the per-event checks in validate_content.py.
+
+Each rule is a plain function registered with the fields of the normalized
+event it reads:
+
+    EVENT_RULES = RuleRegistry()
+
+    @EVENT_RULES.rule("logic.cooldown", reads=("timing",))
+    def _rule_cooldown(view, file_path, ctx, localization_ids):
+        ...
+
+- reads:    the EventView fields the rule looks at (its input dependencies);
+            view.id is always available and need not be listed
+- requires: the rule is dispatched only if at least one of these fields is
+            non-empty; defaults to `reads`. Rules that report *missing* fields
+            declare requires=() so they always run.
+
+Rules run in registration order, which is the report order. A rule that
+returns False stops dispatch for that event (used by the 'id' gate).
+
+Every event is normalized once into an EventView (schema v1 'content' wrapper
+vs v2 top-level fields), so rules never re-derive options/requirements with
+their own dict.get chains. Per-rule run/skip/issue counts and wall time are
+recorded on the ValidationContext (ctx.rule_stats).
+"""
+
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class EventView:
+    """One event, normalized once for all rules."""
+
+    __slots__ = ("raw", "keys", "id", "content", "order_type", "category", "severity",
+                 "title_id", "setup_id", "title", "setup", "options", "top_level_options",
+                 "requirements", "triggers", "timing")
+
+    def __init__(self, event: Dict[str, Any]):
+        content = event.get("content") or {}
+        if not isinstance(content, dict):
+            content = {}  # Malformed wrapper: validate the top-level fields only
+        self.raw = event
+        self.keys = event.keys()
+        self.id = event.get("id", "UNKNOWN")
+        self.content = content
+        self.order_type = event.get("order_type", "")
+        self.category = event.get("category", "")
+        self.severity = event.get("severity", "")
+        # Schema v2 puts text at the top level, schema v1 inside 'content'
+        self.title_id = event.get("titleId") or content.get("titleId")
+        self.setup_id = event.get("setupId") or content.get("setupId")
+        self.title = event.get("title") or content.get("title")
+        self.setup = event.get("setup") or content.get("setup")
+        self.options = (event.get("options") or []) or (content.get("options") or [])
+        self.top_level_options = event.get("options") or []
+        self.requirements = event.get("requirements") or {}
+        self.triggers = event.get("triggers") or {}
+        self.timing = event.get("timing") or {}
+
+    def has(self, field: str) -> bool:
+        return bool(getattr(self, field))
+
+
+class Rule:
+    __slots__ = ("name", "func", "reads", "requires")
+
+    def __init__(self, name: str, func: Callable, reads: Tuple[str, ...], requires: Tuple[str, ...]):
+        self.name = name
+        self.func = func
+        self.reads = reads
+        self.requires = requires
+
+    @property
+    def phase(self) -> str:
+        """Rule family: the part of the name before the first dot (structure, reference, ...)."""
+        return self.name.split(".", 1)[0]
+
+
+class RuleRegistry:
+    """Ordered set of rules with field-dependency-driven dispatch."""
+
+    def __init__(self):
+        self.rules: List[Rule] = []
+        self._by_phase: Dict[str, List[Rule]] = {}
+
+    def rule(self, name: str, reads: Iterable[str] = (), requires: Optional[Iterable[str]] = None):
+        """Decorator registering a rule function."""
+        reads = tuple(reads)
+        for field in reads:
+            if field not in EventView.__slots__:
+                raise ValueError(f"Rule '{name}' reads unknown EventView field '{field}'")
+        requires = reads if requires is None else tuple(requires)
+
+        def register(func: Callable) -> Callable:
+            rule = Rule(name, func, reads, requires)
+            self.rules.append(rule)
+            self._by_phase.setdefault(rule.phase, []).append(rule)
+            return func
+        return register
+
+    def rules_for(self, phase: Optional[str] = None) -> List[Rule]:
+        return self.rules if phase is None else self._by_phase.get(phase, [])
+
+    def run(self, view: EventView, file_path: str, ctx, localization_ids,
+            phase: Optional[str] = None) -> bool:
+        """
+        Dispatch the applicable rules for one event. Returns False if a gate
+        rule stopped dispatch.
+        """
+        stats = ctx.rule_stats
+        clock = time.perf_counter
+        for rule in self.rules_for(phase):
+            entry = stats[rule.name]
+            if rule.requires and not any(view.has(field) for field in rule.requires):
+                entry[1] += 1
+                continue
+            issues_before = len(ctx.issues)
+            start = clock()
+            result = rule.func(view, file_path, ctx, localization_ids)
+            entry[0] += 1
+            entry[2] += len(ctx.issues) - issues_before
+            entry[3] += clock() - start
+            if result is False:
+                return False
+        return True
+
+
+def new_rule_stats() -> Dict[str, List]:
+    """rule name -> [runs, skipped, issues, seconds]"""
+    return defaultdict(lambda: [0, 0, 0, 0.0])
+
+
+def merge_rule_stats(into: Dict[str, List], other: Dict[str, List]):
+    for name, (runs, skipped, issues, seconds) in other.items():
+        entry = into[name]
+        entry[0] += runs
+        entry[1] += skipped
+        entry[2] += issues
+        entry[3] += seconds
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Fuzzy "did you mean" index for unresolved identifiers.
+
+A SuggestIndex is built once over a vocabulary (localization IDs, event IDs,
+flag names, skill names) and answers nearest-match queries without scanning
+the whole vocabulary:
+
+- every word is broken into padded, lower-cased trigrams with an inverted
+  index gram -> word positions
+- a query only looks at the postings of its rarest trigrams (prefix
+  filtering): any word similar enough to pass the cutoff must share at least
+  one of them, so common grams such as "evt" or "_op" are never scanned
+- the few surviving candidates are ranked by trigram overlap and confirmed
+  with difflib's ratio, so cutoffs mean the same as get_close_matches()
+
+Small vocabularies (skills, world states) are not prefiltered at all, and a
+query whose prefiltered candidates all fail the cutoff falls back to a full
+scan: in both cases the result is exactly get_close_matches(). The prefilter
+can only change which match is returned first, never whether there is one.
+On large vocabularies the full scan first computes difflib's quick_ratio bound
+(shared character counts) for every word at once, packed into one big integer
+per character, so only words that can pass the cutoff reach SequenceMatcher.
+Queries that are not strings (a numeric textId) have no suggestions.
+
+case_match() finds a case-only difference ("onehanded" -> "OneHanded").
+
+Usage:
+    from suggest_index import SuggestIndex, did_you_mean, shared_index
+
+    skills = SuggestIndex(ALL_VALID_SKILLS)
+    skills.best("Polarm")                             # 'Polearm'
+    index = shared_index("strings", localization_ids) # built on first use, then reused
+    message += did_you_mean(index.best(missing_id, cutoff=0.8))
+
+    python Tools/Validation/suggest_index.py QUERY [QUERY ...]   # against enlisted_strings.xml
+"""
+
+import bisect
+import math
+import sys
+import time
+from array import array
+from collections import Counter
+from difflib import SequenceMatcher, get_close_matches
+from typing import Any, Collection, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# Trigram overlap (Dice) a candidate needs to be verified, relative to the ratio cutoff
+GRAM_SLACK = 0.1
+MIN_GRAM_DICE = 0.3
+# Candidates confirmed with SequenceMatcher per returned suggestion
+VERIFY_PER_RESULT = 8
+# Vocabularies up to this size are always scanned in full
+FULL_SCAN_MAX_WORDS = 256
+
+
+def _grams(word: str) -> FrozenSet[str]:
+    padded = f"  {word.lower()} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class SuggestIndex:
+    """Trigram index over a fixed vocabulary."""
+
+    __slots__ = ("_words", "_known", "_grams", "_postings", "_by_lower", "_by_length", "_char_lanes")
+
+    def __init__(self, words: Iterable[str] = ()):
+        self._words: List[str] = []
+        self._known = set()
+        self._grams: List[FrozenSet[str]] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._by_lower: Dict[str, str] = {}
+        # (len(word), word), built on the first full scan
+        self._by_length: Optional[List[Tuple[int, str]]] = None
+        # char -> per-word counts of that char in _by_length order (see _char_counts)
+        self._char_lanes: Optional[Dict[str, bytes]] = None
+        for word in sorted(set(words)):
+            self.add(word)
+
+    def add(self, word: str):
+        if not word or word in self._known:
+            return
+        position = len(self._words)
+        grams = _grams(word)
+        self._words.append(word)
+        self._known.add(word)
+        self._grams.append(grams)
+        self._by_lower.setdefault(word.lower(), word)
+        self._by_length = None
+        self._char_lanes = None
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._known
+
+    def suggest(self, query: str, n: int = 1, cutoff: float = 0.6) -> List[str]:
+        """Up to n words closest to query (difflib ratio >= cutoff), best first."""
+        if not isinstance(query, str) or not query or not self._words:
+            return []
+        if len(self._words) <= FULL_SCAN_MAX_WORDS:
+            return self._full_scan(query, n, cutoff)
+
+        query_grams = _grams(query)
+        # Only grams that occur somewhere can be shared; rarest first
+        present = sorted((g for g in query_grams if g in self._postings), key=lambda g: len(self._postings[g]))
+        dice_cutoff = max(MIN_GRAM_DICE, cutoff - GRAM_SLACK)
+        # Dice >= t implies shared >= t * |Q| / (2 - t), so a match must share a gram
+        # among the first len(present) - min_shared + 1 of them
+        min_shared = max(1, math.ceil(dice_cutoff * len(query_grams) / (2 - dice_cutoff)))
+        prefix = len(present) - min_shared + 1
+
+        candidates = set()
+        for gram in present[:max(prefix, 0)]:
+            candidates.update(self._postings[gram])
+
+        scored: List[Tuple[float, int]] = []
+        query_size = len(query_grams)
+        all_grams = self._grams
+        shared = query_grams.intersection
+        for position in candidates:
+            grams = all_grams[position]
+            dice = 2 * len(shared(grams)) / (query_size + len(grams))
+            if dice >= dice_cutoff:
+                scored.append((dice, position))
+        scored.sort(key=lambda item: (-item[0], self._words[item[1]]))
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(query)
+        results: List[Tuple[float, str]] = []
+        for _, position in scored[:max(n * VERIFY_PER_RESULT, VERIFY_PER_RESULT)]:
+            word = self._words[position]
+            matcher.set_seq1(word)
+            if matcher.real_quick_ratio() >= cutoff and matcher.quick_ratio() >= cutoff:
+                ratio = matcher.ratio()
+                if ratio >= cutoff:
+                    results.append((ratio, word))
+        if not results:
+            return self._full_scan(query, n, cutoff)
+        # Same order as get_close_matches(): score, then word, both descending
+        results.sort(reverse=True)
+        return [word for _, word in results[:n]]
+
+    def _full_scan(self, query: str, n: int, cutoff: float) -> List[str]:
+        """get_close_matches() over the words whose length can reach the cutoff at all."""
+        if self._by_length is None:
+            self._by_length = sorted((len(word), word) for word in self._words)
+        if cutoff <= 0:
+            return get_close_matches(query, self._words, n, cutoff)
+        # real_quick_ratio 2 * min(a, b) / (a + b) >= cutoff bounds the length
+        size = len(query)
+        low = math.ceil(size * cutoff / (2 - cutoff) - 1e-9)
+        high = math.floor(size * (2 - cutoff) / cutoff + 1e-9)
+        start = bisect.bisect_left(self._by_length, (low, ""))
+        end = bisect.bisect_left(self._by_length, (high + 1, ""))
+        window = self._by_length[start:end]
+        shared = self._shared_chars(query) if len(self._words) > FULL_SCAN_MAX_WORDS else None
+        if shared is not None:
+            # Same test as quick_ratio(), so dropped words could never pass it
+            window = [(length, word) for (length, word), m in zip(window, shared[start:end])
+                      if 2.0 * m / (size + length) >= cutoff]
+        return get_close_matches(query, [word for _, word in window], n, cutoff)
+
+    def _shared_chars(self, query: str) -> Optional[array]:
+        """
+        Multiset intersection size of query with every word, in _by_length order.
+
+        Each char maps to a 16-bit lane per word holding that word's count of the
+        char. bytes.translate caps every lane at the query's count (min(query,
+        word) for all words at C speed); reading the lanes as one big integer per
+        char and adding those sums them, which cannot carry: a lane total is at
+        most the word's length.
+        """
+        counts = Counter(query)
+        if max(counts.values()) > 255:
+            return None
+        if self._char_lanes is None:
+            self._char_lanes = self._char_counts()
+            if self._char_lanes is None:
+                return None
+        size = 2 * len(self._by_length)
+        total = 0
+        for char, count in counts.items():
+            lanes = self._char_lanes.get(char)
+            if lanes is not None:
+                total += int.from_bytes(lanes.translate(_MIN_TABLES[count]), "little")
+        shared = array("H", total.to_bytes(size, "little"))
+        if sys.byteorder == "big":
+            shared.byteswap()
+        return shared
+
+    def _char_counts(self) -> Optional[Dict[str, bytes]]:
+        """Per-char count lanes for _shared_chars (None if a word is too long for 16-bit lanes)."""
+        if self._by_length[-1][0] > 0xFFFF:
+            return None
+        lanes: Dict[str, bytearray] = {}
+        size = 2 * len(self._by_length)
+        for position, (_, word) in enumerate(self._by_length):
+            for char, count in Counter(word).items():
+                row = lanes.get(char)
+                if row is None:
+                    row = lanes[char] = bytearray(size)
+                # A count above 255 only ever meets query counts <= 255, so capping it is exact
+                row[2 * position] = min(count, 255)
+        return {char: bytes(row) for char, row in lanes.items()}
+
+    def case_match(self, query: str) -> Optional[str]:
+        """The word that differs from query only in case, or None."""
+        if not isinstance(query, str):
+            return None
+        match = self._by_lower.get(query.lower())
+        return match if match != query else None
+
+    def best(self, query: str, cutoff: float = 0.6) -> Optional[str]:
+        """Closest word, or None."""
+        matches = self.suggest(query, 1, cutoff)
+        return matches[0] if matches else None
+
+
+# count -> translate table capping a byte at count (min(byte, count))
+_MIN_TABLES = [bytes(min(value, count) for value in range(256)) for count in range(256)]
+
+
+def did_you_mean(suggestion: Optional[str]) -> str:
+    """Message suffix for an optional suggestion."""
+    return f" (did you mean '{suggestion}'?)" if suggestion else ""
+
+
+# name -> (vocabulary object, its size when indexed, index)
+_SHARED: Dict[str, Tuple[Any, int, SuggestIndex]] = {}
+
+
+def shared_index(name: str, words: Collection[str]) -> SuggestIndex:
+    """
+    Index over `words`, built on first use and reused for as long as callers
+    pass the same, unchanged collection (e.g. the run's localization ID set).
+    """
+    cached = _SHARED.get(name)
+    if cached is not None and cached[0] is words and cached[1] == len(words):
+        return cached[2]
+    index = SuggestIndex(words)
+    _SHARED[name] = (words, len(words), index)
+    return index
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return 1
+    from localization_index import load_index
+
+    started = time.perf_counter()
+    index = SuggestIndex(load_index().ids())
+    print(f"Indexed {len(index)} string IDs in {(time.perf_counter() - started) * 1000:.1f} ms")
+    for query in sys.argv[1:]:
+        started = time.perf_counter()
+        matches = index.suggest(query, n=5, cutoff=0.6)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"  {query}: {', '.join(matches) or '(no match)'} [{elapsed:.3f} ms]")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
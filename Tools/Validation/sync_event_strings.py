@@ -1,19 +1,27 @@
 #!/usr/bin/env python3
 """
-Sync localization strings from JSON event files to enlisted_strings.xml.
+Sync localization strings from JSON content files to enlisted_strings.xml.
 
-This script scans all JSON event files in ModuleData/Enlisted/Events/ and extracts
-localization string IDs and their fallback text, then appends missing strings to
-ModuleData/Languages/enlisted_strings.xml.
+This script scans every content root for localization string IDs and their
+fallback text, then upserts them into ModuleData/Languages/enlisted_strings.xml:
+
+    ModuleData/Enlisted/Events/*.json                 events (titleId/title, setupId/setup, options)
+    ModuleData/Enlisted/Decisions/*.json              decisions, and camp_opportunities.json
+                                                      (titleId, descriptionId, hintId, actionId, tooltipRiskyId)
+    ModuleData/Enlisted/Orders/order_events/*.json    order events
+    ModuleData/Enlisted/Config/*.json                 inline "{=id}text" values (simulation_config.json, ...)
 
 Usage:
-    python tools/events/sync_event_strings.py
+    python Tools/Validation/sync_event_strings.py            # add missing strings to the XML
+    python Tools/Validation/sync_event_strings.py --check    # report only; exit 1 if the XML is out of date
+    python Tools/Validation/sync_event_strings.py --update   # also rewrite XML text that differs from the JSON
 
 The script will:
-1. Scan all event JSON files for string IDs (titleId, setupId, textId, resultTextId, resultFailureTextId)
+1. Scan all content files in parallel (one task per file) for string IDs and fallback text
 2. Load existing string IDs from enlisted_strings.xml
-3. Generate XML <string> entries for any missing IDs using fallback text from JSON
-4. Append missing strings to enlisted_strings.xml (maintaining XML structure)
+3. Insert each missing ID right after the existing ID that sorts before it, so
+   new strings land next to their prefix group and re-runs place them identically
+4. Write the XML atomically (temp file + rename), and only if something changed
 5. Report statistics on strings processed and added
 
 All special characters are properly escaped for XML:
@@ -22,10 +30,36 @@ All special characters are properly escaped for XML:
 - Apostrophes: &apos;
 """
 
+import bisect
+import concurrent.futures
 import json
+import os
 import re
 from pathlib import Path
-from typing import Dict, Set, List, Tuple
+from typing import Dict, Set, List, Optional, Tuple
+
+from localization_index import load_index
+from validation_cache import atomic_write
+
+# (directory, kind) of every content root; kind selects the extractor
+CONTENT_SOURCES = (
+    ("ModuleData/Enlisted/Events", "content"),
+    ("ModuleData/Enlisted/Decisions", "content"),
+    ("ModuleData/Enlisted/Orders/order_events", "content"),
+    ("ModuleData/Enlisted/Config", "inline"),
+)
+
+# Opportunity text fields; each is paired with <field>Id
+OPPORTUNITY_TEXT_FIELDS = ("title", "description", "hint", "action", "tooltipRisky")
+
+# Bannerlord inline localized text: "{=string_id}Fallback text"
+INLINE_TEXT_RE = re.compile(r'^\{=([A-Za-z0-9_.\-]+)\}(.*)$', re.DOTALL)
+
+# A single-element <string id="..." text="..." /> in the string table
+STRING_ELEMENT_RE = re.compile(r'<string\s+id="([^"]*)"\s+text="([^"]*)"\s*/>')
+
+# Below this many files a worker pool costs more than it saves
+PARALLEL_MIN_FILES = 8
 
 
 def xml_escape(text: str) -> str:
@@ -94,73 +128,252 @@ def extract_strings_from_event(event: dict) -> Dict[str, str]:
     return strings
 
 
+def extract_strings_from_opportunity(opportunity: dict) -> Dict[str, str]:
+    """Extract all localizable strings from a camp opportunity definition"""
+    strings = {}
+    for field in OPPORTUNITY_TEXT_FIELDS:
+        string_id = opportunity.get(field + "Id")
+        if string_id and opportunity.get(field):
+            strings[string_id] = opportunity[field]
+    return strings
+
+
+def extract_inline_strings(value, strings: Dict[str, str]) -> Dict[str, str]:
+    """Collect every "{=id}text" string value in a JSON document"""
+    if isinstance(value, str):
+        match = INLINE_TEXT_RE.match(value)
+        if match and match.group(2):
+            strings.setdefault(match.group(1), match.group(2))
+    elif isinstance(value, dict):
+        for item in value.values():
+            extract_inline_strings(item, strings)
+    elif isinstance(value, list):
+        for item in value:
+            extract_inline_strings(item, strings)
+    return strings
+
+
 def load_existing_xml_strings(xml_file: Path) -> Set[str]:
     """Load all existing string IDs from XML file"""
     if not xml_file.exists():
         return set()
     
-    content = xml_file.read_text(encoding='utf-8')
-    pattern = r'<string\s+id="([^"]+)"'
-    return set(re.findall(pattern, content))
+    return set(load_index(xml_file).ids())
 
 
-def scan_event_files(events_dir: Path, verbose: bool = False) -> Tuple[Dict[str, Dict], List[str]]:
-    """Scan all JSON event files and extract strings"""
-    all_strings = {}
+def _load_json(json_file: Path):
+    """Parse a content file, retrying once without trailing commas"""
+    # Handle UTF-8 BOM
+    with open(json_file, 'r', encoding='utf-8-sig') as f:
+        content = f.read()
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        return json.loads(re.sub(r',(\s*[}\]])', r'\1', content))
+
+
+def scan_file(json_file: Path, kind: str = "content") -> Tuple[List[Tuple[str, Dict[str, str]]], List[str], Optional[str]]:
+    """
+    Extract the strings of one content file.
+
+    Returns ([(owner, {id: text})], missing fallback messages, skip reason or None).
+    The owner is the event/opportunity ID, or the file name for inline config text.
+    """
+    try:
+        data = _load_json(json_file)
+    except Exception as e:
+        return [], [], f"{json_file.name}: {e}"
+    
+    if kind == "inline":
+        strings = extract_inline_strings(data, {})
+        return ([(json_file.stem, strings)] if strings else []), [], None
+    
+    owned = []
     missing_ids = []
+    if not isinstance(data, dict):
+        return owned, missing_ids, None
+    for event in data.get("events", []):
+        event_id = event.get("id", "unknown")
+        strings = extract_strings_from_event(event)
+        if strings:
+            owned.append((event_id, strings))
+        
+        # Check for missing fallback text
+        content = event.get("content", {})
+        if content.get("titleId") and not content.get("title"):
+            missing_ids.append(f"{json_file.name}: {event_id} missing 'title' fallback")
+        if content.get("setupId") and not content.get("setup"):
+            missing_ids.append(f"{json_file.name}: {event_id} missing 'setup' fallback")
+    for opportunity in data.get("opportunities", []):
+        strings = extract_strings_from_opportunity(opportunity)
+        if strings:
+            owned.append((opportunity.get("id", "unknown"), strings))
+    return owned, missing_ids, None
+
+
+def _scan_task(task: Tuple[Path, str]):
+    return scan_file(*task)
+
+
+def scan_content(sources=CONTENT_SOURCES, jobs: int = 0, verbose: bool = False) -> Tuple[Dict[str, Dict], List[str]]:
+    """
+    Scan every content root and extract strings, one task per file.
+
+    jobs caps the worker pool (0 = one per CPU, 1 = serial). Results are merged
+    in file order, so the outcome does not depend on the number of workers.
+    """
+    tasks = []
+    for directory, kind in sources:
+        tasks.extend((json_file, kind) for json_file in sorted(Path(directory).glob("*.json")))
     
-    for json_file in events_dir.glob("*.json"):
-        try:
-            # Handle UTF-8 BOM
-            with open(json_file, 'r', encoding='utf-8-sig') as f:
-                content = f.read()
-            
-            # Try to parse JSON, skip files with trailing commas or other issues
-            try:
-                data = json.loads(content)
-            except json.JSONDecodeError:
-                # Try lenient parsing by removing trailing commas
-                content = re.sub(r',(\s*[}\]])', r'\1', content)
-                try:
-                    data = json.loads(content)
-                except json.JSONDecodeError as e:
-                    if verbose:
-                        print(f"  Skipping {json_file.name}: {e}")
-                    continue
-            
-            events = data.get("events", [])
-            for event in events:
-                event_id = event.get("id", "unknown")
-                strings = extract_strings_from_event(event)
-                
-                if strings:
-                    all_strings[event_id] = strings
-                
-                # Check for missing fallback text
-                content = event.get("content", {})
-                if content.get("titleId") and not content.get("title"):
-                    missing_ids.append(f"{json_file.name}: {event_id} missing 'title' fallback")
-                if content.get("setupId") and not content.get("setup"):
-                    missing_ids.append(f"{json_file.name}: {event_id} missing 'setup' fallback")
-                
-        except Exception as e:
-            if verbose:
-                print(f"  Skipping {json_file.name}: {e}")
+    workers = min(jobs or os.cpu_count() or 1, len(tasks))
+    if workers > 1 and len(tasks) >= PARALLEL_MIN_FILES:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_scan_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    else:
+        results = [_scan_task(task) for task in tasks]
     
+    all_strings: Dict[str, Dict[str, str]] = {}
+    missing_ids: List[str] = []
+    for owned, missing, skipped in results:
+        if skipped:
+            if verbose:
+                print(f"  Skipping {skipped}")
+            continue
+        for owner, strings in owned:
+            all_strings.setdefault(owner, {}).update(strings)
+        missing_ids.extend(missing)
     return all_strings, missing_ids
 
 
-def generate_xml_strings(all_strings: Dict[str, Dict], missing_ids: Set[str], output_file: Path) -> None:
-    """Generate XML string entries for missing IDs and write to file"""
-    # Collect missing strings with their text
-    missing_strings = []
-    for event_id, strings in all_strings.items():
+def scan_event_files(events_dir: Path, verbose: bool = False) -> Tuple[Dict[str, Dict], List[str]]:
+    """Scan all JSON event files in one directory and extract strings"""
+    return scan_content(((str(events_dir), "content"),), jobs=1, verbose=verbose)
+
+
+def collect_texts(all_strings: Dict[str, Dict]) -> Tuple[Dict[str, Tuple[str, str]], List[str]]:
+    """
+    Flatten {owner: {id: text}} to {id: (text, owner)}; the first definition wins.
+
+    Also returns a message for every ID defined again with different text.
+    """
+    texts: Dict[str, Tuple[str, str]] = {}
+    conflicts = []
+    for owner, strings in all_strings.items():
         for string_id, text in strings.items():
-            if string_id in missing_ids:
-                missing_strings.append((string_id, text, event_id))
+            first = texts.get(string_id)
+            if first is None:
+                texts[string_id] = (text, owner)
+            elif first[0] != text:
+                conflicts.append(f"{string_id}: {owner} differs from {first[1]} (keeping {first[1]})")
+    return texts, conflicts
+
+
+def string_element(string_id: str, text: str) -> str:
+    return f'<string id="{string_id}" text="{xml_escape(text)}" />'
+
+
+def upsert_strings(xml: str, inserts: Dict[str, str], updates: Dict[str, str]) -> str:
+    """
+    Insert and update <string> elements in string table XML, keyed by ID.
+
+    Each inserted ID goes on a new line right after the line holding the
+    existing element whose ID sorts just before it (before the first element's
+    line for IDs that sort first), indented like that line. Lines holding
+    several elements are never joined by more, so run-on lines do not grow; an
+    opening or closing <strings> tag on such a line moves to its own line.
+    Everything else in the file is left byte-for-byte as it was.
+    """
+    elements = {}
+    for match in STRING_ELEMENT_RE.finditer(xml):
+        elements.setdefault(match.group(1), match)
+    anchors = sorted(elements)
+    
+    # (offset, end, replacement), applied in offset order
+    edits: List[Tuple[int, int, str]] = []
+    for string_id, text in updates.items():
+        match = elements.get(string_id)
+        if match:
+            edits.append((match.start(2), match.end(2), xml_escape(text)))
     
-    # Sort by ID for consistent output
-    missing_strings.sort(key=lambda x: x[0])
+    opening = xml.find("<strings")
+    closing = xml.rfind("</strings>")
+    if opening < 0 or closing < 0:
+        if inserts:
+            raise ValueError("string table has no <strings> element")
+        closing = len(xml)
+    tag_line = xml.rfind("\n", 0, opening) + 1
+    tag_indent = xml[tag_line:opening] if not xml[tag_line:opening].strip() else ""
+    
+    inserted_at: Dict[int, List[str]] = {}
+    for string_id in sorted(inserts):
+        i = bisect.bisect_left(anchors, string_id)
+        key = i - 1 if i else -1
+        inserted_at.setdefault(key, []).append(string_element(string_id, inserts[string_id]))
+    # offset -> (indent, text after the new lines, new elements); anchors sharing a line share one placement
+    placements: Dict[int, Tuple[str, str, List[str]]] = {}
+    for key, new_elements in inserted_at.items():
+        if not anchors:
+            line_start = xml.rfind("\n", 0, closing) + 1
+            if xml[line_start:closing].strip():
+                placements[closing] = (tag_indent + "  ", "\n" + tag_indent, new_elements)
+            else:
+                # Keep the closing tag's own indentation
+                edits.append((line_start, line_start, "".join(f"{tag_indent}  {element}\n"
+                                                              for element in new_elements)))
+            continue
+        match = elements[anchors[key if key >= 0 else 0]]
+        line_start = xml.rfind("\n", 0, match.start()) + 1
+        indent = xml[line_start:match.start()]
+        if indent.strip():
+            # Not first on its line: the line's indentation, or one level inside <strings> if it has none
+            indent = indent[:len(indent) - len(indent.lstrip())] or tag_indent + "  "
+        if key < 0:
+            tag_end = xml.find(">", opening) + 1
+            if line_start < tag_end <= match.start():
+                # <strings> shares the line: the first element's line continues below the new ones
+                placements[tag_end] = (indent, "\n" + indent, new_elements)
+            else:
+                edits.append((line_start, line_start, "".join(indent + element + "\n" for element in new_elements)))
+            continue
+        line_end = xml.find("\n", match.end())
+        line_end = line_end if line_end >= 0 else len(xml)
+        if match.end() <= closing < line_end:
+            # </strings> shares the line: it moves below the new elements
+            offset, tail = closing, "\n" + tag_indent
+        else:
+            # After anything else on the line, such as a trailing comment or more elements
+            offset, tail = line_end, ""
+        if offset in placements:
+            placements[offset][2].extend(new_elements)
+        else:
+            placements[offset] = (indent, tail, list(new_elements))
+    for offset, (indent, tail, new_elements) in placements.items():
+        edits.append((offset, offset, "".join("\n" + indent + element for element in new_elements) + tail))
+    
+    edits.sort(key=lambda edit: edit[0])
+    pieces = []
+    last = 0
+    for offset, end, replacement in edits:
+        pieces.append(xml[last:offset])
+        pieces.append(replacement)
+        last = end
+    pieces.append(xml[last:])
+    return "".join(pieces)
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """Write text via a temp file in the same directory and rename it over path"""
+    with atomic_write(path, newline='') as f:
+        f.write(text)
+
+
+def generate_xml_strings(all_strings: Dict[str, Dict], missing_ids: Set[str], output_file: Path) -> None:
+    """Generate XML string entries for missing IDs and write to file"""
+    # Collect missing strings with their text, sorted by ID for consistent output
+    texts, _ = collect_texts(all_strings)
+    missing_strings = sorted((string_id, text, owner) for string_id, (text, owner) in texts.items()
+                             if string_id in missing_ids)
     
     # Generate XML entries grouped by event
     xml_lines = []
@@ -174,9 +387,7 @@ def generate_xml_strings(all_strings: Dict[str, Dict], missing_ids: Set[str], ou
             xml_lines.append(f"    <!-- {event_id} -->")
             current_event = event_id
         
-        # Escape text for XML
-        escaped_text = xml_escape(text)
-        xml_lines.append(f'    <string id="{string_id}" text="{escaped_text}" />')
+        xml_lines.append(f"    {string_element(string_id, text)}")
     
     # Write to output file
     with open(output_file, 'w', encoding='utf-8') as f:
@@ -184,100 +395,88 @@ def generate_xml_strings(all_strings: Dict[str, Dict], missing_ids: Set[str], ou
     
     print(f"\nGenerated {len(missing_strings)} XML string entries")
     print(f"Output written to: {output_file}")
-    print("\nTo add these to enlisted_strings.xml:")
-    print("1. Review the generated XML")
-    print("2. Copy the entries into enlisted_strings.xml before the closing </strings> tag")
-    print("3. Organize by section if desired (Events, Decisions, Orders, etc.)")
+    print("\nTo add these to enlisted_strings.xml, run without --generate (or copy them in by hand)")
 
 
 def main():
     """Main entry point"""
     import argparse
     
-    parser = argparse.ArgumentParser(description="Check and sync event localization strings")
+    parser = argparse.ArgumentParser(description="Check and sync content localization strings")
     parser.add_argument("--check", action="store_true", help="Check for missing strings only (don't modify)")
     parser.add_argument("--generate", type=str, metavar="FILE", help="Generate missing XML strings to specified file")
+    parser.add_argument("--update", action="store_true", help="Also rewrite XML text that differs from the JSON fallback text")
+    parser.add_argument("--jobs", "-j", type=int, default=0, metavar="N", help="Worker processes for the scan (0 = one per CPU, 1 = serial)")
     parser.add_argument("--verbose", action="store_true", help="Show detailed output")
     args = parser.parse_args()
     
     # Paths
     events_dir = Path("ModuleData/Enlisted/Events")
-    decisions_dir = Path("ModuleData/Enlisted/Decisions")
     xml_file = Path("ModuleData/Languages/enlisted_strings.xml")
     
     if not events_dir.exists():
         print(f"Error: {events_dir} not found")
         return 1
     
-    print("Scanning JSON event files...")
-    all_strings, missing_fallbacks = scan_event_files(events_dir, args.verbose)
-    
-    print("Scanning JSON decision files...")
-    decision_strings, decision_fallbacks = scan_event_files(decisions_dir, args.verbose)
-    all_strings.update(decision_strings)
-    missing_fallbacks.extend(decision_fallbacks)
-    
-    # Scan order event files
-    order_events_dir = Path("ModuleData/Enlisted/Orders/order_events")
-    if order_events_dir.exists():
-        print("Scanning order event files...")
-        order_strings, order_fallbacks = scan_event_files(order_events_dir, args.verbose)
-        all_strings.update(order_strings)
-        missing_fallbacks.extend(order_fallbacks)
-    
-    # Count total strings
-    total_string_count = sum(len(strings) for strings in all_strings.values())
-    print(f"Found {len(all_strings)} events with {total_string_count} localizable strings")
+    print("Scanning JSON content files (events, decisions, opportunities, order events, config)...")
+    all_strings, missing_fallbacks = scan_content(jobs=args.jobs, verbose=args.verbose)
+    texts, conflicts = collect_texts(all_strings)
+    print(f"Found {len(all_strings)} events/sources with {len(texts)} localizable strings")
     
     # Load existing XML strings
-    existing_ids = load_existing_xml_strings(xml_file)
-    print(f"Found {len(existing_ids)} existing strings in XML")
-    
-    # Find missing strings
-    all_required_ids = set()
-    for strings in all_strings.values():
-        all_required_ids.update(strings.keys())
+    existing = load_index(xml_file).texts() if xml_file.exists() else {}
+    print(f"Found {len(existing)} existing strings in XML")
     
-    missing_in_xml = all_required_ids - existing_ids
+    # Find missing and changed strings
+    missing_in_xml = {string_id: text for string_id, (text, _) in texts.items() if string_id not in existing}
+    changed_in_xml = {string_id: text for string_id, (text, _) in texts.items()
+                      if string_id in existing and existing[string_id] != text}
     
     if missing_in_xml:
         print(f"\n[MISSING] {len(missing_in_xml)} string IDs missing from XML:")
         for string_id in sorted(missing_in_xml):
-            # Find which event this belongs to
-            for event_id, strings in all_strings.items():
-                if string_id in strings:
-                    print(f"  {string_id} (from {event_id})")
-                    break
+            print(f"  {string_id} (from {texts[string_id][1]})")
     else:
         print("\n[OK] All string IDs present in XML")
     
+    if changed_in_xml:
+        print(f"\n[{'CHANGED' if args.update else 'INFO'}] {len(changed_in_xml)} XML texts differ from the JSON fallback text"
+              + ("" if args.update else " (--update rewrites them)"))
+        if args.update or args.verbose:
+            for string_id in sorted(changed_in_xml):
+                print(f"  {string_id} (from {texts[string_id][1]})")
+    
+    if conflicts:
+        print(f"\n[WARNING] {len(conflicts)} string IDs defined with different text:")
+        for conflict in conflicts:
+            print(f"  {conflict}")
+    
     if missing_fallbacks:
         print(f"\n[WARNING] {len(missing_fallbacks)} events missing fallback text in JSON:")
         for issue in missing_fallbacks:
             print(f"  {issue}")
     
+    updates = changed_in_xml if args.update else {}
     if args.check:
-        return 1 if (missing_in_xml or missing_fallbacks) else 0
+        return 1 if (missing_in_xml or updates or missing_fallbacks) else 0
     
     # Generate XML strings if requested
-    if args.generate and missing_in_xml:
-        output_file = Path(args.generate)
-        generate_xml_strings(all_strings, missing_in_xml, output_file)
+    if args.generate:
+        if missing_in_xml:
+            generate_xml_strings(all_strings, set(missing_in_xml), Path(args.generate))
         return 0
     
-    # If not just checking, offer to generate missing strings
-    if missing_in_xml:
-        print("\nTo add missing strings, you'll need to:")
-        print("1. Run with --generate output.xml to create XML entries")
-        print("2. Review the generated XML")
-        print("3. Copy entries into enlisted_strings.xml in the appropriate section")
-        print("4. Ensure proper XML escaping is preserved")
-        return 1
+    if not missing_in_xml and not updates:
+        print(f"\n{xml_file} is up to date")
+        return 0
     
+    with open(xml_file, 'r', encoding='utf-8', newline='') as f:
+        xml = f.read()
+    write_atomic(xml_file, upsert_strings(xml, missing_in_xml, updates))
+    print(f"\nWrote {xml_file}: {len(missing_in_xml)} added, {len(updates)} updated")
     return 0
 
 
 if __name__ == "__main__":
     import sys
     sys.exit(main())
-
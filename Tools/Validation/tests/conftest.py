@@ -0,0 +1,9 @@
+"""Make the Tools/Validation modules importable as top-level modules, as the scripts do."""
+
+import sys
+from pathlib import Path
+
+VALIDATION_DIR = Path(__file__).resolve().parent.parent
+
+if str(VALIDATION_DIR) not in sys.path:
+    sys.path.insert(0, str(VALIDATION_DIR))
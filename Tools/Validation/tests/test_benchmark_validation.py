@@ -0,0 +1,67 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import benchmark_validation
+from benchmark_validation import BASELINE_VERSION, compare, generate_corpus, machine_info
+
+VOLUME = {"events": 4, "decisions": 2, "order_events": 2, "opportunities": 2, "strings": 50, "cs_files": 2,
+          "textobjects": 6}
+
+
+def _results(**metrics):
+    return {"version": BASELINE_VERSION, "machine": machine_info(), "volume_1x": VOLUME, "scales": {"1": metrics}}
+
+
+def test_compare_flags_only_real_slowdowns():
+    baseline = _results(phase_0=1.0, phase_8=0.01, **{"validate_content.peak_rss_mib": 50.0})
+    assert compare(_results(phase_0=1.2, phase_8=0.05, **{"validate_content.peak_rss_mib": 500.0}),
+                   baseline, 0.25) == []
+    # Past the threshold, but under the noise floor in absolute terms
+    assert compare(_results(phase_0=1.0, phase_8=0.055), baseline, 0.25) == []
+    assert compare(_results(phase_0=1.5, phase_8=0.07, phase_new=9.0), baseline, 0.25) == [
+        "1x phase_0: 1.000s -> 1.500s (+50%)", "1x phase_8: 0.010s -> 0.070s (+600%)"]
+    assert compare({"scales": {"10": {"phase_0": 9.0}}}, baseline, 0.25) == []
+
+
+@pytest.fixture
+def canned_run(tmp_path, monkeypatch):
+    """main() with the benchmark itself replaced by fixed results; returns (baseline path, run)."""
+    baseline = tmp_path / "cache/benchmark_baseline.json"
+
+    def run(phase_0, *args):
+        monkeypatch.setattr(benchmark_validation, "run_benchmarks", lambda *_: _results(phase_0=phase_0))
+        monkeypatch.setattr(sys, "argv", ["benchmark_validation.py", "--baseline", str(baseline), *args])
+        return benchmark_validation.main()
+    return baseline, run
+
+
+def test_baselines_compare_only_on_the_machine_that_recorded_them(canned_run, capsys):
+    baseline, run = canned_run
+    assert run(1.0) == 0
+    assert "No baseline to compare against" in capsys.readouterr().out
+    assert run(1.0, "--save-baseline") == 0
+    assert json.loads(baseline.read_text(encoding="utf-8"))["machine"] == machine_info()
+    assert run(2.0) == 1
+    assert "1x phase_0: 1.000s -> 2.000s (+100%)" in capsys.readouterr().out
+
+    recorded = json.loads(baseline.read_text(encoding="utf-8"))
+    recorded["machine"]["cpu_count"] = -1
+    baseline.write_text(json.dumps(recorded), encoding="utf-8")
+    assert run(2.0) == 0
+    assert "Ignoring baseline recorded on another machine" in capsys.readouterr().out
+
+
+def test_generated_corpus_is_valid_content(tmp_path):
+    generate_corpus(tmp_path, VOLUME, 2)
+    assert len(list((tmp_path / "ModuleData/Enlisted/Events").glob("*.json"))) == 1
+    assert (tmp_path / "Tools/Validation/content_schema.json").exists()
+    result = subprocess.run([sys.executable, "Tools/Validation/validate_content.py", "--no-cache", "--format", "ndjson"],
+                            cwd=tmp_path, capture_output=True, text=True, timeout=300)
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert records[-1]["type"] == "summary" and records[-1]["total_events"] == 2 * (4 + 2 + 2)
+    assert not [record for record in records if record.get("category") == "structure"]
+    # The copied tools keep their snapshots inside the corpus, never in the real project
+    assert (tmp_path / "Tools/Validation/.cache/id_registry.pickle").exists()
@@ -0,0 +1,116 @@
+import functools
+import io
+import json
+import subprocess
+
+import pytest
+
+import change_scope
+import localization_index
+import reference_graph
+import validate_content
+from change_scope import ChangeScope, ChangeScopeError
+from issue_store import ValidationIssue
+
+EVENTS = "ModuleData/Enlisted/Events"
+XML = "ModuleData/Languages/enlisted_strings.xml"
+
+
+def _event(event_id, title_id, effects=None, triggers=None):
+    event = {"id": event_id, "category": "general", "titleId": title_id, "title": "Title",
+             "options": [{"id": "a", "textId": "evt_opt", "text": "A", "effects": effects or {}}]}
+    if triggers:
+        event["triggers"] = triggers
+    return event
+
+
+def _write(project, rel, *events):
+    (project / rel).write_text(json.dumps({"schemaVersion": 2, "events": list(events)}, indent=2), encoding="utf-8")
+
+
+def _write_strings(project, ids):
+    rows = "\n".join(f'    <string id="{string_id}" text="{string_id}" />' for string_id in ids)
+    (project / XML).write_text(f'<base type="string">\n  <strings>\n{rows}\n  </strings>\n</base>\n',
+                               encoding="utf-8")
+
+
+def _git(project, *args):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                   cwd=project, check=True, capture_output=True)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A committed project: events_a sets plot_joined, events_b reads it, events_c stands alone."""
+    project = tmp_path / "project"
+    (project / EVENTS).mkdir(parents=True)
+    (project / "ModuleData/Languages").mkdir(parents=True)
+    _write(project, f"{EVENTS}/events_a.json", _event("evt_a", "evt_a_title", {"setFlags": ["plot_joined"]}))
+    _write(project, f"{EVENTS}/events_b.json",
+           _event("evt_b", "evt_b_title", triggers={"all": ["has_flag:plot_joined"]}))
+    _write(project, f"{EVENTS}/events_c.json", _event("evt_c", "evt_c_title"))
+    _write_strings(project, ("evt_a_title", "evt_b_title", "evt_opt"))
+    _git(project, "init", "-q")
+    _git(project, "add", ".")
+    _git(project, "commit", "-q", "-m", "base")
+
+    for module in (change_scope, validate_content):
+        monkeypatch.setattr(module, "PROJECT_ROOT", project)
+    for name, value in (("PROJECT_ROOT", project), ("CONTENT_ROOT", project / "ModuleData/Enlisted"),
+                        ("CSHARP_ROOT", project / "src"), ("DEFAULT_XML_PATH", project / XML)):
+        monkeypatch.setattr(reference_graph, name, value)
+    monkeypatch.setattr(change_scope, "load_graph",
+                        functools.partial(reference_graph.load_graph, tmp_path / "cache/graph.pickle"))
+    monkeypatch.setattr(localization_index, "SNAPSHOT_DIR", tmp_path / "cache")
+    return project
+
+
+def _scope(revision="HEAD"):
+    session = validate_content.ValidationSession(out=io.StringIO())
+    session.load_localization()
+    session.discover_files()
+    return ChangeScope.compute(revision, session)
+
+
+def test_edit_that_keeps_ids_and_flags_stays_local(project):
+    _write(project, f"{EVENTS}/events_c.json", {**_event("evt_c", "evt_c_title"), "title": "Renamed"})
+    scope = _scope()
+    assert scope.changed_paths == {f"{EVENTS}/events_c.json"}
+    assert scope.content_files == {f"{EVENTS}/events_c.json"} and scope.dependents == 0
+    assert not scope.cross_file and not scope.flags and not scope.orphans
+    assert scope.phases == {"10"}
+
+
+def test_flag_changes_pull_in_their_readers(project):
+    _write(project, f"{EVENTS}/events_a.json", _event("evt_a", "evt_a_title"))
+    scope = _scope()
+    assert scope.flags == {"plot_joined"} and scope.cross_file
+    assert scope.content_files == {f"{EVENTS}/events_a.json", f"{EVENTS}/events_b.json"} and scope.dependents == 1
+
+    def flag_issue(message):
+        return ValidationIssue("warning", "consistency", message, "flag_analysis")
+    assert scope.includes(flag_issue("Flag 'plot_joined' referenced by 1 event(s) but never set: ['evt_b']"))
+    assert not scope.includes(flag_issue("Flag 'other_flag' referenced by 1 event(s) but never set: ['plot_joined']"))
+    assert not scope.includes(ValidationIssue("error", "structure", "Bad", f"{EVENTS}/events_c.json", "evt_c"))
+
+
+def test_string_table_changes_pull_in_files_using_the_ids(project):
+    _write_strings(project, ("evt_a_title", "evt_b_title", "evt_opt", "evt_c_title"))
+    added = f"{EVENTS}/events_d.json"
+    _write(project, added, _event("evt_a", "evt_a_title"))
+    scope = _scope()
+    assert scope.changed_paths == {XML, added}
+    assert scope.string_ids == {"evt_c_title"} and scope.orphans
+    # The new file is in scope; events_c uses the added ID; a new event ID needs the duplicate check
+    assert scope.content_files == {added, f"{EVENTS}/events_c.json"}
+    assert scope.changed_event_ids == {"evt_a"} and scope.cross_file
+    # Issues in unchanged files are reported once their event is in scope (filled in after Phases 1-4)
+    duplicate = ValidationIssue("error", "structure", "Duplicate event ID: evt_a", f"{EVENTS}/events_a.json", "evt_a")
+    assert not scope.includes(duplicate)
+    scope.event_ids.add("evt_a")
+    assert scope.includes(duplicate)
+
+
+def test_unknown_revision(project):
+    with pytest.raises(ChangeScopeError, match="unknown revision 'no-such-rev'"):
+        _scope("no-such-rev")
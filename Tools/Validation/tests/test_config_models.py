@@ -0,0 +1,99 @@
+import copy
+import dataclasses
+import json
+import os
+
+import pytest
+
+import config_models
+from config_models import BaggageConfig, ConfigIssue, load_all, load_config, parse_config
+
+BAGGAGE = {
+    "access_windows": {"temporary_access_hours": 4, "night_halt_grants_access": True,
+                       "muster_grants_access": True, "settlement_always_access": True},
+    "timing": {"caught_up_check_hours": 24, "caught_up_chance_percent": 25,
+               "min_cooldown_hours": 18, "max_cooldown_hours": 30},
+    "emergency_access": {"base_qm_rep_cost": 5, "nco_qm_rep_cost": 2, "officer_qm_rep_cost": 0,
+                         "cooldown_hours": 12, "high_rep_threshold": 50, "spam_penalty_soldier_rep": 2},
+    "rank_gates": {"emergency_request_min_tier": 3, "column_halt_min_tier": 7, "daily_access_window_min_tier": 5},
+    "lockdown": {"supply_threshold_percent": 20},
+    "events": {"delay_event_chance_bad_weather": 15, "delay_event_chance_mountains": 10,
+               "raid_event_chance_enemy_territory": 8, "theft_event_chance_low_rep": 5},
+}
+
+
+def _parse(data, name="baggage_config.json"):
+    return parse_config(name, json.dumps(data).encode("utf-8"))
+
+
+def test_valid_config_builds_a_frozen_model():
+    loaded = _parse(BAGGAGE)
+    assert loaded.ok and loaded.issues == ()
+    assert isinstance(loaded.model, BaggageConfig)
+    assert loaded.model.timing.max_cooldown_hours == 30
+    assert loaded.model.emergency_access.high_rep_threshold == 50
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        loaded.model.timing.max_cooldown_hours = 1
+
+
+def test_issues_carry_dotted_paths():
+    data = copy.deepcopy(BAGGAGE)
+    data["_comment"] = "ignored"
+    data["extra"] = 1
+    data["timing"].update(caught_up_chance_percent=150, min_cooldown_hours=40, caught_up_check_hours="24")
+    data["access_windows"]["muster_grants_access"] = 1
+    data["emergency_access"]["high_rep_threshold"] = -150
+    del data["lockdown"]["supply_threshold_percent"]
+    issues = set(_parse(data).issues)
+    assert issues == {
+        ConfigIssue("info", "extra", "Unknown field (ignored by the game)"),
+        ConfigIssue("error", "timing.caught_up_chance_percent", "Out of range (0-100): 150"),
+        ConfigIssue("error", "timing.caught_up_check_hours", "Expected an integer, got a string"),
+        ConfigIssue("error", "timing", "min_cooldown_hours (40) is greater than max_cooldown_hours (30)"),
+        ConfigIssue("error", "access_windows.muster_grants_access", "Expected true/false, got a number"),
+        ConfigIssue("error", "emergency_access.high_rep_threshold", "Out of range (-100-100): -150"),
+        ConfigIssue("warning", "lockdown.supply_threshold_percent", "Missing required field"),
+    }
+    assert not _parse(data).ok
+
+
+def test_choices_apply_to_every_dict_value():
+    issues = _parse({"LogLevels": {"Default": "Info", "Battle": "Verbose"}}, "settings.json").issues
+    assert [issue for issue in issues if issue.path.startswith("LogLevels")] == [
+        ConfigIssue("warning", "LogLevels.Battle",
+                    "Unknown value 'Verbose' (expected: Off, Error, Warn, Info, Debug, Trace)")]
+
+
+def test_pointer_and_str():
+    issue = ConfigIssue("error", "tier_progression.requirements[2].xp_required", "x")
+    assert issue.pointer == "/tier_progression/requirements/2/xp_required"
+    assert str(issue) == "tier_progression.requirements[2].xp_required: x"
+    assert ConfigIssue("error", "", "Invalid JSON").pointer == ""
+
+
+def test_invalid_json_and_files_without_a_model():
+    broken = parse_config("settings.json", b"{ nope")
+    assert broken.model is None and not broken.ok and broken.issues[0].message.startswith("Invalid JSON")
+    other = parse_config("unmodelled.json", b'{"a": 1}')
+    assert (other.model, other.ok, other.data) == (None, True, {"a": 1})
+    assert _parse([1, 2]).issues == (ConfigIssue("error", "", "Expected an object, got a list"),)
+
+
+def test_load_config_memoizes_by_content(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_models, "CONFIG_DIR", tmp_path)
+    path = tmp_path / "baggage_config.json"
+    path.write_text(json.dumps(BAGGAGE), encoding="utf-8")
+    first = load_config("baggage_config.json")
+    assert load_config(path) is first
+
+    changed = copy.deepcopy(BAGGAGE)
+    changed["timing"]["max_cooldown_hours"] = 31
+    path.write_text(json.dumps(changed), encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+    assert load_config(path).model.timing.max_cooldown_hours == 31
+
+    # Same bytes under another folder: parsed once more so issues name the right path
+    copy_dir = tmp_path / "copy"
+    copy_dir.mkdir()
+    (copy_dir / "baggage_config.json").write_text(json.dumps(changed), encoding="utf-8")
+    assert load_all(copy_dir)["baggage_config.json"].path == (copy_dir / "baggage_config.json").resolve()
@@ -0,0 +1,123 @@
+import io
+import json
+
+import pytest
+
+import content_lsp
+import localization_index
+import reference_graph
+from content_lsp import ContentLanguageServer, StdioServer, TextDocument, path_to_uri, read_message, write_message
+
+EVENT_FILE = "ModuleData/Enlisted/Events/events_plot.json"
+EVENTS = {"schemaVersion": 2, "events": [
+    {"id": "evt_plot_join", "category": "general", "titleId": "evt_plot_title", "title": "Join",
+     "setupId": "evt_plot_setup", "setup": "Setup",
+     "options": [{"id": "join", "textId": "evt_plot_join", "text": "Join", "tooltip": "Join",
+                  "effects": {"setFlags": ["plot_joined"]}}]},
+    {"id": "evt_plot_act", "category": "general", "titleId": "evt_plot_title", "title": "Act",
+     "setupId": "evt_plot_setup", "setup": "Setup",
+     "triggers": {"all": ["has_flag:plot_joined"], "none": ["flag:plot_joined"]},
+     "options": [{"id": "act", "textId": "evt_plot_missing", "text": "Act", "tooltip": "Act",
+                  "effects": {"clearFlags": ["plot_joined"]}}]},
+]}
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    content = tmp_path / "ModuleData/Enlisted"
+    (content / "Events").mkdir(parents=True)
+    (tmp_path / EVENT_FILE).write_text(json.dumps(EVENTS, indent=2), encoding="utf-8")
+    xml = tmp_path / "ModuleData/Languages/enlisted_strings.xml"
+    xml.parent.mkdir(parents=True)
+    rows = "\n".join(f'    <string id="{string_id}" text="Text of {string_id}" />'
+                     for string_id in ("evt_plot_title", "evt_plot_setup", "evt_plot_join"))
+    xml.write_text(f'<?xml version="1.0" encoding="utf-8"?>\n<base type="string">\n  <strings>\n{rows}\n'
+                   f'  </strings>\n</base>\n', encoding="utf-8")
+    monkeypatch.setattr(content_lsp, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(localization_index, "DEFAULT_XML_PATH", xml)
+    monkeypatch.setattr(localization_index, "SNAPSHOT_DIR", tmp_path / "cache")
+    for name, value in (("PROJECT_ROOT", tmp_path), ("CONTENT_ROOT", content), ("CSHARP_ROOT", tmp_path / "src"),
+                        ("DEFAULT_XML_PATH", xml)):
+        monkeypatch.setattr(reference_graph, name, value)
+    server = ContentLanguageServer()
+    server._load_graph = lambda: reference_graph.load_graph(tmp_path / "cache/graph.pickle")
+    return server
+
+
+def _document(server):
+    path = content_lsp.PROJECT_ROOT / EVENT_FILE
+    doc = TextDocument(path_to_uri(path), path.read_text(encoding="utf-8"))
+    server.documents[doc.uri] = doc
+    return doc
+
+
+def _at(doc, needle, occurrence=1):
+    """LSP position inside the occurrence-th string literal containing needle."""
+    offset = -1
+    for _ in range(occurrence):
+        offset = doc.text.index(needle, offset + 1)
+    position = doc.position(offset)
+    position["character"] += 1
+    return position
+
+
+def test_hover_on_a_flag_and_on_its_triggers(server):
+    doc = _document(server)
+    on_setter = server.hover(doc, _at(doc, '"plot_joined"'))
+    for trigger in ('"has_flag:plot_joined"', '"flag:plot_joined"'):
+        hover = server.hover(doc, _at(doc, trigger))
+        assert hover is not None, trigger
+        assert hover["contents"] == on_setter["contents"]
+        assert hover["range"]["start"]["character"] == _at(doc, trigger)["character"]
+    text = on_setter["contents"]["value"]
+    assert "**Flag `plot_joined` - set by**\n- `evt_plot_join/join` (" + EVENT_FILE in text
+    assert "cleared by" in text and "read by" in text
+    assert server.hover(doc, _at(doc, '"general"')) is None
+
+
+def test_hover_definition_and_completion_for_string_ids(server):
+    doc = _document(server)
+    hover = server.hover(doc, _at(doc, '"evt_plot_setup"'))
+    assert hover["contents"]["value"] == "**`evt_plot_setup`** (enlisted_strings.xml:5)\n\nText of evt_plot_setup"
+    definition = server.definition(doc, _at(doc, '"evt_plot_setup"'))
+    assert definition["range"]["start"] == {"line": 4, "character": 0}
+    assert server.definition(doc, _at(doc, '"evt_plot_missing"')) is None
+
+    position = _at(doc, '"evt_plot_missing"')
+    position["character"] += len("evt_plot_")
+    labels = [item["label"] for item in server.completion(doc, position)["items"]]
+    assert labels == ["evt_plot_join", "evt_plot_setup", "evt_plot_title"]
+
+
+def test_diagnostics_land_on_the_quoted_value(server):
+    doc = _document(server)
+    missing = [d for d in server.diagnostics(doc) if "evt_plot_missing" in d["message"]]
+    assert missing and missing[0]["range"]["start"] == doc.position(doc.text.index("evt_plot_missing"))
+    assert server.diagnostics(TextDocument("file:///elsewhere/notes.json", "{")) == []
+
+
+def test_stdio_round_trip(server, monkeypatch):
+    monkeypatch.setattr(content_lsp, "ContentLanguageServer", lambda: server)
+    doc = _document(server)
+    requests = io.BytesIO()
+    for message in (
+        {"id": 1, "method": "initialize", "params": {}},
+        {"method": "textDocument/didOpen", "params": {"textDocument": {"uri": doc.uri, "text": doc.text}}},
+        {"id": 2, "method": "textDocument/hover",
+         "params": {"textDocument": {"uri": doc.uri}, "position": _at(doc, '"has_flag:plot_joined"')}},
+        {"id": 3, "method": "workspace/symbol", "params": {}},
+        {"id": 4, "method": "shutdown"},
+        {"method": "exit"},
+    ):
+        write_message(requests, message)
+    requests.seek(0)
+    responses = io.BytesIO()
+    assert StdioServer(requests, responses).serve() == 0
+    responses.seek(0)
+    replies = {}
+    while (message := read_message(responses)) is not None:
+        replies[message.get("id", message.get("method"))] = message
+    assert replies[1]["result"]["capabilities"]["hoverProvider"]
+    assert replies["textDocument/publishDiagnostics"]["params"]["diagnostics"]
+    assert "plot_joined" in replies[2]["result"]["contents"]["value"]
+    assert replies[3]["error"]["code"] == content_lsp.METHOD_NOT_FOUND
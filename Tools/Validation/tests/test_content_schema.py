@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+import validate_content
+from content_schema import (KIND_DECISION, KIND_EVENT, KIND_OPPORTUNITY, KIND_ORDER_EVENT, ContentSchema,
+                            SchemaError, kind_of, load_schema)
+
+
+def _event(**fields):
+    event = {"id": "evt_test", "category": "general", "titleId": "t", "setupId": "s",
+             "options": [{"id": "a", "textId": "a_t", "tooltip": "A"},
+                         {"id": "b", "textId": "b_t", "tooltip": "B"}]}
+    event.update(fields)
+    return event
+
+
+@pytest.mark.parametrize("kind, rule", [(KIND_EVENT, "structure.id"), (KIND_ORDER_EVENT, "structure.id"),
+                                        (KIND_OPPORTUNITY, "opportunity.id")])
+@pytest.mark.parametrize("event_id", [None, "", "UNKNOWN"])
+def test_placeholder_and_missing_ids_are_rejected(kind, rule, event_id):
+    issues = load_schema().kind(kind).validate(_event(id=event_id))
+    assert [(issue.rule, issue.severity) for issue in issues] == [(rule, "error")]
+
+
+def test_valid_event_has_no_issues():
+    assert load_schema().kind(KIND_EVENT).validate(_event()) == []
+
+
+def test_validator_reports_unknown_id_as_missing(tmp_path):
+    path = tmp_path / "events_test.json"
+    path.write_text(json.dumps({"events": [_event(id="UNKNOWN")]}), encoding="utf-8")
+    ctx = validate_content.ValidationContext()
+    validate_content.validate_event_file(str(path), ctx, set())
+    assert [(issue.severity, issue.message) for issue in ctx.issues if issue.category == "structure"] == [
+        ("error", "Missing or empty 'id' field")]
+
+
+def test_unhashable_enum_value_is_reported():
+    issues = load_schema().kind(KIND_EVENT).check("structure.event_type", _event(category=["general"]))
+    assert [issue.message for issue in issues] == ["Unknown category: '['general']'"]
+
+
+def test_kind_of():
+    assert kind_of({"id": "dec_rest"}) == KIND_DECISION
+    assert kind_of({"id": "x", "order_type": "guard"}) == KIND_ORDER_EVENT
+    assert kind_of({"id": 5}) == KIND_EVENT
+
+
+def test_unknown_check_type_is_a_schema_error():
+    data = {"version": 1, "enums": {}, "limits": {},
+            "kinds": {"event": {"checks": [{"rule": "r", "check": "nope", "severity": "error", "message": ""}]}}}
+    with pytest.raises(SchemaError, match="unknown check type 'nope'"):
+        ContentSchema(data)
@@ -0,0 +1,106 @@
+import hashlib
+from pathlib import Path
+
+from csharp_index import (BLOCK_CONTROL, BLOCK_INITIALIZER, BLOCK_LAMBDA, BLOCK_MEMBER, BLOCK_TYPE, SPAN_CHAR,
+                          SPAN_COMMENT, SPAN_STRING, CSharpSourceIndex, SourceFile, blank_literals,
+                          scan_literal_spans, scan_structure)
+
+CODE = '''namespace Enlisted
+{
+    public class Camp
+    {
+        // A "quoted" comment { with a brace
+        private readonly string _name = @"verbatim ""{"" text";
+
+        public void Tick(int hours)
+        {
+            var label = $"Day {hours / 24} of {(hours > 0 ? "march" : "rest")}";
+            if (hours > 0)
+            {
+                Log(label, '}');
+            }
+            Run(() => { Log("in lambda", '{'); });
+            var list = new List<int> { 1, 2 };
+        }
+    }
+}
+'''
+
+
+def _kinds(code):
+    return [kind for _, _, kind in scan_literal_spans(code)]
+
+
+def test_literal_spans():
+    spans = scan_literal_spans(CODE)
+    found = [(kind, CODE[start:end]) for start, end, kind in spans]
+    assert (SPAN_COMMENT, '// A "quoted" comment { with a brace') in found
+    assert (SPAN_STRING, '@"verbatim ""{"" text"') in found
+    assert (SPAN_STRING, '$"Day {hours / 24} of {(hours > 0 ? "march" : "rest")}"') in found
+    assert (SPAN_CHAR, "'}'") in found
+    assert _kinds('x = "unterminated\ny = 1; /* block */') == [SPAN_STRING, SPAN_COMMENT]
+
+
+def test_blank_literals_keeps_offsets():
+    blanked = blank_literals(CODE, scan_literal_spans(CODE))
+    assert len(blanked) == len(CODE)
+    assert blanked.count("\n") == CODE.count("\n")
+    assert "verbatim" not in blanked and "quoted" not in blanked
+
+
+def test_structure_blocks_and_statements():
+    structure = scan_structure(blank_literals(CODE, scan_literal_spans(CODE)))
+    kinds = [block.kind for block in structure.blocks[1:]]
+    assert kinds == [BLOCK_TYPE, BLOCK_TYPE, BLOCK_MEMBER, BLOCK_CONTROL, BLOCK_LAMBDA, BLOCK_INITIALIZER]
+
+    log = CODE.index("Log(label")
+    member = structure.member_of(log)
+    assert structure.header(member) == "public void Tick(int hours)"
+    block = structure.block_at(log)
+    assert structure.blocks[block].kind == BLOCK_CONTROL
+    # Statements are read from the code with literals blanked
+    assert structure.statement_text(structure.statement_at(block, log)).strip() == "Log(label,    );"
+
+    # The lambda body stays part of its statement; the if owns its block
+    tick = structure.blocks[member]
+    lambda_call = CODE.index("Run(")
+    statement = structure.statement_at(member, lambda_call)
+    assert statement[2] == -1 and CODE[statement[0]:statement[1]].endswith("});")
+    owned = structure.statement_at(member, CODE.index("if (hours"))
+    assert structure.statement_text(owned).strip() == "if (hours > 0)"
+    assert len(tick.statements) == 4
+
+
+def test_source_file_normalizes_and_hashes(tmp_path):
+    raw = "﻿class A\r\n{\r\n}\r\n".encode("utf-8")
+    (tmp_path / "A.cs").write_bytes(raw)
+    source = SourceFile(Path("A.cs"), tmp_path)
+    assert source.readable and source.text == "class A\n{\n}\n"
+    assert source.sha256 == hashlib.sha256(raw).hexdigest()
+    assert source.line_of(source.text.index("}")) == 3
+    (tmp_path / "empty.cs").write_bytes(b"")
+    assert SourceFile(Path("empty.cs"), tmp_path).text == ""
+    assert not SourceFile(Path("missing.cs"), tmp_path).readable
+
+
+def test_index_paths_are_relative_to_base_and_update(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path.parent)
+    (tmp_path / "src/Camp").mkdir(parents=True)
+    (tmp_path / "src/Camp/A.cs").write_text("class A {}", encoding="utf-8")
+    (tmp_path / "src/B.cs").write_text("class B {}", encoding="utf-8")
+    (tmp_path / "src/Keep.cs").write_text("class Keep {}", encoding="utf-8")
+    index = CSharpSourceIndex.build(base=tmp_path)
+    assert sorted(index.posix_paths()) == ["src/B.cs", "src/Camp/A.cs", "src/Keep.cs"]
+
+    kept = index.get("src/Keep.cs")
+    (tmp_path / "src/Camp/A.cs").write_text("class A2 {}", encoding="utf-8")
+    (tmp_path / "src/B.cs").unlink()
+    (tmp_path / "src/C.cs").write_text("class C {}", encoding="utf-8")
+    index.update(["src/Camp/A.cs"])
+    assert sorted(index.posix_paths()) == ["src/C.cs", "src/Camp/A.cs", "src/Keep.cs"]
+    assert index.get("src/Camp/A.cs").text == "class A2 {}"
+    assert index.get("src/B.cs") is None
+    # Unchanged files keep their SourceFile
+    assert index.get("src/Keep.cs") is kept
+
+    assert not CSharpSourceIndex.build(Path("missing"), base=tmp_path).root_exists
@@ -0,0 +1,76 @@
+from flag_graph import GATE_ALL, GATE_NONE, FlagGraph, FlagNode
+
+
+def _node(event_id, all=(), any=(), none=(), sets=(), clears=()):
+    triggers = {"all": [f"has_flag:{flag}" for flag in all], "any": list(any),
+                "none": [f"flag:{flag}" for flag in none]}
+    options = [{"effects": {"setFlags": list(flags)}} for flags in sets]
+    options += [{"effects": {"clearFlags": list(clears)}}] if clears else []
+    return FlagNode.from_event(event_id, "events_test.json", triggers, options)
+
+
+def test_from_event():
+    node = _node("evt", all=["a"], any=["has_flag:b", "is_at_sea"], none=["c"], sets=[["d"], []], clears=["a"])
+    assert (node.all, node.any, node.any_open, node.none) == (["a"], ["b"], True, ["c"])
+    assert (node.option_sets, node.clears, node.sets) == ([["d"]], ["a"], {"d"})
+    assert FlagNode(*node.to_fields()) == node
+    assert FlagNode.from_event("plain", "f.json", {"all": ["tier:3"]}, [{"effects": {}}]) is None
+    assert FlagNode.from_event("bad", "f.json", ["has_flag:a"], [None]) is None
+
+
+def test_reachability_and_dead_flags():
+    graph = FlagGraph([
+        _node("start", sets=[["a"]]),
+        _node("needs_a", all=["a"], sets=[["b"]]),
+        _node("needs_a_and_b", all=["a", "b"]),
+        _node("needs_any", any=["has_flag:missing", "has_flag:b"]),
+        _node("orphan_setter", all=["never"], sets=[["dead"]]),
+        _node("open_any", any=["has_flag:never", "in_camp"]),
+    ])
+    analysis = graph.analyze()
+    assert analysis.reachable_events == {"start", "needs_a", "needs_a_and_b", "needs_any", "open_any"}
+    assert analysis.reachable_flags == {"a", "b"}
+    assert analysis.unreachable_events == {"orphan_setter": ["never"]}
+    assert analysis.dead_flags == {"dead": ["orphan_setter"]}
+    assert analysis.cycles == []
+
+
+def test_mutual_waits_form_a_cycle():
+    graph = FlagGraph([
+        _node("x", all=["from_y"], sets=[["from_x"]]),
+        _node("y", all=["from_x"], sets=[["from_y"]]),
+        _node("self", all=["own"], sets=[["own"]]),
+        _node("free", sets=[["from_x"]]),
+    ])
+    analysis = graph.analyze()
+    # "free" unlocks x and y, so only the self-gated event is stuck
+    assert analysis.cycles == [(["self"], ["own"])]
+    stuck = FlagGraph(node for node in graph.nodes.values() if node.event_id != "free").analyze()
+    assert stuck.cycles == [(["x", "y"], ["from_x", "from_y"]), (["self"], ["own"])]
+    assert stuck.unreachable_events == {"x": ["from_y"], "y": ["from_x"], "self": ["own"]}
+
+
+def test_blocking_none_gates():
+    graph = FlagGraph([
+        _node("setter", sets=[["req", "forbidden"]]),
+        _node("blocked", all=["req"], none=["forbidden"]),
+        _node("contradiction", all=["x"], none=["x"]),
+        _node("x_setter", sets=[["x"]]),
+        _node("cleared", all=["other"], none=["temp"]),
+        _node("temp_setter", sets=[["other", "temp"]], clears=["temp"]),
+    ])
+    analysis = graph.analyze()
+    assert sorted(analysis.blocking_none_gates) == [("blocked", "forbidden", "req"), ("contradiction", "x", None)]
+    assert "blocked" not in analysis.reachable_events and "cleared" in analysis.reachable_events
+
+
+def test_duplicate_ids_keep_the_first_definition_and_exports():
+    graph = FlagGraph([_node("evt", sets=[["a"]]), _node("evt", sets=[["b"]]), _node("reader", none=["a"])])
+    assert graph.setters == {"a": ["evt"]}
+    assert graph.readers == {"a": [("reader", GATE_NONE)]}
+    data = graph.to_dict()
+    assert [event["id"] for event in data["events"]] == ["evt", "reader"]
+    assert data["flags"] == [{"flag": "a", "reachable": True, "setters": ["evt"], "clearers": [],
+                              "readers": [{"event": "reader", "gate": GATE_NONE}]}]
+    dot = graph.to_dot()
+    assert '"event:evt" -> "flag:a";' in dot and 'label=none' in dot and GATE_ALL not in dot
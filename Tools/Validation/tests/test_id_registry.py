@@ -0,0 +1,83 @@
+import json
+import os
+
+import pytest
+
+import id_registry
+from id_registry import IdRegistry, load_registry, namespace_for
+
+
+def _write(root, rel, data):
+    path = root / "ModuleData/Enlisted" / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(data if isinstance(data, str) else json.dumps(data, indent=2), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setattr(id_registry, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(id_registry, "CONTENT_ROOT", tmp_path / "ModuleData/Enlisted")
+    _write(tmp_path, "Events/events_a.json", {"events": [{"id": "evt_a"}, {"id": "guard_duty"}, {"id": "evt_a"}]})
+    _write(tmp_path, "Orders/orders_t1.json", [{"id": "guard_duty"}])
+    # A repeated key, which json.load would silently drop
+    _write(tmp_path, "Config/orchestrator_overrides.json",
+           '{"needBasedOverrides": {\n  "ovr_rest": {},\n  "ovr_rest": {}\n}, "varietyInjections": {"ovr_mix": {}}}')
+    _write(tmp_path, "Dialogue/qm.json", {"nodes": [
+        {"id": "qm_greet", "context": {"tier": 1}}, {"id": "qm_greet", "context": {"tier": 2}},
+        {"id": "qm_greet", "context": {"tier": 1}}, {"id": "qm_bye"}]})
+    _write(tmp_path, "Events/broken.json", "{ not json")
+    _write(tmp_path, "Events/readme.txt", "ignored")
+    return tmp_path
+
+
+def test_namespace_for():
+    assert namespace_for("ModuleData/Enlisted/Orders/orders_t1.json").name == "order"
+    assert namespace_for("ModuleData/Enlisted/Orders/order_events/guard.json").name == "event"
+    assert namespace_for("ModuleData/Enlisted/Decisions/camp_opportunities.json").name == "opportunity"
+    assert namespace_for("ModuleData/Enlisted/Config/enlisted_config.json") is None
+    assert namespace_for("src/Events/events_a.json") is None
+
+
+def test_collisions_lines_and_errors(project):
+    registry = IdRegistry()
+    registry.refresh()
+    assert registry.ids("override") == ["ovr_mix", "ovr_rest"]
+    assert [entry.line for entry in registry.lookup("ovr_rest")] == [2, 3]
+    assert registry.lookup("guard_duty", "order")[0].location() == "ModuleData/Enlisted/Orders/orders_t1.json:3"
+
+    described = sorted((c.id, c.shared, c.first.namespace, c.other.namespace, c.other.line)
+                       for c in registry.collisions())
+    assert described == [
+        ("evt_a", False, "event", "event", 10),
+        ("guard_duty", True, "event", "order", 3),
+        ("ovr_rest", False, "override", "override", 3),
+        # Same node ID with a different context is a variant, not a duplicate
+        ("qm_greet", False, "dialogue", "dialogue", 16),
+    ]
+    assert list(registry.file_errors) == ["ModuleData/Enlisted/Events/broken.json"]
+    assert "guard_duty" in registry and "missing" not in registry
+
+
+def test_refresh_only_rereads_changed_files(project):
+    registry = IdRegistry()
+    assert registry.refresh() == 5
+    assert registry.refresh() == 0
+
+    path = _write(project, "Orders/orders_t1.json", [{"id": "guard_duty"}, {"id": "patrol"}])
+    os.utime(path, ns=(1, 1))
+    (project / "ModuleData/Enlisted/Events/broken.json").unlink()
+    assert registry.refresh() == 1
+    assert registry.ids("order") == ["guard_duty", "patrol"]
+    assert registry.file_errors == {}
+
+
+def test_snapshot_round_trip(project, tmp_path):
+    snapshot = tmp_path / "cache/id_registry.pickle"
+    first = load_registry(snapshot)
+    assert snapshot.exists()
+    second = load_registry(snapshot)
+    assert second.to_dict() == first.to_dict()
+
+    snapshot.write_bytes(b"corrupt")
+    assert load_registry(snapshot).to_dict() == first.to_dict()
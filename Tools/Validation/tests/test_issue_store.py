@@ -0,0 +1,54 @@
+import random
+from collections import Counter
+
+from issue_store import SEVERITIES, IssueStore, ValidationIssue
+
+CATEGORIES = ("structure", "reference", "logic", "consistency")
+FILES = ("ModuleData/Enlisted/Events/events_a.json", "ModuleData/Enlisted/Events/events_b.json")
+
+
+def _random_issues(count, seed=7):
+    rng = random.Random(seed)
+    return [ValidationIssue(rng.choice(SEVERITIES), rng.choice(CATEGORIES), f"Issue {i}", rng.choice(FILES),
+                            rng.choice((None, "evt_a", "evt_b")))
+            for i in range(count)]
+
+
+def _check_consistent(store, issues):
+    assert len(store) == len(issues) and list(store) == issues
+    for severity in SEVERITIES:
+        expected = [issue for issue in issues if issue.severity == severity]
+        assert store.by_severity(severity) == expected and store.count(severity) == len(expected)
+    for category in CATEGORIES:
+        assert store.by_category(category) == [issue for issue in issues if issue.category == category]
+    assert store.categories() == sorted({issue.category for issue in issues})
+    assert store.stats == Counter(f"{issue.severity}_{issue.category}" for issue in issues)
+
+
+def test_buckets_and_counts_follow_every_append():
+    issues = _random_issues(300)
+    store = IssueStore(issues[:100])
+    _check_consistent(store, issues[:100])
+    for issue in issues[100:200]:
+        store.append(issue)
+    store.extend(issues[200:])
+    _check_consistent(store, issues)
+    assert store[5] is issues[5] and store[10:12] == issues[10:12]
+
+
+def test_unknown_severities_and_empty_store():
+    store = IssueStore()
+    assert len(store) == 0 and store.count("error") == 0 and store.by_category("logic") == []
+    assert store.categories() == [] and not store.stats
+    store.append(ValidationIssue("hint", "style", "Odd severity", FILES[0]))
+    assert store.count("hint") == 1 and store.by_severity("hint")[0].message == "Odd severity"
+    assert store.stats == Counter({"hint_style": 1})
+
+
+def test_issues_share_interned_strings():
+    first = ValidationIssue("error", "structure", "A", "".join(["Module", "Data/x.json"]), "".join(["evt", "_a"]))
+    second = ValidationIssue("error", "structure", "B", "".join(["ModuleData", "/x.json"]), "".join(["evt_", "a"]))
+    assert first.file_path is second.file_path and first.event_id is second.event_id
+    assert ValidationIssue(*first.to_fields()).to_fields() == first.to_fields()
+    assert str(first) == "[ERROR] x.json:evt_a [structure] A"
+    assert ValidationIssue("info", "project", "C", None).to_dict()["file"] is None
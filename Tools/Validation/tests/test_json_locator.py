@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from issue_store import ValidationIssue
+from json_locator import JsonPositions, Location, SourceLocator, from_pointer, to_pointer
+
+FILE = "events_test.json"
+DOCUMENT = {"schemaVersion": 2, "events": [
+    {"id": "evt_first", "titleId": "evt_first_title", "options": []},
+    {"id": "evt_second", "titleId": "evt_second_title", "setup": "Ünïcode ✓ text",
+     "options": [{"id": "a", "textId": "evt_second_a", "skillCheck": "Medicin"},
+                 {"id": "b/c", "textId": "evt_second_b", "tooltip": "B"}]},
+]}
+
+
+def _position(text, needle):
+    """1-based (line, column) of the first occurrence of needle."""
+    offset = text.index(needle)
+    return text.count("\n", 0, offset) + 1, offset - text.rfind("\n", 0, offset)
+
+
+@pytest.fixture
+def located(tmp_path):
+    text = json.dumps(DOCUMENT, indent=2, ensure_ascii=False)
+    (tmp_path / FILE).write_text(text, encoding="utf-8")
+    return text, SourceLocator(tmp_path)
+
+
+def test_pointer_round_trip():
+    assert to_pointer(("events", 3, "a/b~c")) == "/events/3/a~1b~0c"
+    assert from_pointer("/events/3/a~1b~0c") == ["events", "3", "a/b~c"]
+    assert from_pointer("") == []
+
+
+def test_pointer_relative_to_event(located):
+    text, locator = located
+    issue = ValidationIssue("error", "reference", "Missing string", FILE, "evt_second", "/options/1/textId")
+    line, column = _position(text, '"textId": "evt_second_b"')
+    assert locator.locate(issue) == Location(line, column, "/events/1/options/1/textId")
+
+
+def test_missing_field_maps_to_its_parent(located):
+    text, locator = located
+    issue = ValidationIssue("error", "structure", "Option missing tooltip", FILE, "evt_second", "/options/0/tooltip")
+    assert locator.locate(issue).pointer == "/events/1/options/0"
+
+
+def test_quoted_token_and_id_fallback(located):
+    text, locator = located
+    issue = ValidationIssue("warning", "reference", "Invalid skill in skillCheck: 'Medicin'", FILE, "evt_second")
+    line, column = _position(text, '"Medicin"')
+    assert locator.locate(issue) == Location(line, column, "/events/1/options/0/skillCheck")
+
+    issue = ValidationIssue("warning", "logic", "Event 'evt_first' has no options", FILE, "evt_first")
+    line, column = _position(text, '"id": "evt_first"')
+    assert locator.locate(issue) == Location(line, column, "/events/0/id")
+
+
+def test_unplaceable_issues(located):
+    _, locator = located
+    assert locator.locate(ValidationIssue("error", "structure", "x", FILE, "evt_missing")) is None
+    assert locator.locate(ValidationIssue("error", "structure", "x", "Enlisted.csproj", "evt_first")) is None
+    assert locator.locate(ValidationIssue("error", "structure", "x", "missing.json", "evt_first")) is None
+    issue = ValidationIssue("error", "structure", "Invalid JSON: Expecting value: line 4 column 9 (char 40)", FILE)
+    assert locator.locate(issue) == Location(4, 9)
+
+
+def test_columns_count_code_points():
+    text = '{"a": "✓✓", "b": 1}'
+    doc = JsonPositions(text)
+    assert doc.position(doc.keys[("b",)]) == (1, 13)
+
+
+def test_issue_record_adds_location(located):
+    _, locator = located
+    record = locator.issue_record(ValidationIssue("error", "reference", "m", FILE, "evt_first", "/titleId"))
+    assert (record["pointer"], record["file"]) == ("/events/0/titleId", FILE)
+    assert {"line", "column"} <= set(record)
@@ -0,0 +1,60 @@
+import io
+import json
+
+import pytest
+
+from json_stream import RootFormatError, StreamDecodeError, iter_events
+
+EVENTS = [{"id": "evt_a", "setup": "Line one\nline \"two\" {not} [json]", "options": [{"id": "x"}, {"id": "y"}]},
+          {"id": "evt_b", "weight": 1.5e2, "flags": [], "tags": {}, "text": "\\", "none": None},
+          {"id": "evt_c", "setup": "ünïcode ✓"}]
+
+
+def _read(text, chunk_size=7, on_field=None):
+    return list(iter_events(io.StringIO(text), on_field=on_field, chunk_size=chunk_size))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 65536])
+def test_object_root_matches_json_load(chunk_size):
+    text = json.dumps({"schemaVersion": 2, "events": EVENTS, "category": "general"}, indent=2, ensure_ascii=False)
+    fields = []
+    assert _read(text, chunk_size, lambda key, value: fields.append((key, value))) == EVENTS
+    assert fields == [("schemaVersion", 2), ("category", "general")]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 65536])
+def test_array_root_and_empty_containers(chunk_size):
+    assert _read(json.dumps(EVENTS), chunk_size) == EVENTS
+    assert _read("[ ]", chunk_size) == []
+    assert _read("{}", chunk_size) == []
+    # As with data.get("events") or []: a non-array events value is decoded whole
+    assert _read('{"events": null}', chunk_size) == []
+
+
+@pytest.mark.parametrize("text", [
+    '{"events": [{"id": "a"},\n  {"id": "b",}\n]}',
+    '{"events": [{"id": "a"}\n {"id": "b"}]}',
+    '[{"id": "a"}, {"id": "b"]',
+    '{"events": [{"id": "a"}]} trailing',
+    '{"events" [1]}',
+    '[{"id": "a",\n\n   "b": tru}]',
+])
+@pytest.mark.parametrize("chunk_size", [1, 5, 65536])
+def test_syntax_errors_report_the_json_module_position(text, chunk_size):
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(text)
+    with pytest.raises(StreamDecodeError) as error:
+        _read(text, chunk_size)
+    assert (error.value.lineno, error.value.colno) == (expected.value.lineno, expected.value.colno)
+
+
+def test_events_before_an_error_are_yielded():
+    events = iter_events(io.StringIO('[{"id": "a"}, {"id": }]'), chunk_size=4)
+    assert next(events) == {"id": "a"}
+    with pytest.raises(StreamDecodeError):
+        next(events)
+
+
+def test_scalar_root_is_a_format_error():
+    with pytest.raises(RootFormatError):
+        _read('"events"')
@@ -0,0 +1,79 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+import localization_index
+from localization_index import parse_strings, read_sources, source_hash
+
+RESEARCH_DIR = Path(__file__).resolve().parents[2] / "Research"
+
+
+def _xml(strings, language="English"):
+    rows = "\n".join(f'    <string id="{string_id}" text="{text}" />' for string_id, text in strings.items())
+    return (f'<?xml version="1.0" encoding="utf-8"?>\n<base type="string">\n  <tags>\n'
+            f'    <tag language="{language}" />\n  </tags>\n  <strings>\n{rows}\n  </strings>\n</base>\n')
+
+
+@pytest.fixture
+def template(tmp_path, monkeypatch, capsys):
+    """Runs generate_language_template.py --merge on a temp English table; returns (english, output, run)."""
+    monkeypatch.syspath_prepend(str(RESEARCH_DIR))
+    monkeypatch.setattr(localization_index, "SNAPSHOT_DIR", tmp_path / "cache")
+    module = importlib.import_module("generate_language_template")
+    english = tmp_path / "enlisted_strings.xml"
+    output = tmp_path / "FR/enlisted_strings_fr.xml"
+
+    def run(strings, *extra):
+        english.write_text(_xml(strings), encoding="utf-8")
+        monkeypatch.setattr(sys, "argv", ["generate_language_template.py", "--input", str(english),
+                                          "--language", "French", "--output", str(output), "--merge", *extra])
+        module.main()
+        return capsys.readouterr().out.splitlines()[-1].strip()
+    return english, output, run
+
+
+def _translate(output, **texts):
+    xml = output.read_text(encoding="utf-8")
+    for string_id, text in texts.items():
+        xml = xml.replace(f'id="{string_id}" text="{parse_strings(output).text(string_id)}"',
+                          f'id="{string_id}" text="{text}"')
+    output.write_text(xml, encoding="utf-8")
+
+
+def test_merge_keeps_marks_fuzzy_updates_and_drops(template):
+    _, output, run = template
+    first = {"evt_a": "Attack", "evt_b": "Wait", "evt_c": "Flee", "evt_gone": "Gone"}
+    assert run(first) == "0 kept, 0 fuzzy, 0 reviewed, 0 updated, 4 new, 0 removed"
+    assert '<tag language="French" />' in output.read_text(encoding="utf-8")
+    assert read_sources(output) == {string_id: source_hash(text) for string_id, text in first.items()}
+    _translate(output, evt_a="Attaquer", evt_b="Attendre")
+
+    second = {"evt_a": "Attack now", "evt_b": "Wait", "evt_c": "Run", "evt_new": "New"}
+    assert run(second) == "1 kept, 1 fuzzy, 0 reviewed, 1 updated, 1 new, 1 removed"
+    xml = output.read_text(encoding="utf-8")
+    assert '<!-- fuzzy --> <string id="evt_a" text="Attaquer" />' in xml
+    assert parse_strings(output).texts() == {"evt_a": "Attaquer", "evt_b": "Attendre", "evt_c": "Run",
+                                             "evt_new": "New"}
+    # A fuzzy string keeps the hash of the English it was translated from
+    assert read_sources(output)["evt_a"] == source_hash("Attack")
+    assert read_sources(output, "fuzzy") == {"evt_a": source_hash("Attaquer")}
+
+    # Unedited, it stays fuzzy; once edited, it is reviewed and tracks the new English
+    assert run(second) == "3 kept, 1 fuzzy, 0 reviewed, 0 updated, 0 new, 0 removed"
+    _translate(output, evt_a="Attaquer maintenant")
+    assert run(second) == "3 kept, 0 fuzzy, 1 reviewed, 0 updated, 0 new, 0 removed"
+    assert "fuzzy" not in output.read_text(encoding="utf-8")
+    assert read_sources(output)["evt_a"] == source_hash("Attack now")
+    assert read_sources(output, "fuzzy") == {}
+
+
+def test_blank_merge_and_first_merge_without_sidecar(template):
+    _, output, run = template
+    output.parent.mkdir(parents=True)
+    # An existing translation with no sidecar is taken to match the current English
+    output.write_text(_xml({"evt_a": "Attaquer"}, "French"), encoding="utf-8")
+    assert run({"evt_a": "Attack", "evt_b": "Wait"}, "--blank") == \
+        "1 kept, 0 fuzzy, 0 reviewed, 0 updated, 1 new, 0 removed"
+    assert parse_strings(output).texts() == {"evt_a": "Attaquer", "evt_b": ""}
@@ -0,0 +1,82 @@
+import pytest
+
+import localization_coverage
+import localization_index
+from localization_coverage import (Language, discover_languages, feature_prefix, load_english, measure, measure_all,
+                                   needs_translation)
+from localization_index import source_hash, write_sources
+
+
+def _table(path, strings):
+    rows = "\n".join(f'    <string id="{string_id}" text="{text}" />' for string_id, text in strings.items())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f'<?xml version="1.0" encoding="utf-8"?>\n<base type="string">\n  <strings>\n{rows}\n'
+                    f'  </strings>\n</base>\n', encoding="utf-8")
+    return path
+
+
+ENGLISH = {"mi_loot": "Take the loot", "mi_rank": "{RANK}", "evt_a": "Attack", "evt_b": "Wait", "evt_c": "Flee"}
+
+
+@pytest.fixture
+def languages(tmp_path, monkeypatch):
+    monkeypatch.setattr(localization_coverage, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(localization_index, "SNAPSHOT_DIR", tmp_path / "cache")
+    languages_dir = tmp_path / "ModuleData/Languages"
+    _table(languages_dir / "enlisted_strings.xml", dict(list(ENGLISH.items())[:4]))
+    _table(languages_dir / "enlisted_qm_dialogue.xml", {"evt_c": "Flee"})
+    (languages_dir / "language_data.xml").write_text("<LanguageData />", encoding="utf-8")
+    _table(languages_dir / "FR/enlisted_strings_fr.xml",
+           {"mi_loot": "Prendre le butin", "mi_rank": "{RANK}", "evt_a": "Attack", "evt_b": "", "fr_only": "x"})
+    (languages_dir / "FR/language_data.xml").write_text(
+        '<LanguageData id="Français" name="Français">\n'
+        '  <LanguageFile xml_path="FR/enlisted_strings_fr.xml" />\n</LanguageData>\n', encoding="utf-8")
+    (languages_dir / "_TEMPLATE").mkdir()
+    (languages_dir / "_TEMPLATE/language_data.xml").write_text("<LanguageData />", encoding="utf-8")
+    return languages_dir
+
+
+def test_helpers():
+    assert feature_prefix("mi_loot_take") == "mi_" and feature_prefix("plain") == "other"
+    assert not needs_translation("{RANK} ...") and not needs_translation("")
+    assert needs_translation("{RANK} leads")
+
+
+def test_english_and_language_discovery(languages):
+    assert load_english(languages) == ENGLISH
+    (language,) = discover_languages(languages)
+    assert (language.code, language.name) == ("FR", "Français")
+    assert language.files == [languages / "FR/enlisted_strings_fr.xml"]
+
+
+def test_measure_statuses(languages):
+    english = load_english(languages)
+    coverage = measure(discover_languages(languages)[0], english)
+    assert coverage.status == {"mi_loot": "translated", "mi_rank": "translated", "evt_a": "untranslated",
+                               "evt_b": "untranslated", "evt_c": "missing"}
+    assert coverage.extra == ["fr_only"] and not coverage.has_sources
+    assert coverage.percent == 40.0
+    assert coverage.by_prefix()["evt_"]["untranslated"] == 2
+    data = coverage.to_dict(include_ids=True)
+    assert data["files"] == ["ModuleData/Languages/FR/enlisted_strings_fr.xml"]
+    assert data["ids"]["missing"] == ["evt_c"] and data["ids"]["extra"] == ["fr_only"]
+
+
+def test_stale_needs_the_translation_memory(languages):
+    english = load_english(languages)
+    table = languages / "FR/enlisted_strings_fr.xml"
+    write_sources(table, {"mi_loot": source_hash("Take loot"), "mi_rank": source_hash("{RANK}")})
+    coverage = measure(discover_languages(languages)[0], english)
+    assert coverage.has_sources
+    assert (coverage.status["mi_loot"], coverage.status["mi_rank"]) == ("stale", "translated")
+
+
+def test_broken_table_is_an_error_and_parallel_matches_serial(languages):
+    english = load_english(languages)
+    broken = Language("DE", "Deutsch", [_table(languages / "DE/de.xml", {})])
+    broken.files[0].write_text("<strings><string", encoding="utf-8")
+    fr = discover_languages(languages)[0]
+    serial = measure_all([fr, broken], english, jobs=1)
+    assert serial[1].errors and all(status == "missing" for status in serial[1].status.values())
+    parallel = measure_all([fr, broken], english, jobs=2)
+    assert [c.status for c in parallel] == [c.status for c in serial]
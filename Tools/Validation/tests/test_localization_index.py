@@ -0,0 +1,86 @@
+import os
+import pickle
+
+import pytest
+
+import localization_index
+from localization_index import (LocalizationParseError, load_index, parse_strings, read_sources, source_hash,
+                                sources_path, write_sources)
+
+XML = '''<?xml version="1.0" encoding="utf-8"?>
+<base type="string">
+  <strings>
+    <string id="evt_a_title" text="A &amp; B" />
+    <string id="evt_a_setup" text="Line&#xA;two" />
+    <string id="evt_a_title" text="Again" />
+    <string text="no id" />
+  </strings>
+</base>
+'''
+
+
+@pytest.fixture
+def strings(tmp_path, monkeypatch):
+    monkeypatch.setattr(localization_index, "SNAPSHOT_DIR", tmp_path / "cache")
+    monkeypatch.setattr(localization_index, "_MEMO", {})
+    path = tmp_path / "enlisted_strings.xml"
+    path.write_text(XML, encoding="utf-8")
+    return path
+
+
+def test_parse_strings(strings):
+    index = parse_strings(strings)
+    assert list(index) == ["evt_a_title", "evt_a_setup"]
+    assert index.text("evt_a_title") == "A & B" and index.text("evt_a_setup") == "Line\ntwo"
+    assert index.line("evt_a_setup") == 5 and index.line("missing") is None
+    assert index.text("missing", "") == ""
+    assert index.duplicates == [("evt_a_title", 6)]
+    assert parse_strings(strings, b'<strings><string id="x" text="old" /></strings>').texts() == {"x": "old"}
+    with pytest.raises(LocalizationParseError):
+        parse_strings(strings, b"<strings><string id='x'></strings>")
+
+
+def test_snapshot_memo_and_hash_reuse(strings, monkeypatch):
+    first = load_index(strings)
+    assert load_index(strings) is first
+    snapshot = next((strings.parent / "cache").glob("strings_enlisted_strings_*.pickle"))
+    assert [path.suffix for path in (strings.parent / "cache").iterdir()] == [".pickle"]
+
+    # A new process with an unchanged file loads the snapshot instead of parsing
+    monkeypatch.setattr(localization_index, "_MEMO", {})
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError("parsed although the snapshot is current")
+    monkeypatch.setattr(localization_index, "parse_strings", no_parse)
+    assert load_index(strings).texts() == first.texts()
+
+    # Touched but unchanged: still reused via the content hash
+    monkeypatch.setattr(localization_index, "_MEMO", {})
+    os.utime(strings, ns=(1, 1))
+    assert load_index(strings).texts() == first.texts()
+    with open(snapshot, "rb") as f:
+        assert pickle.load(f)["mtime_ns"] == 1
+
+
+def test_changed_or_corrupt_snapshot_is_reparsed(strings, monkeypatch):
+    load_index(strings)
+    strings.write_text(XML.replace('"A &amp; B"', '"Changed"'), encoding="utf-8")
+    os.utime(strings, ns=(2, 2))
+    assert load_index(strings).text("evt_a_title") == "Changed"
+
+    monkeypatch.setattr(localization_index, "_MEMO", {})
+    for snapshot in (strings.parent / "cache").glob("*.pickle"):
+        snapshot.write_bytes(b"corrupt")
+    assert load_index(strings).text("evt_a_title") == "Changed"
+
+
+def test_sources_sidecar(tmp_path):
+    table = tmp_path / "strings_fr.xml"
+    assert read_sources(table) is None
+    write_sources(table, {"b": source_hash("B"), "a": source_hash("A")}, fuzzy={"c": "123"})
+    assert sources_path(table).name == "strings_fr.xml.sources.json"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["strings_fr.xml.sources.json"]
+    assert list(read_sources(table)) == ["a", "b"]
+    assert read_sources(table, "fuzzy") == {"c": "123"}
+    assert source_hash("A") == source_hash("A") != source_hash("A ")
+    assert len(source_hash("A")) == 12
@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+import reference_graph
+from reference_graph import (FLAG_CLEAR, FLAG_READ, FLAG_SET, STRING, PrefixTrie, extract_json_references,
+                             load_graph)
+
+EVENTS = {"events": [
+    {"id": "evt_plot", "titleId": "evt_plot_title", "title": "Plot",
+     "triggers": {"all": ["has_flag:plot_joined"], "none": ["flag:plot_betrayed"]},
+     "options": [
+         {"id": "go", "textId": "evt_plot_go", "effects": {"setFlags": ["plot_done"], "clearFlags": ["plot_joined"]}},
+         {"id": "stay", "textId": "evt_plot_stay", "text": "Stay",
+          "effects": {"clearFlags": ["plot_joined"]}},
+         {"id": "old", "textId": "evt_plot_go", "flags_set": ["plot_betrayed"]},
+     ]},
+]}
+
+
+def _line(text, needle, occurrence=1):
+    offset = -1
+    for _ in range(occurrence):
+        offset = text.index(needle, offset + 1)
+    return text.count("\n", 0, offset) + 1
+
+
+def test_repeated_values_keep_their_own_lines(tmp_path):
+    text = json.dumps(EVENTS, indent=2)
+    path = tmp_path / "events_plot.json"
+    path.write_text(text, encoding="utf-8")
+    refs = extract_json_references(path, "events_plot.json")
+    found = sorted((ref.kind, ref.target, ref.source, ref.line) for ref in refs)
+    assert found == sorted([
+        (STRING, "evt_plot_title", "evt_plot", _line(text, '"evt_plot_title"')),
+        (STRING, "evt_plot_go", "evt_plot/go", _line(text, '"evt_plot_go"')),
+        (STRING, "evt_plot_stay", "evt_plot/stay", _line(text, '"evt_plot_stay"')),
+        (STRING, "evt_plot_go", "evt_plot/old", _line(text, '"evt_plot_go"', 2)),
+        (FLAG_READ, "plot_joined", "evt_plot", _line(text, '"has_flag:plot_joined"')),
+        (FLAG_READ, "plot_betrayed", "evt_plot", _line(text, '"flag:plot_betrayed"')),
+        (FLAG_SET, "plot_done", "evt_plot/go", _line(text, '"plot_done"')),
+        # The same flag cleared by two options is reported on both lines
+        (FLAG_CLEAR, "plot_joined", "evt_plot/go", _line(text, '"plot_joined"', 1)),
+        (FLAG_CLEAR, "plot_joined", "evt_plot/stay", _line(text, '"plot_joined"', 2)),
+        (FLAG_SET, "plot_betrayed", "evt_plot/old", _line(text, '"plot_betrayed"')),
+    ])
+    assert [ref.has_fallback for ref in refs if ref.kind == STRING] == [True, False, True, False]
+    # An older version of the file can be passed as text; invalid JSON yields nothing
+    assert len(extract_json_references(path, "events_plot.json", json.dumps(EVENTS))) == len(refs)
+    assert extract_json_references(path, "events_plot.json", "{") == []
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    content = tmp_path / "ModuleData/Enlisted"
+    (content / "Events").mkdir(parents=True)
+    (content / "Events/events_plot.json").write_text(json.dumps(EVENTS, indent=2), encoding="utf-8")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src/Plot.cs").write_text('var t = new TextObject("{=evt_plot_go}Go");\n', encoding="utf-8")
+    monkeypatch.setattr(reference_graph, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(reference_graph, "CONTENT_ROOT", content)
+    monkeypatch.setattr(reference_graph, "CSHARP_ROOT", tmp_path / "src")
+    monkeypatch.setattr(reference_graph, "DEFAULT_XML_PATH", tmp_path / "missing.xml")
+    return tmp_path
+
+
+def test_graph_indexes_both_directions_and_persists(project):
+    snapshot = project / "cache/graph.pickle"
+    graph = load_graph(snapshot)
+    assert [ref.file for ref in graph.references_to("evt_plot_go")] == [
+        "ModuleData/Enlisted/Events/events_plot.json", "ModuleData/Enlisted/Events/events_plot.json", "src/Plot.cs"]
+    assert graph.references_to("evt_plot_go")[2].has_fallback
+    assert {ref.target for ref in graph.references_from("evt_plot/stay")} == {"evt_plot_stay", "plot_joined"}
+    assert len(graph.references_from("evt_plot")) == 10
+    assert graph.ids_with_prefix("evt_plot_") == ["evt_plot_go", "evt_plot_stay", "evt_plot_title"]
+    assert graph.impact("plot_betrayed")["unreachable_triggers"][0].kind == FLAG_READ
+
+    # A later load only re-reads files that changed
+    assert load_graph(snapshot).refresh() == 0
+    (project / "src/Plot.cs").unlink()
+    assert [ref.file for ref in load_graph(snapshot).references_to("evt_plot_go")] == [
+        "ModuleData/Enlisted/Events/events_plot.json"] * 2
+
+
+def test_prefix_trie():
+    trie = PrefixTrie(["mi_", "mi_loot_", "qm_"])
+    assert trie.match("mi_loot_take") == "mi_" and "qm_x" in trie
+    assert trie.match("evt_x") is None and PrefixTrie([""]).match("anything") == ""
@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+import pytest
+
+import validate_content
+from rule_registry import EventView, RuleRegistry, merge_rule_stats, new_rule_stats
+
+
+def _ctx():
+    return SimpleNamespace(issues=[], rule_stats=new_rule_stats())
+
+
+def test_event_view_normalizes_schema_v1_and_v2():
+    v2 = EventView({"id": "evt", "titleId": "t", "options": [1, 2], "requirements": None})
+    assert (v2.title_id, v2.options, v2.top_level_options, v2.requirements) == ("t", [1, 2], [1, 2], {})
+    v1 = EventView({"id": "evt", "content": {"titleId": "t1", "options": [3]}})
+    assert (v1.title_id, v1.options, v1.top_level_options) == ("t1", [3], [])
+    # A malformed wrapper is ignored rather than crashing every rule
+    assert EventView({"id": "evt", "content": ["x"], "setupId": "s"}).setup_id == "s"
+    assert EventView({}).id == "UNKNOWN"
+
+
+def test_dispatch_order_requires_and_gate():
+    registry = RuleRegistry()
+    calls = []
+
+    @registry.rule("structure.gate", reads=("id",), requires=())
+    def gate(view, file_path, ctx, localization_ids):
+        calls.append("gate")
+        return view.id != "stop"
+
+    @registry.rule("reference.timing", reads=("timing",))
+    def timing(view, file_path, ctx, localization_ids):
+        calls.append("timing")
+        ctx.issues.append("issue")
+
+    @registry.rule("logic.always", reads=("timing",), requires=())
+    def always(view, file_path, ctx, localization_ids):
+        calls.append("always")
+
+    ctx = _ctx()
+    assert registry.run(EventView({"id": "evt"}), "f.json", ctx, set())
+    assert calls == ["gate", "always"]
+    assert registry.run(EventView({"id": "evt", "timing": {"cooldown": 1}}), "f.json", ctx, set())
+    assert calls[2:] == ["gate", "timing", "always"]
+    assert not registry.run(EventView({"id": "stop", "timing": {"cooldown": 1}}), "f.json", ctx, set())
+    assert calls[5:] == ["gate"]
+
+    runs, skipped, issues, _ = ctx.rule_stats["reference.timing"]
+    assert (runs, skipped, issues) == (1, 1, 1)
+    assert [rule.name for rule in registry.rules_for("logic")] == ["logic.always"]
+    assert registry.rules_for("missing") == []
+
+
+def test_unknown_read_field_is_rejected():
+    with pytest.raises(ValueError, match="unknown EventView field 'timings'"):
+        RuleRegistry().rule("logic.bad", reads=("timings",))
+
+
+def test_merge_rule_stats():
+    into, other = new_rule_stats(), new_rule_stats()
+    into["a"][0] += 1
+    other["a"][:] = [2, 3, 4, 0.5]
+    other["b"][1] += 1
+    merge_rule_stats(into, other)
+    assert into["a"] == [3, 3, 4, 0.5] and into["b"] == [0, 1, 0, 0.0]
+
+
+def test_validator_registers_rules_for_every_phase():
+    phases = {rule.phase for rule in validate_content.EVENT_RULES.rules}
+    assert phases == {"structure", "reference", "logic", "consistency"}
+    assert validate_content.EVENT_RULES.rules[0].name == "structure.id"
@@ -0,0 +1,87 @@
+import random
+from difflib import get_close_matches
+
+import pytest
+
+import validate_content
+from suggest_index import FULL_SCAN_MAX_WORDS, SuggestIndex
+
+
+def _typo(rng: random.Random, word: str) -> str:
+    chars = list(word)
+    at = rng.randrange(len(chars))
+    op = rng.randrange(3)
+    if op == 0 and len(chars) > 1:
+        del chars[at]
+    elif op == 1:
+        chars.insert(at, rng.choice("abcdefghijklmnopqrstuvwxyz"))
+    else:
+        chars[at] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+    return "".join(chars)
+
+
+@pytest.mark.parametrize("query", [12, 1.5, None, 7, ["Scouting"], ""])
+def test_non_string_queries_have_no_suggestion(query):
+    index = SuggestIndex(["Scouting", "Riding", "Medicine"])
+    assert index.suggest(query) == []
+    assert index.best(query) is None
+    assert index.case_match(query) is None
+
+
+def test_skill_vocabulary_matches_get_close_matches():
+    skills = sorted(validate_content.ALL_VALID_SKILLS)
+    assert len(skills) <= FULL_SCAN_MAX_WORDS
+    index = validate_content.SKILL_SUGGESTIONS
+    assert index.best("scrutiny") == get_close_matches("scrutiny", skills, 1, 0.6)[0]
+    rng = random.Random(7)
+    for _ in range(3000):
+        query = _typo(rng, _typo(rng, rng.choice(skills)))
+        assert index.suggest(query, 1, 0.6) == get_close_matches(query, skills, 1, 0.6), query
+
+
+def test_large_vocabulary_never_misses_a_match():
+    rng = random.Random(3)
+    parts = ["evt", "dec", "opp", "mi", "qm", "camp", "siege", "loot", "drill", "march", "title", "setup", "opt"]
+    words = sorted({"_".join(rng.choice(parts) for _ in range(rng.randint(2, 5))) + f"_{i}" for i in range(2000)})
+    index = SuggestIndex(words)
+    assert len(index) > FULL_SCAN_MAX_WORDS
+    for _ in range(300):
+        query = _typo(rng, rng.choice(words)) if rng.random() < 0.7 else rng.choice(words)[::-1]
+        expected = get_close_matches(query, words, 1, 0.8)
+        found = index.suggest(query, 1, 0.8)
+        assert bool(found) == bool(expected), query
+
+
+@pytest.mark.parametrize("cutoff", [0.8, 0.6])
+def test_large_vocabulary_full_scan_matches_get_close_matches(cutoff):
+    rng = random.Random(11)
+    parts = ["evt", "dec", "opp", "camp", "siege", "loot", "drill", "title", "setup", "opt", "ÄÖ"]
+    words = sorted({"_".join(rng.choice(parts) for _ in range(rng.randint(1, 4))) + f"_{i}" for i in range(600)})
+    words.append("a" * 300)
+    index = SuggestIndex(words)
+    for _ in range(100):
+        word = rng.choice(words)
+        query = "".join(rng.sample(word, len(word))) if rng.random() < 0.5 else _typo(rng, word)
+        assert index._full_scan(query, 3, cutoff) == get_close_matches(query, words, 3, cutoff), query
+    assert index._full_scan("a" * 290, 2, cutoff) == get_close_matches("a" * 290, words, 2, cutoff)
+
+
+def test_case_match():
+    index = SuggestIndex(["OneHanded", "Polearm"])
+    assert index.case_match("onehanded") == "OneHanded"
+    assert index.case_match("OneHanded") is None
+    assert index.case_match("Polarm") is None
+
+
+def test_numeric_ids_are_reported_not_fatal():
+    event = {
+        "id": "evt_numeric",
+        "titleId": 1.5,
+        "options": [{"id": "opt_a", "textId": 12, "skillCheck": {"skill": 7}}],
+    }
+    ctx = validate_content.ValidationContext()
+    validate_content.validate_references(event, "events_test.json", ctx, {"evt_numeric_title"})
+    messages = [issue.message for issue in ctx.issues]
+    assert "titleId '1.5' not found in enlisted_strings.xml" in messages
+    assert "textId '12' not found in enlisted_strings.xml" in messages
+    assert "Invalid skill in skillCheck: '7'" in messages
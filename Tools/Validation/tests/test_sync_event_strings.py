@@ -0,0 +1,117 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import sync_event_strings
+from localization_index import parse_strings
+from sync_event_strings import collect_texts, scan_content, upsert_strings, xml_escape
+
+TABLE = '''<?xml version="1.0" encoding="utf-8"?>
+<base type="string">
+  <strings>
+    <!-- decisions -->
+    <string id="dec_b" text="B" />
+    <string id="evt_b" text="Old &amp; text" />  <!-- keep -->
+    <string id="evt_d" text="D" /><string id="evt_f" text="F" />
+  </strings>
+</base>
+'''
+
+
+def test_upsert_places_inserts_next_to_their_sort_neighbour():
+    xml = upsert_strings(TABLE, {"evt_c": "C", "aaa": "First", "evt_e": "E", "zzz": 'Last "one"'},
+                         {"evt_b": "New\ntext", "missing": "ignored"})
+    assert xml == '''<?xml version="1.0" encoding="utf-8"?>
+<base type="string">
+  <strings>
+    <!-- decisions -->
+    <string id="aaa" text="First" />
+    <string id="dec_b" text="B" />
+    <string id="evt_b" text="New&#xA;text" />  <!-- keep -->
+    <string id="evt_c" text="C" />
+    <string id="evt_d" text="D" /><string id="evt_f" text="F" />
+    <string id="evt_e" text="E" />
+    <string id="zzz" text="Last &quot;one&quot;" />
+  </strings>
+</base>
+'''
+    assert parse_strings(Path("enlisted_strings.xml"), xml.encode("utf-8")).text("evt_b") == "New\ntext"
+    # Re-running with nothing to do leaves the file byte-for-byte identical
+    assert upsert_strings(xml, {}, {}) == xml
+
+
+def test_upsert_never_grows_a_line_holding_several_elements():
+    xml = '<strings>\n  <string id="b" text="B" /><string id="d" text="D" />\n</strings>\n'
+    assert upsert_strings(xml, {"a": "A", "c": "C", "e": "E"}, {}) == (
+        '<strings>\n  <string id="a" text="A" />\n  <string id="b" text="B" /><string id="d" text="D" />\n'
+        '  <string id="c" text="C" />\n  <string id="e" text="E" />\n</strings>\n')
+
+    # Like the end of enlisted_strings.xml: an unindented run-on line that also closes <strings>
+    xml = ('<base>\n  <strings>\n    <string id="b" text="B" />\n'
+           '<!-- extracted --><string id="d" text="D" /><string id="f" text="F" /></strings>\n</base>\n')
+    assert upsert_strings(xml, {"c": "C", "e": "E", "g": "G"}, {}) == (
+        '<base>\n  <strings>\n    <string id="b" text="B" />\n    <string id="c" text="C" />\n'
+        '<!-- extracted --><string id="d" text="D" /><string id="f" text="F" />\n'
+        '    <string id="e" text="E" />\n    <string id="g" text="G" />\n  </strings>\n</base>\n')
+
+    # ...or opens it
+    assert upsert_strings('<strings><string id="b" text="B" /></strings>', {"a": "A"}, {}) == (
+        '<strings>\n  <string id="a" text="A" />\n  <string id="b" text="B" /></strings>')
+
+
+def test_upsert_into_an_empty_table():
+    xml = upsert_strings("<base>\n  <strings>\n  </strings>\n</base>\n", {"b": "2", "a": "1"}, {})
+    assert xml == ('<base>\n  <strings>\n    <string id="a" text="1" />\n    <string id="b" text="2" />\n'
+                   '  </strings>\n</base>\n')
+    assert upsert_strings("<strings></strings>", {"a": "1"}, {}) == '<strings>\n  <string id="a" text="1" />\n</strings>'
+    with pytest.raises(ValueError):
+        upsert_strings("<base />", {"a": "1"}, {})
+
+
+def test_xml_escape():
+    assert xml_escape("Tom's <b> & \"x\"\n") == "Tom&apos;s &lt;b&gt; &amp; &quot;x&quot;&#xA;"
+    assert xml_escape("") == ""
+
+
+def _write(root, rel, data):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+@pytest.fixture
+def content(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write(tmp_path, "ModuleData/Enlisted/Events/events_a.json", {"events": [
+        {"id": "evt_a", "titleId": "evt_a_title", "title": "Title", "setupId": "evt_a_setup", "setup": "Setup",
+         "options": [{"textId": "evt_a_opt", "text": "Go", "resultTextId": "evt_a_res", "resultText": "Gone"}]},
+        {"id": "evt_dup", "titleId": "evt_a_title", "title": "Other title"}]})
+    _write(tmp_path, "ModuleData/Enlisted/Decisions/camp_opportunities.json", {"opportunities": [
+        {"id": "opp_drill", "titleId": "opp_drill_title", "title": "Drill", "hintId": "opp_drill_hint", "hint": "H"}]})
+    _write(tmp_path, "ModuleData/Enlisted/Orders/order_events/guard.json", {"events": [
+        {"id": "ord_guard", "options": [{"textId": "ord_guard_opt", "text": "Watch",
+                                         "failResultTextId": "ord_guard_fail", "failResultText": "Slept"}]}]})
+    _write(tmp_path, "ModuleData/Enlisted/Config/simulation_config.json",
+           {"incidents": [{"title": "{=sim_fire}Fire in camp"}, {"title": "{=sim_empty}"}], "plain": "no id"})
+    (tmp_path / "ModuleData/Enlisted/Events/broken.json").write_text("{", encoding="utf-8")
+    return tmp_path
+
+
+def test_scan_content_covers_every_root(content):
+    all_strings, missing = scan_content(jobs=1)
+    texts, conflicts = collect_texts(all_strings)
+    assert {string_id: text for string_id, (text, _) in texts.items()} == {
+        "evt_a_title": "Title", "evt_a_setup": "Setup", "evt_a_opt": "Go", "evt_a_res": "Gone",
+        "opp_drill_title": "Drill", "opp_drill_hint": "H",
+        "ord_guard_opt": "Watch", "ord_guard_fail": "Slept",
+        "sim_fire": "Fire in camp",
+    }
+    assert texts["sim_fire"][1] == "simulation_config"
+    assert conflicts == ["evt_a_title: evt_dup differs from evt_a (keeping evt_a)"]
+    assert missing == []
+
+
+def test_parallel_scan_matches_serial(content, monkeypatch):
+    monkeypatch.setattr(sync_event_strings, "PARALLEL_MIN_FILES", 1)
+    assert scan_content(jobs=2) == scan_content(jobs=1)
@@ -0,0 +1,233 @@
+import functools
+import io
+import json
+
+import pytest
+
+import id_registry
+import localization_index
+import validate_content
+import validation_cache
+from csharp_index import CSharpSourceIndex, SourceFile
+from validate_content import (ValidationContext, ValidationSession, _find_unguarded_sea_checks, collect_content_facts,
+                              print_issue_diff, validate_code_quality, validate_content_files)
+
+STRINGS = ("evt_test_title", "evt_test_setup", "evt_test_a", "evt_test_b")
+FILES = ["ModuleData/Enlisted/Events/events_a.json", "ModuleData/Enlisted/Events/events_b.json",
+         "ModuleData/Enlisted/Events/events_c.json"]
+
+
+def _event(event_id, title_id="evt_test_title", flag=None):
+    event = {"id": event_id, "category": "general", "titleId": title_id, "title": "Title",
+             "setupId": "evt_test_setup", "setup": "Setup",
+             "options": [{"id": "a", "textId": "evt_test_a", "text": "A", "tooltip": "A"},
+                         {"id": "b", "textId": "evt_test_b", "text": "B", "tooltip": "B"}]}
+    if flag:
+        event["triggers"] = {"all": [f"has_flag:{flag}"]}
+    return event
+
+
+def _write_events(project, rel, *events):
+    (project / rel).write_text(json.dumps({"schemaVersion": 2, "events": list(events)}, indent=2),
+                               encoding="utf-8")
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Three event files; events_c.json repeats an ID from events_a.json."""
+    project = tmp_path / "project"
+    (project / "ModuleData/Languages").mkdir(parents=True)
+    (project / "ModuleData/Enlisted/Events").mkdir(parents=True)
+    rows = "\n".join(f'    <string id="{string_id}" text="{string_id}" />' for string_id in STRINGS)
+    (project / validate_content.LOCALIZATION_XML).write_text(
+        f'<?xml version="1.0" encoding="utf-8"?>\n<base type="string">\n  <strings>\n{rows}\n  </strings>\n</base>\n',
+        encoding="utf-8")
+    _write_events(project, FILES[0], _event("evt_one", flag="plot_joined"), _event("evt_two"))
+    _write_events(project, FILES[1], _event("evt_three", "evt_test_missing"))
+    _write_events(project, FILES[2], _event("evt_four"), _event("evt_one"))
+    monkeypatch.setattr(validate_content, "PROJECT_ROOT", project)
+    monkeypatch.setattr(validation_cache, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(localization_index, "SNAPSHOT_DIR", tmp_path / "cache")
+    return project
+
+
+def _report(**kwargs):
+    ctx = ValidationContext()
+    validate_content_files(FILES, ctx, set(STRINGS), **kwargs)
+    return ctx
+
+
+def _summary(ctx):
+    return ([str(issue) for issue in ctx.issues], sorted(ctx.event_ids), dict(ctx.flag_references),
+            sorted(ctx.referenced_string_ids), ctx.stats)
+
+
+def test_parallel_run_matches_serial(project):
+    serial = _report(use_cache=False)
+    assert [str(issue) for issue in serial.issues if "Duplicate" in issue.message] == [
+        "[ERROR] events_c.json:evt_one [structure] Duplicate event ID: evt_one"]
+    assert _summary(_report(use_cache=False, jobs=2)) == _summary(serial)
+
+    # Workers only validate cache misses; hits and fresh results merge in file order
+    assert _summary(_report(jobs=2)) == _summary(serial)
+    _write_events(project, FILES[1], _event("evt_three"))
+    partials = collect_content_facts(FILES, set(STRINGS), jobs=2)
+    assert [file_path for file_path, partial in partials.items() if partial.file_seconds] == [FILES[1]]
+    assert not [issue for issue in _report(jobs=2).issues if "evt_test_missing" in issue.message]
+
+
+@pytest.fixture
+def session(project, tmp_path, monkeypatch):
+    """A session after a full run over the project (outside any git tree or real cache)."""
+    monkeypatch.setattr(id_registry, "PROJECT_ROOT", project)
+    monkeypatch.setattr(id_registry, "CONTENT_ROOT", project / "ModuleData/Enlisted")
+    monkeypatch.setattr(validate_content, "load_registry",
+                        functools.partial(id_registry.load_registry, tmp_path / "cache/id_registry.pickle"))
+    session = ValidationSession(out=io.StringIO())
+    assert session.run() is not None
+    return session
+
+
+def _issues(ctx):
+    return sorted(str(issue) for issue in ctx.issues)
+
+
+def test_revalidate_matches_a_fresh_run(project, session):
+    assert session.affected_phases({FILES[1]}) == ({FILES[1]}, {"10"}, False)
+    assert session.affected_phases({validate_content.LOCALIZATION_XML, "src/Plot.cs"}) == (
+        set(FILES), {"5.5", "7", "8", "9"}, True)
+
+    _write_events(project, FILES[1], _event("evt_three"))
+    added = "ModuleData/Enlisted/Events/events_d.json"
+    _write_events(project, added, _event("evt_five", "evt_test_title_new"))
+    ctx = session.revalidate({FILES[1], added})
+    assert added in session.content_files
+    fresh = ValidationSession(out=io.StringIO()).run()
+    assert _issues(ctx) == _issues(fresh)
+    assert [issue.message for issue in ctx.issues if issue.file_path == added] == [
+        "titleId 'evt_test_title_new' not found in enlisted_strings.xml (did you mean 'evt_test_title'?)"]
+
+    # The string table changing re-validates every content file against the new IDs
+    xml = project / validate_content.LOCALIZATION_XML
+    xml.write_text(xml.read_text(encoding="utf-8").replace(
+        "  </strings>", '    <string id="evt_test_title_new" text="New" />\n  </strings>'), encoding="utf-8")
+    ctx = session.revalidate({validate_content.LOCALIZATION_XML})
+    assert _issues(ctx) == _issues(ValidationSession(out=io.StringIO()).run())
+    assert not [issue for issue in ctx.issues if issue.file_path in (FILES[1], added)]
+
+
+def test_print_issue_diff(session, capsys):
+    before = session.ctx
+    after = ValidationContext()
+    after.merge(before)
+    after.add_issue("warning", "logic", "New problem", FILES[0], "evt_one")
+    print_issue_diff(before, after)
+    assert capsys.readouterr().out.splitlines()[0] == "  + [WARNING] events_a.json:evt_one [logic] New problem"
+    print_issue_diff(after, before)
+    assert capsys.readouterr().out.splitlines()[0] == "  - [WARNING] events_a.json:evt_one [logic] New problem"
+
+
+def test_cached_facts_carry_no_measurements(project):
+    fresh = collect_content_facts(FILES, set(STRINGS))
+    assert all(partial.file_seconds and any(stats[0] for stats in partial.rule_stats.values())
+               for partial in fresh.values())
+    # A cache hit replays the file's issues but not the timings of the run that produced them
+    cached = collect_content_facts(FILES, set(STRINGS))
+    for file_path in FILES:
+        assert [str(issue) for issue in cached[file_path].issues] == [str(issue) for issue in fresh[file_path].issues]
+        assert not cached[file_path].file_seconds and not cached[file_path].timings
+        assert not any(stats[0] for stats in cached[file_path].rule_stats.values())
+
+
+SEA_CODE = '''namespace Enlisted
+{
+    public class SeaChecks
+    {
+        public bool Direct(MobileParty party)
+        {
+            return party.CurrentSettlement == null && party.BesiegedSettlement == null && party.IsCurrentlyAtSea;
+        }
+
+        public void EarlyExits(MobileParty party)
+        {
+            if (party.CurrentSettlement != null)
+            {
+                return;
+            }
+            Prepare(party);
+            if (party.BesiegedSettlement != null) return;
+            Prepare(party);
+            if (party.IsCurrentlyAtSea)
+            {
+                Sail(party);
+            }
+        }
+
+        public void Enclosing(MobileParty party)
+        {
+            if (party.CurrentSettlement == null && party.SiegeEvent == null)
+            {
+                if (party.IsCurrentlyAtSea) Sail(party);
+            }
+        }
+
+        public void GuardInAnotherBranch(MobileParty party)
+        {
+            if (party.CurrentSettlement == null && party.BesiegedSettlement == null)
+            {
+                Prepare(party);
+            }
+            var variant = party.IsCurrentlyAtSea ? "sea" : "land";
+        }
+
+        public void SettlementOnly(MobileParty party)
+        {
+            if (party.CurrentSettlement != null) return;
+            if (party.IsCurrentlyAtSea) Sail(party);
+        }
+
+        public void Logging(MobileParty party)
+        {
+            ModLogger.Debug("Sea", $"AtSea={party.IsCurrentlyAtSea}");
+            // party.IsCurrentlyAtSea in a comment
+        }
+    }
+}
+'''
+
+
+def test_sea_guards_follow_the_method_structure(tmp_path):
+    (tmp_path / "SeaChecks.cs").write_text(SEA_CODE, encoding="utf-8")
+    lines = SEA_CODE.splitlines()
+    findings = _find_unguarded_sea_checks(SourceFile(tmp_path / "SeaChecks.cs", tmp_path))
+    # Direct, distant early exits and enclosing conditions guard; a guard in another branch does not
+    assert findings == [[lines.index('            var variant = party.IsCurrentlyAtSea ? "sea" : "land";') + 1,
+                         "error", False, False],
+                        [lines.index("            if (party.IsCurrentlyAtSea) Sail(party);", 40) + 1,
+                         "warning", True, False]]
+
+
+def test_sea_guard_findings_are_cached_by_content(tmp_path, monkeypatch):
+    monkeypatch.setattr(validation_cache, "CACHE_DIR", tmp_path / "cache")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src/SeaChecks.cs").write_text(SEA_CODE, encoding="utf-8")
+    (tmp_path / "src/Renamed.cs").write_text(SEA_CODE, encoding="utf-8")
+
+    def sea_issues(use_cache=True):
+        ctx = ValidationContext()
+        validate_code_quality(ctx, CSharpSourceIndex.build(base=tmp_path), use_cache)
+        return [issue.message for issue in ctx.issues if issue.message.startswith("Line ")]
+    assert len(sea_issues()) == 4
+    cached = json.loads((tmp_path / "cache/sea_guards.json").read_text(encoding="utf-8"))
+    # Both files share one entry: the key is the content hash, not the path
+    assert len(cached["entries"]) == 1
+
+    # Later runs take the stored findings; --no-cache recomputes them
+    sha256 = next(iter(cached["entries"]))
+    cached["entries"][sha256] = cached["entries"][sha256][:1]
+    (tmp_path / "cache/sea_guards.json").write_text(json.dumps(cached), encoding="utf-8")
+    assert len(sea_issues()) == 2
+    assert len(sea_issues(use_cache=False)) == 4
+    # A change to the analysis itself discards every stored finding
+    monkeypatch.setattr(validate_content, "sea_guard_cache_fingerprint", lambda: "changed")
+    assert len(sea_issues()) == 4
@@ -0,0 +1,128 @@
+import functools
+import json
+import os
+
+import pytest
+
+import id_registry
+import localization_index
+import validate_content
+import validation_api
+
+EVENT_FILE = "ModuleData/Enlisted/Events/events_test.json"
+STRINGS = ("evt_test_title", "evt_test_setup", "evt_test_a", "evt_test_b")
+
+
+def _write_strings(project, ids):
+    rows = "\n".join(f'    <string id="{string_id}" text="{string_id}" />' for string_id in ids)
+    (project / validate_content.LOCALIZATION_XML).write_text(
+        f'<?xml version="1.0" encoding="utf-8"?>\n<base type="string">\n  <strings>\n{rows}\n  </strings>\n</base>\n',
+        encoding="utf-8")
+
+
+def _write_event(project, title_id):
+    event = {"id": "evt_test", "category": "general", "titleId": title_id, "title": "Title",
+             "setupId": "evt_test_setup", "setup": "Setup",
+             "options": [{"id": "a", "textId": "evt_test_a", "text": "A", "tooltip": "A"},
+                         {"id": "b", "textId": "evt_test_b", "text": "B", "tooltip": "B"}]}
+    (project / EVENT_FILE).write_text(json.dumps({"schemaVersion": 2, "events": [event]}, indent=2),
+                                      encoding="utf-8")
+
+
+def _messages(report):
+    return [issue.message for issue in report.issues if issue.severity in ("error", "warning")]
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A minimal project tree, validated from an unrelated working directory."""
+    project = tmp_path / "project"
+    (project / "ModuleData/Languages").mkdir(parents=True)
+    (project / "ModuleData/Enlisted/Events").mkdir(parents=True)
+    _write_strings(project, STRINGS)
+    _write_event(project, "evt_test_title")
+    monkeypatch.setattr(validate_content, "PROJECT_ROOT", project)
+    monkeypatch.setattr(validation_api, "PROJECT_ROOT", project)
+    monkeypatch.setattr(localization_index, "SNAPSHOT_DIR", tmp_path / "cache")
+    # Event files feed the Phase 10 ID registry, which must read this tree and cache outside the repo
+    monkeypatch.setattr(id_registry, "PROJECT_ROOT", project)
+    monkeypatch.setattr(id_registry, "CONTENT_ROOT", project / "ModuleData/Enlisted")
+    monkeypatch.setattr(validate_content, "load_registry",
+                        functools.partial(id_registry.load_registry, tmp_path / "cache/id_registry.pickle"))
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+
+    def no_chdir(path):
+        raise AssertionError("validation must not change the process working directory")
+    monkeypatch.setattr(os, "chdir", no_chdir)
+    return project
+
+
+def test_validate_paths_resolves_against_project_root(project):
+    service = validation_api.ValidationService(use_cache=False)
+    report = service.validate_paths([EVENT_FILE])
+    assert report.phases[:2] == ("1-4", "4")
+    assert _messages(report) == []
+    assert report.total_events == 1
+    # Absolute paths name the same project file
+    assert service.validate_paths([project / EVENT_FILE]).paths == (EVENT_FILE,)
+
+
+def test_refresh_revalidates_changed_content_and_strings(project):
+    service = validation_api.ValidationService(use_cache=False)
+    assert _messages(service.validate_paths([EVENT_FILE])) == []
+
+    _write_event(project, "evt_test_title_renamed")
+    messages = _messages(service.validate_paths([EVENT_FILE]))
+    assert len(messages) == 1 and "evt_test_title_renamed" in messages[0]
+
+    # Only the string table changes: the cached event facts must be dropped too
+    _write_strings(project, STRINGS + ("evt_test_title_renamed",))
+    assert _messages(service.validate_paths([EVENT_FILE])) == []
+
+
+def test_refresh_picks_up_new_content_files(project):
+    service = validation_api.ValidationService(use_cache=False)
+    service.validate_paths([EVENT_FILE])
+
+    added = "ModuleData/Enlisted/Events/events_added.json"
+    (project / added).write_text('{"events": []}', encoding="utf-8")
+    report = service.validate_paths([added])
+    assert added in service.session.content_files
+    assert [issue.message for issue in report.issues] == ["No events found in file"]
+
+
+def _write_flag_event(project, rel, event_id, flag):
+    event = {"id": event_id, "category": "general", "titleId": "evt_test_title", "title": "Title",
+             "setupId": "evt_test_setup", "setup": "Setup", "triggers": {"all": [f"has_flag:{flag}"]},
+             "options": [{"id": "a", "textId": "evt_test_a", "text": "A", "tooltip": "A"},
+                         {"id": "b", "textId": "evt_test_b", "text": "B", "tooltip": "B"}]}
+    (project / rel).write_text(json.dumps({"schemaVersion": 2, "events": [event]}, indent=2), encoding="utf-8")
+
+
+def test_file_scope_keeps_flag_findings_about_its_flags(project):
+    plot = "ModuleData/Enlisted/Events/events_plot.json"
+    _write_flag_event(project, plot, "evt_plot", "plot_joined")
+    _write_flag_event(project, "ModuleData/Enlisted/Events/events_other.json", "evt_other", "other_flag")
+    service = validation_api.ValidationService(use_cache=False)
+    flag_messages = [issue.message for issue in service.validate_paths([plot]).issues
+                     if issue.file_path == validation_api.FLAG_ANALYSIS]
+    assert len(flag_messages) == 1 and flag_messages[0].startswith("Flag 'plot_joined' referenced by 1 event(s)")
+    assert not [issue for issue in service.validate_paths([EVENT_FILE]).issues
+                if issue.file_path == validation_api.FLAG_ANALYSIS]
+    # Requesting the phase explicitly reports every flag
+    assert len(service.validate_paths([plot], ["4"]).issues.by_category("consistency")) == 2
+
+
+def test_progress_is_collected_without_swapping_stdout(project, monkeypatch, capsys):
+    original = validate_content.validate_flag_consistency
+
+    def host_prints(ctx):
+        # Stands in for another thread of the host process printing mid-validation
+        print("host output")
+        original(ctx)
+    monkeypatch.setattr(validate_content, "validate_flag_consistency", host_prints)
+    report = validation_api.ValidationService(use_cache=False).validate_paths([EVENT_FILE])
+    assert capsys.readouterr().out == "host output\n"
+    assert "[Phase 0] Loading localization strings..." in report.log
@@ -0,0 +1,102 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+import validate_content
+from validation_cache import ContentFactsCache, HashKeyedCache, atomic_write, local_import_closure
+
+VALIDATOR = Path(validate_content.__file__).resolve()
+
+
+def test_import_closure_follows_nested_and_function_imports(tmp_path):
+    (tmp_path / "entry.py").write_text("import json\nfrom helper import x\n")
+    (tmp_path / "helper.py").write_text("def x():\n    import deep\n    from . import ignored\n")
+    (tmp_path / "deep.py").write_text("import os.path\n")
+    (tmp_path / "unused.py").write_text("")
+    names = [path.name for path in local_import_closure(tmp_path / "entry.py")]
+    assert names == ["deep.py", "entry.py", "helper.py"]
+
+
+def test_fingerprint_covers_modules_that_decide_cached_facts():
+    names = {path.name for path in local_import_closure(VALIDATOR)}
+    assert {"reference_graph.py", "rule_registry.py", "json_stream.py", "issue_store.py",
+            "suggest_index.py", "content_schema.py", "flag_graph.py"} <= names
+
+
+@pytest.mark.parametrize("changed", ["reference_graph.py", "rule_registry.py", "json_stream.py",
+                                     "issue_store.py", "content_schema.json"])
+def test_fingerprint_changes_with_each_input(tmp_path, monkeypatch, changed):
+    for path in local_import_closure(VALIDATOR) + [VALIDATOR.with_name("content_schema.json")]:
+        shutil.copy(path, tmp_path / path.name)
+    monkeypatch.setattr(validate_content, "__file__", str(tmp_path / VALIDATOR.name))
+    ids = {"str_a", "str_b"}
+    before = validate_content.content_cache_fingerprint(ids)
+    assert validate_content.content_cache_fingerprint(ids) == before
+
+    with open(tmp_path / changed, "a", encoding="utf-8") as f:
+        f.write("\n")
+    assert validate_content.content_cache_fingerprint(ids) != before
+
+
+def test_fingerprint_changes_with_localization_ids():
+    assert (validate_content.content_cache_fingerprint({"a"})
+            != validate_content.content_cache_fingerprint({"a", "b"}))
+
+
+def test_cache_is_discarded_when_fingerprint_changes(tmp_path):
+    content = tmp_path / "event.json"
+    content.write_text('{"events": []}')
+    cache_path = tmp_path / "facts.json"
+
+    cache = ContentFactsCache.load("one", cache_path)
+    assert cache.lookup(str(content)) is None
+    cache.store(str(content), {"event_ids": ["e"]})
+    cache.save()
+
+    assert ContentFactsCache.load("one", cache_path).lookup(str(content)) == {"event_ids": ["e"]}
+    assert ContentFactsCache.load("two", cache_path).lookup(str(content)) is None
+
+
+def test_cache_misses_when_file_content_changes(tmp_path):
+    content = tmp_path / "event.json"
+    content.write_text('{"events": []}')
+    cache = ContentFactsCache.load("fp", tmp_path / "facts.json")
+    cache.lookup(str(content))
+    cache.store(str(content), {"event_ids": []})
+
+    content.write_text('{"events": [{}]}')
+    assert cache.lookup(str(content)) is None
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_atomic_writes_do_not_share_a_temp_file(tmp_path):
+    target = tmp_path / "facts.json"
+    # Two runs saving at once: each writes its own temp file, the last replace wins whole
+    with atomic_write(target) as first, atomic_write(target) as second:
+        assert first.name != second.name
+        first.write('{"run": 1}')
+        second.write('{"run": 2}')
+    assert target.read_text(encoding="utf-8") == '{"run": 1}'
+
+    with pytest.raises(RuntimeError):
+        with atomic_write(target, "wb") as f:
+            f.write(b"partial")
+            raise RuntimeError("interrupted")
+    assert target.read_text(encoding="utf-8") == '{"run": 1}'
+    assert [path.name for path in tmp_path.iterdir()] == ["facts.json"]
+
+
+def test_hash_keyed_cache_keeps_only_used_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr("validation_cache.CACHE_DIR", tmp_path)
+    cache = HashKeyedCache.load("scan", "fp")
+    cache.put("aaa", [1])
+    cache.put("bbb", [2])
+    cache.save()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["scan.json"]
+
+    cache = HashKeyedCache.load("scan", "fp")
+    assert (cache.get("aaa"), cache.get("ccc"), cache.hits, cache.misses) == ([1], None, 1, 1)
+    cache.save()
+    assert HashKeyedCache.load("scan", "fp").entries == {"aaa": [1]}
+    assert HashKeyedCache.load("scan", "other").entries == {}
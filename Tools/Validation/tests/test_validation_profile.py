@@ -0,0 +1,50 @@
+import json
+
+import validation_profile
+from validate_content import ValidationContext
+from validation_profile import ValidationProfiler, print_profile_summary, write_profile
+
+
+def _context():
+    ctx = ValidationContext()
+    ctx.event_ids = {"evt_a", "evt_b"}
+    ctx.add_issue("warning", "logic", "Slow", "events_a.json", "evt_a")
+    ctx.rule_stats = {"fast_rule": [4, 0, 0, 0.001], "slow_rule": [2, 1, 1, 0.5], "unused_rule": [0, 3, 0, 0.0]}
+    ctx.file_seconds = {"ModuleData/a.json": 0.25, "ModuleData/b.json": 1.5}
+    ctx.timings["8.sea_context"] += 0.125
+    return ctx
+
+
+def test_phases_and_report(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(validation_profile, "_git_commit", lambda: "abc123")
+    profiler = ValidationProfiler()
+    with profiler.phase("1-4") as record:
+        record["files"] = 2
+        record["events"] = 3
+    with profiler.phase("8"):
+        pass
+
+    profile = profiler.report(_context(), top_n=2, settings={"jobs": 1})
+    first, second = profile["phases"]
+    assert (first["phase"], first["files"], first["events"]) == ("1-4", 2, 3)
+    assert first["files_per_s"] > 0 and first["wall_s"] >= 0 and first["cpu_s"] >= 0
+    # Nothing processed: no rate rather than zero
+    assert second["files_per_s"] is None and second["events_per_s"] is None
+    assert profile["git_commit"] == "abc123" and profile["settings"] == {"jobs": 1}
+    assert profile["total"]["events"] == 2 and profile["total"]["issues"] == 1
+    assert profile["sections"] == {"8.sea_context": 125.0}
+    assert [rule["rule"] for rule in profile["slowest_rules"]] == ["slow_rule", "fast_rule"]
+    assert profile["slowest_rules"][0] == {"rule": "slow_rule", "runs": 2, "skipped": 1, "issues": 1,
+                                           "total_ms": 500.0, "mean_us": 250000.0}
+    assert profile["slowest_files"] == [{"file": "ModuleData/b.json", "ms": 1500.0},
+                                        {"file": "ModuleData/a.json", "ms": 250.0}]
+    unused = profiler.report(_context(), top_n=3)["slowest_rules"][2]
+    assert unused["rule"] == "unused_rule" and unused["mean_us"] is None
+
+    path = tmp_path / "Debugging/profile.json"
+    write_profile(profile, path)
+    assert json.loads(path.read_text(encoding="utf-8")) == profile
+    print_profile_summary(profile)
+    out = capsys.readouterr().out
+    assert "Slowest rule: slow_rule (500.0 ms over 2 runs)" in out
+    assert "Slowest file: ModuleData/b.json (1500.0 ms)" in out
@@ -0,0 +1,89 @@
+import io
+import json
+from collections import Counter
+
+import pytest
+
+from analyze_validation import parse_structured_report, print_analysis
+from issue_store import ValidationIssue
+from json_locator import SourceLocator
+from validation_report import make_issue_writer
+
+EVENT_FILE = "ModuleData/Enlisted/Events/events_a.json"
+ISSUES = [
+    ValidationIssue("error", "reference", "titleId 'evt_a_gone' not found in enlisted_strings.xml", EVENT_FILE,
+                    "evt_a"),
+    ValidationIssue("warning", "consistency", "Flag 'plot_joined' referenced by 1 event(s) but never set",
+                    "flag_analysis"),
+    ValidationIssue("info", "project", "Project includes: 1 compiled files", "Enlisted.csproj"),
+]
+STATS = Counter(f"{issue.severity}_{issue.category}" for issue in ISSUES)
+
+
+def _write(fmt, locator=None):
+    stream = io.StringIO()
+    writer = make_issue_writer(fmt, stream, locator)
+    writer.start()
+    for issue in ISSUES:
+        writer.write_issue(issue)
+    writer.finish(STATS, 2, 1)
+    return stream.getvalue()
+
+
+@pytest.fixture
+def locator(tmp_path):
+    (tmp_path / EVENT_FILE).parent.mkdir(parents=True)
+    (tmp_path / EVENT_FILE).write_text(json.dumps({"events": [{"id": "evt_a", "titleId": "evt_a_gone"}]}, indent=2),
+                                       encoding="utf-8")
+    return SourceLocator(tmp_path)
+
+
+def test_ndjson_and_json_carry_every_issue_and_the_summary(locator):
+    lines = [json.loads(line) for line in _write("ndjson", locator).splitlines()]
+    assert [line["type"] for line in lines] == ["issue", "issue", "issue", "summary"]
+    assert lines[0] == {"type": "issue", "severity": "error", "category": "reference", "message": ISSUES[0].message,
+                        "file": EVENT_FILE, "event_id": "evt_a", "line": 5, "column": 18, "pointer": "/events/0/titleId"}
+    assert "line" not in lines[1]
+    assert lines[3] == {"type": "summary", "total_events": 2, "errors": 1, "warnings": 1, "info": 1,
+                        "by_category": {"error_reference": 1, "info_project": 1, "warning_consistency": 1},
+                        "result": "failed", "exit_code": 1}
+
+    document = json.loads(_write("json", locator))
+    assert document["issues"] == [{key: value for key, value in line.items() if key != "type"}
+                                  for line in lines[:3]]
+    assert document["summary"] == {key: value for key, value in lines[3].items() if key != "type"}
+
+
+def test_empty_json_report_is_valid():
+    stream = io.StringIO()
+    writer = make_issue_writer("json", stream)
+    writer.start()
+    writer.finish(Counter(), 0, 0)
+    assert json.loads(stream.getvalue())["summary"]["result"] == "passed"
+
+
+def test_sarif_results_rules_and_regions(locator):
+    run = json.loads(_write("sarif", locator))["runs"][0]
+    assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == ["reference", "consistency", "project"]
+    first, flags, _ = run["results"]
+    assert first["level"] == "error" and first["ruleIndex"] == 0
+    assert first["locations"][0]["physicalLocation"] == {
+        "artifactLocation": {"uri": EVENT_FILE, "uriBaseId": "%SRCROOT%"},
+        "region": {"startLine": 5, "startColumn": 18}}
+    assert first["properties"] == {"eventId": "evt_a", "pointer": "/events/0/titleId"}
+    # Cross-file checks report against a label, not a file
+    assert "locations" not in flags
+    assert run["properties"]["exit_code"] == 1
+
+
+def test_analyzer_reads_structured_reports_without_printing_to_stdout(capsys):
+    for fmt in ("ndjson", "json"):
+        data = parse_structured_report(_write(fmt))
+        assert data["stats"]["errors"] == 1 and data["stats"]["warning_consistency"] == 1
+        assert data["issues"]["reference"]["missing_strings"] == [("events_a.json", "evt_a", "evt_a_gone")]
+        assert len(data["issues"]["consistency"]["flags"]) == 1
+
+        out = io.StringIO()
+        print_analysis(data, out)
+        assert "VALIDATION ANALYSIS - ACTIONABLE SUMMARY" in out.getvalue()
+        assert capsys.readouterr().out == ""
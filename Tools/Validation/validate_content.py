@@ -6,7 +6,10 @@ Validates events, decisions, orders, configs, and project structure against stru
 logical constraints, and integration requirements from docs/Features/Content/event-system-schemas.md
 
 Usage:
-    python Tools/Validation/validate_content.py [--strict] [--fix-refs] [--check-orphans]
+    python Tools/Validation/validate_content.py [--strict] [--fix-refs] [--check-orphans] [--no-cache] [--jobs N] [--watch]
+                                                [--changed-since REV]
+                                                [--profile [PATH]] [--profile-top N]
+                                                [--format text|json|sarif|ndjson]
 
 Validation Phases:
     Phase 1: Structure validation (JSON schema, required fields, enum values)
@@ -15,41 +18,70 @@ Validation Phases:
     Phase 4: Consistency checks (flags, multi-stage events, priorities)
     Phase 5: Orphan detection (unused XML strings)
     Phase 5.5: Opportunity validation (hints, deprecated 'immediate' field)
-    Phase 6: Config validation (baggage_config.json, etc.)
+    Phase 6: Config validation (typed models for every Config/*.json)
     Phase 7: Project structure validation (.csproj, file organization)
     Phase 8: Code quality validation (hardcoded paths, sea context detection)
     Phase 9: C# TextObject localization (string IDs in code → XML)
     Phase 9.5: Camp schedule descriptions (meaningful phase text)
+    Phase 10: ID registry (duplicate IDs in orders, opportunities, incidents, overrides, conditions, dialogue)
 """
 
 import argparse
+import concurrent.futures
+import contextlib
 import glob
+import io
 import json
 import os
 import re
 import sys
+import time
 import xml.etree.ElementTree as ET
 from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Any, Optional
+from typing import Callable, Dict, List, Set, TextIO, Tuple, Any, Optional
+
+# Sibling helper modules (validation_cache, ...) live next to this script
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+# Content paths are reported relative to the project root and resolved against it,
+# so the validator works from any working directory
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+from change_scope import ChangeScope, ChangeScopeError
+from config_models import load_config
+from content_schema import KIND_EVENT, KIND_OPPORTUNITY, KIND_ORDER_EVENT, SchemaIssue, load_schema
+from csharp_index import BLOCK_MEMBER, BLOCK_TYPE, CSharpSourceIndex
+from flag_graph import FlagGraph, FlagNode
+from id_registry import NAMESPACES_BY_NAME, load_registry, namespace_for
+from issue_store import IssueStore, ValidationIssue
+from json_locator import SourceLocator
+from json_stream import RootFormatError, iter_events
+from localization_index import LocalizationParseError, load_index
+from reference_graph import TEXTOBJECT_PATTERN, PrefixTrie, flags_read_by, flags_set_by
+from rule_registry import EventView, RuleRegistry, merge_rule_stats, new_rule_stats
+from suggest_index import SuggestIndex, did_you_mean, shared_index
+from validation_cache import ContentFactsCache, HashKeyedCache, fingerprint, local_import_closure
+from validation_profile import (DEFAULT_PROFILE_PATH, ValidationProfiler, print_profile_summary,
+                                write_profile)
+from validation_report import OUTPUT_FORMATS, make_issue_writer
 
 # ============================================================================
 # Constants and Reference Data (aligned with event-system-schemas.md)
 # ============================================================================
 
+# Enums, limits and Phase 1 structure checks live in content_schema.json, shared with
+# the CrewAI schema tools. Edit the schema, not these names.
+CONTENT_SCHEMA = load_schema()
+
 # Valid Bannerlord skills (from schema)
-# NOTE: If you add new skills to the game, add them here to avoid false positives
-VALID_SKILLS = {
-    "OneHanded", "TwoHanded", "Polearm", "Bow", "Crossbow", "Throwing",
-    "Riding", "Athletics", "Crafting", "Scouting", "Tactics", "Roguery",
-    "Charm", "Leadership", "Trade", "Stewardship", "Medicine", "Engineering",
-    "Perception"  # Used in order events for awareness checks
-}
+# NOTE: If you add new skills to the game, add them to content_schema.json to avoid false positives
+VALID_SKILLS = set(CONTENT_SCHEMA.enum("skills"))
 
 # EXTENSION MECHANISM: Load custom skills from config if present
 def load_custom_skills():
     """Load additional valid skills from custom config."""
-    config_path = Path("ModuleData/Enlisted/Config/validation_extensions.json")
+    config_path = PROJECT_ROOT / "ModuleData/Enlisted/Config/validation_extensions.json"
     if config_path.exists():
         try:
             with open(config_path, encoding='utf-8-sig') as f:
@@ -64,76 +96,39 @@ def load_custom_skills():
 
 CUSTOM_SKILLS = load_custom_skills()
 ALL_VALID_SKILLS = VALID_SKILLS | CUSTOM_SKILLS
+SKILL_SUGGESTIONS = SuggestIndex(ALL_VALID_SKILLS)
+
+# "Did you mean" cutoffs (difflib ratio). IDs are long and share prefixes, so they need a closer match.
+SKILL_SUGGEST_CUTOFF = 0.6
+ID_SUGGEST_CUTOFF = 0.8
 
 # Valid roles as defined by the Identity System (from schema)
-VALID_ROLES = {
-    "Any", "Scout", "Medic", "Engineer", "Officer", "Operative", "NCO", "Soldier"
-}
+VALID_ROLES = set(CONTENT_SCHEMA.enum("roles"))
 
 # Valid contexts for narrative events (from schema)
-VALID_CONTEXTS = {
-    "Any", "War", "Peace", "Siege", "Battle", "Town", "Village", "Camp", "March"
-}
+VALID_CONTEXTS = set(CONTENT_SCHEMA.enum("contexts"))
 
 # Valid categories for events/decisions (from schema)
-VALID_CATEGORIES = {
-    "decision", "escalation", "role", "universal", "muster", "crisis", "general",
-    "onboarding", "pay", "promotion", "retinue", "training", "threshold",
-    "medical", "map_incident"  # Medical system events and map incident events
-}
+VALID_CATEGORIES = set(CONTENT_SCHEMA.enum("categories"))
 
 # Valid severities for order events (from schema)
-VALID_SEVERITIES = {"normal", "attention", "critical", "urgent", "positive"}
+VALID_SEVERITIES = set(CONTENT_SCHEMA.enum("order_severities"))
 
 # Valid severities for news priority (from schema)
-VALID_NEWS_SEVERITIES = {"normal", "positive", "attention", "urgent", "critical"}
+VALID_NEWS_SEVERITIES = set(CONTENT_SCHEMA.enum("news_severities"))
 
 # Valid world states for order events (from schema - requirements.world_state)
-VALID_WORLD_STATES = {
-    "peacetime_garrison", "peacetime_recruiting", "peacetime_patrol",
-    "war_marching", "war_active_campaign", "war_raiding",
-    "siege_attacking", "siege_defending",
-    "retreat", "recovery"
-}
+VALID_WORLD_STATES = set(CONTENT_SCHEMA.enum("world_states"))
 
 # Valid time of day (from schema)
-VALID_TIME_OF_DAY = {"dawn", "morning", "midday", "afternoon", "evening", "night", "Dawn", "Midday", "Dusk", "Night"}
+VALID_TIME_OF_DAY = set(CONTENT_SCHEMA.enum("time_of_day"))
 
 # Role tier requirements (minimum tier for each role)
-ROLE_MIN_TIERS = {
-    "Officer": 5,
-    "NCO": 4,
-    "Operative": 3,
-    "Scout": 1,
-    "Medic": 1,
-    "Engineer": 1,
-    "Soldier": 1,
-    "Any": 1
-}
+ROLE_MIN_TIERS = CONTENT_SCHEMA.role_min_tiers
 
 # Escalation tracks and their ranges (from schema)
 # Parser accepts multiple naming variants
-ESCALATION_TRACKS = {
-    # Primary tracks
-    "scrutiny": (0, 10),
-    "discipline": (0, 10),
-    "medical_risk": (0, 5),
-    "medicalrisk": (0, 5),
-    "MedicalRisk": (0, 5),
-    "pay_tension": (0, 100),
-    "pay_tension_min": (0, 100),
-    "paytension": (0, 100),
-    # Reputation tracks
-    "soldierreputation": (-50, 50),
-    "soldier_reputation": (-50, 50),
-    "SoldierReputation": (-50, 50),
-    "officerreputation": (0, 100),
-    "officer_reputation": (0, 100),
-    "OfficerReputation": (0, 100),
-    "lordreputation": (0, 100),
-    "lord_reputation": (0, 100),
-    "LordReputation": (0, 100),
-}
+ESCALATION_TRACKS = CONTENT_SCHEMA.escalation_tracks
 
 # Known system string prefixes that shouldn't be flagged as orphans
 SYSTEM_STRING_PREFIXES = {
@@ -155,45 +150,129 @@ SYSTEM_STRING_PREFIXES = {
     "opp_",       # Opportunity strings
     "prog_",      # Progression strings
 }
+SYSTEM_STRING_TRIE = PrefixTrie(SYSTEM_STRING_PREFIXES)
 
 # ============================================================================
 # Data Structures
 # ============================================================================
 
-class ValidationIssue:
-    """Represents a validation issue with severity and context."""
-    
-    def __init__(self, severity: str, category: str, message: str, file_path: str, event_id: str = None):
-        self.severity = severity  # "error", "warning", "info"
-        self.category = category  # e.g., "structure", "reference", "logic", "consistency"
-        self.message = message
-        self.file_path = file_path
-        self.event_id = event_id
-    
-    def __str__(self):
-        prefix = f"[{self.severity.upper()}]"
-        location = f"{Path(self.file_path).name}"
-        if self.event_id:
-            location += f":{self.event_id}"
-        return f"{prefix} {location} [{self.category}] {self.message}"
+def progress(message: str = "", out: Optional[TextIO] = None):
+    """Print a progress line to `out` (default: whatever sys.stdout is at call time)."""
+    print(message, file=sys.stdout if out is None else out)
 
 
 class ValidationContext:
     """Accumulates validation issues and provides reporting."""
     
-    def __init__(self, strict: bool = False):
+    def __init__(self, strict: bool = False, out: Optional[TextIO] = None):
         self.strict = strict
-        self.issues: List[ValidationIssue] = []
-        self.stats = Counter()
+        # Progress lines of the phases run into this context (see progress())
+        self.out = out
+        self.issues = IssueStore()
         self.event_ids: Set[str] = set()
         self.flag_references: Dict[str, List[str]] = defaultdict(list)
         self.flag_setters: Dict[str, List[str]] = defaultdict(list)
+        # Flag gates and effects per event, for the Phase 4 reachability analysis
+        self.flag_nodes: List[FlagNode] = []
         self.referenced_string_ids: Set[str] = set()
+        # (event_id, issue index, file) for every first sighting of an event ID.
+        # Lets partial contexts be merged with duplicate detection at the exact
+        # position the serial run would have reported it.
+        self.event_id_claims: List[Tuple[str, int, str]] = []
+        # Called with every issue as it lands in this context (structured output streaming)
+        self.on_issue: Optional[Callable[[ValidationIssue], None]] = None
+        # Per-rule [runs, skipped, issues, seconds] for rules executed in this run
+        self.rule_stats: Dict[str, List] = new_rule_stats()
+        # Wall seconds per content file and per named sub-section (--profile)
+        self.file_seconds: Dict[str, float] = {}
+        self.timings = Counter()
         
-    def add_issue(self, severity: str, category: str, message: str, file_path: str, event_id: str = None):
-        """Add a validation issue."""
-        self.issues.append(ValidationIssue(severity, category, message, file_path, event_id))
-        self.stats[f"{severity}_{category}"] += 1
+    def add_issue(self, severity: str, category: str, message: str, file_path: str, event_id: str = None,
+                  pointer: str = None):
+        """Add a validation issue (pointer: JSON pointer of the value, relative to the event if any)."""
+        issue = ValidationIssue(severity, category, message, file_path, event_id, pointer)
+        self.issues.append(issue)
+        if self.on_issue:
+            self.on_issue(issue)
+    
+    @property
+    def stats(self) -> Counter:
+        """Issue counts keyed by "severity_category"."""
+        return self.issues.stats
+    
+    def _extend_issues(self, issues: List[ValidationIssue]):
+        self.issues.extend(issues)
+        if self.on_issue:
+            for issue in issues:
+                self.on_issue(issue)
+    
+    def progress(self, message: str = ""):
+        progress(message, self.out)
+    
+    def claim_event_id(self, event_id: str, file_path: str) -> bool:
+        """Register an event ID, reporting a duplicate if it was already seen."""
+        if event_id in self.event_ids:
+            self.add_issue("error", "structure", f"Duplicate event ID: {event_id}", file_path, event_id)
+            return False
+        self.event_ids.add(event_id)
+        self.event_id_claims.append((event_id, len(self.issues), file_path))
+        return True
+    
+    def merge(self, other: "ValidationContext"):
+        """
+        Fold a partial context (one file, one worker, one cached entry) into this one.
+        
+        Issues are replayed in order and event IDs re-claimed, so cross-file duplicate
+        IDs are reported exactly where a single shared context would have reported them.
+        """
+        position = 0
+        for event_id, index, file_path in other.event_id_claims:
+            self._extend_issues(other.issues[position:index])
+            position = index
+            self.claim_event_id(event_id, file_path)
+        self._extend_issues(other.issues[position:])
+        for flag, events in other.flag_references.items():
+            self.flag_references[flag].extend(events)
+        for flag, events in other.flag_setters.items():
+            self.flag_setters[flag].extend(events)
+        self.flag_nodes.extend(other.flag_nodes)
+        self.referenced_string_ids.update(other.referenced_string_ids)
+        merge_rule_stats(self.rule_stats, other.rule_stats)
+        self.file_seconds.update(other.file_seconds)
+        self.timings.update(other.timings)
+    
+    def to_facts(self) -> Dict[str, Any]:
+        """Serialize the per-file facts of a partial context (see validation_cache.py)."""
+        return {
+            "issues": [issue.to_fields() for issue in self.issues],
+            "event_id_claims": [list(claim) for claim in self.event_id_claims],
+            "flag_references": dict(self.flag_references),
+            "flag_setters": dict(self.flag_setters),
+            "flag_nodes": [node.to_fields() for node in self.flag_nodes],
+            "referenced_string_ids": sorted(self.referenced_string_ids),
+            "rule_stats": dict(self.rule_stats),
+            "file_seconds": self.file_seconds,
+            "timings": dict(self.timings),
+        }
+    
+    @classmethod
+    def from_facts(cls, facts: Dict[str, Any]) -> "ValidationContext":
+        """Rebuild a partial context from facts produced by to_facts()."""
+        ctx = cls()
+        ctx.issues.extend(ValidationIssue(*fields) for fields in facts["issues"])
+        ctx.event_id_claims = [tuple(claim) for claim in facts["event_id_claims"]]
+        ctx.event_ids = {claim[0] for claim in ctx.event_id_claims}
+        for flag, events in facts["flag_references"].items():
+            ctx.flag_references[flag].extend(events)
+        for flag, events in facts["flag_setters"].items():
+            ctx.flag_setters[flag].extend(events)
+        ctx.flag_nodes = [FlagNode(*fields) for fields in facts["flag_nodes"]]
+        ctx.referenced_string_ids = set(facts["referenced_string_ids"])
+        # Absent for cached facts: those rules did not run this time
+        merge_rule_stats(ctx.rule_stats, facts.get("rule_stats", {}))
+        ctx.file_seconds.update(facts.get("file_seconds", {}))
+        ctx.timings.update(facts.get("timings", {}))
+        return ctx
     
     def track_string_reference(self, string_id: str):
         """Track a string ID that is referenced by JSON content."""
@@ -201,19 +280,19 @@ class ValidationContext:
             self.referenced_string_ids.add(string_id)
     
     def has_errors(self) -> bool:
-        return any(issue.severity == "error" for issue in self.issues)
+        return self.issues.count("error") > 0
     
     def has_critical_issues(self) -> bool:
         return self.has_errors() or (self.strict and self.has_warnings())
     
     def has_warnings(self) -> bool:
-        return any(issue.severity == "warning" for issue in self.issues)
+        return self.issues.count("warning") > 0
     
     def print_report(self):
         """Print validation report."""
-        errors = [i for i in self.issues if i.severity == "error"]
-        warnings = [i for i in self.issues if i.severity == "warning"]
-        infos = [i for i in self.issues if i.severity == "info"]
+        errors = self.issues.by_severity("error")
+        warnings = self.issues.by_severity("warning")
+        infos = self.issues.by_severity("info")
         
         print("\n" + "=" * 80)
         print("VALIDATION REPORT")
@@ -259,27 +338,19 @@ class ValidationContext:
 # Localization String Loader
 # ============================================================================
 
-def load_localization_strings() -> Set[str]:
-    """Load all string IDs from enlisted_strings.xml."""
-    xml_path = Path("ModuleData/Languages/enlisted_strings.xml")
+def load_localization_strings(out: Optional[TextIO] = None) -> Set[str]:
+    """Load all string IDs from enlisted_strings.xml (via the shared localization index)."""
+    xml_path = PROJECT_ROOT / LOCALIZATION_XML
     if not xml_path.exists():
-        print(f"Warning: Localization file not found at {xml_path}")
+        progress(f"Warning: Localization file not found at {xml_path}", out)
         return set()
     
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-        string_ids = set()
-        
-        for string_elem in root.findall(".//string"):
-            string_id = string_elem.get("id")
-            if string_id:
-                string_ids.add(string_id)
-        
-        print(f"[INFO] Loaded {len(string_ids)} localization strings from enlisted_strings.xml")
+        string_ids = set(load_index(xml_path).ids())
+        progress(f"[INFO] Loaded {len(string_ids)} localization strings from enlisted_strings.xml", out)
         return string_ids
-    except Exception as e:
-        print(f"Error loading localization strings: {e}")
+    except (LocalizationParseError, OSError) as e:
+        progress(f"Error loading localization strings: {e}", out)
         return set()
 
 
@@ -287,129 +358,101 @@ def load_localization_strings() -> Set[str]:
 # Phase 1: Structure Validation
 # ============================================================================
 
-def validate_structure(event: Dict, file_path: str, ctx: ValidationContext) -> bool:
-    """Validate event structure and required fields."""
-    event_id = event.get("id", "UNKNOWN")
-    
-    # Required: ID field
-    if not event_id or event_id == "UNKNOWN":
-        ctx.add_issue("error", "structure", "Missing or empty 'id' field", file_path)
+# Per-event rules for Phases 1-4, dispatched in registration (= report) order
+EVENT_RULES = RuleRegistry()
+
+
+def _add_schema_issues(issues: List[SchemaIssue], file_path: str, ctx: ValidationContext, object_id: str):
+    for issue in issues:
+        ctx.add_issue(issue.severity, issue.category, issue.message, file_path,
+                      object_id if issue.scoped else None, issue.pointer if issue.scoped else None)
+
+
+def _event_schema_check(rule: str, view: EventView, file_path: str, ctx: ValidationContext) -> bool:
+    """Run one rule's compiled schema checks (content_schema.json); True if it found issues."""
+    kind = CONTENT_SCHEMA.kind(KIND_ORDER_EVENT if view.order_type else KIND_EVENT)
+    issues = kind.check(rule, view.raw)
+    _add_schema_issues(issues, file_path, ctx, view.id)
+    return bool(issues)
+
+
+@EVENT_RULES.rule("structure.id", reads=("id",), requires=())
+def _rule_event_id(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
+    """Required: ID field. Events without one are not validated further."""
+    if _event_schema_check("structure.id", view, file_path, ctx):
         return False
-    
+
+
+@EVENT_RULES.rule("structure.unknown_fields", reads=("keys",), requires=())
+def _rule_unknown_fields(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
     # SAFETY: Detect unknown fields that might be typos or deprecated
-    known_top_level_fields = {
-        'id', 'category', 'order_type', 'severity', 'titleId', 'title', 'setupId', 'setup',
-        'requirements', 'triggers', 'timing', 'options', 'content', 'metadata', 'delivery',
-        'packId', 'schemaVersion', 'skill_check', 'sets_flag', 'requires_flag'
-    }
-    unknown_fields = set(event.keys()) - known_top_level_fields
-    if unknown_fields:
-        ctx.add_issue("info", "structure", 
-            f"Unknown top-level fields (new feature or typo?): {sorted(unknown_fields)}",
-            file_path, event_id)
-    
+    _event_schema_check("structure.unknown_fields", view, file_path, ctx)
+
+
+@EVENT_RULES.rule("structure.duplicate_id", reads=("id",), requires=())
+def _rule_duplicate_id(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
     # Track event ID for duplicate detection
-    if event_id in ctx.event_ids:
-        ctx.add_issue("error", "structure", f"Duplicate event ID: {event_id}", file_path, event_id)
-    else:
-        ctx.event_ids.add(event_id)
-    
-    # Determine event type: Order Event vs Narrative Event
-    order_type = event.get("order_type", "")
-    category = event.get("category", "")
-    severity = event.get("severity", "")
-    
-    if order_type:
-        # ORDER EVENT: Uses order_type + severity
-        if severity and severity.lower() not in VALID_SEVERITIES:
-            ctx.add_issue("warning", "structure", f"Unknown order severity: '{severity}'", file_path, event_id)
-    else:
-        # NARRATIVE EVENT: Uses category
-        if not category:
-            ctx.add_issue("error", "structure", "Missing 'category' field", file_path, event_id)
-        elif category not in VALID_CATEGORIES:
-            ctx.add_issue("warning", "structure", f"Unknown category: '{category}'", file_path, event_id)
-        
-        # Check news severity if present
-        if severity and severity.lower() not in VALID_NEWS_SEVERITIES:
-            ctx.add_issue("warning", "structure", f"Unknown news severity: '{severity}'", file_path, event_id)
-    
-    # Title and setup (check both schema v1 and v2 locations)
-    content = event.get("content") or {}
-    title_id = event.get("titleId") or content.get("titleId")
-    setup_id = event.get("setupId") or content.get("setupId")
-    title = event.get("title") or content.get("title")
-    setup = event.get("setup") or content.get("setup")
-    
-    # Either titleId or title must be present
-    if not title_id and not title:
-        ctx.add_issue("error", "structure", "Missing 'titleId' or 'title' field", file_path, event_id)
-    if not setup_id and not setup:
-        ctx.add_issue("error", "structure", "Missing 'setupId' or 'setup' field", file_path, event_id)
-    
-    # Options validation
-    options = (event.get("options") or []) or (content.get("options") or [])
-    if not options:
-        # Allow empty options for dec_baggage_access (dynamically generated)
-        if event_id != "dec_baggage_access":
-            ctx.add_issue("error", "structure", "Missing or empty 'options' array", file_path, event_id)
-    else:
-        # Option count validation
-        has_abort = any(opt.get("abortsEnlistment") for opt in options)
-        is_onboarding = category == "onboarding" or event.get("timing", {}).get("oneTime")
-        
-        if len(options) == 1:
-            ctx.add_issue("error", "structure", f"Invalid option count: {len(options)} (must be 0 or 2-6)", file_path, event_id)
-        elif len(options) > 6:
-            ctx.add_issue("error", "structure", f"Invalid option count: {len(options)} (must be 2-6)", file_path, event_id)
-        elif len(options) > 4 and not (is_onboarding or has_abort):
-            ctx.add_issue("warning", "structure", "5-6 options only recommended for onboarding/abort events", file_path, event_id)
-    
-    # Validate each option's structure
-    for i, option in enumerate(options):
-        opt_id = option.get("id", f"option_{i}")
-        
-        # Text requirement
-        if not option.get("textId") and not option.get("text"):
-            ctx.add_issue("error", "structure", f"Option '{opt_id}' missing textId and fallback text", file_path, event_id)
-        
-        # Tooltip requirement (order events auto-generate from effects, so they can skip)
-        if not order_type:
-            has_tooltip = option.get("tooltip") or option.get("tooltipTemplate")
-            if not has_tooltip:
-                ctx.add_issue("error", "structure", f"Option '{opt_id}' missing tooltip or tooltipTemplate", file_path, event_id)
-            elif option.get("tooltip") and len(option.get("tooltip", "")) > 100:
-                ctx.add_issue("warning", "structure", f"Option '{opt_id}' tooltip is long ({len(option['tooltip'])} chars)", file_path, event_id)
-    
-    return True
+    ctx.claim_event_id(view.id, file_path)
+
+
+@EVENT_RULES.rule("structure.event_type", reads=("order_type", "category", "severity"), requires=())
+def _rule_event_type(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
+    # ORDER EVENT: order_type + severity; NARRATIVE EVENT: category (+ optional news severity)
+    _event_schema_check("structure.event_type", view, file_path, ctx)
+
+
+@EVENT_RULES.rule("structure.title_setup", reads=("title_id", "title", "setup_id", "setup"), requires=())
+def _rule_title_setup(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
+    # Either titleId or title must be present (schema v1 and v2 locations)
+    _event_schema_check("structure.title_setup", view, file_path, ctx)
+
+
+@EVENT_RULES.rule("structure.option_count", reads=("options", "category", "timing"), requires=())
+def _rule_option_count(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
+    # 0 (dynamic) or 2-6 options; 5-6 only for onboarding/abort events
+    _event_schema_check("structure.option_count", view, file_path, ctx)
+
+
+@EVENT_RULES.rule("structure.option_fields", reads=("options", "order_type"), requires=("options",))
+def _rule_option_fields(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
+    # Option text and tooltip (order events auto-generate tooltips from effects, so they can skip)
+    _event_schema_check("structure.option_fields", view, file_path, ctx)
+
+
+def validate_structure(event: Dict, file_path: str, ctx: ValidationContext) -> bool:
+    """Validate event structure and required fields."""
+    return EVENT_RULES.run(EventView(event), file_path, ctx, set(), phase="structure")
 
 
 # ============================================================================
 # Phase 2: Reference Validation
 # ============================================================================
 
-def validate_references(event: Dict, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
-    """Validate references to localization strings, skills, traits."""
-    event_id = event.get("id", "UNKNOWN")
-    order_type = event.get("order_type", "")
-    
-    # Check localization references
-    content = event.get("content") or {}
-    title_id = event.get("titleId") or content.get("titleId")
-    setup_id = event.get("setupId") or content.get("setupId")
+def _missing_string_hint(string_id: str, localization_ids: Set[str]) -> str:
+    """' (did you mean ...)' suffix for a localization ID that is not in the string table."""
+    index = shared_index("localization_ids", localization_ids)
+    return did_you_mean(index.best(string_id, ID_SUGGEST_CUTOFF))
+
+
+@EVENT_RULES.rule("reference.event_strings", reads=("title_id", "setup_id"))
+def _rule_event_strings(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
+    title_id, setup_id = view.title_id, view.setup_id
     
     # Track references for orphan detection
     ctx.track_string_reference(title_id)
     ctx.track_string_reference(setup_id)
     
     if title_id and title_id not in localization_ids:
-        ctx.add_issue("warning", "reference", f"titleId '{title_id}' not found in enlisted_strings.xml", file_path, event_id)
+        ctx.add_issue("warning", "reference", f"titleId '{title_id}' not found in enlisted_strings.xml"
+                      f"{_missing_string_hint(title_id, localization_ids)}", file_path, view.id)
     if setup_id and setup_id not in localization_ids:
-        ctx.add_issue("warning", "reference", f"setupId '{setup_id}' not found in enlisted_strings.xml", file_path, event_id)
-    
-    # Check option references
-    options = (event.get("options") or []) or (content.get("options") or [])
-    for option in options:
+        ctx.add_issue("warning", "reference", f"setupId '{setup_id}' not found in enlisted_strings.xml"
+                      f"{_missing_string_hint(setup_id, localization_ids)}", file_path, view.id)
+
+
+@EVENT_RULES.rule("reference.option_strings", reads=("options",))
+def _rule_option_strings(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
+    for option in view.options:
         text_id = option.get("textId")
         result_id = option.get("resultTextId")
         fail_result_id = option.get("failResultTextId") or option.get("resultTextFailureId")
@@ -419,38 +462,51 @@ def validate_references(event: Dict, file_path: str, ctx: ValidationContext, loc
         ctx.track_string_reference(fail_result_id)
         
         if text_id and text_id not in localization_ids:
-            ctx.add_issue("warning", "reference", f"textId '{text_id}' not found in enlisted_strings.xml", file_path, event_id)
+            ctx.add_issue("warning", "reference", f"textId '{text_id}' not found in enlisted_strings.xml"
+                          f"{_missing_string_hint(text_id, localization_ids)}", file_path, view.id)
         if result_id and result_id not in localization_ids:
-            ctx.add_issue("warning", "reference", f"resultTextId '{result_id}' not found in enlisted_strings.xml", file_path, event_id)
+            ctx.add_issue("warning", "reference", f"resultTextId '{result_id}' not found in enlisted_strings.xml"
+                          f"{_missing_string_hint(result_id, localization_ids)}", file_path, view.id)
         if fail_result_id and fail_result_id not in localization_ids:
-            ctx.add_issue("warning", "reference", f"failResultTextId '{fail_result_id}' not found in enlisted_strings.xml", file_path, event_id)
-    
+            ctx.add_issue("warning", "reference", f"failResultTextId '{fail_result_id}' not found in enlisted_strings.xml"
+                          f"{_missing_string_hint(fail_result_id, localization_ids)}", file_path, view.id)
+
+
+@EVENT_RULES.rule("reference.min_skills", reads=("requirements",))
+def _rule_min_skills(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
     # Check skill references in requirements
-    requirements = event.get("requirements") or {}
-    min_skills = requirements.get("minSkills") or {}
+    min_skills = view.requirements.get("minSkills") or {}
     for skill_name in min_skills.keys():
         if skill_name not in ALL_VALID_SKILLS:
             # SAFETY: Suggest close matches before flagging as error
-            from difflib import get_close_matches
-            suggestions = get_close_matches(skill_name, ALL_VALID_SKILLS, n=1, cutoff=0.6)
-            if suggestions:
+            suggestion = SKILL_SUGGESTIONS.best(skill_name, SKILL_SUGGEST_CUTOFF)
+            if suggestion:
                 ctx.add_issue("error", "reference", 
-                    f"Invalid skill in minSkills: '{skill_name}' (did you mean '{suggestions[0]}'?)", 
-                    file_path, event_id)
+                    f"Invalid skill in minSkills: '{skill_name}' (did you mean '{suggestion}'?)", 
+                    file_path, view.id)
             else:
                 ctx.add_issue("warning", "reference",
                     f"Unknown skill in minSkills: '{skill_name}' (add to VALID_SKILLS if this is a custom skill)",
-                    file_path, event_id)
-    
+                    file_path, view.id)
+
+
+@EVENT_RULES.rule("reference.world_state", reads=("requirements",))
+def _rule_world_state(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
     # Check world_state values (for order events)
-    world_states = requirements.get("world_state") or []
+    world_states = view.requirements.get("world_state") or []
     if isinstance(world_states, list):
         for ws in world_states:
             if ws not in VALID_WORLD_STATES:
-                ctx.add_issue("warning", "reference", f"Unknown world_state: '{ws}'", file_path, event_id)
-    
+                suggestion = shared_index("world_states", VALID_WORLD_STATES).best(str(ws), SKILL_SUGGEST_CUTOFF)
+                ctx.add_issue("warning", "reference", f"Unknown world_state: '{ws}'{did_you_mean(suggestion)}",
+                              file_path, view.id)
+
+
+@EVENT_RULES.rule("reference.option_skills", reads=("options",))
+def _rule_option_skills(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
+    event_id = view.id
     # Check skill XP in effects, rewards, failEffects
-    for option in options:
+    for option in view.options:
         _validate_skill_xp(option.get("effects") or {}, "effects", event_id, file_path, ctx)
         _validate_skill_xp(option.get("failEffects") or {}, "failEffects", event_id, file_path, ctx)
         _validate_skill_xp(option.get("rewards") or {}, "rewards", event_id, file_path, ctx)
@@ -465,7 +521,9 @@ def validate_references(event: Dict, file_path: str, ctx: ValidationContext, loc
             else:
                 check_skill = str(skill_check)
             if check_skill and check_skill not in VALID_SKILLS:
-                ctx.add_issue("error", "reference", f"Invalid skill in skillCheck: '{check_skill}'", file_path, event_id)
+                suggestion = SKILL_SUGGESTIONS.best(check_skill, SKILL_SUGGEST_CUTOFF)
+                ctx.add_issue("error", "reference",
+                              f"Invalid skill in skillCheck: '{check_skill}'{did_you_mean(suggestion)}", file_path, event_id)
         
         # LOGIC CHECK: Skill-gated options should use dynamic skill checks
         option_requirements = option.get("requirements") or {}
@@ -480,6 +538,11 @@ def validate_references(event: Dict, file_path: str, ctx: ValidationContext, loc
                 file_path, event_id)
 
 
+def validate_references(event: Dict, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
+    """Validate references to localization strings, skills, traits."""
+    EVENT_RULES.run(EventView(event), file_path, ctx, localization_ids, phase="reference")
+
+
 def _validate_skill_xp(obj: Dict, location: str, event_id: str, file_path: str, ctx: ValidationContext):
     """Helper to validate skillXp references in any object."""
     if not obj:
@@ -487,17 +550,18 @@ def _validate_skill_xp(obj: Dict, location: str, event_id: str, file_path: str,
     skill_xp = obj.get("skillXp") or {}
     for skill_name in skill_xp.keys():
         if skill_name not in ALL_VALID_SKILLS:
-            # Suggest proper casing
-            skill_lower = skill_name.lower()
-            suggestion = next((s for s in ALL_VALID_SKILLS if s.lower() == skill_lower), None)
-            if suggestion:
+            # A casing mistake is an error; anything else may be a custom skill
+            case_match = SKILL_SUGGESTIONS.case_match(skill_name)
+            if case_match:
                 ctx.add_issue("error", "reference", 
-                    f"Invalid skill in {location}.skillXp: '{skill_name}' (did you mean '{suggestion}'?)", 
+                    f"Invalid skill in {location}.skillXp: '{skill_name}' (did you mean '{case_match}'?)", 
                     file_path, event_id)
             else:
                 # SAFETY: Warn instead of error if might be custom skill
+                suggestion = SKILL_SUGGESTIONS.best(skill_name, SKILL_SUGGEST_CUTOFF)
                 ctx.add_issue("warning", "reference", 
-                    f"Unknown skill in {location}.skillXp: '{skill_name}' (add to validation_extensions.json if custom)", 
+                    f"Unknown skill in {location}.skillXp: '{skill_name}' (add to validation_extensions.json if custom)"
+                    f"{did_you_mean(suggestion)}", 
                     file_path, event_id)
 
 
@@ -505,127 +569,156 @@ def _validate_skill_xp(obj: Dict, location: str, event_id: str, file_path: str,
 # Phase 3: Logical Validation
 # ============================================================================
 
-def validate_logic(event: Dict, file_path: str, ctx: ValidationContext):
-    """Validate logical consistency and impossible combinations."""
-    event_id = event.get("id", "UNKNOWN")
-    order_type = event.get("order_type", "")
-    category = event.get("category", "")
-    requirements = event.get("requirements") or {}
-    
-    # Get tier requirements
+def _tier_bounds(requirements: Dict) -> Tuple[Any, Any]:
     tier_req = requirements.get("tier") or {}
-    min_tier = tier_req.get("min") or requirements.get("minTier")
-    max_tier = tier_req.get("max") or requirements.get("maxTier")
-    role = requirements.get("role", "Any")
-    
+    return (tier_req.get("min") or requirements.get("minTier"),
+            tier_req.get("max") or requirements.get("maxTier"))
+
+
+@EVENT_RULES.rule("logic.tier_role", reads=("requirements",))
+def _rule_tier_role(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
     # Rule 1: Check tier × role combinations
+    min_tier, max_tier = _tier_bounds(view.requirements)
+    role = view.requirements.get("role", "Any")
     if role in ROLE_MIN_TIERS:
         role_min = ROLE_MIN_TIERS[role]
         if min_tier and min_tier < role_min:
             ctx.add_issue("error", "logic", 
                 f"Impossible tier×role: role '{role}' requires tier {role_min}+, but minTier={min_tier}",
-                file_path, event_id)
+                file_path, view.id, "/requirements/role")
         if max_tier and max_tier < role_min:
             ctx.add_issue("error", "logic",
                 f"Impossible tier×role: role '{role}' requires tier {role_min}+, but maxTier={max_tier}",
-                file_path, event_id)
-    
+                file_path, view.id, "/requirements/role")
+
+
+@EVENT_RULES.rule("logic.decision_context", reads=("requirements",))
+def _rule_decision_context(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
     # Rule 2: Camp Hub decisions can't require Battle context
-    context = requirements.get("context", "Any")
-    if event_id.startswith("dec_") and context == "Battle":
+    context = view.requirements.get("context", "Any")
+    if view.id.startswith("dec_") and context == "Battle":
         ctx.add_issue("error", "logic",
             "Camp Hub decisions (dec_*) cannot require 'Battle' context",
-            file_path, event_id)
-    
+            file_path, view.id, "/requirements/context")
+
+
+@EVENT_RULES.rule("logic.role_skills", reads=("requirements",))
+def _rule_role_skills(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
     # Rule 3: Role-skill alignment check
-    min_skills = requirements.get("minSkills") or {}
+    role = view.requirements.get("role", "Any")
+    min_skills = view.requirements.get("minSkills") or {}
     if role == "Medic" and min_skills:
         if "Medicine" not in min_skills:
             ctx.add_issue("warning", "logic",
                 f"Role 'Medic' usually requires Medicine skill, but minSkills={list(min_skills.keys())}",
-                file_path, event_id)
+                file_path, view.id, "/requirements/minSkills")
     elif role == "Engineer" and min_skills:
         if "Engineering" not in min_skills:
             ctx.add_issue("warning", "logic",
                 f"Role 'Engineer' usually requires Engineering skill, but minSkills={list(min_skills.keys())}",
-                file_path, event_id)
-    
+                file_path, view.id, "/requirements/minSkills")
+
+
+@EVENT_RULES.rule("logic.escalation_ranges", reads=("triggers", "requirements"))
+def _rule_escalation_ranges(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
     # Rule 4: Escalation requirements range check
-    triggers = event.get("triggers") or {}
-    escalation_reqs = (triggers.get("escalation_requirements") or {}) or (requirements.get("minEscalation") or {})
+    escalation_reqs = ((view.triggers.get("escalation_requirements") or {})
+                       or (view.requirements.get("minEscalation") or {}))
     for track, value in escalation_reqs.items():
         if track in ESCALATION_TRACKS:
             min_val, max_val = ESCALATION_TRACKS[track]
             if not (min_val <= value <= max_val):
                 ctx.add_issue("error", "logic",
                     f"Escalation track '{track}' value {value} out of range ({min_val}-{max_val})",
-                    file_path, event_id)
-    
+                    file_path, view.id)
+
+
+@EVENT_RULES.rule("logic.cooldown", reads=("timing",))
+def _rule_cooldown(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
     # Rule 5: Cooldown reasonableness
-    timing = event.get("timing") or {}
-    cooldown = timing.get("cooldown_days") or timing.get("cooldownDays") or 0
+    cooldown_key = "cooldown_days" if view.timing.get("cooldown_days") else "cooldownDays"
+    cooldown = view.timing.get(cooldown_key) or 0
     if cooldown < 0:
-        ctx.add_issue("error", "logic", f"Negative cooldown: {cooldown}", file_path, event_id)
-    elif event_id.startswith("dec_rest") and cooldown > 7:
+        ctx.add_issue("error", "logic", f"Negative cooldown: {cooldown}", file_path, view.id, f"/timing/{cooldown_key}")
+    elif view.id.startswith("dec_rest") and cooldown > 7:
         ctx.add_issue("warning", "logic",
             f"Rest decisions should have short cooldowns (1-2 days), but cooldown={cooldown}",
-            file_path, event_id)
-    
+            file_path, view.id, f"/timing/{cooldown_key}")
+
+
+@EVENT_RULES.rule("logic.one_time_priority", reads=("timing",))
+def _rule_one_time_priority(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
     # Rule 6: One-time events should have high priority
-    priority = timing.get("priority", "normal")
-    one_time = timing.get("one_time") or timing.get("oneTime") or False
+    priority = view.timing.get("priority", "normal")
+    one_time = view.timing.get("one_time") or view.timing.get("oneTime") or False
     if one_time and priority in ["low", "rare"]:
         ctx.add_issue("warning", "logic",
             f"One-time event with low priority ({priority}) - should use 'high' or 'critical'",
-            file_path, event_id)
-    
+            file_path, view.id, "/timing/priority")
+
+
+@EVENT_RULES.rule("logic.order_xp", reads=("order_type", "top_level_options"), requires=("order_type",))
+def _rule_order_xp(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
     # Rule 7: Order events MUST grant XP (from schema)
-    if order_type:
-        options = event.get("options") or []
-        for option in options:
-            opt_id = option.get("id", "unknown")
-            effects = option.get("effects") or {}
-            fail_effects = option.get("failEffects") or {}
-            
-            has_xp = "skillXp" in effects or "skillXp" in fail_effects
-            if not has_xp:
-                ctx.add_issue("warning", "logic",
-                    f"Order event option '{opt_id}' grants no skillXp - players expect XP for completing orders",
-                    file_path, event_id)
+    for option in view.top_level_options:
+        opt_id = option.get("id", "unknown")
+        effects = option.get("effects") or {}
+        fail_effects = option.get("failEffects") or {}
+        
+        has_xp = "skillXp" in effects or "skillXp" in fail_effects
+        if not has_xp:
+            ctx.add_issue("warning", "logic",
+                f"Order event option '{opt_id}' grants no skillXp - players expect XP for completing orders",
+                file_path, view.id)
+
+
+def validate_logic(event: Dict, file_path: str, ctx: ValidationContext):
+    """Validate logical consistency and impossible combinations."""
+    EVENT_RULES.run(EventView(event), file_path, ctx, set(), phase="logic")
 
 
 # ============================================================================
 # Phase 4: Consistency Checks
 # ============================================================================
 
-def validate_consistency(event: Dict, file_path: str, ctx: ValidationContext):
-    """Validate flag usage and multi-stage event consistency."""
-    event_id = event.get("id", "UNKNOWN")
-    
+@EVENT_RULES.rule("consistency.flag_references", reads=("triggers",))
+def _rule_flag_references(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
     # Track flag references
-    triggers = event.get("triggers") or {}
-    for trigger_list in [triggers.get("all") or [], triggers.get("any") or [], triggers.get("none") or []]:
-        for trigger in trigger_list:
-            if trigger.startswith("has_flag:") or trigger.startswith("flag:"):
-                flag_name = trigger.replace("has_flag:", "").replace("flag:", "")
-                ctx.flag_references[flag_name].append(event_id)
-    
+    for flag_name in flags_read_by(view.triggers):
+        ctx.flag_references[flag_name].append(view.id)
+
+
+@EVENT_RULES.rule("consistency.flag_setters", reads=("options",))
+def _rule_flag_setters(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
     # Track flag setters
-    content = event.get("content") or {}
-    options = (event.get("options") or []) or (content.get("options") or [])
-    for option in options:
-        effects = option.get("effects") or {}
-        flags_set = (effects.get("setFlags") or []) or (effects.get("set_flags") or []) or (option.get("flags_set") or [])
-        for flag in flags_set:
-            ctx.flag_setters[flag].append(event_id)
+    for option in view.options:
+        for flag in flags_set_by(option):
+            ctx.flag_setters[flag].append(view.id)
+
+
+@EVENT_RULES.rule("consistency.flag_graph", reads=("triggers", "options"))
+def _rule_flag_graph(view: EventView, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
+    # Gates and per-option flag effects for the reachability analysis in validate_flag_consistency
+    node = FlagNode.from_event(view.id, file_path, view.triggers, view.options)
+    if node is not None:
+        ctx.flag_nodes.append(node)
+
+
+def validate_consistency(event: Dict, file_path: str, ctx: ValidationContext):
+    """Validate flag usage and multi-stage event consistency."""
+    EVENT_RULES.run(EventView(event), file_path, ctx, set(), phase="consistency")
 
 
 def validate_flag_consistency(ctx: ValidationContext):
     """Check for flags that are referenced but never set, or set but never referenced."""
+    set_flags = None
     for flag, references in ctx.flag_references.items():
         if flag not in ctx.flag_setters:
+            if set_flags is None:
+                set_flags = SuggestIndex(ctx.flag_setters)
             ctx.add_issue("warning", "consistency",
-                f"Flag '{flag}' referenced by {len(references)} event(s) but never set: {references[:3]}",
+                f"Flag '{flag}' referenced by {len(references)} event(s) but never set: {references[:3]}"
+                f"{did_you_mean(set_flags.best(flag, ID_SUGGEST_CUTOFF))}",
                 "flag_analysis", None)
     
     for flag, setters in ctx.flag_setters.items():
@@ -633,6 +726,45 @@ def validate_flag_consistency(ctx: ValidationContext):
             ctx.add_issue("info", "consistency",
                 f"Flag '{flag}' set by event(s) but never referenced (terminal flag?): {setters[:3]}",
                 "flag_analysis", None)
+    
+    validate_flag_reachability(ctx)
+
+
+def validate_flag_reachability(ctx: ValidationContext):
+    """Dead flags, unreachable events, gate cycles and blocking 'none' gates (see flag_graph.py)."""
+    graph = FlagGraph(ctx.flag_nodes)
+    analysis = graph.analyze()
+    
+    for flag, setters in analysis.dead_flags.items():
+        ctx.add_issue("warning", "consistency",
+            f"Flag '{flag}' is only set by events that can never fire: {setters[:3]}",
+            "flag_analysis", None)
+    
+    for events, flags in analysis.cycles:
+        ctx.add_issue("warning", "consistency",
+            f"Flag cycle {flags}: events {events[:5]} each wait for a flag set by another, so none can fire first",
+            "flag_analysis", None)
+    
+    in_cycles = {event_id for events, _ in analysis.cycles for event_id in events}
+    blocked = set()
+    for event_id, flag, required in analysis.blocking_none_gates:
+        blocked.add(event_id)
+        node = graph.nodes[event_id]
+        if required is None:
+            message = f"Event can never fire: flag '{flag}' is required by triggers.all and forbidden by triggers.none"
+        else:
+            message = (f"Event can never fire: triggers.none forbids '{flag}', which every option setting "
+                       f"required flag '{required}' also sets, and no content clears it")
+        ctx.add_issue("warning", "consistency", message, node.file, event_id)
+    
+    for event_id, missing in analysis.unreachable_events.items():
+        # Flags nobody sets are reported above ("never set"); here only the knock-on effects
+        if event_id in in_cycles or event_id in blocked or not missing:
+            continue
+        if all(flag in graph.setters for flag in missing):
+            ctx.add_issue("warning", "consistency",
+                f"Event can never fire: gate flag(s) {missing} are only set by events that can never fire",
+                graph.nodes[event_id].file, event_id)
 
 
 # ============================================================================
@@ -644,10 +776,10 @@ def detect_orphan_strings(localization_ids: Set[str], ctx: ValidationContext):
     orphan_count = 0
     orphan_samples = []
     
-    for string_id in localization_ids:
+    # Sorted so the sampled orphans are stable between runs (set order is hash-seeded)
+    for string_id in sorted(localization_ids):
         if string_id not in ctx.referenced_string_ids:
-            is_system = any(string_id.startswith(prefix) for prefix in SYSTEM_STRING_PREFIXES)
-            if not is_system:
+            if string_id not in SYSTEM_STRING_TRIE:
                 orphan_count += 1
                 if len(orphan_samples) < 30:
                     orphan_samples.append(string_id)
@@ -675,11 +807,11 @@ def detect_orphan_strings(localization_ids: Set[str], ctx: ValidationContext):
 # Phase 5.5: Opportunity Validation (including hints)
 # ============================================================================
 
-# Valid opportunity types (from event-system-schemas.md)
-VALID_OPPORTUNITY_TYPES = {"training", "social", "economic", "recovery", "special"}
+# Valid opportunity types (from schema)
+VALID_OPPORTUNITY_TYPES = set(CONTENT_SCHEMA.enum("opportunity_types"))
 
-# Valid day phases for opportunities
-VALID_DAY_PHASES = {"Dawn", "Midday", "Dusk", "Night"}
+# Valid day phases for opportunities (from schema)
+VALID_DAY_PHASES = set(CONTENT_SCHEMA.enum("day_phases"))
 
 # Placeholder tokens that should be used in hints for personalization
 RECOMMENDED_HINT_PLACEHOLDERS = {
@@ -691,7 +823,7 @@ RECOMMENDED_HINT_PLACEHOLDERS = {
 def validate_opportunities(file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
     """Validate camp_opportunities.json structure and hint fields."""
     try:
-        with open(file_path, encoding="utf-8-sig") as f:
+        with open(PROJECT_ROOT / file_path, encoding="utf-8-sig") as f:
             data = json.load(f)
     except json.JSONDecodeError as e:
         ctx.add_issue("error", "structure", f"Invalid JSON: {e}", file_path)
@@ -722,30 +854,17 @@ def validate_opportunities(file_path: str, ctx: ValidationContext, localization_
         opp_id = opp.get("id", "UNKNOWN")
 
         # Check required fields
-        if not opp_id or opp_id == "UNKNOWN":
-            ctx.add_issue("error", "structure", "Opportunity missing 'id' field", file_path)
+        if _check_opportunity("opportunity.id", opp, file_path, ctx):
             continue
 
         # Check type
-        opp_type = opp.get("type")
-        if opp_type and opp_type not in VALID_OPPORTUNITY_TYPES:
-            ctx.add_issue("warning", "structure",
-                f"Unknown opportunity type: '{opp_type}' (expected: {VALID_OPPORTUNITY_TYPES})",
-                file_path, opp_id)
+        _check_opportunity("opportunity.type", opp, file_path, ctx)
 
         # Check valid phases
-        valid_phases = opp.get("validPhases") or []
-        for phase in valid_phases:
-            if phase not in VALID_DAY_PHASES:
-                ctx.add_issue("warning", "structure",
-                    f"Unknown day phase: '{phase}' (expected: {VALID_DAY_PHASES})",
-                    file_path, opp_id)
+        _check_opportunity("opportunity.phases", opp, file_path, ctx)
         
         # Check for deprecated 'immediate' field (removed 2026-01-04)
-        if "immediate" in opp:
-            ctx.add_issue("error", "deprecated",
-                f"Field 'immediate' is deprecated (removed 2026-01-04). All opportunities now compete on fitness through orchestrator. Remove this field.",
-                file_path, opp_id)
+        _check_opportunity("opportunity.deprecated", opp, file_path, ctx)
 
         # ==================== HINT VALIDATION ====================
 
@@ -755,7 +874,8 @@ def validate_opportunities(file_path: str, ctx: ValidationContext, localization_
         # Check if hint localization exists
         if hint_id and hint_id not in localization_ids:
             ctx.add_issue("info", "reference",
-                f"hintId '{hint_id}' not found in enlisted_strings.xml (using fallback)",
+                f"hintId '{hint_id}' not found in enlisted_strings.xml (using fallback)"
+                f"{_missing_string_hint(hint_id, localization_ids)}",
                 file_path, opp_id)
 
         # Validate hint text if present
@@ -792,14 +912,7 @@ def validate_opportunities(file_path: str, ctx: ValidationContext, localization_
                     file_path, opp_id)
 
         # Check localization field order (hint should follow hintId)
-        keys = list(opp.keys())
-        if "hintId" in keys and "hint" in keys:
-            hint_id_idx = keys.index("hintId")
-            hint_idx = keys.index("hint")
-            if hint_idx != hint_id_idx + 1:
-                ctx.add_issue("info", "structure",
-                    "Fallback 'hint' should immediately follow 'hintId' (field ordering)",
-                    file_path, opp_id)
+        _check_opportunity("opportunity.field_order", opp, file_path, ctx)
 
     # Summary stats
     total_opps = len(opportunities)
@@ -811,9 +924,16 @@ def validate_opportunities(file_path: str, ctx: ValidationContext, localization_
             f"{missing}/{total_opps} opportunities missing hints (foreshadowing won't appear in Daily Brief)",
             file_path)
 
-    print(f"    Opportunities: {total_opps} total, {opps_with_hints} with hints")
-    print(f"    Hint categories: {camp_rumors} camp rumors, {personal_hints} personal hints")
-    print(f"    Placeholder usage: {hints_with_placeholders} with, {hints_without_placeholders} without")
+    ctx.progress(f"    Opportunities: {total_opps} total, {opps_with_hints} with hints")
+    ctx.progress(f"    Hint categories: {camp_rumors} camp rumors, {personal_hints} personal hints")
+    ctx.progress(f"    Placeholder usage: {hints_with_placeholders} with, {hints_without_placeholders} without")
+
+
+def _check_opportunity(rule: str, opp: Dict, file_path: str, ctx: ValidationContext) -> bool:
+    """Run one rule's compiled schema checks for an opportunity; True if it found issues."""
+    issues = CONTENT_SCHEMA.kind(KIND_OPPORTUNITY).check(rule, opp)
+    _add_schema_issues(issues, file_path, ctx, opp.get("id", "UNKNOWN"))
+    return bool(issues)
 
 
 def _is_personal_hint(hint: str) -> bool:
@@ -838,62 +958,22 @@ def _is_personal_hint(hint: str) -> bool:
 # ============================================================================
 
 def validate_config_files(ctx: ValidationContext):
-    """Validate configuration JSON files."""
+    """Validate configuration JSON files against their typed models (see config_models.py)."""
     config_path = Path("ModuleData/Enlisted/Config")
-    if not config_path.exists():
-        return
-    
-    print("[Phase 6] Validating config files...")
-    
-    # Validate baggage_config.json
-    baggage_config = config_path / "baggage_config.json"
-    if baggage_config.exists():
-        _validate_baggage_config(baggage_config, ctx)
-    
-    # Validate other config files
-    for config_file in config_path.glob("*.json"):
-        _validate_generic_config(config_file, ctx)
-
-
-def _validate_baggage_config(file_path: Path, ctx: ValidationContext):
-    """Validate baggage_config.json structure and values."""
-    try:
-        with open(file_path, encoding="utf-8-sig") as f:
-            config = json.load(f)
-    except Exception as e:
-        ctx.add_issue("error", "config", f"Failed to parse: {e}", str(file_path))
+    if not (PROJECT_ROOT / config_path).exists():
         return
     
-    required_sections = ["access_windows", "timing", "emergency_access", "rank_gates", "lockdown", "events"]
-    for section in required_sections:
-        if section not in config:
-            ctx.add_issue("warning", "config", f"Missing section: '{section}'", str(file_path))
-    
-    if "timing" in config:
-        timing = config["timing"]
-        if timing.get("caught_up_chance_percent", 0) > 100:
-            ctx.add_issue("error", "config", "caught_up_chance_percent cannot exceed 100", str(file_path))
+    ctx.progress("[Phase 6] Validating config files...")
     
-    if "lockdown" in config:
-        lockdown = config["lockdown"]
-        threshold = lockdown.get("supply_threshold_percent", 0)
-        if threshold < 0 or threshold > 100:
-            ctx.add_issue("error", "config", f"supply_threshold_percent out of range: {threshold}", str(file_path))
-    
-    if "rank_gates" in config:
-        gates = config["rank_gates"]
-        for key, value in gates.items():
-            if isinstance(value, int) and (value < 1 or value > 9):
-                ctx.add_issue("error", "config", f"Tier value out of range (1-9): {key}={value}", str(file_path))
-
-
-def _validate_generic_config(file_path: Path, ctx: ValidationContext):
-    """Generic JSON config validation (syntax only)."""
-    try:
-        with open(file_path, encoding="utf-8-sig") as f:
-            json.load(f)
-    except json.JSONDecodeError as e:
-        ctx.add_issue("error", "config", f"Invalid JSON: {e}", str(file_path))
+    for config_file in sorted((PROJECT_ROOT / config_path).glob("*.json")):
+        file_path = str(config_path / config_file.name)
+        try:
+            loaded = load_config(config_file)
+        except OSError as e:
+            ctx.add_issue("error", "config", f"Failed to read: {e}", file_path)
+            continue
+        for issue in loaded.issues:
+            ctx.add_issue(issue.severity, "config", str(issue), file_path, pointer=issue.pointer)
 
 
 # ============================================================================
@@ -927,7 +1007,7 @@ ALLOWED_ROOT_DIRS = {
 }
 
 
-def validate_csproj(ctx: ValidationContext):
+def validate_csproj(ctx: ValidationContext, cs_index: Optional[CSharpSourceIndex] = None):
     """
     Validate project structure and .csproj file completeness.
     
@@ -937,12 +1017,12 @@ def validate_csproj(ctx: ValidationContext):
     3. GUI assets are properly included
     4. No rogue files in root directory
     """
-    csproj_path = Path("Enlisted.csproj")
+    csproj_path = PROJECT_ROOT / "Enlisted.csproj"
     if not csproj_path.exists():
         ctx.add_issue("error", "project", "Enlisted.csproj not found", "Enlisted.csproj")
         return
     
-    print("[Phase 7] Validating project structure...")
+    ctx.progress("[Phase 7] Validating project structure...")
     
     try:
         # Parse .csproj XML (handle MSBuild namespace)
@@ -962,7 +1042,7 @@ def validate_csproj(ctx: ValidationContext):
                 if "*" in normalized:
                     # Wildcard - expand it
                     pattern = normalized.replace("/", os.sep)
-                    for match in glob.glob(pattern, recursive=True):
+                    for match in glob.glob(pattern, root_dir=PROJECT_ROOT, recursive=True):
                         compile_includes.add(Path(match).as_posix())
                 else:
                     compile_includes.add(normalized)
@@ -975,7 +1055,7 @@ def validate_csproj(ctx: ValidationContext):
                 normalized = include.replace("\\", "/")
                 if "*" in normalized:
                     pattern = normalized.replace("/", os.sep)
-                    for match in glob.glob(pattern, recursive=True):
+                    for match in glob.glob(pattern, root_dir=PROJECT_ROOT, recursive=True):
                         none_includes.add(Path(match).as_posix())
                 else:
                     none_includes.add(normalized)
@@ -989,11 +1069,10 @@ def validate_csproj(ctx: ValidationContext):
                 content_includes.add(normalized)
         
         # --- Check 1: All .cs files in src/ are in .csproj ---
-        src_path = Path("src")
-        if src_path.exists():
-            actual_cs_files = set()
-            for cs_file in src_path.rglob("*.cs"):
-                actual_cs_files.add(cs_file.as_posix())
+        if cs_index is None:
+            cs_index = CSharpSourceIndex.build(base=PROJECT_ROOT)
+        if cs_index.root_exists:
+            actual_cs_files = set(cs_index.posix_paths())
             
             # Find .cs files not in .csproj
             missing_from_csproj = actual_cs_files - compile_includes
@@ -1010,18 +1089,18 @@ def validate_csproj(ctx: ValidationContext):
         # --- Check 2: All compiled files in .csproj exist ---
         for include in compile_includes:
             if "*" not in include:  # Skip wildcards
-                file_path = Path(include.replace("/", os.sep))
+                file_path = PROJECT_ROOT / include.replace("/", os.sep)
                 if not file_path.exists():
                     ctx.add_issue("error", "project",
                         f"File in .csproj does not exist: {include} (remove from .csproj or restore file)",
                         "Enlisted.csproj")
         
         # --- Check 3: GUI assets are properly included ---
-        gui_path = Path("GUI")
+        gui_path = PROJECT_ROOT / "GUI"
         if gui_path.exists():
             actual_gui_files = set()
             for xml_file in gui_path.rglob("*.xml"):
-                actual_gui_files.add(xml_file.as_posix())
+                actual_gui_files.add(xml_file.relative_to(PROJECT_ROOT).as_posix())
             
             missing_gui = actual_gui_files - content_includes
             for missing in sorted(missing_gui):
@@ -1030,7 +1109,7 @@ def validate_csproj(ctx: ValidationContext):
                     "Enlisted.csproj")
         
         # --- Check 4: No rogue files in root directory ---
-        root_path = Path(".")
+        root_path = PROJECT_ROOT
         rogue_files = []
         rogue_dirs = []
         
@@ -1072,11 +1151,11 @@ def validate_csproj(ctx: ValidationContext):
                 "Enlisted.csproj")
         
         # --- Check 5: Tools documentation coverage ---
-        tools_path = Path("Tools")
+        tools_path = PROJECT_ROOT / "Tools"
         if tools_path.exists():
             tools_md_files = set()
             for md_file in tools_path.rglob("*.md"):
-                tools_md_files.add(md_file.as_posix())
+                tools_md_files.add(md_file.relative_to(PROJECT_ROOT).as_posix())
             
             # Check if Tools README exists
             if not (tools_path / "README.md").exists():
@@ -1095,7 +1174,7 @@ def validate_csproj(ctx: ValidationContext):
         csproj_content = csproj_path.read_text(encoding='utf-8')
         
         for source_dir, item_group_name, pattern in content_dirs_to_check:
-            source_path = Path(source_dir.replace("/", os.sep))
+            source_path = PROJECT_ROOT / source_dir.replace("/", os.sep)
             if source_path.exists():
                 # Directory exists in source - check if .csproj will deploy it
                 has_itemgroup = item_group_name in csproj_content
@@ -1137,7 +1216,8 @@ def validate_csproj(ctx: ValidationContext):
 # Phase 8: Code Quality Validation (Sea Context Detection)
 # ============================================================================
 
-def validate_code_quality(ctx: ValidationContext):
+def validate_code_quality(ctx: ValidationContext, cs_index: Optional[CSharpSourceIndex] = None,
+                          use_cache: bool = True):
     """
     Validate C# code for common anti-patterns and bugs.
     
@@ -1147,22 +1227,30 @@ def validate_code_quality(ctx: ValidationContext):
     2. Hardcoded module paths that break Steam Workshop installs
        (must use ModulePaths utility instead of hardcoded "Modules", "Enlisted" paths)
     
-    Guard patterns recognized:
+    Guards are found from the block structure of the enclosing method, not a
+    fixed line window (see _sea_guard_spans):
     - Direct: party.CurrentSettlement == null && party.BesiegedSettlement == null && party.IsCurrentlyAtSea
-    - Early-return: if (settlement != null) return; ... if (IsCurrentlyAtSea) (within 20 lines)
+    - Enclosing condition: if (party.CurrentSettlement == null) { ... IsCurrentlyAtSea ... }
+    - Early-return: if (settlement != null) return; ... if (IsCurrentlyAtSea) (anywhere earlier in the method)
     - Alternative siege: BesiegerCamp, SiegeEvent, Party?.SiegeEvent
     
     Whitelisted patterns:
     - Diagnostic/logging only (ModLogger.Debug/Info, AtSea= in log strings)
     - Harmony patches that report raw values for debugging
+    
+    Per-file results are cached by content hash (.cache/sea_guards.json).
     """
-    print("[Phase 8] Validating code quality patterns...")
+    ctx.progress("[Phase 8] Validating code quality patterns...")
+    
+    if cs_index is None:
+        cs_index = CSharpSourceIndex.build(base=PROJECT_ROOT)
     
     # Check 1: Hardcoded module paths (breaks Steam Workshop)
-    _validate_no_hardcoded_paths(ctx)
+    started = time.perf_counter()
+    _validate_no_hardcoded_paths(ctx, cs_index)
+    ctx.timings["8.hardcoded_paths"] += time.perf_counter() - started
     
-    src_path = Path("src")
-    if not src_path.exists():
+    if not cs_index.root_exists:
         ctx.add_issue("warning", "project", "Source directory not found, skipping code quality checks", "src/")
         return
     
@@ -1171,99 +1259,39 @@ def validate_code_quality(ctx: ValidationContext):
         'NavalNavigationCapabilityPatch.cs',  # Harmony patch - diagnostic logging only
     }
     
-    cs_files = list(src_path.rglob("*.cs"))
+    cs_files = cs_index.files
+    cache = HashKeyedCache.load("sea_guards", sea_guard_cache_fingerprint()) if use_cache else None
     issues_found = 0
     files_with_issues = set()
+    started = time.perf_counter()
     
     for cs_file in cs_files:
         # Skip whitelisted files entirely
         if cs_file.name in WHITELISTED_FILES:
             continue
-            
-        try:
-            content = cs_file.read_text(encoding='utf-8')
-            lines = content.split('\n')
-        except Exception as e:
+        if not cs_file.readable:
             continue  # Skip unreadable files
+        if 'IsCurrentlyAtSea' not in cs_file.text:
+            continue
         
-        for i, line in enumerate(lines):
-            # Skip comments
-            if line.strip().startswith('//') or line.strip().startswith('*'):
-                continue
-            
-            # Look for IsCurrentlyAtSea usage
-            if 'IsCurrentlyAtSea' not in line:
-                continue
-            
-            # Skip if this line is purely diagnostic logging
-            if _is_diagnostic_logging(line):
-                continue
-            
-            # Extract extended context for early-return pattern detection
-            # Look 20 lines back for guards (early-return patterns)
-            # Look 10 lines forward for context
-            guard_start = max(0, i - 20)
-            context_end = min(len(lines), i + 11)
-            
-            guard_context = '\n'.join(lines[guard_start:i])  # Lines before (for early-return guards)
-            full_context = '\n'.join(lines[guard_start:context_end])  # Full context
-            
-            # Check for proper safety patterns
-            has_settlement = _has_settlement_guard(guard_context, full_context)
-            has_siege = _has_siege_guard(guard_context, full_context)
-            
-            # If both guards present (directly or via early-return), it's OK
-            if has_settlement and has_siege:
-                continue
-            
-            # Check if this is UI-only (lower risk)
-            is_ui_only = any(keyword in full_context for keyword in [
-                'conversation_scene_sea', 'seaConversationScene', 
-                'OpenConversationMission', 'CampaignMission.Open',
-                'CampaignMapConversation'  # Scene selection for conversations
-            ])
-            
-            # Check if this is game state sync (intentional, not content filtering)
-            # Patterns:
-            # - Assignment: main.IsCurrentlyAtSea = lordParty.IsCurrentlyAtSea (syncing sea state)
-            # - Comparison for sync: main.IsCurrentlyAtSea != lordParty.IsCurrentlyAtSea (checking mismatch to fix)
-            # - Naval battle context: IsNavalMapEvent && ... IsCurrentlyAtSea (battle state handling)
-            is_state_sync = bool(re.search(r'IsCurrentlyAtSea\s*=\s*\w+\.IsCurrentlyAtSea', line))
-            is_sync_check = bool(re.search(r'IsCurrentlyAtSea\s*!=\s*\w+\.IsCurrentlyAtSea', line))
-            is_naval_battle = 'IsNavalMapEvent' in full_context and 'IsCurrentlyAtSea' in line
-            if is_state_sync or is_sync_check or is_naval_battle:
-                continue  # State sync/battle handling is intentional, skip validation
-            
-            # Check if this is content filtering (high risk)
-            is_content_filter = any(keyword in full_context for keyword in [
-                'isAtSea', 'atSea', 'NotAtSea', 'variant', 'filter', 
-                'eligible', 'available', 'requirement', 'DetectTravelContext'
-            ])
-            
-            # UI scene selection is not content filtering (just visual choice)
-            if is_ui_only:
-                is_content_filter = False
-            
-            # Determine severity
-            if is_content_filter and not has_settlement and not has_siege:
-                # Content filtering without guards - critical
-                severity = "error"
-                issues_found += 1
-                files_with_issues.add(str(cs_file))
-            elif is_ui_only and (has_settlement or has_siege):
-                continue  # UI with at least one guard is acceptable
-            elif has_settlement or has_siege:
-                severity = "warning"
-                issues_found += 1
-            else:
-                severity = "warning"
-                issues_found += 1
-            
+        findings = cache.get(cs_file.sha256) if cache else None
+        if findings is None:
+            findings = _find_unguarded_sea_checks(cs_file)
+            if cache:
+                cache.put(cs_file.sha256, findings)
+        
+        for line_number, severity, has_settlement, has_siege in findings:
+            issues_found += 1
+            files_with_issues.add(str(cs_file.path))
             guard_status = f"Settlement={has_settlement}, Siege={has_siege}"
             ctx.add_issue(severity, "code_quality",
-                f"Line {i+1}: IsCurrentlyAtSea without full settlement/siege guards ({guard_status}). "
+                f"Line {line_number}: IsCurrentlyAtSea without full settlement/siege guards ({guard_status}). "
                 f"Add: party.CurrentSettlement == null && party.BesiegedSettlement == null",
-                str(cs_file), None)
+                str(cs_file.path), None)
+    
+    if cache:
+        cache.save()
+    ctx.timings["8.sea_context"] += time.perf_counter() - started
     
     if issues_found == 0:
         ctx.add_issue("info", "code_quality", 
@@ -1276,7 +1304,161 @@ def validate_code_quality(ctx: ValidationContext):
             "src/")
 
 
-def _validate_no_hardcoded_paths(ctx: ValidationContext):
+def sea_guard_cache_fingerprint() -> str:
+    """Everything besides the C# file itself that the sea guard findings depend on."""
+    return fingerprint([
+        Path(__file__).read_text(encoding="utf-8"),
+        Path(__file__).with_name("csharp_index.py").read_text(encoding="utf-8"),
+    ])
+
+
+SEA_CHECK_PATTERN = re.compile(r'\bIsCurrentlyAtSea\b')
+_EXIT_STATEMENT = re.compile(r'(?:return|continue|break|throw|yield\s+break)\b')
+_LOCAL_DECLARATION = re.compile(r'(?:var|bool)\s+(\w+)\s*=[^=]')
+_IF_STATEMENT = re.compile(r'if\s*\(')
+_ELSE_STATEMENT = re.compile(r'else\b')
+
+
+def _find_unguarded_sea_checks(cs_file) -> List[List[Any]]:
+    """
+    [line, severity, has_settlement, has_siege] for every IsCurrentlyAtSea use in
+    one file that is not dominated by both guards.
+    """
+    findings = []
+    text = cs_file.text
+    structure = cs_file.structure
+    checked_lines = set()
+    for match in SEA_CHECK_PATTERN.finditer(text):
+        offset = match.start()
+        # Skip comments and strings
+        if not cs_file.is_code(offset):
+            continue
+        # One finding per line, like the line-based check this replaced
+        line_number = cs_file.line_of(offset)
+        if line_number in checked_lines:
+            continue
+        checked_lines.add(line_number)
+        line = cs_file.lines[line_number - 1]
+        
+        # Skip if this line is purely diagnostic logging
+        if _is_diagnostic_logging(line):
+            continue
+        
+        # Check for proper safety patterns (comments and strings blanked)
+        guard_spans = _sea_guard_spans(structure, offset)
+        guard_code = "\n".join(structure.code[start:end] for start, end in guard_spans)
+        has_settlement = _has_settlement_guard(guard_code)
+        has_siege = _has_siege_guard(guard_code)
+        
+        # If both guards present (directly or via early-return), it's OK
+        if has_settlement and has_siege:
+            continue
+        
+        # Context keywords: the whole statement using the check (e.g. the body of
+        # `if (IsCurrentlyAtSea) { ... }`) and the headers of the blocks around it
+        # up to the method signature
+        block_index = structure.block_at(offset)
+        statement = structure.statement_at(block_index, offset)
+        context_spans = [statement[:2]] if statement else []
+        for index in structure.ancestors(block_index):
+            block = structure.blocks[index]
+            context_spans.append((block.header_start, block.start))
+            if block.kind in (BLOCK_MEMBER, BLOCK_TYPE):
+                break
+        scope_text = "\n".join(text[start:end] for start, end in context_spans)
+        
+        # Check if this is UI-only (lower risk)
+        is_ui_only = any(keyword in scope_text for keyword in [
+            'conversation_scene_sea', 'seaConversationScene', 
+            'OpenConversationMission', 'CampaignMission.Open',
+            'CampaignMapConversation'  # Scene selection for conversations
+        ])
+        
+        # Check if this is game state sync (intentional, not content filtering)
+        # Patterns:
+        # - Assignment: main.IsCurrentlyAtSea = lordParty.IsCurrentlyAtSea (syncing sea state)
+        # - Comparison for sync: main.IsCurrentlyAtSea != lordParty.IsCurrentlyAtSea (checking mismatch to fix)
+        # - Naval battle context: IsNavalMapEvent && ... IsCurrentlyAtSea (battle state handling)
+        is_state_sync = bool(re.search(r'IsCurrentlyAtSea\s*=\s*\w+\.IsCurrentlyAtSea', line))
+        is_sync_check = bool(re.search(r'IsCurrentlyAtSea\s*!=\s*\w+\.IsCurrentlyAtSea', line))
+        is_naval_battle = 'IsNavalMapEvent' in scope_text
+        if is_state_sync or is_sync_check or is_naval_battle:
+            continue  # State sync/battle handling is intentional, skip validation
+        
+        # Check if this is content filtering (high risk)
+        is_content_filter = any(keyword in scope_text for keyword in [
+            'isAtSea', 'atSea', 'NotAtSea', 'variant', 'filter', 
+            'eligible', 'available', 'requirement', 'DetectTravelContext'
+        ])
+        
+        # UI scene selection is not content filtering (just visual choice)
+        if is_ui_only:
+            is_content_filter = False
+        
+        # Determine severity
+        if is_content_filter and not has_settlement and not has_siege:
+            # Content filtering without guards - critical
+            severity = "error"
+        elif is_ui_only and (has_settlement or has_siege):
+            continue  # UI with at least one guard is acceptable
+        else:
+            severity = "warning"
+        findings.append([line_number, severity, has_settlement, has_siege])
+    return findings
+
+
+def _sea_guard_spans(structure, offset: int) -> List[Tuple[int, int]]:
+    """
+    (start, end) spans of the code that guards offset within its method:
+    - the statement containing it (including multi-line conditions)
+    - the conditions of enclosing if/else/while/... blocks, with the earlier
+      branches of an else-if chain
+    - earlier early-exit statements (if (...) return/continue/break/throw) and
+      plain statements such as bool locals, in every enclosing block
+    - later statements reading a bool local the check is assigned to
+    """
+    spans = []
+    blocks = structure.blocks
+    innermost = structure.block_at(offset)
+    position = offset
+    for index in structure.ancestors(innermost):
+        block = blocks[index]
+        statements = block.statements
+        statement = structure.statement_at(index, position)
+        limit = statement[0] if statement else position
+        for sibling in statements:
+            if sibling[0] >= limit:
+                break
+            is_if = _IF_STATEMENT.match(structure.statement_text(sibling))
+            if (sibling[2] < 0 and not is_if) or (is_if and _exits_early(structure, sibling)):
+                spans.append(structure.statement_span(sibling))
+        if statement:
+            spans.append(structure.statement_span(statement))
+            at = statements.index(statement)
+            # else / else if: the conditions of the earlier branches hold too
+            while _ELSE_STATEMENT.match(structure.statement_text(statements[at])) and at > 0:
+                at -= 1
+                spans.append(structure.statement_span(statements[at]))
+            local = _LOCAL_DECLARATION.match(structure.statement_text(statement)) if index == innermost else None
+            if local:
+                name = re.compile(rf'\b{local.group(1)}\b')
+                spans.extend(structure.statement_span(later) for later in statements
+                             if later[0] > statement[0] and name.search(structure.statement_text(later)))
+        if block.kind in (BLOCK_MEMBER, BLOCK_TYPE):
+            break
+        position = block.start
+    return spans
+
+
+def _exits_early(structure, statement) -> bool:
+    """if (...) return; or if (...) { ...; return; } at the top level of its body."""
+    if statement[2] < 0:
+        return bool(_EXIT_STATEMENT.search(structure.statement_text(statement)))
+    return any(_EXIT_STATEMENT.match(structure.statement_text(child).lstrip())
+               for child in structure.blocks[statement[2]].statements)
+
+
+def _validate_no_hardcoded_paths(ctx: ValidationContext, cs_index: Optional[CSharpSourceIndex] = None):
     """
     Check for hardcoded module paths that break Steam Workshop installs.
     
@@ -1292,8 +1474,9 @@ def _validate_no_hardcoded_paths(ctx: ValidationContext):
     - Comments and string literals in documentation/logging
     - Test files
     """
-    src_path = Path("src")
-    if not src_path.exists():
+    if cs_index is None:
+        cs_index = CSharpSourceIndex.build(base=PROJECT_ROOT)
+    if not cs_index.root_exists:
         return
     
     # Files that are allowed to have the hardcoded patterns (they ARE the fix)
@@ -1318,21 +1501,22 @@ def _validate_no_hardcoded_paths(ctx: ValidationContext):
          'Hardcoded path string with Modules/Enlisted - use ModulePaths utility'),
     ]
     
-    cs_files = list(src_path.rglob("*.cs"))
+    cs_files = cs_index.files
     issues_found = 0
     
     for cs_file in cs_files:
         # Skip whitelisted files
         if cs_file.name in WHITELISTED_FILES:
             continue
-        
-        try:
-            content = cs_file.read_text(encoding='utf-8')
-            lines = content.split('\n')
-        except Exception:
+        if not cs_file.readable:
+            continue
+        # Every pattern needs a literal "Modules" - skip files/lines without one
+        if "modules" not in cs_file.text.lower():
             continue
         
-        for i, line in enumerate(lines):
+        for i, line in enumerate(cs_file.lines):
+            if "modules" not in line.lower():
+                continue
             # Skip pure comments
             stripped = line.strip()
             if stripped.startswith('//') or stripped.startswith('*') or stripped.startswith('///'):
@@ -1346,7 +1530,7 @@ def _validate_no_hardcoded_paths(ctx: ValidationContext):
                         f"Line {i+1}: HARDCODED MODULE PATH - {message}. "
                         f"This breaks Steam Workshop installs! "
                         f"Workshop users get files in steamapps/workshop/content/, not Modules/.",
-                        str(cs_file), None)
+                        str(cs_file.path), None)
                     break  # Only report first match per line
     
     if issues_found == 0:
@@ -1377,12 +1561,12 @@ def _is_diagnostic_logging(line: str) -> bool:
     return False
 
 
-def _has_settlement_guard(guard_context: str, full_context: str) -> bool:
-    """Check for CurrentSettlement guard in context."""
-    return bool(re.search(r'CurrentSettlement\s*[!=]=\s*null', full_context, re.IGNORECASE))
+def _has_settlement_guard(guard_code: str) -> bool:
+    """Check for CurrentSettlement guard in the guarding code."""
+    return bool(re.search(r'CurrentSettlement\s*[!=]=\s*null', guard_code, re.IGNORECASE))
 
 
-def _has_siege_guard(guard_context: str, full_context: str) -> bool:
+def _has_siege_guard(guard_code: str) -> bool:
     """
     Check for siege guard in context.
     Recognizes multiple equivalent patterns:
@@ -1397,7 +1581,7 @@ def _has_siege_guard(guard_context: str, full_context: str) -> bool:
         r'Party\??\s*\.\s*SiegeEvent\s*[!=]=\s*null',
     ]
     for pattern in siege_patterns:
-        if re.search(pattern, full_context, re.IGNORECASE):
+        if re.search(pattern, guard_code, re.IGNORECASE):
             return True
     return False
 
@@ -1406,7 +1590,8 @@ def _has_siege_guard(guard_context: str, full_context: str) -> bool:
 # Phase 9: C# TextObject Localization Validation
 # ============================================================================
 
-def validate_csharp_textobjects(ctx: ValidationContext, localization_ids: Set[str]):
+def validate_csharp_textobjects(ctx: ValidationContext, localization_ids: Set[str],
+                                cs_index: Optional[CSharpSourceIndex] = None):
     """
     Scan C# files for TextObject("{=string_id}...") patterns and verify
     that string_ids exist in enlisted_strings.xml.
@@ -1419,10 +1604,11 @@ def validate_csharp_textobjects(ctx: ValidationContext, localization_ids: Set[st
     - test_ (test messages)
     - internal_ (internal system messages)
     """
-    print("[Phase 9] Validating C# TextObject string references...")
+    ctx.progress("[Phase 9] Validating C# TextObject string references...")
     
-    src_path = Path("src")
-    if not src_path.exists():
+    if cs_index is None:
+        cs_index = CSharpSourceIndex.build(base=PROJECT_ROOT)
+    if not cs_index.root_exists:
         ctx.add_issue("info", "project", "Source directory not found, skipping C# TextObject checks", "src/")
         return
     
@@ -1435,7 +1621,6 @@ def validate_csharp_textobjects(ctx: ValidationContext, localization_ids: Set[st
     # Pattern to match TextObject("{=string_id}...") where string_id is captured
     # Matches: new TextObject("{=my_string_id}Some fallback text")
     # Also matches: TextObject("{=my_string_id}...")
-    textobject_pattern = re.compile(r'TextObject\s*\(\s*["\']?\{=([a-zA-Z0-9_]+)\}', re.MULTILINE)
     
     total_refs = 0
     missing_refs = 0
@@ -1443,42 +1628,38 @@ def validate_csharp_textobjects(ctx: ValidationContext, localization_ids: Set[st
     files_scanned = 0
     missing_by_file = defaultdict(list)
     
-    for cs_file in src_path.rglob("*.cs"):
+    for cs_file in cs_index:
         # Skip whitelisted files (debug tools)
         if cs_file.name in WHITELIST_FILES:
             continue
+        
+        if not cs_file.readable:
+            ctx.add_issue("warning", "code_quality", 
+                f"Failed to read file for TextObject scan: {cs_file.error}", 
+                str(cs_file.path))
+            continue
+        files_scanned += 1
+        
+        # Find all TextObject string references
+        for string_id, _ in TEXTOBJECT_PATTERN.findall(cs_file.text):
+            total_refs += 1
+            ctx.track_string_reference(string_id)
             
-        try:
-            content = cs_file.read_text(encoding='utf-8-sig')
-            files_scanned += 1
-            
-            # Find all TextObject string references
-            matches = textobject_pattern.findall(content)
+            # Skip whitelisted prefixes (debug strings)
+            if string_id.startswith(WHITELIST_PREFIXES):
+                skipped_debug += 1
+                continue
             
-            for string_id in matches:
-                total_refs += 1
-                ctx.track_string_reference(string_id)
-                
-                # Skip whitelisted prefixes (debug strings)
-                if string_id.startswith(WHITELIST_PREFIXES):
-                    skipped_debug += 1
-                    continue
-                
-                if string_id not in localization_ids:
-                    missing_refs += 1
-                    relative_path = str(cs_file.relative_to(Path(".")))
-                    missing_by_file[relative_path].append(string_id)
-                    
-        except Exception as e:
-            ctx.add_issue("warning", "code_quality", 
-                f"Failed to read file for TextObject scan: {e}", 
-                str(cs_file))
+            if string_id not in localization_ids:
+                missing_refs += 1
+                missing_by_file[str(cs_file.path)].append(string_id)
     
     # Report missing string references
     for file_path, missing_ids in sorted(missing_by_file.items()):
         for string_id in missing_ids:
             ctx.add_issue("warning", "reference",
-                f"TextObject string '{string_id}' not found in enlisted_strings.xml",
+                f"TextObject string '{string_id}' not found in enlisted_strings.xml"
+                f"{_missing_string_hint(string_id, localization_ids)}",
                 file_path, string_id)
     
     # Summary info
@@ -1494,69 +1675,110 @@ def validate_camp_schedule_descriptions(ctx: ValidationContext):
     These descriptions are displayed to the player in status forecasts.
     """
     schedule_path = Path("ModuleData/Enlisted/Config/camp_schedule.json")
-    if not schedule_path.exists():
+    if not (PROJECT_ROOT / schedule_path).exists():
         return
     
     try:
-        with open(schedule_path, encoding='utf-8-sig') as f:
-            data = json.load(f)
-    except Exception as e:
+        loaded = load_config(PROJECT_ROOT / schedule_path)
+    except OSError as e:
         ctx.add_issue("warning", "config", f"Failed to read camp_schedule.json: {e}", str(schedule_path))
         return
+    schedule = loaded.model
+    if schedule is None:
+        ctx.add_issue("warning", "config", f"Failed to read camp_schedule.json: {loaded.issues[0]}", str(schedule_path))
+        return
     
-    phases = data.get("phases", {})
-    for phase_name, phase_data in phases.items():
-        # Check slot1 description
-        slot1 = phase_data.get("slot1", {})
-        slot1_desc = slot1.get("description", "")
-        if not slot1_desc or len(slot1_desc) < 5:
-            ctx.add_issue("warning", "config",
-                f"Phase '{phase_name}' slot1 has empty or too short description",
-                str(schedule_path), phase_name)
-        
-        # Check slot2 description
-        slot2 = phase_data.get("slot2", {})
-        slot2_desc = slot2.get("description", "")
-        if not slot2_desc or len(slot2_desc) < 5:
-            ctx.add_issue("warning", "config",
-                f"Phase '{phase_name}' slot2 has empty or too short description",
-                str(schedule_path), phase_name)
+    for phase_name, phase_data in (schedule.phases or {}).items():
+        if phase_data is None:
+            continue
+        for slot_name in ("slot1", "slot2"):
+            slot = getattr(phase_data, slot_name)
+            description = slot.description if slot is not None else ""
+            if not description or len(description) < 5:
+                ctx.add_issue("warning", "config",
+                    f"Phase '{phase_name}' {slot_name} has empty or too short description",
+                    str(schedule_path), phase_name)
         
         # Check flavor text (optional but recommended)
-        flavor = phase_data.get("flavor", "")
-        if not flavor:
+        if not phase_data.flavor:
             ctx.add_issue("info", "config",
                 f"Phase '{phase_name}' has no flavor text (optional)",
                 str(schedule_path), phase_name)
 
 
+# ============================================================================
+# Phase 10: ID Registry (every content and dialogue namespace)
+# ============================================================================
+
+def validate_id_registry(ctx: ValidationContext, use_cache: bool = True):
+    """
+    Report ID collisions across orders, opportunities, incidents, overrides,
+    conditions, injuries and dialogue nodes (see id_registry.py).
+
+    Event ID duplicates and JSON errors in files another phase already parses
+    are left to that phase.
+    """
+    ctx.progress("[Phase 10] Checking IDs across content namespaces...")
+    registry = load_registry(rebuild=not use_cache)
+
+    for file_path, error in sorted(registry.file_errors.items()):
+        if namespace_for(file_path).parsed_by is None:
+            ctx.add_issue("error", "structure", f"Invalid JSON: {error}", file_path)
+
+    for collision in registry.collisions():
+        first, other = collision.first, collision.other
+        if collision.shared:
+            ctx.add_issue("info", "consistency",
+                f"ID '{collision.id}' is used by both {first.namespace} ({first.location()}) and {other.namespace} definitions (ambiguous in logs and lookups)",
+                other.file, collision.id)
+        elif NAMESPACES_BY_NAME[other.namespace].duplicates_by:
+            continue
+        elif other.namespace == "dialogue":
+            ctx.add_issue("warning", "consistency",
+                f"Dialogue node '{collision.id}' repeats the context of the variant at {first.location()} (only one can ever be chosen)",
+                other.file, collision.id)
+        else:
+            ctx.add_issue("error", "consistency",
+                f"Duplicate {other.namespace} ID '{collision.id}' (first defined at {first.location()})",
+                other.file, collision.id)
+
+
 # ============================================================================
 # Main Validation Pipeline
 # ============================================================================
 
+# Content files at least this large are validated event by event (json_stream.py)
+# instead of being loaded whole; --stream lowers it to 0
+STREAM_MIN_BYTES = 4 * 1024 * 1024
+
+
 def validate_event_file(file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
     """Validate a single event JSON file."""
     try:
-        with open(file_path, encoding="utf-8-sig") as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        ctx.add_issue("error", "structure", f"Invalid JSON: {e}", file_path)
-        return
+        stream = os.path.getsize(PROJECT_ROOT / file_path) >= STREAM_MIN_BYTES
+        if not stream:
+            with open(PROJECT_ROOT / file_path, encoding="utf-8-sig") as f:
+                text = f.read()
     except Exception as e:
         ctx.add_issue("error", "structure", f"Failed to read file: {e}", file_path)
         return
+    if stream:
+        validate_event_stream(file_path, ctx, localization_ids)
+    else:
+        validate_event_text(text, file_path, ctx, localization_ids)
+
+
+def validate_event_text(text: str, file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
+    """Validate the contents of an event JSON file (an unsaved editor buffer, for content_lsp.py)."""
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        ctx.add_issue("error", "structure", f"Invalid JSON: {e}", file_path)
+        return
     
     # SAFETY: Check schema version
     if isinstance(data, dict):
-        schema_version = data.get("schemaVersion", 0)
-        if schema_version == 1:
-            ctx.add_issue("info", "structure",
-                "Using schema v1 (deprecated). Consider migrating to schema v2.",
-                file_path, None)
-        elif schema_version > 2:
-            ctx.add_issue("warning", "structure",
-                f"Unknown schema version: {schema_version}. Validator may not understand all fields.",
-                file_path, None)
+        _check_schema_version(data.get("schemaVersion", 0), file_path, ctx)
     
     # Handle both array format and object format
     if isinstance(data, list):
@@ -1572,15 +1794,523 @@ def validate_event_file(file_path: str, ctx: ValidationContext, localization_ids
         return
     
     for event in events:
-        if not validate_structure(event, file_path, ctx):
-            continue
-        validate_references(event, file_path, ctx, localization_ids)
-        validate_logic(event, file_path, ctx)
-        validate_consistency(event, file_path, ctx)
+        # Phases 1-4: every applicable rule, in report order, on one normalized view
+        EVENT_RULES.run(EventView(event), file_path, ctx, localization_ids)
+
+
+def validate_event_stream(file_path: str, ctx: ValidationContext, localization_ids: Set[str]):
+    """
+    Validate an event JSON file one event at a time, without loading it whole.
+    
+    Reports the same issues as validate_event_text. A syntax error is reported
+    (with its line and column) when the reader reaches it; events before it
+    have already been validated.
+    """
+    def on_field(key: str, value: Any):
+        if key == "schemaVersion":
+            _check_schema_version(value, file_path, ctx)
+    
+    found = False
+    try:
+        with open(PROJECT_ROOT / file_path, encoding="utf-8-sig") as f:
+            for event in iter_events(f, on_field):
+                found = True
+                EVENT_RULES.run(EventView(event), file_path, ctx, localization_ids)
+    except json.JSONDecodeError as e:
+        ctx.add_issue("error", "structure", f"Invalid JSON: {e}", file_path)
+        return
+    except (OSError, UnicodeDecodeError) as e:
+        ctx.add_issue("error", "structure", f"Failed to read file: {e}", file_path)
+        return
+    except RootFormatError:
+        ctx.add_issue("error", "structure", "Invalid root format (expected array or object with 'events' key)", file_path)
+        return
+    
+    if not found:
+        ctx.add_issue("warning", "structure", "No events found in file", file_path)
+
+
+def _check_schema_version(schema_version: Any, file_path: str, ctx: ValidationContext):
+    if schema_version == 1:
+        ctx.add_issue("info", "structure",
+            "Using schema v1 (deprecated). Consider migrating to schema v2.",
+            file_path, None)
+    elif schema_version > 2:
+        ctx.add_issue("warning", "structure",
+            f"Unknown schema version: {schema_version}. Validator may not understand all fields.",
+            file_path, None)
+
+
+def validate_event_file_isolated(file_path: str, localization_ids: Set[str]) -> ValidationContext:
+    """Validate a single event file into a fresh partial context (cacheable, mergeable)."""
+    partial = ValidationContext()
+    started = time.perf_counter()
+    validate_event_file(file_path, partial, localization_ids)
+    partial.file_seconds[file_path] = time.perf_counter() - started
+    return partial
+
+
+def content_cache_fingerprint(localization_ids: Set[str]) -> str:
+    """Everything besides the file itself that Phases 1-4 results depend on."""
+    sources = local_import_closure(Path(__file__).resolve())
+    return fingerprint([
+        *(f"{path.name}\n{path.read_text(encoding='utf-8')}" for path in sources),
+        Path(__file__).with_name("content_schema.json").read_text(encoding="utf-8"),
+        ",".join(sorted(ALL_VALID_SKILLS)),
+        "\n".join(sorted(localization_ids)),
+    ])
+
+
+# Localization IDs shared by every task of a --jobs worker process
+_WORKER_LOCALIZATION_IDS: Set[str] = set()
+
+
+def _init_validation_worker(localization_ids: Set[str], stream_min_bytes: int):
+    """Process pool initializer: receive the localization IDs (and --stream) once per worker."""
+    global _WORKER_LOCALIZATION_IDS, STREAM_MIN_BYTES
+    _WORKER_LOCALIZATION_IDS = localization_ids
+    STREAM_MIN_BYTES = stream_min_bytes
+
+
+def _validate_file_in_worker(file_path: str) -> Dict[str, Any]:
+    """Process pool task: validate one file and return its mergeable facts."""
+    return validate_event_file_isolated(file_path, _WORKER_LOCALIZATION_IDS).to_facts()
+
+
+# Measurements of this run only; never replayed from the cache
+_PER_RUN_FACTS = ("rule_stats", "file_seconds", "timings")
+
+
+def _cacheable_facts(facts: Dict[str, Any]) -> Dict[str, Any]:
+    """Facts minus the per-run measurements."""
+    return {key: value for key, value in facts.items() if key not in _PER_RUN_FACTS}
+
+
+def collect_content_facts(files: List[str], localization_ids: Set[str], use_cache: bool = True, jobs: int = 1,
+                          out: Optional[TextIO] = None) -> Dict[str, ValidationContext]:
+    """
+    Run Phases 1-4 over content files, reusing cached facts for unchanged files.
+    
+    Returns one partial context per file. Every file is validated in isolation, so
+    cached, fresh, parallel (jobs > 1) and mixed runs all merge to identical reports.
+    """
+    cache = (ContentFactsCache.load(content_cache_fingerprint(localization_ids), root=PROJECT_ROOT)
+             if use_cache else None)
+    
+    facts_by_file: Dict[str, Dict[str, Any]] = {}
+    if cache:
+        for file_path in files:
+            facts = cache.lookup(file_path)
+            if facts is not None:
+                facts_by_file[file_path] = facts
+    pending = [f for f in files if f not in facts_by_file]
+    
+    if jobs > 1 and len(pending) > 1:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(jobs, len(pending)),
+                initializer=_init_validation_worker,
+                initargs=(localization_ids, STREAM_MIN_BYTES)) as pool:
+            for file_path, facts in zip(pending, pool.map(_validate_file_in_worker, pending)):
+                facts_by_file[file_path] = facts
+                if cache:
+                    cache.store(file_path, _cacheable_facts(facts))
+    
+    partials: Dict[str, ValidationContext] = {}
+    for file_path in files:
+        facts = facts_by_file.get(file_path)
+        if facts is not None:
+            partials[file_path] = ValidationContext.from_facts(facts)
+        else:
+            partials[file_path] = validate_event_file_isolated(file_path, localization_ids)
+            if cache:
+                cache.store(file_path, _cacheable_facts(partials[file_path].to_facts()))
+    
+    if cache:
+        cache.save()
+        progress(f"[Phase 1-4] Cache: {cache.hits} file(s) unchanged, {cache.misses} re-validated", out)
+    return partials
+
+
+def validate_content_files(files: List[str], ctx: ValidationContext, localization_ids: Set[str],
+                           use_cache: bool = True, jobs: int = 1):
+    """Run Phases 1-4 over content files and merge the results into ctx in file order."""
+    partials = collect_content_facts(files, localization_ids, use_cache, jobs, ctx.out)
+    for file_path in files:
+        ctx.merge(partials[file_path])
+
+
+LOCALIZATION_XML = "ModuleData/Languages/enlisted_strings.xml"
+
+# Roots polled by --watch, plus the project file (Phase 7)
+WATCH_ROOTS = ("ModuleData", "src", "GUI")
+WATCH_FILES = ("Enlisted.csproj",)
+
+
+class ValidationSession:
+    """
+    The validation pipeline with its state kept warm between runs.
+    
+    Holds the localization ID set, the per-file Phase 1-4 results, the C# source
+    index and the result of every standalone phase. run() performs a full
+    validation; revalidate() re-runs only the phases affected by changed paths
+    and reassembles the report, which is what --watch uses.
+    """
+    
+    # Phases that produce their own partial context, in report order
+    PHASE_ORDER = ("5.5", "6", "7", "8", "9", "9.5", "10")
+    
+    def __init__(self, strict: bool = False, check_orphans: bool = False,
+                 use_cache: bool = True, jobs: int = 1,
+                 on_issue: Optional[Callable[[ValidationIssue], None]] = None,
+                 profiler: Optional[ValidationProfiler] = None, out: Optional[TextIO] = None):
+        self.strict = strict
+        # Progress lines go here instead of sys.stdout (the in-process API collects them per call)
+        self.out = out
+        self.on_issue = on_issue
+        self.profiler = profiler
+        self.check_orphans = check_orphans
+        self.use_cache = use_cache
+        self.jobs = jobs
+        self.localization_ids: Set[str] = set()
+        self.event_files: List[str] = []
+        self.decision_files: List[str] = []
+        self.order_event_files: List[str] = []
+        self.opportunity_files: List[str] = []
+        self.content_files: List[str] = []
+        self.content_facts: Dict[str, ValidationContext] = {}
+        self.phase_results: Dict[str, ValidationContext] = {}
+        self.cs_index: Optional[CSharpSourceIndex] = None
+        self.ctx: Optional[ValidationContext] = None
+    
+    # ---- Loading --------------------------------------------------------
+    
+    def load_localization(self):
+        progress("[Phase 0] Loading localization strings...", self.out)
+        self.localization_ids = load_localization_strings(self.out)
+    
+    def discover_files(self):
+        """Collect all content files (Events, Decisions, Order Events, Opportunities)."""
+        def find(pattern: str) -> List[str]:
+            return sorted(glob.glob(pattern, root_dir=PROJECT_ROOT, recursive=True))
+        
+        self.event_files = find("ModuleData/Enlisted/Events/**/*.json")
+        decision_files = find("ModuleData/Enlisted/Decisions/**/*.json")
+        # Only validate order_events/*.json, not the order definition files (orders_*.json)
+        self.order_event_files = find("ModuleData/Enlisted/Orders/order_events/**/*.json")
+        # Opportunity files (separate validation for hints - not treated as regular events)
+        self.opportunity_files = find("ModuleData/Enlisted/Decisions/camp_opportunities*.json")
+        # Exclude opportunity files from regular event validation (they have different structure)
+        self.decision_files = [f for f in decision_files if not any(op in f for op in self.opportunity_files)]
+        self.content_files = self.event_files + self.decision_files + self.order_event_files
+    
+    def ensure_cs_index(self) -> CSharpSourceIndex:
+        # Phases 7-9 share one read of every C# file
+        if self.cs_index is None:
+            self.cs_index = CSharpSourceIndex.build(base=PROJECT_ROOT)
+        return self.cs_index
+    
+    # ---- Phases ---------------------------------------------------------
+    
+    def _profile(self, key: str):
+        """Measure one phase when --profile is active (yields a record for files/events)."""
+        return self.profiler.phase(key) if self.profiler else contextlib.nullcontext({})
+    
+    def validate_content(self, files: Optional[List[str]] = None):
+        """Phases 1-4 for the given files (default: all content files)."""
+        files = self.content_files if files is None else files
+        self.content_facts.update(collect_content_facts(
+            files, self.localization_ids, self.use_cache, self.jobs, self.out))
+    
+    def run_phase(self, key: str):
+        """Run one standalone phase into its own partial context."""
+        partial = ValidationContext(strict=self.strict, out=self.out)
+        if key == "5.5":
+            if self.opportunity_files:
+                partial.progress("[Phase 5.5] Validating opportunities and hints...")
+                for opp_file in self.opportunity_files:
+                    validate_opportunities(opp_file, partial, self.localization_ids)
+        elif key == "6":
+            validate_config_files(partial)
+        elif key == "7":
+            validate_csproj(partial, self.ensure_cs_index())
+        elif key == "8":
+            validate_code_quality(partial, self.ensure_cs_index(), self.use_cache)
+        elif key == "9":
+            validate_csharp_textobjects(partial, self.localization_ids, self.ensure_cs_index())
+        elif key == "9.5":
+            validate_camp_schedule_descriptions(partial)
+        elif key == "10":
+            validate_id_registry(partial, self.use_cache)
+        else:
+            raise ValueError(f"Unknown phase: {key}")
+        self.phase_results[key] = partial
+    
+    def assemble(self) -> ValidationContext:
+        """Merge all phase results, in report order, into a fresh context."""
+        ctx = ValidationContext(strict=self.strict, out=self.out)
+        ctx.on_issue = self.on_issue
+        for file_path in self.content_files:
+            ctx.merge(self.content_facts[file_path])
+        validate_flag_consistency(ctx)
+        if self.check_orphans:
+            detect_orphan_strings(self.localization_ids, ctx)
+        for key in self.PHASE_ORDER:
+            if key in self.phase_results:
+                ctx.merge(self.phase_results[key])
+        self.ctx = ctx
+        return ctx
+    
+    def run(self) -> Optional[ValidationContext]:
+        """Full validation. Returns None if there is no content to validate."""
+        with self._profile("0") as record:
+            self.load_localization()
+            self.discover_files()
+            record["files"] = len(self.content_files) + len(self.opportunity_files)
+        
+        if not self.content_files:
+            progress("[ERROR] No content files found!", self.out)
+            return None
+        
+        progress(f"[Phase 0] Found {len(self.content_files)} content files ({len(self.event_files)} events, {len(self.decision_files)} decisions, {len(self.order_event_files)} order events, {len(self.opportunity_files)} opportunity files)", self.out)
+        progress(out=self.out)
+        
+        # Same merge order as assemble(), but each phase lands in the live
+        # context as soon as it finishes so structured output can stream
+        ctx = ValidationContext(strict=self.strict, out=self.out)
+        ctx.on_issue = self.on_issue
+        
+        progress("[Phase 1-4] Validating structure, references, logic, and consistency...", self.out)
+        with self._profile("1-4") as record:
+            self.validate_content()
+            for file_path in self.content_files:
+                ctx.merge(self.content_facts[file_path])
+            record["files"] = len(self.content_files)
+            record["events"] = len(ctx.event_ids)
+        
+        progress("[Phase 4] Running cross-file consistency checks...", self.out)
+        with self._profile("4"):
+            validate_flag_consistency(ctx)
+        
+        if self.check_orphans:
+            progress("[Phase 5] Detecting orphaned strings...", self.out)
+            with self._profile("5"):
+                detect_orphan_strings(self.localization_ids, ctx)
+        
+        for key in self.PHASE_ORDER:
+            with self._profile(key) as record:
+                self.run_phase(key)
+                ctx.merge(self.phase_results[key])
+                if key == "5.5":
+                    record["files"] = len(self.opportunity_files)
+                elif key in ("7", "8", "9"):
+                    record["files"] = len(self.cs_index)
+        
+        self.ctx = ctx
+        return ctx
+    
+    def run_changed(self, revision: str) -> Optional[ValidationContext]:
+        """
+        --changed-since: validate only what changed since a git revision, plus
+        its dependents, and report only issues inside that scope.
+        
+        Raises ChangeScopeError if git cannot resolve the revision.
+        """
+        with self._profile("0") as record:
+            self.load_localization()
+            self.discover_files()
+            scope = ChangeScope.compute(revision, self)
+            record["files"] = len(scope.changed_paths)
+        
+        if not self.content_files:
+            progress("[ERROR] No content files found!", self.out)
+            return None
+        for line in scope.summary_lines():
+            progress(line, self.out)
+        progress(out=self.out)
+        
+        # Full results for the scoped work; filtered into the reported context below
+        work = ValidationContext(strict=self.strict, out=self.out)
+        scoped_files = [f for f in self.content_files if Path(f).as_posix() in scope.content_files]
+        
+        if scoped_files or scope.cross_file:
+            progress("[Phase 1-4] Validating structure, references, logic, and consistency...", self.out)
+            with self._profile("1-4") as record:
+                self.validate_content(scoped_files)
+                if scope.cross_file:
+                    # Cross-file checks need every file's facts; unchanged files come from the cache
+                    others = [f for f in self.content_files if f not in self.content_facts]
+                    self.content_facts.update(collect_content_facts(
+                        others, self.localization_ids, True, self.jobs, self.out))
+                for file_path in self.content_files:
+                    if file_path in self.content_facts:
+                        work.merge(self.content_facts[file_path])
+                for file_path in scoped_files:
+                    scope.event_ids.update(self.content_facts[file_path].event_ids)
+                record["files"] = len(scoped_files)
+                record["events"] = len(scope.event_ids)
+        
+        if scope.cross_file:
+            progress("[Phase 4] Running cross-file consistency checks...", self.out)
+            with self._profile("4"):
+                validate_flag_consistency(work)
+        
+        if self.check_orphans and scope.orphans:
+            progress("[Phase 5] Detecting orphaned strings...", self.out)
+            with self._profile("5"):
+                detect_orphan_strings(self.localization_ids, work)
+        
+        for key in self.PHASE_ORDER:
+            if key in scope.phases:
+                with self._profile(key):
+                    self.run_phase(key)
+                    work.merge(self.phase_results[key])
+        
+        ctx = ValidationContext(strict=self.strict, out=self.out)
+        ctx.on_issue = self.on_issue
+        ctx.event_ids = set(scope.event_ids)
+        ctx._extend_issues([issue for issue in work.issues if scope.includes(issue)])
+        merge_rule_stats(ctx.rule_stats, work.rule_stats)
+        ctx.file_seconds.update(work.file_seconds)
+        ctx.timings.update(work.timings)
+        self.ctx = ctx
+        return ctx
+    
+    # ---- Incremental re-validation ---------------------------------------
+    
+    def affected_phases(self, changed_paths: Set[str]) -> Tuple[Set[str], Set[str], bool]:
+        """
+        Map changed paths (posix, relative to the project root) to the work they invalidate.
+        
+        Returns (content files to re-validate, standalone phases to re-run,
+        whether the localization IDs must be reloaded).
+        """
+        content = set()
+        phases = set()
+        reload_localization = False
+        content_by_posix = {Path(f).as_posix(): f for f in self.content_files}
+        opportunity_posix = {Path(f).as_posix() for f in self.opportunity_files}
+        
+        for path in changed_paths:
+            if namespace_for(path):
+                # IDs can collide across files of any namespace
+                phases.add("10")
+            if path == LOCALIZATION_XML:
+                reload_localization = True
+                content.update(self.content_files)
+                phases.update({"5.5", "9"})
+            elif path.startswith("src/") and path.endswith(".cs"):
+                phases.update({"7", "8", "9"})
+            elif path.startswith("ModuleData/Enlisted/Config/"):
+                phases.update({"6", "9.5"})
+            elif path in opportunity_posix:
+                phases.add("5.5")
+            elif path in content_by_posix:
+                content.add(content_by_posix[path])
+            elif path in WATCH_FILES or path.startswith("GUI/"):
+                phases.add("7")
+        return content, phases, reload_localization
+    
+    def revalidate(self, changed_paths: Set[str]) -> ValidationContext:
+        """Re-run only the work affected by changed paths and reassemble the report."""
+        content, phases, reload_localization = self.affected_phases(changed_paths)
+        
+        if reload_localization:
+            self.localization_ids = load_localization_strings(self.out)
+        
+        # New or deleted JSON files change the file lists themselves
+        if any(p.startswith("ModuleData/Enlisted/") and p.endswith(".json") for p in changed_paths):
+            known = set(self.content_files)
+            self.discover_files()
+            content.update(f for f in self.content_files if f not in known)
+            for removed in known - set(self.content_files):
+                self.content_facts.pop(removed, None)
+            phases.add("5.5")
+        
+        cs_changed = [p for p in changed_paths if p.endswith(".cs")]
+        if cs_changed and self.cs_index is not None:
+            self.cs_index.update(cs_changed)
+        
+        if content:
+            self.validate_content([f for f in self.content_files if f in content])
+        for key in self.PHASE_ORDER:
+            if key in phases:
+                self.run_phase(key)
+        return self.assemble()
+    
+    def snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """(mtime, size) of every watched file, keyed by posix path."""
+        state = {}
+        for root in WATCH_ROOTS:
+            for dirpath, _, filenames in os.walk(PROJECT_ROOT / root):
+                for name in filenames:
+                    path = os.path.join(dirpath, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    state[Path(path).relative_to(PROJECT_ROOT).as_posix()] = (st.st_mtime_ns, st.st_size)
+        for path in WATCH_FILES:
+            try:
+                st = os.stat(PROJECT_ROOT / path)
+            except OSError:
+                continue
+            state[path] = (st.st_mtime_ns, st.st_size)
+        return state
+    
+    def watch(self, interval: float = 0.25):
+        """Poll the watched roots and print new/resolved issues after every change."""
+        state = self.snapshot()
+        previous = self.ctx
+        print(f"[WATCH] Watching {', '.join(WATCH_ROOTS + WATCH_FILES)} for changes (Ctrl+C to stop)...")
+        try:
+            while True:
+                time.sleep(interval)
+                current = self.snapshot()
+                changed = {p for p in current.keys() | state.keys() if current.get(p) != state.get(p)}
+                if not changed:
+                    continue
+                state = current
+                
+                started = time.perf_counter()
+                # Progress lines of the re-run are discarded; only the issue diff is printed
+                self.out = io.StringIO()
+                ctx = self.revalidate(changed)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                
+                names = ", ".join(sorted(Path(p).name for p in changed)[:5])
+                print(f"\n[WATCH] {len(changed)} file(s) changed ({names}) - re-validated in {elapsed_ms:.0f} ms")
+                print_issue_diff(previous, ctx)
+                previous = ctx
+        except KeyboardInterrupt:
+            print("\n[WATCH] Stopped")
+
+
+def _issue_key(issue: ValidationIssue) -> Tuple:
+    return (issue.severity, issue.category, issue.message, issue.file_path, issue.event_id)
+
+
+def print_issue_diff(before: Optional[ValidationContext], after: ValidationContext):
+    """Print issues that appeared or disappeared between two reports."""
+    old = Counter(_issue_key(i) for i in before.issues) if before else Counter()
+    new = Counter(_issue_key(i) for i in after.issues)
+    added = new - old
+    resolved = old - new
+    
+    for key in resolved.elements():
+        print(f"  - {ValidationIssue(*key)}")
+    for key in added.elements():
+        print(f"  + {ValidationIssue(*key)}")
+    if not added and not resolved:
+        print("  (no change in issues)")
+    
+    errors = after.issues.count("error")
+    warnings = after.issues.count("warning")
+    print(f"  Now: {errors} error(s), {warnings} warning(s) - {len(resolved)} resolved, {len(added)} new")
 
 
 def main():
     """Main validation entry point."""
+    global STREAM_MIN_BYTES
     parser = argparse.ArgumentParser(description="Validate Enlisted mod content files")
     parser.add_argument("--strict", action="store_true",
                       help="Treat warnings as errors (blocks merge)")
@@ -1588,68 +2318,125 @@ def main():
                       help="Generate stub entries for missing localization strings")
     parser.add_argument("--check-orphans", action="store_true",
                       help="Detect orphaned XML strings not referenced by any JSON")
+    parser.add_argument("--no-cache", action="store_true",
+                      help="Re-validate every content file instead of reusing cached results")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                      help="Validate content files in N worker processes (0 = one per CPU)")
+    parser.add_argument("--stream", action="store_true",
+                      help="Validate every content file event by event instead of loading it whole "
+                           f"(default: only files of {STREAM_MIN_BYTES // (1024 * 1024)} MB or more)")
+    parser.add_argument("--watch", action="store_true",
+                      help="Keep running; re-validate affected phases whenever ModuleData/ or src/ changes")
+    parser.add_argument("--changed-since", metavar="REV",
+                      help="Validate only files changed since git revision REV (plus their dependents) "
+                           "and report only issues in that scope")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="text",
+                      help="Report format. json/sarif/ndjson stream every issue (untruncated) to stdout; "
+                           "progress messages go to stderr")
+    parser.add_argument("--profile", nargs="?", const=str(DEFAULT_PROFILE_PATH), metavar="PATH",
+                      help="Write per-phase/per-rule timings and peak RSS as JSON "
+                           f"(default: {DEFAULT_PROFILE_PATH.as_posix()}; '-' for stdout)")
+    parser.add_argument("--profile-top", type=int, default=10, metavar="N",
+                      help="Number of slowest rules/files listed in the profile (default: 10)")
     args = parser.parse_args()
     
-    print("=" * 80)
-    print("ENLISTED MOD - CONTENT VALIDATION TOOL")
-    print("=" * 80)
-    print()
-    
-    ctx = ValidationContext(strict=args.strict)
+    if args.profile == "-" and args.format != "text":
+        parser.error("--profile - cannot share stdout with --format json/sarif/ndjson")
     
-    print("[Phase 0] Loading localization strings...")
-    localization_ids = load_localization_strings()
+    if args.stream:
+        STREAM_MIN_BYTES = 0
     
-    # Collect all content files (Events, Decisions, Order Events)
-    event_files = sorted(glob.glob("ModuleData/Enlisted/Events/**/*.json", recursive=True))
-    decision_files = sorted(glob.glob("ModuleData/Enlisted/Decisions/**/*.json", recursive=True))
-    # Only validate order_events/*.json, not the order definition files (orders_*.json)
-    order_event_files = sorted(glob.glob("ModuleData/Enlisted/Orders/order_events/**/*.json", recursive=True))
-    # Opportunity files (separate validation for hints - not treated as regular events)
-    opportunity_files = sorted(glob.glob("ModuleData/Enlisted/Decisions/camp_opportunities*.json", recursive=True))
-    # Exclude opportunity files from regular event validation (they have different structure)
-    decision_files = [f for f in decision_files if not any(op in f for op in opportunity_files)]
-    all_files = event_files + decision_files + order_event_files
+    if args.watch and args.changed_since:
+        parser.error("--watch and --changed-since cannot be combined")
     
-    if not all_files:
-        print("[ERROR] No content files found!")
-        return 2
+    if args.format != "text":
+        if args.watch:
+            parser.error("--watch only supports --format text")
+        return _main_structured(args)
     
-    print(f"[Phase 0] Found {len(all_files)} content files ({len(event_files)} events, {len(decision_files)} decisions, {len(order_event_files)} order events, {len(opportunity_files)} opportunity files)")
+    print("=" * 80)
+    print("ENLISTED MOD - CONTENT VALIDATION TOOL")
+    print("=" * 80)
     print()
     
-    print("[Phase 1-4] Validating structure, references, logic, and consistency...")
-    for file_path in all_files:
-        validate_event_file(file_path, ctx, localization_ids)
-    
-    print("[Phase 4] Running cross-file consistency checks...")
-    validate_flag_consistency(ctx)
-    
-    if args.check_orphans:
-        print("[Phase 5] Detecting orphaned strings...")
-        detect_orphan_strings(localization_ids, ctx)
-    
-    # Validate opportunities with hint checks
-    if opportunity_files:
-        print("[Phase 5.5] Validating opportunities and hints...")
-        for opp_file in opportunity_files:
-            validate_opportunities(opp_file, ctx, localization_ids)
-    
-    validate_config_files(ctx)
+    session = _build_session(args)
+    try:
+        ctx = _run_session(args, session)
+    except ChangeScopeError as e:
+        print(f"[ERROR] --changed-since {args.changed_since}: {e}")
+        return 2
+    if ctx is None:
+        return 2
     
-    # Phase 7: Project structure validation
-    validate_csproj(ctx)
+    _write_fix_refs(args, ctx)
     
-    # Phase 8: Code quality validation
-    validate_code_quality(ctx)
+    ctx.print_report()
+    _write_profile(args, session, ctx)
     
-    # Phase 9: C# TextObject localization validation
-    validate_csharp_textobjects(ctx, localization_ids)
+    if args.watch:
+        session.watch()
+        return 0
     
-    # Phase 9.5: Camp schedule description validation
-    validate_camp_schedule_descriptions(ctx)
+    return _exit_code(ctx)
+
+
+def _main_structured(args) -> int:
+    """--format json/sarif/ndjson: issues to stdout as they are produced, progress to stderr."""
+    writer = make_issue_writer(args.format, sys.stdout, SourceLocator(PROJECT_ROOT))
+    session = _build_session(args, on_issue=writer.write_issue)
+    writer.start()
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            ctx = _run_session(args, session)
+        except ChangeScopeError as e:
+            print(f"[ERROR] --changed-since {args.changed_since}: {e}")
+            ctx = None
+        if ctx is not None:
+            _write_fix_refs(args, ctx)
+            _write_profile(args, session, ctx)
+    if ctx is None:
+        ctx = ValidationContext(strict=args.strict)
+        exit_code = 2
+    else:
+        exit_code = _exit_code(ctx, quiet=True)
+    writer.finish(ctx.stats, len(ctx.event_ids), exit_code)
+    return exit_code
+
+
+def _run_session(args, session: ValidationSession) -> Optional[ValidationContext]:
+    if args.changed_since:
+        return session.run_changed(args.changed_since)
+    return session.run()
+
 
-    # Generate missing strings file if requested
+def _build_session(args, on_issue: Optional[Callable[[ValidationIssue], None]] = None) -> ValidationSession:
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    return ValidationSession(strict=args.strict, check_orphans=args.check_orphans,
+                             use_cache=not args.no_cache, jobs=jobs, on_issue=on_issue,
+                             profiler=ValidationProfiler() if args.profile else None)
+
+
+def _write_profile(args, session: ValidationSession, ctx: ValidationContext):
+    """Emit the --profile JSON for the run that just finished."""
+    if not session.profiler:
+        return
+    profile = session.profiler.report(ctx, top_n=args.profile_top, settings={
+        "jobs": session.jobs,
+        "cache": session.use_cache,
+        "check_orphans": session.check_orphans,
+        "format": args.format,
+        "changed_since": args.changed_since,
+    })
+    if args.profile == "-":
+        print(json.dumps(profile, indent=2))
+        return
+    write_profile(profile, Path(args.profile))
+    print_profile_summary(profile)
+    print(f"[PROFILE] Written to {args.profile}\n")
+
+
+def _write_fix_refs(args, ctx: ValidationContext):
+    """Generate missing strings file if requested (--fix-refs)."""
     if args.fix_refs:
         missing_strings = []
         for issue in ctx.issues:
@@ -1666,17 +2453,20 @@ def main():
                 for string_id in sorted(set(missing_strings)):
                     f.write(f'    <string id="{string_id}" text="TODO: {string_id}" />\n')
             print(f"\n[FIX-REFS] Generated {output_file} with {len(set(missing_strings))} missing string stubs")
-    
-    ctx.print_report()
-    
+
+
+def _exit_code(ctx: ValidationContext, quiet: bool = False) -> int:
     if ctx.has_critical_issues():
-        print("[X] VALIDATION FAILED - Critical issues found")
+        if not quiet:
+            print("[X] VALIDATION FAILED - Critical issues found")
         return 1
     elif ctx.has_warnings():
-        print("[!] VALIDATION PASSED WITH WARNINGS")
+        if not quiet:
+            print("[!] VALIDATION PASSED WITH WARNINGS")
         return 0
     else:
-        print("[OK] VALIDATION PASSED")
+        if not quiet:
+            print("[OK] VALIDATION PASSED")
         return 0
 
 
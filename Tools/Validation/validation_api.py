@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+In-process validation API for editors and the CrewAI tools.
+
+    from validation_api import validate_paths
+
+    report = validate_paths(["ModuleData/Enlisted/Events/events_baggage_stowage.json"])
+    report.errors, report.warnings     # counts
+    report.to_dict(limit=25)           # compact structured summary
+    report.summary(limit=20)           # a few lines of text
+
+One ValidationSession is kept warm per process. Between calls it polls the
+same roots as --watch and only invalidates what changed:
+
+- localization IDs are reloaded when enlisted_strings.xml changes
+- per-file Phase 1-4 results are kept until that file changes
+- the C# source index is updated for changed .cs files
+- standalone phase results (5.5-10) are reused until an input of that phase changes
+
+Phases are the validator's keys: "1-4", "4" (cross-file flag/duplicate checks),
+"5" (orphans), "5.5", "6", "7", "8", "9", "9.5", "10". With paths and no phases, the
+phases affected by those paths run (the --watch mapping) and only issues for
+those files (or events they define) are returned; cross-file flag findings
+are returned when they name a flag those files set, clear or read. Phases
+passed explicitly report all of their issues.
+
+The validator's progress lines are collected per call (Report.log) rather
+than printed, without touching sys.stdout, so other threads of the host
+process keep their output.
+"""
+
+import io
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+VALIDATION_DIR = Path(__file__).resolve().parent
+
+if str(VALIDATION_DIR) not in sys.path:
+    sys.path.insert(0, str(VALIDATION_DIR))
+
+from issue_store import IssueStore, ValidationIssue  # noqa: E402
+from json_locator import SourceLocator  # noqa: E402
+
+CONTENT_PHASE = "1-4"
+CROSS_FILE_PHASE = "4"
+ORPHAN_PHASE = "5"
+STANDALONE_PHASES = ("5.5", "6", "7", "8", "9", "9.5", "10")
+ALL_PHASES = (CONTENT_PHASE, CROSS_FILE_PHASE, ORPHAN_PHASE) + STANDALONE_PHASES
+# A full run without --check-orphans
+DEFAULT_PHASES = (CONTENT_PHASE, CROSS_FILE_PHASE) + STANDALONE_PHASES
+
+# Phase 4 files its flag findings under this path, naming the flags in quotes
+FLAG_ANALYSIS = "flag_analysis"
+_QUOTED_ID = re.compile(r"'([^']+)'")
+
+
+def _project_posix(path) -> str:
+    """Path relative to the project root, posix-style (absolute or relative input)."""
+    path = Path(path)
+    if path.is_absolute():
+        try:
+            path = path.resolve().relative_to(PROJECT_ROOT)
+        except ValueError:
+            pass
+    return path.as_posix()
+
+
+class Report:
+    """Result of one validate_paths() call."""
+
+    __slots__ = ("issues", "paths", "phases", "strict", "total_events", "elapsed_ms", "log")
+
+    def __init__(self, issues: Iterable[ValidationIssue], paths: Sequence[str], phases: Sequence[str],
+                 strict: bool = False, total_events: int = 0, elapsed_ms: float = 0.0, log: str = ""):
+        self.issues = IssueStore(issues)
+        self.paths = tuple(paths)
+        self.phases = tuple(phases)
+        self.strict = strict
+        self.total_events = total_events
+        self.elapsed_ms = elapsed_ms
+        # The validator's progress lines for this call
+        self.log = log
+
+    @property
+    def errors(self) -> int:
+        return self.issues.count("error")
+
+    @property
+    def warnings(self) -> int:
+        return self.issues.count("warning")
+
+    @property
+    def ok(self) -> bool:
+        """No errors (and, with strict, no warnings)."""
+        return not self.errors and not (self.strict and self.warnings)
+
+    def top_issues(self, limit: int = 25, include_info: bool = False) -> List[ValidationIssue]:
+        """Errors first, then warnings (then info), each in report order."""
+        severities = ("error", "warning", "info") if include_info else ("error", "warning")
+        ordered = [issue for severity in severities for issue in self.issues.by_severity(severity)]
+        return ordered[:limit]
+
+    def to_dict(self, limit: int = 25, include_info: bool = False) -> Dict[str, Any]:
+        """Compact structured summary: counts plus the first `limit` issues."""
+        shown = self.top_issues(limit, include_info)
+        locator = SourceLocator(PROJECT_ROOT)
+        reportable = self.errors + self.warnings + (self.issues.count("info") if include_info else 0)
+        return {
+            "ok": self.ok,
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "info": self.issues.count("info"),
+            "by_category": dict(sorted(self.issues.stats.items())),
+            "files": len(self.paths) if self.paths else None,
+            "phases": list(self.phases),
+            "total_events": self.total_events,
+            "elapsed_ms": round(self.elapsed_ms, 1),
+            "issues": [locator.issue_record(issue) for issue in shown],
+            "truncated": reportable - len(shown),
+        }
+
+    def summary(self, limit: int = 20) -> str:
+        """One status line plus the first errors and warnings, one per line."""
+        scope = f"{len(self.paths)} file(s)" if self.paths else "project"
+        lines = [f"{'OK' if self.ok else 'FAILED'}: {self.errors} error(s), {self.warnings} warning(s), "
+                 f"{self.issues.count('info')} info - {scope}, phases {', '.join(self.phases) or 'none'} "
+                 f"({self.elapsed_ms:.0f} ms)"]
+        shown = self.top_issues(limit)
+        lines.extend(str(issue) for issue in shown)
+        hidden = self.errors + self.warnings - len(shown)
+        if hidden:
+            lines.append(f"... {hidden} more")
+        return "\n".join(lines)
+
+
+class ValidationService:
+    """A warm ValidationSession plus the file state it was built from."""
+
+    def __init__(self, strict: bool = False, use_cache: bool = True):
+        self.strict = strict
+        self.use_cache = use_cache
+        self.session = None
+        self._state: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    # ---- Session state ---------------------------------------------------
+
+    def _start(self, out: io.StringIO):
+        import validate_content
+        self._vc = validate_content
+        self.session = validate_content.ValidationSession(strict=self.strict, use_cache=self.use_cache, out=out)
+        self.session.load_localization()
+        self.session.discover_files()
+        self._state = self.session.snapshot()
+
+    def _refresh(self):
+        """Drop every cached result whose inputs changed since the last call."""
+        session = self.session
+        current = session.snapshot()
+        changed = {p for p in current.keys() | self._state.keys() if current.get(p) != self._state.get(p)}
+        self._state = current
+        if not changed:
+            return
+
+        content, phases, reload_localization = session.affected_phases(changed)
+        if reload_localization:
+            session.localization_ids = self._vc.load_localization_strings(session.out)
+        if any(p.startswith("ModuleData/Enlisted/") and p.endswith(".json") for p in changed):
+            known = set(session.content_files)
+            session.discover_files()
+            content.update(known ^ set(session.content_files))
+            phases.add("5.5")
+        cs_changed = [p for p in changed if p.endswith(".cs")]
+        if cs_changed and session.cs_index is not None:
+            session.cs_index.update(cs_changed)
+        for file_path in content:
+            session.content_facts.pop(file_path, None)
+        for key in phases:
+            session.phase_results.pop(key, None)
+
+    def _ensure_facts(self, files: List[str]):
+        missing = [f for f in files if f not in self.session.content_facts]
+        if missing:
+            self.session.validate_content(missing)
+
+    # ---- API -------------------------------------------------------------
+
+    def resolve_phases(self, targets: Set[str]) -> List[str]:
+        """Phases a set of project paths affects (the --watch mapping)."""
+        session = self.session
+        content, phases, reload_localization = session.affected_phases(targets)
+        if content or reload_localization:
+            phases.update({CONTENT_PHASE, CROSS_FILE_PHASE})
+        if reload_localization:
+            # A string ID change matters to whoever references it, not to the XML itself
+            phases.add(ORPHAN_PHASE)
+        return [key for key in ALL_PHASES if key in phases]
+
+    def validate_paths(self, paths: Optional[Iterable] = None,
+                       phases: Optional[Iterable[str]] = None) -> Report:
+        """
+        Validate some project files (default: the whole project).
+
+        paths are relative to the project root or absolute. Raises ValueError
+        for an unknown phase key.
+        """
+        requested = None if phases is None else [str(key) for key in phases]
+        for key in requested or ():
+            if key not in ALL_PHASES:
+                raise ValueError(f"Unknown phase: {key} (expected one of {', '.join(ALL_PHASES)})")
+
+        with self._lock:
+            started = time.perf_counter()
+            out = io.StringIO()
+            if self.session is None:
+                self._start(out)
+            else:
+                self.session.out = out
+                self._refresh()
+            session = self.session
+
+            targets = None if paths is None else {_project_posix(p) for p in paths}
+            if requested is not None:
+                run = [key for key in ALL_PHASES if key in requested]
+            elif targets is None:
+                run = list(DEFAULT_PHASES)
+            else:
+                run = self.resolve_phases(targets)
+
+            # Explicitly requested phases report everything; inferred ones only the targets
+            explicit = set(ALL_PHASES) if targets is None else set(requested or ())
+            ctx = self._vc.ValidationContext(strict=self.strict, out=out)
+            issues: List[ValidationIssue] = []
+            target_ids: Set[str] = set()
+            target_flags: Set[str] = set()
+            seen = 0
+
+            def take(key: str, keep: bool = True):
+                """Move the issues the last phase added to ctx into the report."""
+                nonlocal seen
+                new = ctx.issues[seen:]
+                seen = len(ctx.issues)
+                if keep:
+                    issues.extend(new if key in explicit else [
+                        issue for issue in new if self._in_targets(issue, targets, target_ids, target_flags)])
+
+            needs_facts = {CONTENT_PHASE, CROSS_FILE_PHASE, ORPHAN_PHASE} & set(run)
+            if needs_facts:
+                content_files = session.content_files
+                if targets is not None and needs_facts == {CONTENT_PHASE}:
+                    content_files = [f for f in content_files if Path(f).as_posix() in targets]
+                self._ensure_facts(content_files)
+                for file_path in content_files:
+                    facts = session.content_facts[file_path]
+                    if targets is not None and Path(file_path).as_posix() in targets:
+                        target_ids.update(facts.event_ids)
+                        target_flags.update(facts.flag_references, facts.flag_setters)
+                        target_flags.update(flag for node in facts.flag_nodes for flag in node.clears)
+                    ctx.merge(facts)
+                # Cross-file phases need every file's facts, but report them only for "1-4"
+                take(CONTENT_PHASE, CONTENT_PHASE in run)
+            if CROSS_FILE_PHASE in run:
+                self._vc.validate_flag_consistency(ctx)
+                take(CROSS_FILE_PHASE)
+            if ORPHAN_PHASE in run:
+                self._vc.detect_orphan_strings(session.localization_ids, ctx)
+                take(ORPHAN_PHASE)
+            for key in STANDALONE_PHASES:
+                if key in run:
+                    if key not in session.phase_results:
+                        session.run_phase(key)
+                    ctx.merge(session.phase_results[key])
+                    take(key)
+
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            return Report(issues, sorted(targets) if targets is not None else (), run,
+                          self.strict, len(ctx.event_ids), elapsed_ms, out.getvalue())
+
+    @staticmethod
+    def _in_targets(issue: ValidationIssue, targets: Optional[Set[str]], target_ids: Set[str],
+                    target_flags: Set[str]) -> bool:
+        if targets is None:
+            return True
+        path = Path(issue.file_path).as_posix() if issue.file_path else ""
+        if path == FLAG_ANALYSIS:
+            # "Flag 'x' ..." or "Flag cycle ['x', 'y']: ..." - same matching as ChangeScope.includes
+            return any(flag in target_flags for flag in _QUOTED_ID.findall(issue.message.split(":", 1)[0]))
+        return path in targets or bool(issue.event_id and issue.event_id in target_ids)
+
+
+_SERVICE: Optional[ValidationService] = None
+
+
+def shared_service() -> ValidationService:
+    """The process-wide warm service used by validate_paths()."""
+    global _SERVICE
+    if _SERVICE is None:
+        _SERVICE = ValidationService()
+    return _SERVICE
+
+
+def validate_paths(paths: Optional[Iterable] = None, phases: Optional[Iterable[str]] = None) -> Report:
+    """Validate project files in-process, reusing the warm shared session."""
+    return shared_service().validate_paths(paths, phases)
+
+
+def main():
+    import json
+    args = sys.argv[1:]
+    phases = None
+    if "--phases" in args:
+        at = args.index("--phases")
+        phases = args[at + 1].split(",") if at + 1 < len(args) else []
+        del args[at:at + 2]
+    report = validate_paths(args or None, phases)
+    print(json.dumps(report.to_dict(), indent=2))
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
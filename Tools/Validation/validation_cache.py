@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Content-hash result cache for validate_content.py.
+
+Stores the per-file facts produced by Phases 1-4 (issues, event IDs, flag
+setters/references, referenced string IDs) keyed by each file's SHA-256.
+On re-runs only files whose bytes changed are re-validated; the cross-file
+checks (duplicate IDs, flag consistency, orphan strings) are recomputed from
+the merged facts.
+
+The whole cache is invalidated when its fingerprint changes. The validator
+derives the fingerprint from the source of every Tools/Validation module it
+imports (directly or through other modules, see local_import_closure), the
+schema, the custom skill list and the localization ID set, so rule or
+string-table changes never serve stale facts.
+
+Cache location: Tools/Validation/.cache/content_facts.json (safe to delete).
+
+HashKeyedCache is the same idea for per-file analyses of sources that are
+already hashed while being read (e.g. the C# index): results are keyed by the
+content SHA-256 alone, so renames and touches never invalidate them.
+"""
+
+import ast
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional
+
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+CACHE_FORMAT_VERSION = 1
+
+
+def file_sha256(path: Path) -> str:
+    """Hash a file's raw bytes."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+@contextlib.contextmanager
+def atomic_write(path: Path, mode: str = "w", **kwargs) -> Iterator[IO]:
+    """
+    Write path through a uniquely named temp file next to it, moved into place on success.
+
+    Concurrent runs (--watch next to CI or the LSP) each write their own temp
+    file, so the last one to finish replaces path with a complete file.
+    """
+    if "b" not in mode:
+        kwargs.setdefault("encoding", "utf-8")
+    f = tempfile.NamedTemporaryFile(mode, dir=path.parent, prefix=path.name + ".", suffix=".tmp",
+                                    delete=False, **kwargs)
+    try:
+        with f:
+            yield f
+        os.replace(f.name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(f.name)
+        raise
+
+
+def fingerprint(parts: Iterable[str]) -> str:
+    """Combine several strings into a single stable digest."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def local_import_closure(entry: Path) -> List[Path]:
+    """
+    entry plus every module in its directory that it imports, transitively.
+
+    Imports are read from the source (including ones inside functions), so the
+    result is the same whichever script loaded the validator. Sorted by name.
+    """
+    directory = entry.parent
+    found = {entry.name: entry}
+    pending = [entry]
+    while pending:
+        tree = ast.parse(pending.pop().read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                path = directory / f"{name.split('.')[0]}.py"
+                if path.name not in found and path.exists():
+                    found[path.name] = path
+                    pending.append(path)
+    return [found[name] for name in sorted(found)]
+
+
+class ContentFactsCache:
+    """
+    Persistent map of file path -> (content hash, facts).
+
+    File paths are the validator's (relative to root when one is given).
+    """
+
+    def __init__(self, path: Path, fingerprint: str, root: Optional[Path] = None):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.root = root
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._pending_hashes: Dict[str, str] = {}
+
+    @classmethod
+    def load(cls, fingerprint: str, path: Optional[Path] = None,
+             root: Optional[Path] = None) -> "ContentFactsCache":
+        """Load the cache from disk, discarding it if the fingerprint changed."""
+        cache = cls(path or CACHE_DIR / "content_facts.json", fingerprint, root)
+        if not cache.path.exists():
+            return cache
+        try:
+            with open(cache.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return cache  # Corrupt cache - rebuild from scratch
+        if data.get("version") == CACHE_FORMAT_VERSION and data.get("fingerprint") == fingerprint:
+            cache.entries = data.get("files", {})
+        else:
+            cache._dirty = True
+        return cache
+
+    def _resolve(self, file_path: str) -> Path:
+        return self.root / file_path if self.root else Path(file_path)
+
+    def lookup(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Return cached facts for a file if its content is unchanged."""
+        entry = self.entries.get(file_path)
+        try:
+            stat = os.stat(self._resolve(file_path))
+        except OSError:
+            return None
+
+        if entry is not None:
+            # mtime+size is only a shortcut; the content hash is the real key
+            if entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+                self.hits += 1
+                return entry["facts"]
+            sha = file_sha256(self._resolve(file_path))
+            if entry.get("sha256") == sha:
+                entry["mtime_ns"] = stat.st_mtime_ns
+                entry["size"] = stat.st_size
+                self._dirty = True
+                self.hits += 1
+                return entry["facts"]
+            self._pending_hashes[file_path] = sha
+
+        self.misses += 1
+        return None
+
+    def store(self, file_path: str, facts: Dict[str, Any]):
+        """Record freshly computed facts for a file."""
+        try:
+            stat = os.stat(self._resolve(file_path))
+        except OSError:
+            return
+        sha = self._pending_hashes.pop(file_path, None) or file_sha256(self._resolve(file_path))
+        self.entries[file_path] = {
+            "sha256": sha,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "facts": facts,
+        }
+        self._dirty = True
+
+    def save(self):
+        """Write the cache back to disk (atomically) if anything changed."""
+        stale = [p for p in self.entries if not self._resolve(p).exists()]
+        for p in stale:
+            del self.entries[p]
+        if not (self._dirty or stale):
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_write(self.path) as f:
+            json.dump({
+                "version": CACHE_FORMAT_VERSION,
+                "fingerprint": self.fingerprint,
+                "files": self.entries,
+            }, f, separators=(",", ":"))
+        self._dirty = False
+
+
+class HashKeyedCache:
+    """Persistent map of content SHA-256 -> analysis result."""
+
+    def __init__(self, path: Path, fingerprint: str):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.entries: Dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+        self._used = set()
+        self._dirty = False
+
+    @classmethod
+    def load(cls, name: str, fingerprint: str) -> "HashKeyedCache":
+        """Load Tools/Validation/.cache/<name>.json, discarding it if the fingerprint changed."""
+        cache = cls(CACHE_DIR / f"{name}.json", fingerprint)
+        try:
+            with open(cache.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return cache
+        if data.get("version") == CACHE_FORMAT_VERSION and data.get("fingerprint") == fingerprint:
+            cache.entries = data.get("entries", {})
+        return cache
+
+    def get(self, sha256: str) -> Optional[Any]:
+        self._used.add(sha256)
+        if sha256 in self.entries:
+            self.hits += 1
+            return self.entries[sha256]
+        self.misses += 1
+        return None
+
+    def put(self, sha256: str, value: Any):
+        self._used.add(sha256)
+        self.entries[sha256] = value
+        self._dirty = True
+
+    def save(self):
+        """Write back (atomically), keeping only entries used by this run."""
+        unused = [sha for sha in self.entries if sha not in self._used]
+        for sha in unused:
+            del self.entries[sha]
+        if not (self._dirty or unused):
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_write(self.path) as f:
+            json.dump({
+                "version": CACHE_FORMAT_VERSION,
+                "fingerprint": self.fingerprint,
+                "entries": self.entries,
+            }, f, separators=(",", ":"))
+        self._dirty = False
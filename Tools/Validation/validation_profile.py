@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Profiling surface for validate_content.py (--profile).
+
+Records, for every phase (0 through 10):
+- wall time and CPU time (plus CPU used by --jobs worker processes)
+- files and events processed, and the resulting files/events per second
+- peak RSS of the validator process at the end of the phase (a high-water mark)
+
+and, from the merged ValidationContext, the slowest per-event rules, the
+slowest content files and named sub-sections (e.g. Phase 8's hardcoded path
+scan vs its sea-context window). The result is one JSON document keyed by git
+commit so profiles can be compared across commits.
+
+Per-file and per-rule numbers only cover work done in this run; use
+--no-cache to profile every content file.
+"""
+
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource  # POSIX only
+except ImportError:
+    resource = None
+
+PROFILE_VERSION = 1
+DEFAULT_PROFILE_PATH = Path("Tools/Debugging/validation_profile.json")
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process, or None if unavailable."""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS bytes
+        return peak if sys.platform == "darwin" else peak * 1024
+    if sys.platform == "win32":
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return counters.PeakWorkingSetSize
+        except (AttributeError, OSError):
+            pass
+    return None
+
+
+def _children_cpu_seconds() -> float:
+    """CPU time of terminated child processes (--jobs workers)."""
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+class ValidationProfiler:
+    """Collects per-phase measurements for one validator run."""
+
+    def __init__(self):
+        self.phases: List[Dict[str, Any]] = []
+        self._started = time.perf_counter()
+        self._cpu_started = time.process_time()
+        self._children_started = _children_cpu_seconds()
+
+    @contextlib.contextmanager
+    def phase(self, key: str) -> Iterator[Dict[str, Any]]:
+        """Time one phase. The caller may set 'files' and 'events' on the yielded record."""
+        record: Dict[str, Any] = {"phase": key, "files": 0, "events": 0}
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        children = _children_cpu_seconds()
+        try:
+            yield record
+        finally:
+            wall = time.perf_counter() - wall
+            record["wall_s"] = round(wall, 6)
+            record["cpu_s"] = round(time.process_time() - cpu, 6)
+            record["worker_cpu_s"] = round(_children_cpu_seconds() - children, 6)
+            record["files_per_s"] = round(record["files"] / wall, 1) if record["files"] and wall else None
+            record["events_per_s"] = round(record["events"] / wall, 1) if record["events"] and wall else None
+            record["peak_rss_bytes"] = peak_rss_bytes()
+            self.phases.append(record)
+
+    def report(self, ctx, top_n: int = 10, settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build the JSON profile from the recorded phases and the merged context."""
+        rules = [
+            {"rule": name, "runs": runs, "skipped": skipped, "issues": issues,
+             "total_ms": round(seconds * 1000, 3),
+             "mean_us": round(seconds * 1e6 / runs, 2) if runs else None}
+            for name, (runs, skipped, issues, seconds) in ctx.rule_stats.items()
+        ]
+        rules.sort(key=lambda r: -r["total_ms"])
+        files = sorted(ctx.file_seconds.items(), key=lambda item: -item[1])
+        return {
+            "version": PROFILE_VERSION,
+            "generated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "settings": settings or {},
+            "total": {
+                "wall_s": round(time.perf_counter() - self._started, 6),
+                "cpu_s": round(time.process_time() - self._cpu_started, 6),
+                "worker_cpu_s": round(_children_cpu_seconds() - self._children_started, 6),
+                "peak_rss_bytes": peak_rss_bytes(),
+                "events": len(ctx.event_ids),
+                "issues": len(ctx.issues),
+            },
+            "phases": self.phases,
+            "sections": {name: round(seconds * 1000, 3) for name, seconds in sorted(ctx.timings.items())},
+            "slowest_rules": rules[:top_n],
+            "slowest_files": [{"file": Path(path).as_posix(), "ms": round(seconds * 1000, 3)}
+                              for path, seconds in files[:top_n]],
+        }
+
+
+def write_profile(profile: Dict[str, Any], path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(profile, f, indent=2)
+        f.write("\n")
+
+
+def print_profile_summary(profile: Dict[str, Any]):
+    """Short human-readable digest of a profile."""
+    print("PROFILE (wall ms / cpu ms per phase):")
+    for record in profile["phases"]:
+        rate = f", {record['files_per_s']} files/s" if record["files_per_s"] else ""
+        print(f"  Phase {record['phase']:<5} {record['wall_s'] * 1000:9.1f} / {record['cpu_s'] * 1000:9.1f}{rate}")
+    for name, ms in profile["sections"].items():
+        print(f"    {name}: {ms:.1f} ms")
+    if profile["slowest_rules"]:
+        slowest = profile["slowest_rules"][0]
+        print(f"  Slowest rule: {slowest['rule']} ({slowest['total_ms']:.1f} ms over {slowest['runs']} runs)")
+    if profile["slowest_files"]:
+        slowest = profile["slowest_files"][0]
+        print(f"  Slowest file: {slowest['file']} ({slowest['ms']:.1f} ms)")
+    peak = profile["total"]["peak_rss_bytes"]
+    if peak:
+        print(f"  Peak RSS: {peak / (1024 * 1024):.1f} MiB")
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Structured report writers for validate_content.py (--format json|sarif|ndjson).
+
+Issues are written as they land in the ValidationContext (via its on_issue
+hook), so nothing is truncated and large reports never sit in memory as text.
+The summary follows once validation has finished.
+
+Formats:
+    ndjson  one {"type": "issue", ...} object per line, then one {"type": "summary", ...}
+    json    {"issues": [...], "summary": {...}}
+    sarif   SARIF 2.1.0 log with one run; ruleId is the issue category
+
+Issues in JSON files get "line", "column" and "pointer" fields (SARIF: a region)
+from json_locator.SourceLocator, which only parses files that have issues.
+
+analyze_validation.py and the CrewAI tools read the ndjson/json forms directly.
+"""
+
+import json
+from collections import Counter
+from typing import Any, Dict, Optional, TextIO
+
+from json_locator import SourceLocator
+
+OUTPUT_FORMATS = ("text", "json", "sarif", "ndjson")
+
+TOOL_NAME = "enlisted-validate-content"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_LEVELS = {"error": "error", "warning": "warning", "info": "note"}
+
+# Issue "files" that are not real paths (cross-file checks report against a label)
+_PSEUDO_FILES = {"flag_analysis", "orphan_analysis", "csharp_textobjects", "src/"}
+
+
+def _summary(severities: Counter, stats: Dict[str, int], total_events: int, exit_code: int) -> Dict[str, Any]:
+    if severities["error"]:
+        result = "failed"
+    elif severities["warning"]:
+        result = "passed_with_warnings"
+    else:
+        result = "passed"
+    return {
+        "total_events": total_events,
+        "errors": severities["error"],
+        "warnings": severities["warning"],
+        "info": severities["info"],
+        "by_category": dict(sorted(stats.items())),
+        "result": result,
+        "exit_code": exit_code,
+    }
+
+
+class IssueWriter:
+    """Base writer: counts issues; subclasses serialize them."""
+
+    def __init__(self, stream: TextIO, locator: Optional[SourceLocator] = None):
+        self.stream = stream
+        self.severities: Counter = Counter()
+        self.locator = locator
+
+    def start(self):
+        pass
+
+    def write_issue(self, issue):
+        self.severities[issue.severity] += 1
+        self._write(self.locator.issue_record(issue) if self.locator else issue.to_dict())
+
+    def _write(self, record: Dict[str, Any]):
+        raise NotImplementedError
+
+    def finish(self, stats: Dict[str, int], total_events: int, exit_code: int):
+        raise NotImplementedError
+
+
+class NdjsonIssueWriter(IssueWriter):
+    def _write(self, record: Dict[str, Any]):
+        self.stream.write(json.dumps({"type": "issue", **record}) + "\n")
+        self.stream.flush()
+
+    def finish(self, stats: Dict[str, int], total_events: int, exit_code: int):
+        summary = _summary(self.severities, stats, total_events, exit_code)
+        self.stream.write(json.dumps({"type": "summary", **summary}) + "\n")
+        self.stream.flush()
+
+
+class JsonIssueWriter(IssueWriter):
+    """Writes the issues array incrementally, then closes the document with the summary."""
+
+    def __init__(self, stream: TextIO, locator: Optional[SourceLocator] = None):
+        super().__init__(stream, locator)
+        self._first = True
+
+    def start(self):
+        self.stream.write('{\n  "tool": "%s",\n  "issues": [' % TOOL_NAME)
+
+    def _write(self, record: Dict[str, Any]):
+        self.stream.write(("\n    " if self._first else ",\n    ") + json.dumps(record))
+        self._first = False
+
+    def finish(self, stats: Dict[str, int], total_events: int, exit_code: int):
+        summary = _summary(self.severities, stats, total_events, exit_code)
+        self.stream.write(("" if self._first else "\n  ") + "],\n")
+        self.stream.write('  "summary": ' + json.dumps(summary, indent=2).replace("\n", "\n  ") + "\n}\n")
+        self.stream.flush()
+
+
+class SarifIssueWriter(IssueWriter):
+    """
+    SARIF 2.1.0 output. Results are streamed first; the tool/rules block is
+    written after them because the rule list is only known at the end.
+    """
+
+    def __init__(self, stream: TextIO, locator: Optional[SourceLocator] = None):
+        super().__init__(stream, locator)
+        self._first = True
+        self._rules: Dict[str, int] = {}
+
+    def start(self):
+        self.stream.write('{\n  "$schema": "%s",\n  "version": "2.1.0",\n  "runs": [\n    {\n      "results": ['
+                          % SARIF_SCHEMA)
+
+    def _write(self, record: Dict[str, Any]):
+        rule_id = record["category"]
+        if rule_id not in self._rules:
+            self._rules[rule_id] = len(self._rules)
+        result: Dict[str, Any] = {
+            "ruleId": rule_id,
+            "ruleIndex": self._rules[rule_id],
+            "level": SARIF_LEVELS.get(record["severity"], "note"),
+            "message": {"text": record["message"]},
+        }
+        file_path = record["file"]
+        if file_path and file_path not in _PSEUDO_FILES:
+            physical: Dict[str, Any] = {"artifactLocation": {"uri": file_path, "uriBaseId": "%SRCROOT%"}}
+            if "line" in record:
+                physical["region"] = {"startLine": record["line"], "startColumn": record["column"]}
+            result["locations"] = [{"physicalLocation": physical}]
+        properties = {}
+        if record["event_id"]:
+            properties["eventId"] = record["event_id"]
+        if "pointer" in record:
+            properties["pointer"] = record["pointer"]
+        if properties:
+            result["properties"] = properties
+        self.stream.write(("\n        " if self._first else ",\n        ") + json.dumps(result))
+        self._first = False
+
+    def finish(self, stats: Dict[str, int], total_events: int, exit_code: int):
+        summary = _summary(self.severities, stats, total_events, exit_code)
+        driver = {
+            "name": TOOL_NAME,
+            "rules": [{"id": rule_id, "name": rule_id} for rule_id in self._rules],
+        }
+        self.stream.write(("" if self._first else "\n      ") + "],\n")
+        self.stream.write('      "tool": {"driver": ' + json.dumps(driver) + "},\n")
+        # Region columns count characters, not UTF-16 code units
+        self.stream.write('      "columnKind": "unicodeCodePoints",\n')
+        self.stream.write('      "properties": ' + json.dumps(summary) + "\n")
+        self.stream.write("    }\n  ]\n}\n")
+        self.stream.flush()
+
+
+_WRITERS = {
+    "json": JsonIssueWriter,
+    "sarif": SarifIssueWriter,
+    "ndjson": NdjsonIssueWriter,
+}
+
+
+def make_issue_writer(fmt: str, stream: TextIO, locator: Optional[SourceLocator] = None) -> IssueWriter:
+    """Create the writer for a structured --format value (locator: add line/column to issues)."""
+    return _WRITERS[fmt](stream, locator)